@@ -173,9 +173,37 @@ class ApiClient:
         event_type: Optional[str] = None,
         limit: int = 200,
     ) -> List[Dict[str, Any]]:
+        return self.get_logs_page(
+            collection=collection, event_type=event_type, limit=limit
+        ).get("entries", [])
+
+    def get_logs_page(
+        self,
+        collection: str = "access_logs",
+        event_type: Optional[str] = None,
+        limit: int = 200,
+        *,
+        domain_uuid: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        text: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Return {"entries": [...], "next_cursor": str|None} for one page of logs.
+        Filtering happens server-side; pass next_cursor back to continue."""
         params: Dict[str, Any] = {"collection": collection, "limit": int(limit or 200)}
         if event_type and event_type != "<All>":
             params["event_type"] = event_type
+        if domain_uuid:
+            params["domain_uuid"] = domain_uuid
+        if since:
+            params["since"] = since
+        if until:
+            params["until"] = until
+        if text:
+            params["q"] = text
+        if cursor:
+            params["cursor"] = cursor
         r = requests.get(
             f"{self.base_url}/admin/logs",
             params=params,
@@ -184,7 +212,38 @@ class ApiClient:
         )
         r.raise_for_status()
         data = r.json() or {}
-        return data.get("entries", [])
+        return {
+            "entries": data.get("entries", []),
+            "next_cursor": data.get("next_cursor"),
+        }
+
+    def get_log_rollups(
+        self,
+        collection: str = "access_logs",
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        event_type: Optional[str] = None,
+        domain_uuid: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return daily counters [{day, event_type, domain_uuid, count}] (days are YYYY-MM-DD)."""
+        params: Dict[str, Any] = {"collection": collection}
+        if since:
+            params["since"] = since
+        if until:
+            params["until"] = until
+        if event_type and event_type != "<All>":
+            params["event_type"] = event_type
+        if domain_uuid:
+            params["domain_uuid"] = domain_uuid
+        r = requests.get(
+            f"{self.base_url}/admin/logs/rollups",
+            params=params,
+            headers=self._headers(),
+            timeout=TIMEOUT,
+        )
+        r.raise_for_status()
+        data = r.json() or {}
+        return data.get("rollups", [])
 
     # ---- Bulk update helpers for full refreshes ----
     def update_all_clients(self) -> List[Dict[str, Any]]:
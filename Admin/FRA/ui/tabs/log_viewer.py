@@ -1,14 +1,26 @@
 import json
+from datetime import datetime, timedelta, timezone
 
 from PyQt5.QtCore import QEvent, Qt
 from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import (QApplication, QCheckBox, QComboBox, QHBoxLayout,
-                             QHeaderView, QLabel, QPushButton, QSizePolicy,
-                             QSplitter, QTableWidget, QTableWidgetItem,
-                             QTextEdit, QVBoxLayout, QWidget)
+                             QHeaderView, QLabel, QLineEdit, QPushButton,
+                             QSizePolicy, QSplitter, QTableWidget,
+                             QTableWidgetItem, QTextEdit, QVBoxLayout, QWidget)
 
 from core.api_client import ApiClient
 
+PAGE_SIZE = 200
+
+# Label -> look-back window (None = no lower bound)
+TIME_RANGES = [
+    ("Last hour", timedelta(hours=1)),
+    ("Last 24 hours", timedelta(days=1)),
+    ("Last 7 days", timedelta(days=7)),
+    ("Last 30 days", timedelta(days=30)),
+    ("All time", None),
+]
+
 
 class LogViewerTab(QWidget):
     def __init__(self, parent=None):
@@ -50,6 +62,37 @@ class LogViewerTab(QWidget):
 
         self.layout.addLayout(self.filter_row)
 
+        # --- Server-side filters (applied on Enter / selection) ---
+        self.search_row = QHBoxLayout()
+
+        self.time_range_dropdown = QComboBox()
+        self.time_range_dropdown.addItems([label for label, _ in TIME_RANGES])
+        self.time_range_dropdown.setCurrentIndex(2)  # Last 7 days
+        self.time_range_dropdown.currentIndexChanged.connect(self.load_logs)
+
+        self.domain_filter = QLineEdit()
+        self.domain_filter.setPlaceholderText("Domain UUID")
+        self.domain_filter.returnPressed.connect(self.load_logs)
+
+        self.text_filter = QLineEdit()
+        self.text_filter.setPlaceholderText("Search note, device or IP")
+        self.text_filter.returnPressed.connect(self.load_logs)
+
+        self.load_more_btn = QPushButton("Load More")
+        self.load_more_btn.clicked.connect(self.load_next_page)
+        self.load_more_btn.setEnabled(False)
+
+        self.count_label = QLabel("")
+
+        self.search_row.addWidget(QLabel("Range:"))
+        self.search_row.addWidget(self.time_range_dropdown)
+        self.search_row.addWidget(self.domain_filter)
+        self.search_row.addWidget(self.text_filter)
+        self.search_row.addWidget(self.load_more_btn)
+        self.search_row.addWidget(self.count_label)
+
+        self.layout.addLayout(self.search_row)
+
         self.splitter = QSplitter(Qt.Vertical)
 
         self.table = QTableWidget()
@@ -61,6 +104,8 @@ class LogViewerTab(QWidget):
         self.table.verticalHeader().setObjectName("logTableVHeader")
         self.table.setSelectionBehavior(QTableWidget.SelectRows)
         self.table.cellClicked.connect(self.display_payload)
+        # Fetch the next page when the user scrolls to the bottom
+        self.table.verticalScrollBar().valueChanged.connect(self._maybe_load_more)
         self.splitter.addWidget(self.table)
 
         self.payload_view = QTextEdit()
@@ -80,6 +125,10 @@ class LogViewerTab(QWidget):
         # Recolor rows when the application's theme property changes
         QApplication.instance().installEventFilter(self)
 
+        self.entries = []
+        self._next_cursor = None
+        self._loading = False
+
         self.configure_table()
         # Defer data loading until MainWindow confirms FRAAPI connectivity.
         self.api = ApiClient()
@@ -127,80 +176,123 @@ class LogViewerTab(QWidget):
             return []
 
     def load_logs(self):
+        """Reset the table and load the first page for the current filters."""
         self.table.setRowCount(0)
         self.payload_view.clear()
+        self.entries = []
+        self._next_cursor = None
+        self._fetch_page(None)
 
+    def load_next_page(self):
+        if self._next_cursor:
+            self._fetch_page(self._next_cursor)
+
+    def _maybe_load_more(self, value):
+        bar = self.table.verticalScrollBar()
+        if self._next_cursor and not self._loading and value >= bar.maximum() - 2:
+            self.load_next_page()
+
+    def _current_filters(self):
         collection_name = self.collection_dropdown.currentText()
         event_filter = self.event_type_dropdown.currentText()
-
+        window = TIME_RANGES[max(0, self.time_range_dropdown.currentIndex())][1]
+        since = None
+        if window is not None:
+            since = (datetime.now(timezone.utc) - window).isoformat()
+        return {
+            "collection": collection_name,
+            "event_type": None if event_filter == "<All>" else event_filter,
+            "domain_uuid": self.domain_filter.text().strip() or None,
+            "since": since,
+            "text": self.text_filter.text().strip() or None,
+        }
+
+    def _fetch_page(self, cursor):
+        if self._loading:
+            return
+        self._loading = True
         try:
-            self.entries = self.api.update_all_logs(
-                collection_name,
-                None if event_filter == "<All>" else event_filter,
-                limit=200,
-            )
-        except Exception:
-            self.entries = []
-
-        for row, entry in enumerate(self.entries):
-            self.table.insertRow(row)
-
-            payload = entry.get("object", {}).get("payload", {})
-            is_empty_payload = not payload
-            event_type = entry.get("event_type", "").lower()
-
-            if self.advanced_mode:
-                self.table.setItem(row, 0, QTableWidgetItem(entry.get("timestamp", "")))
-                self.table.setItem(
-                    row, 1, QTableWidgetItem(entry.get("event_type", ""))
-                )
-                self.table.setItem(
-                    row, 2, QTableWidgetItem(entry.get("domain_uuid", ""))
-                )
-                self.table.setItem(row, 3, QTableWidgetItem(entry.get("device_id", "")))
-                self.table.setItem(row, 4, QTableWidgetItem(entry.get("source_ip", "")))
-                self.table.setItem(
-                    row, 5, QTableWidgetItem(self.fmt_actor(entry.get("actor")))
-                )
-                self.table.setItem(
-                    row, 6, QTableWidgetItem(self.fmt_object(entry.get("object")))
-                )
-                self.table.setItem(row, 7, QTableWidgetItem(entry.get("note", "")))
-            else:
-                self.table.setItem(row, 0, QTableWidgetItem(entry.get("timestamp", "")))
-                self.table.setItem(
-                    row, 1, QTableWidgetItem(entry.get("event_type", ""))
-                )
-                self.table.setItem(
-                    row, 2, QTableWidgetItem(self.fmt_actor(entry.get("actor")))
+            try:
+                page = self.api.get_logs_page(
+                    limit=PAGE_SIZE, cursor=cursor, **self._current_filters()
                 )
-                self.table.setItem(row, 3, QTableWidgetItem(entry.get("note", "")))
-
-            theme = QApplication.instance().property("fra_theme") or "light"
-            dark = theme == "dark"
-
-            # Coloring logic
-            if dark:
-                bg_color = QColor("#2a2f3a")  # default dark row
-                if not is_empty_payload:
-                    bg_color = QColor("#244024")  # green-ish dark
-                if "delete" in event_type:
-                    bg_color = QColor("#402424")  # red-ish dark
-                elif "fail" in event_type or "error" in event_type:
-                    bg_color = QColor("#403824")  # amber-ish dark
-            else:
-                bg_color = QColor("#fdfdfd")  # default light row
-                if not is_empty_payload:
-                    bg_color = QColor("#e9f6e9")
-                if "delete" in event_type:
-                    bg_color = QColor("#ffecec")
-                elif "fail" in event_type or "error" in event_type:
-                    bg_color = QColor("#fff4e5")
+            except Exception:
+                page = {"entries": [], "next_cursor": None}
+            new_entries = page.get("entries") or []
+            self._next_cursor = page.get("next_cursor")
+            start = len(self.entries)
+            self.entries.extend(new_entries)
+            self.table.setUpdatesEnabled(False)
+            try:
+                for offset, entry in enumerate(new_entries):
+                    self._append_row(start + offset, entry)
+            finally:
+                self.table.setUpdatesEnabled(True)
+            self.load_more_btn.setEnabled(bool(self._next_cursor))
+            suffix = "+" if self._next_cursor else ""
+            self.count_label.setText(f"{len(self.entries)}{suffix} entries")
+        finally:
+            self._loading = False
+
+    def _append_row(self, row, entry):
+        self.table.insertRow(row)
 
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item:
-                    item.setBackground(bg_color)
+        if self.advanced_mode:
+            self.table.setItem(row, 0, QTableWidgetItem(entry.get("timestamp", "")))
+            self.table.setItem(
+                row, 1, QTableWidgetItem(entry.get("event_type", ""))
+            )
+            self.table.setItem(
+                row, 2, QTableWidgetItem(entry.get("domain_uuid", ""))
+            )
+            self.table.setItem(row, 3, QTableWidgetItem(entry.get("device_id", "")))
+            self.table.setItem(row, 4, QTableWidgetItem(entry.get("source_ip", "")))
+            self.table.setItem(
+                row, 5, QTableWidgetItem(self.fmt_actor(entry.get("actor")))
+            )
+            self.table.setItem(
+                row, 6, QTableWidgetItem(self.fmt_object(entry.get("object")))
+            )
+            self.table.setItem(row, 7, QTableWidgetItem(entry.get("note", "")))
+        else:
+            self.table.setItem(row, 0, QTableWidgetItem(entry.get("timestamp", "")))
+            self.table.setItem(
+                row, 1, QTableWidgetItem(entry.get("event_type", ""))
+            )
+            self.table.setItem(
+                row, 2, QTableWidgetItem(self.fmt_actor(entry.get("actor")))
+            )
+            self.table.setItem(row, 3, QTableWidgetItem(entry.get("note", "")))
+
+        theme = QApplication.instance().property("fra_theme") or "light"
+        bg_color = self._row_color(entry, theme == "dark")
+        for col in range(self.table.columnCount()):
+            item = self.table.item(row, col)
+            if item:
+                item.setBackground(bg_color)
+
+    def _row_color(self, entry, dark):
+        payload = (entry.get("object") or {}).get("payload", {})
+        is_empty_payload = not payload
+        event_type = (entry.get("event_type", "") or "").lower()
+
+        if dark:
+            bg_color = QColor("#2a2f3a")  # default dark row
+            if not is_empty_payload:
+                bg_color = QColor("#244024")  # green-ish dark
+            if "delete" in event_type:
+                bg_color = QColor("#402424")  # red-ish dark
+            elif "fail" in event_type or "error" in event_type:
+                bg_color = QColor("#403824")  # amber-ish dark
+        else:
+            bg_color = QColor("#fdfdfd")  # default light row
+            if not is_empty_payload:
+                bg_color = QColor("#e9f6e9")
+            if "delete" in event_type:
+                bg_color = QColor("#ffecec")
+            elif "fail" in event_type or "error" in event_type:
+                bg_color = QColor("#fff4e5")
+        return bg_color
 
     def recolor_rows(self):
         if not hasattr(self, "entries"):
@@ -210,28 +302,7 @@ class LogViewerTab(QWidget):
         for row in range(self.table.rowCount()):
             if row >= len(self.entries):
                 continue
-            entry = self.entries[row]
-            payload = entry.get("object", {}).get("payload", {})
-            is_empty_payload = not payload
-            event_type = (entry.get("event_type", "") or "").lower()
-
-            if dark:
-                bg_color = QColor("#2a2f3a")
-                if not is_empty_payload:
-                    bg_color = QColor("#244024")
-                if "delete" in event_type:
-                    bg_color = QColor("#402424")
-                elif "fail" in event_type or "error" in event_type:
-                    bg_color = QColor("#403824")
-            else:
-                bg_color = QColor("#fdfdfd")
-                if not is_empty_payload:
-                    bg_color = QColor("#e9f6e9")
-                if "delete" in event_type:
-                    bg_color = QColor("#ffecec")
-                elif "fail" in event_type or "error" in event_type:
-                    bg_color = QColor("#fff4e5")
-
+            bg_color = self._row_color(self.entries[row], dark)
             for col in range(self.table.columnCount()):
                 item = self.table.item(row, col)
                 if item:
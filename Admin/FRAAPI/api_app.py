@@ -78,6 +78,25 @@ def _startup_indexes():
                 logger.info(f"Mongo index initialization completed in {elapsed:.1f}s")
             except Exception as e:
                 logger.warning(f"Mongo index initialization skipped/failed: {e}")
+            try:
+                from core.logger import migrate_log_timestamps
+
+                t1 = time.time()
+                converted = migrate_log_timestamps()
+                if converted:
+                    logger.info(
+                        f"Converted {converted} legacy log timestamps in {time.time() - t1:.1f}s"
+                    )
+            except Exception as e:
+                logger.warning(f"Log timestamp migration skipped/failed: {e}")
+            try:
+                from db.mongo_interface import migrate_fax_tag_maps
+
+                migrated = migrate_fax_tag_maps()
+                if migrated:
+                    logger.info(f"Migrated {migrated} fax tags to per-fax documents")
+            except Exception as e:
+                logger.warning(f"Fax tag migration skipped/failed: {e}")
 
         threading.Thread(target=_bg, daemon=True).start()
     except Exception:
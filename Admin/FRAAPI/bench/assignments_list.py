@@ -0,0 +1,124 @@
+"""
+Benchmark: /assignments.list against a seeded database, client cache on and off.
+
+Seeds a throwaway MongoDB database (never the configured DB_NAME) with synthetic
+client documents. They carry realistic bulk (known devices, integration blobs), so
+the projection matters. The script points db.mongo_interface at that database and
+calls /assignments.list through FastAPI's TestClient with a signed JWT per domain,
+in two phases:
+
+- cache on:  CLIENT_CACHE_TTL_SECONDS as configured (default 5 s)
+- cache off: CLIENT_CACHE_TTL_SECONDS = 0, so every call reads MongoDB
+
+It reports requests per second and p50/p95/p99 latency for each phase. The
+seeded database is dropped afterwards unless --keep is given.
+
+Usage (from Admin/FRAAPI, with FRA_MONGO_URI and the JWT keys configured):
+    python bench/assignments_list.py --clients 200 --numbers 20 --requests 2000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from uuid import uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import COL_CLIENTS, DB_NAME
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import db.mongo_interface as mongo_interface
+from auth.token_utils import generate_jwt_token
+from routes.assignments_route import router as assignments_router
+
+
+def seed(coll, clients: int, numbers: int, rng: random.Random) -> list[str]:
+    docs, domains = [], []
+    for i in range(clients):
+        domain = str(uuid4())
+        nums = [f"+1{rng.randint(200, 999)}{rng.randint(2000000, 9999999)}" for _ in range(numbers)]
+        devices = [f"WS-{i:04d}-{d:02d}" for d in range(8)]
+        docs.append({
+            "domain_uuid": domain,
+            "fax_user": f"{100 + i}@bench.{i}.service",
+            "authentication_token": uuid4().hex,
+            "active": True,
+            "all_fax_numbers": nums,
+            "retriever_assignments": {n: rng.choice(devices) for n in nums if rng.random() < 0.5},
+            "assignments_version": rng.randint(1, 50),
+            "known_devices": devices,
+            "libertyrx_device_pubkeys": {d: {"pem": "x" * 800} for d in devices},
+            "integrations": {"libertyrx": {"enabled": True, "blob": "y" * 2048}},
+        })
+        domains.append(domain)
+    coll.insert_many(docs)
+    coll.create_index("domain_uuid", unique=True)
+    return domains
+
+
+def run_phase(http: TestClient, tokens: list[str], requests: int, rng: random.Random) -> list[float]:
+    latencies = []
+    for _ in range(requests):
+        token = rng.choice(tokens)
+        start = time.perf_counter()
+        resp = http.post("/assignments.list", headers={"Authorization": f"Bearer {token}"})
+        latencies.append(time.perf_counter() - start)
+        if resp.status_code != 200:
+            raise SystemExit(f"/assignments.list returned HTTP {resp.status_code}: {resp.text}")
+    return latencies
+
+
+def report(name: str, latencies: list[float]) -> None:
+    ms = sorted(x * 1000 for x in latencies)
+    q = statistics.quantiles(ms, n=100)
+    total = sum(latencies)
+    print(
+        f"{name:<10}{len(ms) / total:>10.0f} req/s   p50 {q[49]:6.2f} ms   "
+        f"p95 {q[94]:6.2f} ms   p99 {q[98]:6.2f} ms"
+    )
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--clients", type=int, default=200)
+    ap.add_argument("--numbers", type=int, default=20, help="fax numbers per client")
+    ap.add_argument("--requests", type=int, default=2000, help="requests per phase")
+    ap.add_argument("--db", default=f"{DB_NAME}_bench")
+    ap.add_argument("--seed", type=int, default=3)
+    ap.add_argument("--keep", action="store_true", help="keep the seeded database")
+    args = ap.parse_args()
+    if args.db == DB_NAME:
+        raise SystemExit("Refusing to seed the configured database; pass a different --db")
+
+    rng = random.Random(args.seed)
+    bench_db = mongo_interface.client[args.db]
+    coll = bench_db[COL_CLIENTS]
+    coll.drop()
+    ttl = mongo_interface.CLIENT_CACHE_TTL_SECONDS
+    mongo_interface.clients = coll
+    try:
+        domains = seed(coll, args.clients, args.numbers, rng)
+        tokens = [generate_jwt_token(d, "BENCH-WS", ["assignments.list"], nbf_offset_seconds=0) for d in domains]
+
+        app = FastAPI()
+        app.include_router(assignments_router)
+        http = TestClient(app)
+        run_phase(http, tokens, min(50, args.requests), rng)  # warm-up
+
+        print(f"{args.clients} clients x {args.numbers} numbers, {args.requests} requests per phase")
+        mongo_interface.invalidate_client_cache()
+        report("cache on", run_phase(http, tokens, args.requests, rng))
+        mongo_interface.CLIENT_CACHE_TTL_SECONDS = 0.0
+        mongo_interface.invalidate_client_cache()
+        report("cache off", run_phase(http, tokens, args.requests, rng))
+    finally:
+        mongo_interface.CLIENT_CACHE_TTL_SECONDS = ttl
+        if not args.keep:
+            mongo_interface.client.drop_database(args.db)
+
+
+if __name__ == "__main__":
+    main()
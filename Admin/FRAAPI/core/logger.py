@@ -1,16 +1,29 @@
 import inspect
+import os
+import re
 import traceback
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 from uuid import uuid4
 
+from bson import ObjectId
 from config import COL_AUDIT_LOGS, COL_LOGS, DB_NAME, MONGO_URI
-from pymongo import MongoClient
+from pymongo import DESCENDING, MongoClient, UpdateOne
 
 # MongoDB clients and collections (keep server selection fast to avoid startup stalls)
 mongo_client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=1500)
 log_db = mongo_client[DB_NAME]
 log_collection = log_db[COL_LOGS]
 audit_collection = log_db[COL_AUDIT_LOGS]
+# Per-day event counters (by collection, event_type, domain) that outlive raw events
+rollup_collection = log_db["log_daily_rollups"]
+
+# Raw event retention, enforced by TTL indexes on timestamp (see ensure_indexes).
+# 0 disables expiry for that collection.
+LOG_RETENTION_DAYS = {
+    COL_LOGS: int(os.environ.get("FRA_ACCESS_LOG_RETENTION_DAYS", "90")),
+    COL_AUDIT_LOGS: int(os.environ.get("FRA_AUDIT_LOG_RETENTION_DAYS", "365")),
+}
 
 # def log_event(
 #     event_type: str,
@@ -53,7 +66,8 @@ def log_event_v2(
     High-fidelity structured logger for operational and audit logs.
     """
     event = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        # Native BSON date so range filters and keyset pagination use the index
+        "timestamp": datetime.now(timezone.utc),
         "event_type": event_type,
         "domain_uuid": domain_uuid,
         "device_id": device_id,
@@ -97,8 +111,199 @@ def recent_events(domain_uuid: str, limit: int = 50):
 
 def delete_events_older_than(days: int = 365):
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-    log_collection.delete_many({"timestamp": {"$lt": cutoff.isoformat()}})
-    audit_collection.delete_many({"timestamp": {"$lt": cutoff.isoformat()}})
+    # Match both native dates and legacy ISO strings not yet migrated
+    for coll in (log_collection, audit_collection):
+        coll.delete_many(
+            {
+                "$or": [
+                    {"timestamp": {"$lt": cutoff}},
+                    {"timestamp": {"$lt": cutoff.isoformat(), "$type": "string"}},
+                ]
+            }
+        )
+
+
+def migrate_log_timestamps(batch_size: int = 1000) -> int:
+    """Convert legacy ISO-string timestamps to native BSON dates in both log collections.
+
+    Walks each collection in _id order so unparseable values are skipped rather
+    than revisited. Idempotent; returns the number of documents converted.
+    """
+    converted = 0
+    for coll in (log_collection, audit_collection):
+        last_id = None
+        while True:
+            q: dict = {"timestamp": {"$type": "string"}}
+            if last_id is not None:
+                q["_id"] = {"$gt": last_id}
+            batch = list(coll.find(q, {"timestamp": 1}).sort("_id", 1).limit(batch_size))
+            if not batch:
+                break
+            ops = []
+            for doc in batch:
+                try:
+                    ts = datetime.fromisoformat(str(doc["timestamp"]).replace("Z", "+00:00"))
+                except ValueError:
+                    continue
+                if ts.tzinfo is None:
+                    ts = ts.replace(tzinfo=timezone.utc)
+                ops.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"timestamp": ts}}))
+            if ops:
+                converted += coll.bulk_write(ops, ordered=False).modified_count
+            last_id = batch[-1]["_id"]
+    return converted
+
+
+def encode_log_cursor(doc: dict) -> Optional[str]:
+    """Opaque keyset cursor for the (timestamp, _id) position of a log entry."""
+    ts = doc.get("timestamp")
+    oid = doc.get("_id")
+    if not isinstance(ts, datetime) or oid is None:
+        return None
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return f"{ts.isoformat()}|{oid}"
+
+
+def _decode_log_cursor(cursor: str) -> tuple:
+    """Inverse of encode_log_cursor; raises ValueError for a malformed cursor."""
+    try:
+        ts_str, oid_str = cursor.split("|", 1)
+        return datetime.fromisoformat(ts_str), ObjectId(oid_str)
+    except Exception:
+        raise ValueError("invalid log cursor")
+
+
+def query_events(
+    collection,
+    *,
+    event_type: Optional[str] = None,
+    domain_uuid: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    text: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = 200,
+) -> tuple[list[dict], Optional[str]]:
+    """Return one page of log entries, newest first, plus the cursor for the next page.
+
+    Pagination is keyset-based on (timestamp, _id) so deep pages cost the same as
+    the first one. event_type/domain_uuid filters are served by the compound
+    indexes created in ensure_indexes; text is a case-insensitive substring
+    match over note, device_id and source_ip applied within that range. A malformed
+    cursor raises ValueError rather than silently restarting at the first page.
+    """
+    q: dict = {}
+    if event_type:
+        q["event_type"] = event_type
+    if domain_uuid:
+        q["domain_uuid"] = domain_uuid
+    ts_range: dict = {}
+    if since:
+        ts_range["$gte"] = since
+    if until:
+        ts_range["$lt"] = until
+    # Only native dates participate; legacy string timestamps are handled by migration
+    ts_range["$type"] = "date"
+    q["timestamp"] = ts_range
+
+    and_clauses = []
+    if text:
+        rx = {"$regex": re.escape(text), "$options": "i"}
+        and_clauses.append(
+            {"$or": [{"note": rx}, {"device_id": rx}, {"source_ip": rx}]}
+        )
+    if cursor:
+        ts, oid = _decode_log_cursor(cursor)
+        and_clauses.append(
+            {"$or": [{"timestamp": {"$lt": ts}}, {"timestamp": ts, "_id": {"$lt": oid}}]}
+        )
+    if and_clauses:
+        q["$and"] = and_clauses
+
+    docs = list(
+        collection.find(q)
+        .sort([("timestamp", DESCENDING), ("_id", DESCENDING)])
+        .limit(int(limit) + 1)
+    )
+    next_cursor = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        next_cursor = encode_log_cursor(docs[-1])
+    return docs, next_cursor
+
+
+def rollup_day(collection, day_start: datetime) -> None:
+    """Recompute the per-(event_type, domain) counters for one UTC day.
+
+    Runs entirely server-side ($group + $merge) and replaces any existing counters
+    for that day, so re-running a partially rolled day is safe.
+    """
+    day_end = day_start + timedelta(days=1)
+    collection.aggregate(
+        [
+            {"$match": {"timestamp": {"$gte": day_start, "$lt": day_end}}},
+            {
+                "$group": {
+                    "_id": {
+                        "event_type": {"$ifNull": ["$event_type", ""]},
+                        "domain_uuid": {"$ifNull": ["$domain_uuid", ""]},
+                    },
+                    "count": {"$sum": 1},
+                }
+            },
+            {
+                "$project": {
+                    "_id": 0,
+                    "collection": {"$literal": collection.name},
+                    "day": {"$literal": day_start.strftime("%Y-%m-%d")},
+                    "event_type": "$_id.event_type",
+                    "domain_uuid": "$_id.domain_uuid",
+                    "count": 1,
+                    "updated_at": "$$NOW",
+                }
+            },
+            {
+                "$merge": {
+                    "into": rollup_collection.name,
+                    "on": ["collection", "day", "event_type", "domain_uuid"],
+                    "whenMatched": "replace",
+                    "whenNotMatched": "insert",
+                }
+            },
+        ]
+    )
+
+
+def query_rollups(
+    collection_name: str,
+    *,
+    since_day: Optional[str] = None,
+    until_day: Optional[str] = None,
+    event_type: Optional[str] = None,
+    domain_uuid: Optional[str] = None,
+) -> list[dict]:
+    """Return daily counters ({day, event_type, domain_uuid, count}) ordered by day.
+
+    Days are inclusive "YYYY-MM-DD" strings.
+    """
+    q: dict = {"collection": collection_name}
+    day_range: dict = {}
+    if since_day:
+        day_range["$gte"] = since_day
+    if until_day:
+        day_range["$lte"] = until_day
+    if day_range:
+        q["day"] = day_range
+    if event_type:
+        q["event_type"] = event_type
+    if domain_uuid:
+        q["domain_uuid"] = domain_uuid
+    return list(
+        rollup_collection.find(
+            q, {"_id": 0, "day": 1, "event_type": 1, "domain_uuid": 1, "count": 1}
+        ).sort([("day", 1), ("event_type", 1)])
+    )
 
 
 def auto_log_event(
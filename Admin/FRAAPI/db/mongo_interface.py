@@ -1,16 +1,19 @@
 # Admin/licensing_server/db/mongo_interface.py
 
+import threading
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, TypedDict
 from uuid import uuid4
 
 from auth.crypto_utils import CryptoError, decrypt_blob, encrypt_blob
 from config import (COL_BEARERS, COL_CLIENTS, COL_LOGS, COL_RESELLERS, DB_NAME,
                     MONGO_URI, SYSTEM_ACTOR, COL_DOWNLOAD_HISTORY, COL_FAX_TAGS)
-from pymongo import ASCENDING, DESCENDING, MongoClient, ReturnDocument
+from pymongo import ASCENDING, DESCENDING, MongoClient, ReturnDocument, UpdateOne
 from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
 
-from core.logger import log_event_v2
+from core.logger import LOG_RETENTION_DAYS, log_event_v2
 
 client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=1500)
 db = client[DB_NAME]
@@ -24,28 +27,138 @@ fax_tags: Collection = db[COL_FAX_TAGS]
 
 BEARER_REFRESH_OFFSET = timedelta(hours=1)
 
+# Per-process cache of assignment-relevant client fields. Kept short so that
+# writes made by other FRAAPI workers become visible quickly; local writes
+# invalidate the entry immediately.
+CLIENT_CACHE_TTL_SECONDS = 5.0
+
+# Field projections per use case. Hot routes only need a handful of fields;
+# fetching the whole client document drags device lists, pubkeys and integration
+# blobs over the wire on every request.
+CLIENT_PROJECTION_IDENTITY = {"_id": 0, "domain_uuid": 1, "fax_user": 1, "active": 1}
+CLIENT_PROJECTION_INIT = {
+    "_id": 0,
+    "domain_uuid": 1,
+    "fax_user": 1,
+    "active": 1,
+    "all_fax_numbers": 1,
+}
+CLIENT_PROJECTION_ASSIGNMENTS = {
+    "_id": 0,
+    "domain_uuid": 1,
+    "active": 1,
+    "all_fax_numbers": 1,
+    "retriever_assignments": 1,
+    "assignments_version": 1,
+}
+CLIENT_PROJECTION_ADMIN_LIST = {
+    "_id": 0,
+    "fax_user": 1,
+    "authentication_token": 1,
+    "domain_uuid": 1,
+    "active": 1,
+    "all_fax_numbers": 1,
+    "retriever_assignments": 1,
+}
+CLIENT_PROJECTION_ADMIN_FULL = dict(CLIENT_PROJECTION_ADMIN_LIST, known_devices=1)
+
+
+class ClientAssignmentsRecord(TypedDict):
+    """Assignment-relevant view of a client document (see get_client_assignments)."""
+
+    domain_uuid: str
+    active: bool
+    all_fax_numbers: list[str]
+    retriever_assignments: dict[str, str]
+    assignments_version: int
+
+
+_client_cache: dict[str, tuple[float, ClientAssignmentsRecord]] = {}
+_client_cache_lock = threading.Lock()
+
+
+def _log_collections() -> list[tuple[Collection, str]]:
+    # Import the audit collection from core.logger lazily to avoid cycles
+    from core.logger import audit_collection as _audit
+
+    return [(logs, "logs"), (_audit, "audit")]
+
+
+def _timestamp_asc_index(coll: Collection) -> Optional[tuple[str, dict]]:
+    """(name, info) of the existing index keyed exactly on timestamp ascending, if any."""
+    for idx_name, info in coll.index_information().items():
+        key = info.get("key") or []
+        if len(key) == 1 and key[0][0] == "timestamp" and key[0][1] == ASCENDING:
+            return idx_name, info
+    return None
+
+
+def _ensure_ttl_index(coll: Collection, name: str, days: int) -> None:
+    """Create or retune a TTL index on timestamp; days <= 0 removes it.
+
+    An index on timestamp may already exist under another name (created by hand
+    or by an older release); it is found by key and retuned under its own name.
+    """
+    if days <= 0:
+        existing = _timestamp_asc_index(coll)
+        if existing and "expireAfterSeconds" in existing[1]:
+            coll.drop_index(existing[0])
+        return
+    seconds = int(days) * 86400
+    try:
+        coll.create_index([("timestamp", ASCENDING)], name=name, expireAfterSeconds=seconds)
+    except OperationFailure:
+        # Same key with a different name or retention; change it in place
+        existing = _timestamp_asc_index(coll)
+        if existing is None:
+            raise
+        db.command(
+            "collMod", coll.name, index={"name": existing[0], "expireAfterSeconds": seconds}
+        )
+
 
 def ensure_indexes() -> None:
     """Create indexes used by hot paths. Idempotent and safe to call on startup."""
+    for coll, prefix in _log_collections():
+        try:
+            # Keyset pagination sorts on (timestamp, _id); every filter index carries both
+            coll.create_index(
+                [("timestamp", DESCENDING), ("_id", DESCENDING)],
+                name=f"{prefix}_ts_id_desc",
+            )
+            coll.create_index(
+                [("event_type", ASCENDING), ("timestamp", DESCENDING), ("_id", DESCENDING)],
+                name=f"{prefix}_event_ts_id_desc",
+            )
+            coll.create_index(
+                [("domain_uuid", ASCENDING), ("timestamp", DESCENDING), ("_id", DESCENDING)],
+                name=f"{prefix}_domain_ts_id_desc",
+            )
+        except Exception:
+            pass
+        # Superseded by the compound indexes above; extra indexes only slow inserts
+        for legacy in (f"{prefix}_ts_desc", f"{prefix}_event_ts_desc"):
+            try:
+                coll.drop_index(legacy)
+            except Exception:
+                pass
+        try:
+            _ensure_ttl_index(coll, f"{prefix}_ts_ttl", LOG_RETENTION_DAYS.get(coll.name, 0))
+        except Exception:
+            pass
     try:
-        # Access logs
-        logs.create_index([("timestamp", DESCENDING)], name="logs_ts_desc")
-        logs.create_index([("event_type", ASCENDING)], name="logs_event_type")
-        logs.create_index(
-            [("event_type", ASCENDING), ("timestamp", DESCENDING)],
-            name="logs_event_ts_desc",
-        )
-    except Exception:
-        pass
-    try:
-        # Audit logs (import collection from core.logger lazily to avoid cycles)
-        from core.logger import audit_collection as _audit
-
-        _audit.create_index([("timestamp", DESCENDING)], name="audit_ts_desc")
-        _audit.create_index([("event_type", ASCENDING)], name="audit_event_type")
-        _audit.create_index(
-            [("event_type", ASCENDING), ("timestamp", DESCENDING)],
-            name="audit_event_ts_desc",
+        # Daily rollups; $merge requires a unique index on its "on" fields
+        from core.logger import rollup_collection
+
+        rollup_collection.create_index(
+            [
+                ("collection", ASCENDING),
+                ("day", ASCENDING),
+                ("event_type", ASCENDING),
+                ("domain_uuid", ASCENDING),
+            ],
+            name="rollups_key",
+            unique=True,
         )
     except Exception:
         pass
@@ -84,6 +197,16 @@ def ensure_indexes() -> None:
         )
     except Exception:
         pass
+    try:
+        # Fax source tags — one document per (domain, fax_id)
+        fax_tags.create_index(
+            [("domain_uuid", ASCENDING), ("fax_id", ASCENDING)],
+            name="fax_tags_domain_fax_id",
+            unique=True,
+            partialFilterExpression={"doc_type": "tag"},
+        )
+    except Exception:
+        pass
     try:
         # Download history — Single history document per domain (doc_type="history") only
         downloads.create_index(
@@ -226,18 +349,72 @@ def set_client_libertyrx_enabled(domain_uuid: str, enabled: bool) -> bool:
 # === Client Domain Logic ===
 
 
-def get_client_by_auth(auth_token: str, fax_user: str) -> Optional[dict]:
+def get_client_by_auth(
+    auth_token: str, fax_user: str, projection: Optional[dict] = None
+) -> Optional[dict]:
     return clients.find_one(
         {
             "authentication_token": auth_token.strip(),
             "fax_user": fax_user.strip().lower(),
             "active": True,
-        }
+        },
+        projection,
     )
 
 
-def get_client_by_uuid(domain_uuid: str) -> Optional[dict]:
-    return clients.find_one({"domain_uuid": domain_uuid, "active": True})
+def get_client_by_uuid(
+    domain_uuid: str, projection: Optional[dict] = None
+) -> Optional[dict]:
+    """Return the active client document for a domain.
+
+    Pass one of the CLIENT_PROJECTION_* constants to fetch only the fields the
+    caller needs; None returns the full document.
+    """
+    return clients.find_one({"domain_uuid": domain_uuid, "active": True}, projection)
+
+
+def invalidate_client_cache(domain_uuid: Optional[str] = None) -> None:
+    """Drop cached assignment records for a domain (or all domains when None)."""
+    with _client_cache_lock:
+        if domain_uuid is None:
+            _client_cache.clear()
+        else:
+            _client_cache.pop(domain_uuid, None)
+
+
+def get_client_assignments(
+    domain_uuid: str, *, use_cache: bool = True
+) -> Optional[ClientAssignmentsRecord]:
+    """Return numbers, assignments and assignments_version for an active domain.
+
+    Results are cached per process for CLIENT_CACHE_TTL_SECONDS. Every write
+    that bumps assignments_version through this module invalidates the entry,
+    so a worker always observes its own writes; other workers converge within
+    the TTL. Returns None when the domain is unknown or inactive.
+    """
+    if not domain_uuid:
+        return None
+    now = time.monotonic()
+    if use_cache:
+        with _client_cache_lock:
+            hit = _client_cache.get(domain_uuid)
+        if hit and hit[0] > now:
+            return hit[1]
+
+    doc = get_client_by_uuid(domain_uuid, CLIENT_PROJECTION_ASSIGNMENTS)
+    if not doc:
+        invalidate_client_cache(domain_uuid)
+        return None
+    rec: ClientAssignmentsRecord = {
+        "domain_uuid": domain_uuid,
+        "active": bool(doc.get("active", False)),
+        "all_fax_numbers": list(doc.get("all_fax_numbers") or []),
+        "retriever_assignments": dict(doc.get("retriever_assignments") or {}),
+        "assignments_version": int(doc.get("assignments_version", 0) or 0),
+    }
+    with _client_cache_lock:
+        _client_cache[domain_uuid] = (now + CLIENT_CACHE_TTL_SECONDS, rec)
+    return rec
 
 
 # === Retriever assignment (v2.2) ===
@@ -260,6 +437,8 @@ def claim_retriever_number(domain_uuid: str, number: str, device_id: str) -> boo
         },
         {"$set": {field: device_id}, "$inc": {"assignments_version": 1}},
     )
+    if res.modified_count == 1:
+        invalidate_client_cache(domain_uuid)
     return res.modified_count == 1
 
 
@@ -273,49 +452,159 @@ def unclaim_retriever_number(domain_uuid: str, number: str, device_id: str) -> b
         {"domain_uuid": domain_uuid, "active": True, field: device_id},
         {"$unset": {field: ""}, "$inc": {"assignments_version": 1}},
     )
+    if res.modified_count == 1:
+        invalidate_client_cache(domain_uuid)
     return res.modified_count == 1
 
 
-def unclaim_retriever_numbers(
+def _assignment_path(number: str) -> str:
+    return f"$retriever_assignments.{number}"
+
+
+def _assignments_after_unclaim(numbers: Optional[list[str]], device_id: str) -> dict:
+    """Pipeline expression: the assignments map minus entries owned by device_id.
+
+    When numbers is None every entry owned by the device is dropped; otherwise
+    only the listed numbers are considered.
+    """
+    owned = {"$eq": ["$$this.v", {"$literal": device_id}]}
+    if numbers is not None:
+        owned = {"$and": [{"$in": ["$$this.k", {"$literal": numbers}]}, owned]}
+    return {
+        "$filter": {
+            "input": {"$objectToArray": {"$ifNull": ["$retriever_assignments", {}]}},
+            "cond": owned,
+        }
+    }
+
+
+def claim_retriever_numbers(
     domain_uuid: str, numbers: list[str], device_id: str
-) -> dict:
-    """Unassign multiple numbers for a device; returns a map of number->bool indicating success."""
-    results: dict[str, bool] = {}
-    for n in numbers:
-        try:
-            results[n] = unclaim_retriever_number(domain_uuid, n, device_id)
-        except Exception:
-            results[n] = False
-    return results
+) -> Optional[tuple[dict[str, Optional[str]], int]]:
+    """
+    Atomically claim every unassigned number in 'numbers' for 'device_id' in a single update.
+    Uses the same "unassigned" definition as claim_retriever_number. assignments_version is
+    bumped once if at least one number changed hands.
+    Returns ({number: owner_after_claim}, assignments_version after the update) (the caller
+    won a number iff owner == device_id), or None if the domain is unknown or inactive.
+    """
+    if not numbers:
+        return {}, get_assignments_version(domain_uuid)
+    device = {"$literal": device_id}
+    unowned = {
+        n: {"$in": [{"$ifNull": [_assignment_path(n), ""]}, ["", "<unknown>"]]}
+        for n in numbers
+    }
+    # Both fields are computed in one $set stage, so each sees the pre-update document.
+    pipeline = [
+        {
+            "$set": {
+                "retriever_assignments": {
+                    "$mergeObjects": [
+                        {"$ifNull": ["$retriever_assignments", {}]},
+                        {
+                            n: {"$cond": [unowned[n], device, _assignment_path(n)]}
+                            for n in numbers
+                        },
+                    ]
+                },
+                "assignments_version": {
+                    "$add": [
+                        {"$ifNull": ["$assignments_version", 0]},
+                        {"$cond": [{"$or": list(unowned.values())}, 1, 0]},
+                    ]
+                },
+            }
+        }
+    ]
+    doc = clients.find_one_and_update(
+        {"domain_uuid": domain_uuid, "active": True},
+        pipeline,
+        projection={
+            "_id": 0,
+            "assignments_version": 1,
+            **{f"retriever_assignments.{n}": 1 for n in numbers},
+        },
+        return_document=ReturnDocument.AFTER,
+    )
+    if doc is None:
+        return None
+    invalidate_client_cache(domain_uuid)
+    current = doc.get("retriever_assignments") or {}
+    return {n: current.get(n) for n in numbers}, int(doc.get("assignments_version") or 0)
 
 
-def unclaim_all_for_device(domain_uuid: str, device_id: str) -> list[str]:
+def unclaim_retriever_numbers(
+    domain_uuid: str, numbers: Optional[list[str]], device_id: str
+) -> tuple[dict, int]:
     """
-    Unassign all numbers currently owned by device_id in the domain.
-    Returns the list of numbers that were unassigned.
+    Unassign multiple numbers owned by device_id in a single atomic update.
+    numbers=None unassigns every number the device owns. assignments_version is bumped once
+    if anything was removed. Returns (map of number->bool indicating success,
+    assignments_version after the update).
     """
-    doc = (
-        clients.find_one(
-            {"domain_uuid": domain_uuid, "active": True}, {"retriever_assignments": 1}
-        )
-        or {}
+    if numbers is not None and not numbers:
+        return {}, get_assignments_version(domain_uuid)
+    removed = _assignments_after_unclaim(numbers, device_id)
+    pipeline = [
+        {
+            "$set": {
+                "retriever_assignments": {
+                    "$arrayToObject": {
+                        "$filter": {
+                            "input": {
+                                "$objectToArray": {
+                                    "$ifNull": ["$retriever_assignments", {}]
+                                }
+                            },
+                            "as": "entry",
+                            "cond": {"$not": [{"$in": ["$$entry", removed]}]},
+                        }
+                    }
+                },
+                "assignments_version": {
+                    "$add": [
+                        {"$ifNull": ["$assignments_version", 0]},
+                        {"$cond": [{"$gt": [{"$size": removed}, 0]}, 1, 0]},
+                    ]
+                },
+            }
+        }
+    ]
+    before = clients.find_one_and_update(
+        {"domain_uuid": domain_uuid, "active": True},
+        pipeline,
+        projection={"_id": 0, "retriever_assignments": 1, "assignments_version": 1},
+        return_document=ReturnDocument.BEFORE,
     )
-    assignments = doc.get("retriever_assignments") or {}
-    changed: list[str] = []
-    for number, owner in list(assignments.items()):
-        if owner == device_id:
-            field = f"retriever_assignments.{number}"
-            res = clients.update_one(
-                {"domain_uuid": domain_uuid, "active": True, field: device_id},
-                {"$unset": {field: ""}, "$inc": {"assignments_version": 1}},
-            )
-            if res.modified_count == 1:
-                changed.append(number)
-    return changed
+    if before is None:
+        return ({} if numbers is None else {n: False for n in numbers}), get_assignments_version(domain_uuid)
+    previous = before.get("retriever_assignments") or {}
+    owned = [n for n, owner in previous.items() if owner == device_id]
+    # The pre-update document decides which entries go; the same update bumps the version
+    # exactly when something was removed, so the post-update version follows from it.
+    version = int(before.get("assignments_version") or 0) + (1 if owned else 0)
+    if owned:
+        invalidate_client_cache(domain_uuid)
+    if numbers is None:
+        return {n: True for n in owned}, version
+    owned_set = set(owned)
+    return {n: n in owned_set for n in numbers}, version
+
+
+def unclaim_all_for_device(domain_uuid: str, device_id: str) -> tuple[list[str], int]:
+    """
+    Unassign all numbers currently owned by device_id in the domain.
+    Returns (the numbers that were unassigned, assignments_version after the update).
+    """
+    res_map, version = unclaim_retriever_numbers(domain_uuid, None, device_id)
+    return list(res_map), version
 
 
 def get_assignments_version(domain_uuid: str) -> int:
-    doc = clients.find_one({"domain_uuid": domain_uuid}, {"assignments_version": 1})
+    doc = clients.find_one(
+        {"domain_uuid": domain_uuid}, {"_id": 0, "assignments_version": 1}
+    )
     return int((doc or {}).get("assignments_version", 0))
 
 
@@ -344,14 +633,14 @@ def get_assignments_version(domain_uuid: str) -> int:
 
 
 def get_fax_numbers(domain_uuid: str) -> list[str]:
-    doc = clients.find_one({"domain_uuid": domain_uuid})
+    doc = clients.find_one({"domain_uuid": domain_uuid}, {"_id": 0, "all_fax_numbers": 1})
     return doc.get("all_fax_numbers", []) if doc else []
 
 
 def save_fax_user(fax_user: str, auth_token: str, fax_numbers: list[str]) -> str:
     domain = fax_user.strip().lower()
     token = auth_token.strip().upper()
-    existing = clients.find_one({"fax_user": domain})
+    existing = clients.find_one({"fax_user": domain}, {"_id": 0, "domain_uuid": 1})
 
     if existing:
         # Update in place
@@ -360,6 +649,7 @@ def save_fax_user(fax_user: str, auth_token: str, fax_numbers: list[str]) -> str
             {"$set": {"authentication_token": token, "all_fax_numbers": fax_numbers}},
         )
         domain_uuid = existing.get("domain_uuid")
+        invalidate_client_cache(domain_uuid)
         log_event_v2(
             event_type="client_updated",
             domain_uuid=domain_uuid,
@@ -399,18 +689,19 @@ def save_fax_user(fax_user: str, auth_token: str, fax_numbers: list[str]) -> str
     return domain_uuid
 
 
-def get_all_clients() -> list[dict]:
-    return list(clients.find())
+def get_all_clients(projection: Optional[dict] = None) -> list[dict]:
+    return list(clients.find({}, projection))
 
 
 def toggle_client_active(domain_uuid: str) -> bool:
-    doc = clients.find_one({"domain_uuid": domain_uuid})
+    doc = clients.find_one({"domain_uuid": domain_uuid}, {"_id": 0, "active": 1})
     if not doc:
         return False
     new_state = not doc.get("active", True)
     result = clients.update_one(
         {"domain_uuid": domain_uuid}, {"$set": {"active": new_state}}
     )
+    invalidate_client_cache(domain_uuid)
     log_event_v2(
         event_type="client_toggled",
         domain_uuid=domain_uuid,
@@ -428,6 +719,7 @@ def toggle_client_active(domain_uuid: str) -> bool:
 
 def delete_client(domain_uuid: str) -> bool:
     result = clients.delete_one({"domain_uuid": domain_uuid})
+    invalidate_client_cache(domain_uuid)
     log_event_v2(
         event_type="client_deleted",
         domain_uuid=domain_uuid,
@@ -449,7 +741,7 @@ def register_device(domain_uuid: str, device_id: str):
 
 
 def get_known_devices(domain_uuid: str) -> list[str]:
-    doc = clients.find_one({"domain_uuid": domain_uuid})
+    doc = clients.find_one({"domain_uuid": domain_uuid}, {"_id": 0, "known_devices": 1})
     return doc.get("known_devices", []) if doc else []
 
 
@@ -479,12 +771,17 @@ def update_client_retriever_assignment(
 ) -> bool:
     """
     Deprecated in v2.2; retain for admin overrides via GUI if needed.
-    Prefer claim_retriever_number for runtime arbitration.
+    Prefer claim_retriever_numbers for runtime arbitration.
     """
     result = clients.update_one(
         {"fax_user": fax_user.lower().strip()},
-        {"$set": {"retriever_assignments": updated_assignments}},
+        {
+            "$set": {"retriever_assignments": updated_assignments},
+            "$inc": {"assignments_version": 1},
+        },
     )
+    # Keyed by fax_user rather than domain_uuid; admin overrides are rare, so drop all.
+    invalidate_client_cache()
     if result.modified_count > 0:
         log_event_v2(
             event_type="retriever_updated",
@@ -764,7 +1061,8 @@ def add_downloaded_ids(domain_uuid: str, ids: list[str]) -> dict:
 def remove_downloaded_ids(domain_uuid: str, ids: list[str]) -> dict:
     """Remove fax IDs from the download history for a domain.
 
-    Used when faxes are deleted from SkySwitch per retention policy.
+    Used when faxes are deleted from SkySwitch per retention policy. Source tags for
+    the same IDs are deleted as well.
     Returns dict: {"removed": int, "total": int}
     """
     if not ids:
@@ -795,6 +1093,8 @@ def remove_downloaded_ids(domain_uuid: str, ids: list[str]) -> dict:
                 "$set": {"updated_at": now},
             },
         )
+    # Tags share the history lifecycle: once a fax leaves history its tag is dead weight
+    delete_fax_tags(domain_uuid, list(norm))
 
     new_total = len(existing) - len(actually_removed)
     return {"removed": len(actually_removed), "total": max(0, new_total)}
@@ -840,14 +1140,27 @@ def count_downloaded_ids(domain_uuid: str) -> int:
 
 # ─── Fax source tags ─────────────────────────────────────────────────
 
+# Upper bound on fax IDs per $in query; lookups larger than a page of history
+# are split into several indexed queries rather than one huge one.
+FAX_TAG_LOOKUP_BATCH = 500
+
+# Whether legacy per-domain tag maps (doc_type="tags") may still exist. None until
+# checked; set False once migrate_fax_tag_maps (or the first check) finds none. Nothing
+# writes that shape any more, so afterwards lookups skip the legacy fallback for good.
+_legacy_tag_maps: Optional[bool] = None
+
+
+def _tag_filter(domain_uuid: str, fax_id: str) -> dict:
+    return {"domain_uuid": domain_uuid, "doc_type": "tag", "fax_id": fax_id}
+
 
 def upsert_fax_tags(domain_uuid: str, tags: list[dict]) -> dict:
     """Upsert integration source tags for fax IDs.
 
     Each tag: {"fax_id": "12345", "source": "crx"|"lrx", "device_id": "...", ...}
 
-    Document schema per domain:
-      {domain_uuid, doc_type: "tags", tags: {<fax_id>: {source, device_id, tagged_at, ...}}}
+    Document schema: one document per (domain, fax):
+      {domain_uuid, doc_type: "tag", fax_id, source, device_id, tagged_at, ...}
 
     Returns {"upserted": <count>}.
     """
@@ -855,7 +1168,7 @@ def upsert_fax_tags(domain_uuid: str, tags: list[dict]) -> dict:
         return {"upserted": 0}
 
     now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    set_ops = {}
+    ops: dict[str, UpdateOne] = {}
     for t in tags:
         fid = str(t.get("fax_id", "")).strip()
         if not fid:
@@ -867,42 +1180,128 @@ def upsert_fax_tags(domain_uuid: str, tags: list[dict]) -> dict:
         }
         # Preserve extra fields (record_id, etc.)
         for k, v in t.items():
-            if k not in ("fax_id", "source", "device_id"):
+            if k not in ("fax_id", "source", "device_id", "domain_uuid", "doc_type"):
                 entry[k] = v
-        set_ops[f"tags.{fid}"] = entry
+        # Last tag for a fax_id wins, matching the previous map semantics
+        ops[fid] = UpdateOne(_tag_filter(domain_uuid, fid), {"$set": entry}, upsert=True)
 
-    if not set_ops:
+    if not ops:
         return {"upserted": 0}
 
     try:
-        fax_tags.update_one(
-            {"domain_uuid": domain_uuid, "doc_type": "tags"},
-            {"$set": set_ops, "$setOnInsert": {"domain_uuid": domain_uuid, "doc_type": "tags"}},
-            upsert=True,
-        )
-        return {"upserted": len(set_ops)}
+        fax_tags.bulk_write(list(ops.values()), ordered=False)
+        return {"upserted": len(ops)}
     except Exception:
         return {"upserted": 0}
 
 
+def _legacy_tag_maps_remain() -> bool:
+    global _legacy_tag_maps
+    if _legacy_tag_maps is None:
+        try:
+            _legacy_tag_maps = fax_tags.count_documents({"doc_type": "tags"}, limit=1) > 0
+        except Exception:
+            return True
+    return _legacy_tag_maps
+
+
+def _legacy_fax_tags(domain_uuid: str, fax_ids: list[str]) -> dict[str, dict]:
+    """Read specific entries from a not-yet-migrated per-domain tags map."""
+    doc = fax_tags.find_one(
+        {"domain_uuid": domain_uuid, "doc_type": "tags"},
+        {"_id": 0, **{f"tags.{fid}": 1 for fid in fax_ids}},
+    )
+    found = (doc or {}).get("tags")
+    return found if isinstance(found, dict) else {}
+
+
 def get_fax_tags(domain_uuid: str, fax_ids: list[str] | None = None) -> dict[str, dict]:
     """Get source tags for fax IDs.
 
-    If fax_ids is None, returns all tags for the domain.
+    Looks up per-fax tag documents with indexed $in queries of at most
+    FAX_TAG_LOOKUP_BATCH IDs; untagged IDs are looked up in the legacy map only
+    while unmigrated maps remain. If fax_ids is None, returns all tags for the domain.
     Returns {<fax_id>: {source, device_id, tagged_at, ...}}.
     """
+    projection = {"_id": 0, "domain_uuid": 0, "doc_type": 0}
+    out: dict[str, dict] = {}
     try:
-        doc = fax_tags.find_one(
-            {"domain_uuid": domain_uuid, "doc_type": "tags"},
-            {"tags": 1},
-        )
-        if not doc or not isinstance(doc.get("tags"), dict):
-            return {}
-
-        all_tags = doc["tags"]
         if fax_ids is None:
-            return all_tags
-
-        return {fid: all_tags[fid] for fid in fax_ids if fid in all_tags}
+            for doc in fax_tags.find({"domain_uuid": domain_uuid, "doc_type": "tag"}, projection):
+                out[doc.pop("fax_id")] = doc
+            return out
+
+        ids = [fid for fid in dict.fromkeys(fax_ids) if fid]
+        legacy = _legacy_tag_maps_remain()
+        for i in range(0, len(ids), FAX_TAG_LOOKUP_BATCH):
+            chunk = ids[i : i + FAX_TAG_LOOKUP_BATCH]
+            for doc in fax_tags.find(
+                {"domain_uuid": domain_uuid, "doc_type": "tag", "fax_id": {"$in": chunk}},
+                projection,
+            ):
+                out[doc.pop("fax_id")] = doc
+            if not legacy:
+                continue
+            # Fall back to the legacy map for anything the migration has not reached yet
+            missing = [
+                fid
+                for fid in chunk
+                if fid not in out and "." not in fid and not fid.startswith("$")
+            ]
+            if missing:
+                out.update(_legacy_fax_tags(domain_uuid, missing))
+        return out
     except Exception:
-        return {}
+        return out
+
+
+def delete_fax_tags(domain_uuid: str, fax_ids: list[str]) -> int:
+    """Delete tag documents for fax IDs (used when history entries are pruned)."""
+    removed = 0
+    ids = [fid for fid in dict.fromkeys(fax_ids) if fid]
+    for i in range(0, len(ids), FAX_TAG_LOOKUP_BATCH):
+        chunk = ids[i : i + FAX_TAG_LOOKUP_BATCH]
+        try:
+            res = fax_tags.delete_many(
+                {"domain_uuid": domain_uuid, "doc_type": "tag", "fax_id": {"$in": chunk}}
+            )
+            removed += res.deleted_count
+        except Exception:
+            pass
+    return removed
+
+
+def migrate_fax_tag_maps(batch_size: int = 1000) -> int:
+    """Split legacy per-domain tag maps (doc_type="tags") into per-fax documents.
+
+    Existing per-fax documents take precedence ($setOnInsert). The legacy document
+    is removed once all of its entries have been written. Idempotent; returns the
+    number of tag entries migrated. Clears the legacy-lookup flag once no legacy
+    maps remain.
+    """
+    global _legacy_tag_maps
+    migrated = 0
+    for legacy in fax_tags.find({"doc_type": "tags"}):
+        domain_uuid = legacy.get("domain_uuid")
+        entries = legacy.get("tags") if isinstance(legacy.get("tags"), dict) else {}
+        ops = []
+        for fid, entry in entries.items():
+            if not isinstance(entry, dict):
+                continue
+            ops.append(
+                UpdateOne(
+                    _tag_filter(domain_uuid, fid),
+                    {"$setOnInsert": {**entry, **_tag_filter(domain_uuid, fid)}},
+                    upsert=True,
+                )
+            )
+            if len(ops) >= batch_size:
+                fax_tags.bulk_write(ops, ordered=False)
+                migrated += len(ops)
+                ops = []
+        if ops:
+            fax_tags.bulk_write(ops, ordered=False)
+            migrated += len(ops)
+        fax_tags.delete_one({"_id": legacy["_id"]})
+    _legacy_tag_maps = fax_tags.count_documents({"doc_type": "tags"}, limit=1) > 0
+    return migrated
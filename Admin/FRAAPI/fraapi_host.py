@@ -63,6 +63,26 @@ class TokenRefresher(threading.Thread):
                 self._stop.wait(self._interval)
 
 
+class LogRollupWorker(threading.Thread):
+    """Periodically rolls raw log events into daily counters before TTL expiry removes them."""
+
+    def __init__(self, stop_event: threading.Event, interval_seconds: int = 3600):
+        super().__init__(daemon=True)
+        self._stop = stop_event
+        self._interval = interval_seconds
+
+    def run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                from tasks.log_rollup import rollup_log_events
+
+                rollup_log_events()
+            except Exception as e:
+                logging.getLogger("fraapi.host").warning(f"Log rollup failed: {e}")
+            finally:
+                self._stop.wait(self._interval)
+
+
 class UvicornThread(threading.Thread):
     """Runs uvicorn programmatically and allows cooperative shutdown."""
 
@@ -456,6 +476,7 @@ class HostWindow:  # built without subclassing to avoid hard dependency at impor
         self._stop_evt = threading.Event()
         self._server_thread: Optional[UvicornThread] = None
         self._refresher: Optional[TokenRefresher] = None
+        self._rollups: Optional[LogRollupWorker] = None
         self._running = False
 
         # Configure logging to feed the queue
@@ -525,6 +546,9 @@ class HostWindow:  # built without subclassing to avoid hard dependency at impor
         # Start token refresher
         self._refresher = TokenRefresher(self._stop_evt)
         self._refresher.start()
+        # Start log rollups
+        self._rollups = LogRollupWorker(self._stop_evt)
+        self._rollups.start()
         self._running = True
         try:
             self._win.lbl_status.setText("Status: Running")
@@ -542,6 +566,8 @@ class HostWindow:  # built without subclassing to avoid hard dependency at impor
                 self._server_thread.join(timeout=5)
             if self._refresher:
                 self._refresher.join(timeout=5)
+            if self._rollups:
+                self._rollups.join(timeout=5)
         except Exception:
             pass
         self._running = False
@@ -634,6 +660,8 @@ def run_headless(port: int, mongo_uri: Optional[str]) -> None:
     # Start token refresher in background
     refresher = TokenRefresher(stop_evt)
     refresher.start()
+    rollups = LogRollupWorker(stop_evt)
+    rollups.start()
     try:
         uvicorn.run(APP_PATH, host="0.0.0.0", port=port, log_level="info")
     except KeyboardInterrupt:
@@ -642,6 +670,7 @@ def run_headless(port: int, mongo_uri: Optional[str]) -> None:
         stop_evt.set()
         try:
             refresher.join(timeout=5)
+            rollups.join(timeout=5)
         except Exception:
             pass
 
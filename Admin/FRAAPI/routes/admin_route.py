@@ -13,7 +13,9 @@ from typing import Any, Dict, List, Optional
 
 from auth.crypto_utils import decrypt_blob
 from db.mongo_interface import resellers  # Collection for list/delete
-from db.mongo_interface import (delete_client, get_all_clients,
+from db.mongo_interface import (CLIENT_PROJECTION_ADMIN_FULL,
+                                CLIENT_PROJECTION_ADMIN_LIST, delete_client,
+                                get_all_clients,
                                 get_cached_bearer, get_fax_numbers,
                                 get_known_devices, get_reseller_blob,
                                 save_fax_user, save_reseller_blob,
@@ -53,7 +55,7 @@ def list_clients() -> List[Dict[str, Any]]:
     Returns all clients with fields needed by the GUI.
     """
     docs = []
-    for d in get_all_clients():
+    for d in get_all_clients(CLIENT_PROJECTION_ADMIN_LIST):
         docs.append(
             {
                 "fax_user": d.get("fax_user"),
@@ -74,10 +76,10 @@ def list_clients_full() -> List[Dict[str, Any]]:
     in a single call, to avoid N+1 requests from the GUI.
     """
     out: List[Dict[str, Any]] = []
-    for d in get_all_clients():
+    for d in get_all_clients(CLIENT_PROJECTION_ADMIN_FULL):
         fax_user = d.get("fax_user")
         domain_uuid = d.get("domain_uuid")
-        devices = get_known_devices(domain_uuid) or []
+        devices = d.get("known_devices") or []
         bearer = get_cached_bearer(fax_user) or {}
         out.append(
             {
@@ -193,8 +195,16 @@ def reseller_delete(reseller_id: str) -> Dict[str, Any]:
 
 
 # -------- Logs (admin) --------
+import time as _time
+from datetime import datetime as _log_dt, timezone as _log_tz
+
 from core.logger import audit_collection as _audit_coll
 from core.logger import log_collection as _access_coll
+from core.logger import query_events, query_rollups
+
+LOG_PAGE_MAX = 500
+_EVENT_TYPES_TTL_SECONDS = 60.0
+_event_types_cache: Dict[str, tuple] = {}
 
 
 def _resolve_log_collection(name: str):
@@ -205,12 +215,39 @@ def _resolve_log_collection(name: str):
     return _access_coll
 
 
+def _parse_log_time(value: Optional[str], field: str):
+    if not value or not value.strip():
+        return None
+    try:
+        ts = _log_dt.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST, detail=f"{field} must be an ISO-8601 timestamp"
+        )
+    return ts if ts.tzinfo else ts.replace(tzinfo=_log_tz.utc)
+
+
+def _log_entry_out(doc: Dict[str, Any]) -> Dict[str, Any]:
+    d = dict(doc)
+    d.pop("_id", None)
+    ts = d.get("timestamp")
+    if isinstance(ts, _log_dt):
+        # Mongo returns naive UTC datetimes; keep the wire format an ISO string
+        d["timestamp"] = (ts if ts.tzinfo else ts.replace(tzinfo=_log_tz.utc)).isoformat()
+    return d
+
+
 @router.get("/logs/types", dependencies=[Depends(require_admin)])
 def log_event_types(collection: str = "access_logs") -> Dict[str, Any]:
     coll = _resolve_log_collection(collection)
+    key = coll.name
+    hit = _event_types_cache.get(key)
+    if hit and hit[0] > _time.monotonic():
+        return {"event_types": hit[1]}
     try:
         types = coll.distinct("event_type")
         types = sorted([t for t in types if isinstance(t, str)])
+        _event_types_cache[key] = (_time.monotonic() + _EVENT_TYPES_TTL_SECONDS, types)
     except Exception:
         types = []
     return {"event_types": types}
@@ -218,22 +255,76 @@ def log_event_types(collection: str = "access_logs") -> Dict[str, Any]:
 
 @router.get("/logs", dependencies=[Depends(require_admin)])
 def list_logs(
-    collection: str = "access_logs", event_type: Optional[str] = None, limit: int = 200
+    collection: str = "access_logs",
+    event_type: Optional[str] = None,
+    limit: int = 200,
+    domain_uuid: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    q: Optional[str] = None,
+    cursor: Optional[str] = None,
 ) -> Dict[str, Any]:
+    """
+    Returns one page of log entries, newest first. Pass the returned next_cursor back
+    as cursor to fetch the following page; next_cursor is null on the last page.
+    """
     coll = _resolve_log_collection(collection)
+    since_dt = _parse_log_time(since, "since")
+    until_dt = _parse_log_time(until, "until")
+    limit = max(1, min(int(limit or 200), LOG_PAGE_MAX))
     try:
-        q = {}
-        if event_type and event_type.strip() and event_type != "<All>":
-            q["event_type"] = event_type.strip()
-        cursor = coll.find(q).sort("timestamp", -1).limit(int(limit or 200))
-        out: List[Dict[str, Any]] = []
-        for doc in cursor:
-            d = dict(doc)
-            d.pop("_id", None)
-            out.append(d)
-        return {"entries": out}
+        et = (event_type or "").strip()
+        docs, next_cursor = query_events(
+            coll,
+            event_type=et if et and et != "<All>" else None,
+            domain_uuid=(domain_uuid or "").strip() or None,
+            since=since_dt,
+            until=until_dt,
+            text=(q or "").strip() or None,
+            cursor=(cursor or "").strip() or None,
+            limit=limit,
+        )
+        return {"entries": [_log_entry_out(d) for d in docs], "next_cursor": next_cursor}
+    except ValueError:
+        raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    except Exception:
+        return {"entries": [], "next_cursor": None}
+
+
+@router.get("/logs/rollups", dependencies=[Depends(require_admin)])
+def list_log_rollups(
+    collection: str = "access_logs",
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    event_type: Optional[str] = None,
+    domain_uuid: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Returns per-day event counters (by event_type and domain) for dashboards. Counters
+    outlive raw events, which expire per collection retention. since/until are inclusive
+    YYYY-MM-DD days.
+    """
+    coll = _resolve_log_collection(collection)
+    for field, value in (("since", since), ("until", until)):
+        if value:
+            try:
+                _log_dt.strptime(value, "%Y-%m-%d")
+            except ValueError:
+                raise HTTPException(
+                    status_code=HTTP_400_BAD_REQUEST, detail=f"{field} must be YYYY-MM-DD"
+                )
+    et = (event_type or "").strip()
+    try:
+        rows = query_rollups(
+            coll.name,
+            since_day=since,
+            until_day=until,
+            event_type=et if et and et != "<All>" else None,
+            domain_uuid=(domain_uuid or "").strip() or None,
+        )
     except Exception:
-        return {"entries": []}
+        rows = []
+    return {"rollups": rows}
 
 
 # -------- Integrations (admin) --------
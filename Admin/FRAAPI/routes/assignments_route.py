@@ -8,16 +8,13 @@ from auth.token_utils import (TokenError, decode_jwt_token, generate_jwt_token,
                               require_scopes)
 from config import JWT_TTL_SECONDS, SYSTEM_ACTOR
 from db.mongo_interface import \
-    get_assignments_version  # monotonic version getter
-from db.mongo_interface import get_client_by_uuid  # domain lookup
+    get_client_assignments  # cached, projected domain lookup
 from db.mongo_interface import \
-    unclaim_all_for_device  # bulk unclaim for a device
+    unclaim_all_for_device  # bulk unclaim for a device (returns new version)
 from db.mongo_interface import \
-    unclaim_retriever_number  # atomic per-number unclaim
+    unclaim_retriever_numbers  # atomic multi-number unclaim (returns new version)
 from db.mongo_interface import \
-    unclaim_retriever_numbers  # multi-number unclaim
-from db.mongo_interface import \
-    claim_retriever_number  # atomic per-number claim (returns True if assigned to caller)
+    claim_retriever_numbers  # atomic multi-number claim (returns owners and new version)
 from fastapi import APIRouter, Header, HTTPException, Request
 from pydantic import BaseModel, Field, validator
 from starlette.status import (HTTP_400_BAD_REQUEST, HTTP_401_UNAUTHORIZED,
@@ -163,7 +160,7 @@ async def list_assignments(request: Request, authorization: str = Header(None)):
     device_id = payload.get("device_id")
 
     # Domain lookup
-    client = get_client_by_uuid(domain_uuid)
+    client = get_client_assignments(domain_uuid)
     if not client:
         _err(
             HTTP_404_NOT_FOUND,
@@ -177,16 +174,16 @@ async def list_assignments(request: Request, authorization: str = Header(None)):
             obj_op="lookup",
         )
 
-    domain_numbers = list(client.get("all_fax_numbers", []) or [])
-    assignments = client.get("retriever_assignments") or {}  # {number: owner_device_id}
+    domain_numbers = client["all_fax_numbers"]
+    assignments = client["retriever_assignments"]  # {number: owner_device_id}
 
     results = {}
     for n in domain_numbers:
         owner = assignments.get(n)
         results[n] = {"owner": owner if owner else None}
 
-    version = get_assignments_version(domain_uuid)
-    return {"results": results, "version": version}
+    # Version comes from the same snapshot as the assignments map
+    return {"results": results, "version": client["assignments_version"]}
 
 
 @router.post("/assignments.request")
@@ -247,7 +244,7 @@ async def request_assignments(
         )
 
     # Domain lookup
-    client = get_client_by_uuid(domain_uuid)
+    client = get_client_assignments(domain_uuid)
     if not client:
         _err(
             HTTP_404_NOT_FOUND,
@@ -263,7 +260,7 @@ async def request_assignments(
 
     # Validate + coerce numbers, ensure in-domain
     numbers = _parse_numbers(body.numbers)
-    domain_numbers = set(client.get("all_fax_numbers", []) or [])
+    domain_numbers = set(client["all_fax_numbers"])
     out_of_domain = [n for n in numbers if n not in domain_numbers]
     if out_of_domain:
         _err(
@@ -278,21 +275,29 @@ async def request_assignments(
             payload={"invalid_numbers": out_of_domain},
         )
 
-    # Per-number arbitration (atomic in DB)
+    # Bulk arbitration: one atomic update claims every unassigned number
+    claimed = claim_retriever_numbers(domain_uuid, numbers, jwt_device_id)
+    if claimed is None:
+        _err(
+            HTTP_404_NOT_FOUND,
+            "ERR_DOMAIN_NOT_FOUND",
+            "Domain not found",
+            ip=ip,
+            domain_uuid=domain_uuid,
+            device_id=jwt_device_id,
+            event_type="client_not_found",
+            obj_type="client",
+            obj_op="lookup",
+        )
+    owners, version = claimed
     results = {}
     for n in numbers:
-        assigned = claim_retriever_number(domain_uuid, n, jwt_device_id)
-        if assigned:
+        owner = owners.get(n)
+        if owner == jwt_device_id:
+            # Newly claimed or already ours (idempotent)
             results[n] = {"status": "allowed", "owner": jwt_device_id}
         else:
-            # Atomic claim failed — read current owner to determine reason
-            fresh = get_client_by_uuid(domain_uuid) or {}
-            owner = (fresh.get("retriever_assignments") or {}).get(n)
-            if owner == jwt_device_id:
-                # We already own it (idempotent)
-                results[n] = {"status": "allowed", "owner": jwt_device_id}
-            else:
-                results[n] = {"status": "denied", "owner": owner or "<unknown>"}
+            results[n] = {"status": "denied", "owner": owner or "<unknown>"}
 
     log_event_v2(
         event_type="assignments_processed",
@@ -308,8 +313,6 @@ async def request_assignments(
         audit=True,
     )
 
-    version = get_assignments_version(domain_uuid)
-
     # If at least one assignment was allowed and the current token lacks the unregister scope,
     # issue an upgraded JWT that includes "assignments.unregister" while preserving expiration.
     allowed = [n for n, r in results.items() if (r or {}).get("status") == "allowed"]
@@ -400,7 +403,7 @@ async def unregister_assignments(
         )
 
     # Domain lookup
-    client = get_client_by_uuid(domain_uuid)
+    client = get_client_assignments(domain_uuid)
     if not client:
         _err(
             HTTP_404_NOT_FOUND,
@@ -414,12 +417,12 @@ async def unregister_assignments(
             obj_op="lookup",
         )
 
-    domain_numbers = set(client.get("all_fax_numbers", []) or [])
+    domain_numbers = set(client["all_fax_numbers"])
 
     results = {}
     if body.numbers is None:
         # Bulk unregister all numbers for this device
-        changed = unclaim_all_for_device(domain_uuid, jwt_device_id)
+        changed, version = unclaim_all_for_device(domain_uuid, jwt_device_id)
         for n in changed:
             results[n] = {"status": "unregistered"}
     else:
@@ -437,7 +440,7 @@ async def unregister_assignments(
                 obj_op="validate",
                 payload={"invalid_numbers": out_of_domain},
             )
-        res_map = unclaim_retriever_numbers(domain_uuid, numbers, jwt_device_id)
+        res_map, version = unclaim_retriever_numbers(domain_uuid, numbers, jwt_device_id)
         for n, ok in res_map.items():
             results[n] = {"status": "unregistered" if ok else "not_owner"}
 
@@ -455,5 +458,4 @@ async def unregister_assignments(
         audit=True,
     )
 
-    version = get_assignments_version(domain_uuid)
     return {"results": results, "version": version}
@@ -11,8 +11,9 @@ from auth.crypto_utils import CryptoError, decrypt_blob
 from auth.token_utils import TokenError, decode_jwt_token, require_scopes
 from config import (BEARER_REFRESH_OFFSET, SKYSWITCH_TOKEN_URL, SYSTEM_ACTOR,
                     TOKEN_GRANT_TYPE)
-from db.mongo_interface import (get_cached_bearer, get_client_by_uuid,
-                                get_reseller_blob, save_bearer_token)
+from db.mongo_interface import (CLIENT_PROJECTION_INIT, get_cached_bearer,
+                                get_client_by_uuid, get_reseller_blob,
+                                save_bearer_token)
 from fastapi import APIRouter, Header, HTTPException, Request
 from starlette.status import (HTTP_401_UNAUTHORIZED, HTTP_403_FORBIDDEN,
                               HTTP_404_NOT_FOUND,
@@ -93,7 +94,7 @@ async def get_bearer_token(request: Request, authorization: str = Header(None)):
     device_id = payload.get("device_id")
 
     # --- Domain lookup ---
-    client = get_client_by_uuid(domain_uuid)
+    client = get_client_by_uuid(domain_uuid, CLIENT_PROJECTION_INIT)
     if not client:
         err(
             HTTP_404_NOT_FOUND,
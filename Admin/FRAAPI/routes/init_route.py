@@ -3,7 +3,8 @@ from datetime import datetime, timedelta, timezone
 
 from auth.token_utils import generate_jwt_token
 from config import JWT_TTL_SECONDS, SYSTEM_ACTOR
-from db.mongo_interface import get_client_by_auth, register_device, is_libertyrx_enabled
+from db.mongo_interface import (CLIENT_PROJECTION_INIT, get_client_by_auth,
+                                is_libertyrx_enabled, register_device)
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 from starlette.status import HTTP_401_UNAUTHORIZED
@@ -48,7 +49,7 @@ async def initialize_client(req: InitRequest, request: Request):
         audit=False,
     )
 
-    client = get_client_by_auth(auth_token, fax_user)
+    client = get_client_by_auth(auth_token, fax_user, CLIENT_PROJECTION_INIT)
     if not client:
         log_event_v2(
             event_type="init_denied",
@@ -21,6 +21,7 @@ from typing import Any, Optional
 
 from auth.token_utils import TokenError, decode_jwt_token, require_scopes, generate_jwt_token
 from db.mongo_interface import (
+    CLIENT_PROJECTION_IDENTITY,
     get_client_by_uuid,
     get_reseller_liberty_basic,
     resellers,
@@ -257,7 +258,7 @@ async def device_get_vendor_basic(request: Request, authorization: str = Header(
     domain_uuid = payload.get("sub")
     device_id = payload.get("device_id")
 
-    client = get_client_by_uuid(domain_uuid)
+    client = get_client_by_uuid(domain_uuid, CLIENT_PROJECTION_IDENTITY)
     if not client:
         err(
             HTTP_404_NOT_FOUND,
@@ -0,0 +1,54 @@
+# log_rollup.py
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from config import SYSTEM_ACTOR
+
+from core.logger import (audit_collection, log_collection, log_event_v2,
+                         rollup_collection, rollup_day)
+
+
+def _first_day_to_roll(coll) -> Optional[datetime]:
+    """Resume at the last rolled day (it may have been partial), else the oldest event."""
+    last = rollup_collection.find_one(
+        {"collection": coll.name}, {"day": 1}, sort=[("day", -1)]
+    )
+    if last and last.get("day"):
+        return datetime.strptime(last["day"], "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    oldest = coll.find_one(
+        {"timestamp": {"$type": "date"}}, {"timestamp": 1}, sort=[("timestamp", 1)]
+    )
+    if not oldest:
+        return None
+    ts = oldest["timestamp"]
+    return datetime(ts.year, ts.month, ts.day, tzinfo=timezone.utc)
+
+
+def rollup_log_events():
+    """Roll raw access/audit events into per-day counters up to and including today.
+
+    Runs periodically from the host (well inside the TTL retention window), so every
+    day is counted before its raw events expire.
+    """
+    now = datetime.now(timezone.utc)
+    today = datetime(now.year, now.month, now.day, tzinfo=timezone.utc)
+    for coll in (log_collection, audit_collection):
+        day = _first_day_to_roll(coll)
+        if day is None:
+            continue
+        rolled = 0
+        while day <= today:
+            rollup_day(coll, day)
+            day += timedelta(days=1)
+            rolled += 1
+        if rolled > 1:
+            log_event_v2(
+                event_type="log_rollup_completed",
+                note=f"Rolled up {rolled} day(s) of {coll.name}",
+                actor_component=SYSTEM_ACTOR,
+                actor_function="rollup_log_events",
+                object_type="log_rollups",
+                object_operation="write",
+                payload={"collection": coll.name, "days": rolled},
+            )
@@ -5,8 +5,9 @@ from datetime import datetime, timedelta, timezone
 import requests
 from auth.crypto_utils import CryptoError, decrypt_blob
 from config import SKYSWITCH_TOKEN_URL, SYSTEM_ACTOR, TOKEN_GRANT_TYPE
-from db.mongo_interface import (get_all_clients, get_cached_bearer,
-                                get_reseller_blob, save_bearer_token)
+from db.mongo_interface import (CLIENT_PROJECTION_INIT, get_all_clients,
+                                get_cached_bearer, get_reseller_blob,
+                                save_bearer_token)
 
 from core.logger import log_event_v2
 from utils.fax_user_utils import parse_reseller_id
@@ -41,7 +42,7 @@ def token_expiring_soon(upstream_expires_at):
 
 
 def refresh_bearer_tokens():
-    for client in get_all_clients():
+    for client in get_all_clients(CLIENT_PROJECTION_INIT):
         if not client.get("active"):
             continue
 
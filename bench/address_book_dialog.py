@@ -0,0 +1,123 @@
+"""
+Benchmark: Address Book dialog with 5,000 synthetic contacts.
+
+Writes a synthetic address_book.json to a temporary directory and points
+AddressBookManager at it through FR_ADDRESS_BOOK_FILE, so the real address book
+is never touched. It then reports:
+
+- AddressBookManager load (normalize, dedupe, phone index);
+- AddressBookDialog construction (indexing, card data, both grid models);
+- time to first paint of the Contacts grid after show();
+- one debounced search pass and a switch to the Companies tab.
+
+Usage (from the repository root):
+    python bench/address_book_dialog.py --contacts 5000
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+FIRST = ("Alex", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie", "Avery", "Quinn", "Drew")
+LAST = ("Smith", "Nguyen", "Garcia", "Patel", "Johnson", "Kim", "Brown", "Lopez", "Clark", "Young")
+COMPANY = ("Northside Clinic", "Lakeview Pharmacy", "Main St Medical", "Valley Health", "")
+
+
+def synthetic_contacts(count: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    contacts = []
+    for i in range(count):
+        name = f"{rng.choice(FIRST)} {rng.choice(LAST)} {i}"
+        contacts.append({
+            "name": name,
+            "phone": f"{rng.randint(200, 999)}{rng.randint(2000000, 9999999)}",
+            "phone1": f"{rng.randint(200, 999)}{rng.randint(2000000, 9999999)}" if rng.random() < 0.3 else "",
+            "company": rng.choice(COMPANY),
+            "email": f"user{i}@example.com" if rng.random() < 0.5 else "",
+            "notes": "",
+            "favorite": rng.random() < 0.05,
+        })
+    return contacts
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--contacts", type=int, default=5000)
+    ap.add_argument("--seed", type=int, default=5)
+    ap.add_argument("--search", default="garcia")
+    args = ap.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="bench_abook_")
+    book = os.path.join(tmp, "address_book.json")
+    with open(book, "w", encoding="utf-8") as f:
+        json.dump(synthetic_contacts(args.contacts, args.seed), f)
+    os.environ["FR_ADDRESS_BOOK_FILE"] = book
+
+    from PyQt5.QtCore import QEvent, QObject
+    from PyQt5.QtWidgets import QApplication
+
+    from core.address_book import AddressBookManager
+    from ui.address_book_dialog import AddressBookDialog
+
+    class FirstPaint(QObject):
+        def __init__(self):
+            super().__init__()
+            self.seen = False
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint:
+                self.seen = True
+            return False
+
+    def pump_until(predicate, timeout: float = 30.0):
+        end = time.perf_counter() + timeout
+        while not predicate() and time.perf_counter() < end:
+            app.processEvents()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    try:
+        t0 = time.perf_counter()
+        manager = AddressBookManager(tmp)
+        t1 = time.perf_counter()
+        dialog = AddressBookDialog(ROOT, manager)
+        t2 = time.perf_counter()
+
+        probe = FirstPaint()
+        dialog.contacts_view.viewport().installEventFilter(probe)
+        t3 = time.perf_counter()
+        dialog.show()
+        pump_until(lambda: probe.seen)
+        t4 = time.perf_counter()
+        dialog.contacts_view.viewport().removeEventFilter(probe)
+
+        dialog.search_bar.blockSignals(True)
+        dialog.search_bar.setText(args.search)
+        dialog.search_bar.blockSignals(False)
+        t5 = time.perf_counter()
+        dialog._on_search_change()
+        app.processEvents()
+        t6 = time.perf_counter()
+        dialog.tabs.setCurrentWidget(dialog.companies_tab)
+        app.processEvents()
+        t7 = time.perf_counter()
+
+        print(f"{len(manager.contacts)} contacts")
+        print(f"AddressBookManager load  {(t1 - t0) * 1000:8.0f} ms")
+        print(f"AddressBookDialog init   {(t2 - t1) * 1000:8.0f} ms")
+        print(f"time to first paint      {(t4 - t3) * 1000:8.0f} ms")
+        print(f"search '{args.search}'          {(t6 - t5) * 1000:8.0f} ms")
+        print(f"companies tab            {(t7 - t6) * 1000:8.0f} ms")
+        dialog.close()
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
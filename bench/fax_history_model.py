@@ -0,0 +1,174 @@
+"""
+Benchmark: fax history list with 5,000 synthetic records.
+
+Builds FaxRecords for synthetic inbound/outbound entries, loads them into
+FaxHistoryModel behind FaxHistoryFilterProxy, and shows them in a QListView
+with FaxHistoryDelegate, wired as in FaxHistoryPanel. It reports:
+
+- record build and model insert time;
+- time to first paint (show() until the viewport's first paint event completes);
+- time for a search-filter pass and for a scroll to the bottom;
+- Python heap allocated by the records and model (tracemalloc), and the process RSS
+  when psutil is installed.
+
+The panel is replaced by a minimal widget that provides the hooks the delegate
+calls (no inbox, no network thumbnails), so only model and painting costs count.
+
+Usage (from the repository root):
+    python bench/fax_history_model.py --records 5000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from PyQt5.QtCore import QEvent, QObject, Qt
+from PyQt5.QtWidgets import QAbstractItemView, QApplication, QListView, QVBoxLayout, QWidget
+
+from ui.widgets.fax_history_view import (FaxHistoryDelegate,
+                                         FaxHistoryFilterProxy,
+                                         FaxHistoryModel, FaxRecord)
+
+STATUSES = ("received", "delivered", "failed", "sending", "queued")
+
+
+def synthetic_entries(count: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    entries = []
+    for i in range(count):
+        inbound = rng.random() < 0.6
+        remote = f"1{rng.randint(200, 999)}{rng.randint(2000000, 9999999)}"
+        local = "15550100100"
+        entries.append({
+            "id": f"bench-{i:06d}",
+            "direction": "Inbound" if inbound else "Outbound",
+            "status": "received" if inbound else rng.choice(STATUSES),
+            "caller_id": remote if inbound else local,
+            "destination": local if inbound else remote,
+            "remote_number": remote,
+            "pages": rng.randint(1, 12),
+            "created_at": (now - timedelta(minutes=7 * i)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        })
+    return entries
+
+
+class _Thumbs:
+    @staticmethod
+    def thumbnail_url_for(_entry):
+        return ""
+
+
+class BenchPanel(QWidget):
+    """The parts of FaxHistoryPanel the model, proxy and delegate use."""
+
+    def __init__(self):
+        super().__init__()
+        self.thumb_helper = _Thumbs()
+        self.model = FaxHistoryModel(self)
+        self.proxy = FaxHistoryFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        self.view = QListView()
+        self.view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.view.setResizeMode(QListView.Adjust)
+        self.view.setUniformItemSizes(True)
+        self.view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.view.setMouseTracking(True)
+        self.delegate = FaxHistoryDelegate(self, self.view)
+        self.view.setItemDelegate(self.delegate)
+        self.view.setModel(self.proxy)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.view)
+        self.resize(900, 1000)
+
+    @staticmethod
+    def _resolve_local_pdf(_entry):
+        return None
+
+
+class _FirstPaint(QObject):
+    """Notes the viewport's first paint event; the view paints it in the same event pass."""
+
+    def __init__(self):
+        super().__init__()
+        self.seen = False
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            self.seen = True
+        return False
+
+
+def _pump_until(app, predicate, timeout: float = 30.0):
+    end = time.perf_counter() + timeout
+    while not predicate() and time.perf_counter() < end:
+        app.processEvents()
+
+
+def _rss_mb():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except Exception:
+        return None
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--records", type=int, default=5000)
+    ap.add_argument("--seed", type=int, default=11)
+    ap.add_argument("--search", default="555")
+    args = ap.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    entries = synthetic_entries(args.records, args.seed)
+    rss_before = _rss_mb()
+    panel = BenchPanel()
+
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    records = [FaxRecord(e) for e in entries]
+    t1 = time.perf_counter()
+    panel.model.add_records(records)
+    t2 = time.perf_counter()
+    heap, heap_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    probe = _FirstPaint()
+    panel.view.viewport().installEventFilter(probe)
+    t3 = time.perf_counter()
+    panel.show()
+    _pump_until(app, lambda: probe.seen)
+    first_paint = time.perf_counter() - t3
+    panel.view.viewport().removeEventFilter(probe)
+
+    t4 = time.perf_counter()
+    panel.proxy.set_filter(args.search, True, True)
+    app.processEvents()
+    t5 = time.perf_counter()
+    panel.view.scrollToBottom()
+    app.processEvents()
+    t6 = time.perf_counter()
+    rss_after = _rss_mb()
+
+    print(f"{args.records} records ({panel.model.rowCount()} rows in model)")
+    print(f"build FaxRecords    {(t1 - t0) * 1000:8.0f} ms")
+    print(f"model.add_records   {(t2 - t1) * 1000:8.0f} ms")
+    print(f"time to first paint {first_paint * 1000:8.0f} ms")
+    print(f"search '{args.search}'        {(t5 - t4) * 1000:8.0f} ms ({panel.proxy.rowCount()} rows)")
+    print(f"scroll to bottom    {(t6 - t5) * 1000:8.0f} ms")
+    print(f"python heap         {heap / (1024 * 1024):8.1f} MB (peak {heap_peak / (1024 * 1024):.1f} MB)")
+    if rss_before is not None and rss_after is not None:
+        print(f"process RSS         {rss_after:8.1f} MB (+{rss_after - rss_before:.1f} MB)")
+    panel.close()
+
+
+if __name__ == "__main__":
+    main()
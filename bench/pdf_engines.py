@@ -0,0 +1,139 @@
+"""
+Benchmark: PDF normalization engines and fax compression on a synthetic scan corpus.
+
+Builds PDFs of noisy grayscale "scanned" pages (Pillow noise plus text-like bars,
+embedded as JPEG through PyMuPDF). Some pages are landscape and some are portrait
+pages stored landscape with /Rotate 90. Each document is run through:
+
+- pymupdf   utils.document_utils._normalize_with_pymupdf
+- pypdf     utils.document_utils._normalize_with_pypdf
+- g4        utils.fax_compression._compress on the PyMuPDF output
+
+It reports the median time and the output size per engine, plus how many pages
+each normalizer leaves displayed landscape (this should be 0).
+
+Usage (from the repository root):
+    python bench/pdf_engines.py --docs 5 --pages 8 --repeat 3
+"""
+import argparse
+import io
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+import fitz  # PyMuPDF
+from PIL import Image, ImageDraw
+
+from utils.document_utils import _normalize_with_pymupdf, _normalize_with_pypdf
+from utils.fax_compression import _compress
+
+LETTER = (612, 792)
+SCAN_DPI = 200
+
+
+def _scan_image(width_pt: float, height_pt: float, rng: random.Random) -> bytes:
+    """JPEG of a grayscale page: paper noise, text-like bars and a speckled margin."""
+    w, h = int(width_pt * SCAN_DPI / 72), int(height_pt * SCAN_DPI / 72)
+    noise = Image.effect_noise((w, h), 24).point(lambda v: 215 + v // 8)
+    draw = ImageDraw.Draw(noise)
+    y = int(h * 0.08)
+    while y < h * 0.9:
+        x = int(w * 0.08)
+        while x < w * 0.9:
+            word = rng.randint(w // 40, w // 12)
+            draw.rectangle([x, y, min(x + word, int(w * 0.92)), y + h // 110], fill=rng.randint(20, 70))
+            x += word + w // 60
+        y += h // 40
+    for _ in range(w * h // 4000):
+        draw.point((rng.randrange(w), rng.randrange(h)), fill=rng.randint(0, 120))
+    out = io.BytesIO()
+    noise.save(out, format="JPEG", quality=85)
+    return out.getvalue()
+
+
+def build_corpus(docs: int, pages: int, seed: int) -> list[bytes]:
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(docs):
+        doc = fitz.open()
+        for i in range(pages):
+            kind = i % 3  # 0 portrait, 1 landscape, 2 portrait stored landscape + /Rotate 90
+            w, h = (LETTER[1], LETTER[0]) if kind else LETTER
+            page = doc.new_page(width=w, height=h)
+            page.insert_image(page.rect, stream=_scan_image(w, h, rng))
+            if kind == 2:
+                page.set_rotation(90)
+        corpus.append(doc.tobytes(garbage=3, deflate=True))
+        doc.close()
+    return corpus
+
+
+def _landscape_pages(path: str) -> int:
+    with fitz.open(path) as doc:
+        return sum(1 for p in doc if p.rect.width > p.rect.height)
+
+
+def _timed(fn, repeat: int):
+    times, result = [], None
+    for _ in range(repeat):
+        if isinstance(result, str) and os.path.exists(result):
+            os.remove(result)
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--docs", type=int, default=5)
+    ap.add_argument("--pages", type=int, default=8)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+
+    corpus = build_corpus(args.docs, args.pages, args.seed)
+    totals = {name: [0.0, 0, 0] for name in ("input", "pymupdf", "pypdf", "g4")}  # secs, bytes, landscape
+    temps = []
+    try:
+        for data in corpus:
+            totals["input"][1] += len(data)
+            for name, fn in (
+                ("pymupdf", lambda: _normalize_with_pymupdf(data, True)),
+                ("pypdf", lambda: _normalize_with_pypdf(data, True)),
+            ):
+                secs, path = _timed(fn, args.repeat)
+                if not path:
+                    print(f"{name}: normalization failed")
+                    continue
+                temps.append(path)
+                totals[name][0] += secs
+                totals[name][1] += os.path.getsize(path)
+                totals[name][2] += _landscape_pages(path)
+                if name == "pymupdf":
+                    secs, (compressed, _pages) = _timed(lambda p=path: _compress(p), args.repeat)
+                    totals["g4"][0] += secs
+                    totals["g4"][1] += len(compressed) if compressed else os.path.getsize(path)
+    finally:
+        for p in temps:
+            try:
+                os.remove(p)
+            except Exception:
+                pass
+
+    n_pages = args.docs * args.pages
+    print(f"{args.docs} docs x {args.pages} pages, median of {args.repeat} run(s)")
+    print(f"{'engine':<10}{'total ms':>12}{'ms/page':>10}{'KB':>12}{'landscape':>11}")
+    for name, (secs, size, landscape) in totals.items():
+        ms = secs * 1000
+        shown = "-" if name in ("input", "g4") else str(landscape)
+        print(f"{name:<10}{ms:>12.0f}{ms / n_pages:>10.1f}{size / 1024:>12.0f}{shown:>11}")
+
+
+if __name__ == "__main__":
+    main()
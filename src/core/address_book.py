@@ -1,6 +1,7 @@
 import json
 import os
 import sys
+import time
 from typing import Optional
 
 
@@ -88,10 +89,17 @@ def _resolve_address_book_path(
 
 
 class AddressBookManager:
+    # Minimum seconds between stat() calls when validating the phone index
+    INDEX_CHECK_INTERVAL = 1.0
+
     def __init__(self, exe_dir, filename="address_book.json"):
         # Resolve to a shared location when launched via SMB; fall back as needed
         self.filename = _resolve_address_book_path(exe_dir, filename)
+        self._phone_index: dict[str, int] = {}
+        self._file_sig = None
+        self._last_check = 0.0
         self.contacts = self.load_contacts()
+        self._rebuild_phone_index()
 
     @staticmethod
     def _sanitize_phone(raw: str) -> str:
@@ -158,9 +166,43 @@ class AddressBookManager:
             result.append(c)
         return result
 
+    def _file_signature(self):
+        try:
+            st = os.stat(self.filename)
+            return (st.st_mtime_ns, st.st_size)
+        except Exception:
+            return None
+
+    def _rebuild_phone_index(self):
+        """Map sanitized phone/phone1 -> contact index. First contact wins, matching
+        the previous linear scan order."""
+        index: dict[str, int] = {}
+        for idx, c in enumerate(self.contacts or []):
+            if c.get("is_placeholder", False):
+                continue
+            for key in ("phone", "phone1"):
+                p = self._sanitize_phone(c.get(key, ""))
+                if p and p not in index:
+                    index[p] = idx
+        self._phone_index = index
+
+    def reload_if_changed(self) -> bool:
+        """Reload contacts only when address_book.json changed on disk (e.g. edited by
+        another client on the share). Returns True when a reload happened."""
+        now = time.monotonic()
+        if now - self._last_check < self.INDEX_CHECK_INTERVAL:
+            return False
+        self._last_check = now
+        sig = self._file_signature()
+        if sig is None or sig == self._file_sig:
+            return False
+        self.refresh_contacts()
+        return True
+
     def load_contacts(self):
         if not os.path.exists(self.filename):
             self._initialize_with_placeholder()
+        self._file_sig = self._file_signature()
 
         try:
             with open(self.filename, "r", encoding="utf-8") as file:
@@ -203,25 +245,26 @@ class AddressBookManager:
         with open(tmp_path, "w", encoding="utf-8") as file:
             json.dump(self.contacts, file, indent=4)
         os.replace(tmp_path, self.filename)
+        self._file_sig = self._file_signature()
+        self._rebuild_phone_index()
 
     def refresh_contacts(self):
         self.contacts = self.load_contacts()
+        self._rebuild_phone_index()
 
     def find_contact_by_phone(self, phone: str):
         """Return (index, contact) for the first contact whose phone or phone1
         matches the sanitized input. If not found, returns (None, None).
+        Uses the phone index, reloading first if the file changed on disk.
         """
         try:
             target = self._sanitize_phone(phone or "")
             if not target:
                 return None, None
-            for idx, c in enumerate(self.contacts or []):
-                if c.get("is_placeholder", False):
-                    continue
-                p0 = self._sanitize_phone(c.get("phone", ""))
-                p1 = self._sanitize_phone(c.get("phone1", ""))
-                if target and (target == p0 or target == p1):
-                    return idx, c
+            self.reload_if_changed()
+            idx = self._phone_index.get(target)
+            if idx is not None and 0 <= idx < len(self.contacts or []):
+                return idx, self.contacts[idx]
         except Exception:
             pass
         return None, None
@@ -0,0 +1,394 @@
+"""
+core/history_cache.py
+
+Local searchable cache of fax history metadata (inbound and outbound).
+- SQLite database stored under <base_dir>/cache/fax_history.db.
+- The receiver and the history panel's fetch thread upsert every listing they
+  see, so the panel can search and page offline without re-downloading pages.
+- Numbers, contact names and statuses are indexed with FTS5 (trigram tokenizer
+  for substring matches); short queries and builds without FTS5 fall back to LIKE.
+- Results are ordered newest-first and paged with a (created_at, key) cursor.
+- Each thread keeps one open connection (WAL, set up once); writes are serialized
+  by a lock, reads run alongside them. query() raises when the cache cannot be
+  read so callers can fall back to the API listing.
+
+Follows repository conventions:
+- typing annotations (Python 3.10+)
+- utils.logging_utils.get_logger
+- Windows-friendly paths
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from utils.logging_utils import get_logger
+
+log = get_logger("history.cache")
+
+_DB_FILENAME = "fax_history.db"
+# Trigram FTS needs at least three characters per term
+_FTS_MIN_CHARS = 3
+_PHONE_TERM = re.compile(r"^[\d()+\-.]*\d[\d()+\-.]*$")
+
+_caches: Dict[str, "HistoryCache"] = {}
+_caches_lock = threading.Lock()
+
+
+def get_history_cache(base_dir: str) -> "HistoryCache":
+    """Shared cache instance for base_dir (one per process)."""
+    key = os.path.normcase(os.path.abspath(base_dir))
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = HistoryCache(base_dir)
+            _caches[key] = cache
+        return cache
+
+
+def _digits(value: str) -> str:
+    return re.sub(r"\D", "", value or "")
+
+
+def _search_numbers(*numbers: str) -> str:
+    """Raw numbers plus digit-only forms with and without the leading country code."""
+    parts: list[str] = []
+    for n in numbers:
+        n = str(n or "").strip()
+        if not n:
+            continue
+        parts.append(n)
+        d = _digits(n)
+        if d:
+            parts.append(d)
+            if len(d) == 11 and d.startswith("1"):
+                parts.append(d[1:])
+    return " ".join(dict.fromkeys(parts))
+
+
+def entry_key(entry: Dict[str, Any], direction: Optional[str] = None) -> Tuple[str, str, str]:
+    """(key, fax_id, direction) for an API entry; key matches FaxRecord.key."""
+    fax_id = str(entry.get("id") or entry.get("fax_id") or entry.get("uuid") or "")
+    d = str(direction or entry.get("direction") or "").lower()
+    return f"{d}:{fax_id}", fax_id, d
+
+
+class HistoryCache:
+    def __init__(self, base_dir: str):
+        self.base_dir = base_dir
+        self.cache_dir = os.path.join(base_dir, "cache")
+        self.db_path = os.path.join(self.cache_dir, _DB_FILENAME)
+        self._conn_lock = threading.Lock()  # serializes writers
+        self._local = threading.local()
+        self.fts_mode: str | None = None  # "trigram", "unicode61" or None (LIKE only)
+        self._ensure_dirs()
+        self._init_db()
+
+    # --- Paths and dirs ---
+    def _ensure_dirs(self):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except Exception:
+            log.exception(f"Failed to create cache dir: {self.cache_dir}")
+
+    # --- DB helpers ---
+    def _connect(self) -> sqlite3.Connection:
+        """This thread's connection, opened on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        """End any transaction a failed statement left open; drop the connection if that fails."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except Exception:
+            self._local.conn = None
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def _init_db(self):
+        with self._conn_lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS faxes (
+                        key TEXT PRIMARY KEY,
+                        fax_id TEXT NOT NULL,
+                        direction TEXT NOT NULL,
+                        caller_id TEXT,
+                        destination TEXT,
+                        remote_number TEXT,
+                        search_numbers TEXT,
+                        contact_name TEXT,
+                        status TEXT,
+                        pages INTEGER,
+                        created_at TEXT NOT NULL,
+                        entry_json TEXT NOT NULL,
+                        updated_at INTEGER NOT NULL
+                    )
+                    """
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_faxes_created ON faxes(created_at)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_faxes_dir_created ON faxes(direction, created_at)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_faxes_fax_id ON faxes(fax_id)")
+                conn.commit()
+                self.fts_mode = self._init_fts(conn)
+            finally:
+                self._release(conn)
+
+    def _init_fts(self, conn: sqlite3.Connection) -> str | None:
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='faxes_fts'"
+        ).fetchone()
+        if row:
+            return "trigram" if "trigram" in (row[0] or "") else "unicode61"
+        for tokenizer in ("trigram", "unicode61"):
+            try:
+                conn.execute(
+                    f"""
+                    CREATE VIRTUAL TABLE faxes_fts USING fts5(
+                        search_numbers, contact_name, status,
+                        content='faxes', content_rowid='rowid', tokenize='{tokenizer}'
+                    )
+                    """
+                )
+                conn.executescript(
+                    """
+                    CREATE TRIGGER IF NOT EXISTS faxes_ai AFTER INSERT ON faxes BEGIN
+                        INSERT INTO faxes_fts(rowid, search_numbers, contact_name, status)
+                        VALUES (new.rowid, new.search_numbers, new.contact_name, new.status);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS faxes_ad AFTER DELETE ON faxes BEGIN
+                        INSERT INTO faxes_fts(faxes_fts, rowid, search_numbers, contact_name, status)
+                        VALUES ('delete', old.rowid, old.search_numbers, old.contact_name, old.status);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS faxes_au AFTER UPDATE ON faxes BEGIN
+                        INSERT INTO faxes_fts(faxes_fts, rowid, search_numbers, contact_name, status)
+                        VALUES ('delete', old.rowid, old.search_numbers, old.contact_name, old.status);
+                        INSERT INTO faxes_fts(rowid, search_numbers, contact_name, status)
+                        VALUES (new.rowid, new.search_numbers, new.contact_name, new.status);
+                    END;
+                    """
+                )
+                conn.execute("INSERT INTO faxes_fts(faxes_fts) VALUES ('rebuild')")
+                conn.commit()
+                return tokenizer
+            except sqlite3.OperationalError:
+                conn.rollback()
+                continue
+        log.info("SQLite FTS5 unavailable; fax history search uses LIKE")
+        return None
+
+    # --- Public API ---
+    def upsert_entries(
+        self,
+        entries: Iterable[Dict[str, Any]],
+        direction: Optional[str] = None,
+        contact_lookup: Optional[Callable[[str], str]] = None,
+    ) -> int:
+        """
+        Insert or refresh API entries. contact_lookup(number) -> display name; when it is
+        not given (e.g. from the receiver) a previously cached name is kept.
+        """
+        now = int(time.time())
+        rows = []
+        for e in entries or []:
+            try:
+                key, fax_id, d = entry_key(e, direction)
+                if not fax_id or not d:
+                    continue
+                caller = str(e.get("caller_id") or "")
+                dest = str(e.get("destination") or "")
+                remote = str(e.get("remote_number") or "")
+                name = ""
+                if contact_lookup:
+                    try:
+                        name = contact_lookup(caller if d == "inbound" else (dest or remote)) or ""
+                    except Exception:
+                        name = ""
+                try:
+                    pages = int(e.get("pages") or 0)
+                except Exception:
+                    pages = 0
+                stored = dict(e)
+                stored.setdefault("direction", d.capitalize())
+                rows.append((
+                    key, fax_id, d, caller, dest, remote,
+                    _search_numbers(caller, dest, remote), name,
+                    str(e.get("status") or ""), pages,
+                    str(e.get("created_at") or ""),
+                    json.dumps(stored, separators=(",", ":")), now,
+                ))
+            except Exception:
+                continue
+        if not rows:
+            return 0
+        with self._conn_lock:
+            conn = self._connect()
+            try:
+                conn.executemany(
+                    """
+                    INSERT INTO faxes(key, fax_id, direction, caller_id, destination, remote_number,
+                                      search_numbers, contact_name, status, pages, created_at,
+                                      entry_json, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET
+                        caller_id=excluded.caller_id,
+                        destination=excluded.destination,
+                        remote_number=excluded.remote_number,
+                        search_numbers=excluded.search_numbers,
+                        contact_name=CASE WHEN excluded.contact_name <> '' THEN excluded.contact_name
+                                          ELSE faxes.contact_name END,
+                        status=excluded.status,
+                        pages=excluded.pages,
+                        created_at=excluded.created_at,
+                        entry_json=excluded.entry_json,
+                        updated_at=excluded.updated_at
+                    WHERE faxes.entry_json <> excluded.entry_json
+                       OR (excluded.contact_name <> '' AND excluded.contact_name <> IFNULL(faxes.contact_name, ''))
+                    """,
+                    rows,
+                )
+                conn.commit()
+            except Exception:
+                log.exception("Failed to update fax history cache")
+                return 0
+            finally:
+                self._release(conn)
+        return len(rows)
+
+    def delete_ids(self, fax_ids: Iterable[str]) -> int:
+        ids = [str(i) for i in (fax_ids or []) if i]
+        if not ids:
+            return 0
+        with self._conn_lock:
+            conn = self._connect()
+            try:
+                cur = conn.executemany("DELETE FROM faxes WHERE fax_id = ?", [(i,) for i in ids])
+                conn.commit()
+                return cur.rowcount or 0
+            except Exception:
+                log.exception("Failed to delete fax history cache rows")
+                return 0
+            finally:
+                self._release(conn)
+
+    def prune_older_than(self, cutoff_iso: str) -> int:
+        """Drop rows created before cutoff_iso (same format as the API's created_at)."""
+        if not cutoff_iso:
+            return 0
+        with self._conn_lock:
+            conn = self._connect()
+            try:
+                cur = conn.execute("DELETE FROM faxes WHERE created_at < ?", (cutoff_iso,))
+                conn.commit()
+                return cur.rowcount or 0
+            except Exception:
+                log.exception("Failed to prune fax history cache")
+                return 0
+            finally:
+                self._release(conn)
+
+    def _text_clause(self, text: str) -> Tuple[str, list]:
+        terms = [t for t in (text or "").strip().split() if t]
+        if not terms:
+            return "", []
+        clauses: list[str] = []
+        params: list = []
+        for term in terms:
+            # Numbers are matched on their digits so "(555) 123" finds 5551234567
+            needle = _digits(term) if _PHONE_TERM.match(term) else term
+            if self.fts_mode == "trigram" and len(needle) >= _FTS_MIN_CHARS:
+                clauses.append(
+                    "(f.rowid IN (SELECT rowid FROM faxes_fts WHERE faxes_fts MATCH ?) OR f.direction = ?)"
+                )
+                params.extend(['"' + needle.replace('"', '""') + '"', needle.lower()])
+            else:
+                like = "%" + needle.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+                clauses.append(
+                    "(f.search_numbers LIKE ? ESCAPE '\\' OR f.contact_name LIKE ? ESCAPE '\\' "
+                    "OR f.status LIKE ? ESCAPE '\\' OR f.direction LIKE ? ESCAPE '\\')"
+                )
+                params.extend([like, like, like, like])
+        return " AND ".join(clauses), params
+
+    def query(
+        self,
+        text: str = "",
+        directions: Iterable[str] = ("inbound", "outbound"),
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        before: Optional[Tuple[str, str]] = None,
+        not_before: Optional[Tuple[str, str]] = None,
+        limit: int = 50,
+    ) -> list[Dict[str, Any]]:
+        """
+        Newest-first entries matching text (numbers, contact name, status) within
+        [since, until). Pass the (created_at, key) of the last row seen as before to
+        fetch the next page, or as not_before to re-read everything down to that row.
+        Raises sqlite3.Error when the cache cannot be read.
+        """
+        dirs = [d.lower() for d in (directions or []) if d]
+        if not dirs:
+            return []
+        where = [f"f.direction IN ({','.join('?' * len(dirs))})"]
+        params: list = list(dirs)
+        if since:
+            where.append("f.created_at >= ?")
+            params.append(since)
+        if until:
+            where.append("f.created_at < ?")
+            params.append(until)
+        if before:
+            where.append("(f.created_at < ? OR (f.created_at = ? AND f.key < ?))")
+            params.extend([before[0], before[0], before[1]])
+        if not_before:
+            where.append("(f.created_at > ? OR (f.created_at = ? AND f.key >= ?))")
+            params.extend([not_before[0], not_before[0], not_before[1]])
+        text_sql, text_params = self._text_clause(text)
+        if text_sql:
+            where.append(text_sql)
+            params.extend(text_params)
+        sql = (
+            "SELECT f.entry_json FROM faxes f WHERE " + " AND ".join(where)
+            + " ORDER BY f.created_at DESC, f.key DESC LIMIT ?"
+        )
+        params.append(int(max(1, limit)))
+        conn = self._connect()
+        try:
+            rows = conn.execute(sql, params).fetchall()
+        except Exception:
+            log.exception("Fax history cache query failed")
+            raise
+        finally:
+            self._release(conn)
+        out = []
+        for (raw,) in rows:
+            try:
+                out.append(json.loads(raw))
+            except Exception:
+                continue
+        return out
+
+    def count(self) -> int:
+        conn = self._connect()
+        try:
+            return int(conn.execute("SELECT COUNT(*) FROM faxes").fetchone()[0])
+        except Exception:
+            return 0
+        finally:
+            self._release(conn)
@@ -0,0 +1,262 @@
+"""
+core/history_publisher.py
+
+Background publisher for downloaded-fax history IDs (FRAAPI /sync/post).
+
+- submit() never blocks on the network: IDs are appended to a durable journal
+  (<base_dir>/cache/history_post.journal) and handed to a worker thread.
+- The worker coalesces pending IDs into /sync/post batches of up to MAX_PAGE,
+  lingering briefly after the first submission so a receiver pass that downloads
+  many faxes produces one request.
+- Journal lines are "+<id>" (pending) and "-<id>" (delivered). Delivery appends a
+  single write per batch; the file is compacted to the pending set on startup and
+  once enough delivered lines accumulate, instead of rewriting a JSON queue on
+  every failure.
+- A circuit breaker stops posting after consecutive failures and retries with a
+  single half-open batch after a cool-down that doubles up to BREAKER_MAX_COOLDOWN.
+- IDs left in the legacy cache/history_sync_queue.json are migrated on start.
+"""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from core.sync_client import MAX_PAGE, post_ids
+from utils.logging_utils import get_logger
+
+log = get_logger("history_publisher")
+
+_JOURNAL_FILE = os.path.join("cache", "history_post.journal")
+_LEGACY_QUEUE_FILE = os.path.join("cache", "history_sync_queue.json")
+
+# Seconds to wait after a submission for more IDs before posting
+LINGER_SECONDS = 1.0
+# Consecutive failed batches before the breaker opens
+BREAKER_THRESHOLD = 3
+BREAKER_BASE_COOLDOWN = 30.0
+BREAKER_MAX_COOLDOWN = 900.0
+# Delivered lines tolerated in the journal before it is compacted
+COMPACT_AFTER = 2000
+
+_publishers: Dict[str, "HistoryPublisher"] = {}
+_publishers_lock = threading.Lock()
+
+
+def get_publisher(base_dir: str) -> "HistoryPublisher":
+    """Shared publisher for base_dir; the worker thread starts on first use."""
+    key = os.path.normcase(os.path.abspath(base_dir))
+    with _publishers_lock:
+        pub = _publishers.get(key)
+        if pub is None:
+            pub = HistoryPublisher(base_dir)
+            _publishers[key] = pub
+        return pub
+
+
+class _CircuitBreaker:
+    def __init__(self):
+        self.failures = 0
+        self.cooldown = BREAKER_BASE_COOLDOWN
+        self.open_until = 0.0
+
+    def allow(self, now: float) -> bool:
+        return now >= self.open_until
+
+    def wait_time(self, now: float) -> float:
+        return max(0.0, self.open_until - now)
+
+    def success(self) -> None:
+        if self.failures >= BREAKER_THRESHOLD:
+            log.info("FRAAPI history sync recovered; circuit closed")
+        self.failures = 0
+        self.cooldown = BREAKER_BASE_COOLDOWN
+        self.open_until = 0.0
+
+    def failure(self, now: float) -> None:
+        self.failures += 1
+        if self.failures < BREAKER_THRESHOLD:
+            return
+        if self.failures > BREAKER_THRESHOLD:
+            # Half-open probe failed: back off further
+            self.cooldown = min(BREAKER_MAX_COOLDOWN, self.cooldown * 2)
+        self.open_until = now + self.cooldown
+        log.warning("FRAAPI history sync unhealthy; pausing posts for %ds", int(self.cooldown))
+
+
+class HistoryPublisher:
+    def __init__(self, base_dir: str):
+        self.base_dir = base_dir
+        self.journal_path = os.path.join(base_dir, _JOURNAL_FILE)
+        self._cond = threading.Condition()
+        self._pending: Dict[str, None] = {}  # insertion-ordered set
+        self._delivered_lines = 0
+        self._submitted_at = 0.0
+        self._breaker = _CircuitBreaker()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = False
+        try:
+            os.makedirs(os.path.dirname(self.journal_path), exist_ok=True)
+        except Exception:
+            pass
+        with self._cond:
+            self._load_journal()
+            self._migrate_legacy_queue()
+            self._compact()
+
+    # --- Journal ---
+    def _load_journal(self) -> None:
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if len(line) < 2:
+                        continue
+                    op, fid = line[0], line[1:]
+                    if op == "+":
+                        self._pending[fid] = None
+                    elif op == "-":
+                        self._pending.pop(fid, None)
+        except FileNotFoundError:
+            pass
+        except Exception:
+            log.exception("Failed to read history journal")
+
+    def _append(self, op: str, ids: Iterable[str]) -> None:
+        lines = "".join(f"{op}{fid}\n" for fid in ids)
+        if not lines:
+            return
+        try:
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception:
+            log.exception("Failed to append to history journal")
+
+    def _compact(self) -> None:
+        """Rewrite the journal with only the pending IDs."""
+        dir_path = os.path.dirname(self.journal_path) or "."
+        tmp = None
+        try:
+            fd, tmp = tempfile.mkstemp(dir=dir_path, suffix=".tmp", prefix=".history_post_")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("".join(f"+{fid}\n" for fid in self._pending))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.journal_path)
+            self._delivered_lines = 0
+        except Exception:
+            if tmp:
+                try:
+                    os.unlink(tmp)
+                except Exception:
+                    pass
+
+    def _migrate_legacy_queue(self) -> None:
+        path = os.path.join(self.base_dir, _LEGACY_QUEUE_FILE)
+        try:
+            if not os.path.exists(path):
+                return
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            ids = [str(x).strip() for x in (data if isinstance(data, list) else []) if str(x).strip()]
+            fresh = [fid for fid in ids if fid not in self._pending]
+            for fid in fresh:
+                self._pending[fid] = None
+            self._append("+", fresh)
+            os.remove(path)
+            if ids:
+                log.info("Migrated %d queued history IDs to the publisher journal", len(ids))
+        except Exception:
+            log.exception("Failed to migrate legacy history queue")
+
+    # --- Public API ---
+    def submit(self, fax_ids: Iterable[str]) -> None:
+        """Record IDs for posting; returns immediately."""
+        clean = [str(x).strip() for x in (fax_ids or []) if str(x).strip()]
+        with self._cond:
+            fresh = [fid for fid in dict.fromkeys(clean) if fid not in self._pending]
+            if not fresh:
+                return
+            for fid in fresh:
+                self._pending[fid] = None
+            self._append("+", fresh)
+            self._submitted_at = time.monotonic()
+            self._ensure_thread()
+            self._cond.notify()
+
+    def wake(self) -> None:
+        """Ask the worker to try pending IDs now (breaker permitting)."""
+        with self._cond:
+            if self._pending:
+                self._ensure_thread()
+                self._cond.notify()
+
+    def pending_count(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def stop(self, timeout: float = 2.0) -> None:
+        with self._cond:
+            self._stop = True
+            self._cond.notify()
+        t = self._thread
+        if t is not None:
+            t.join(timeout)
+
+    # --- Worker ---
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._stop = False
+            self._thread = threading.Thread(target=self._run, name="HistoryPublisher", daemon=True)
+            self._thread.start()
+
+    def _next_batch(self) -> Optional[List[str]]:
+        """Wait (under the lock) until a batch may be posted; None when stopping."""
+        while True:
+            if self._stop:
+                return None
+            if not self._pending:
+                self._cond.wait()
+                continue
+            now = time.monotonic()
+            if not self._breaker.allow(now):
+                self._cond.wait(self._breaker.wait_time(now))
+                continue
+            linger = self._submitted_at + LINGER_SECONDS - now
+            if linger > 0 and len(self._pending) < MAX_PAGE:
+                self._cond.wait(linger)
+                continue
+            return list(self._pending)[:MAX_PAGE]
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                # Single attempt: retry pacing is the breaker's job, not the caller's
+                res = post_ids(batch, max_attempts=1)
+            except Exception as e:
+                res = {"error": str(e)}
+            with self._cond:
+                now = time.monotonic()
+                if res.get("error"):
+                    self._breaker.failure(now)
+                    if self._breaker.allow(now):
+                        # Below the threshold: short pause before the next try
+                        self._cond.wait(min(5.0, 0.5 * (2 ** self._breaker.failures)))
+                    continue
+                self._breaker.success()
+                for fid in batch:
+                    self._pending.pop(fid, None)
+                self._append("-", batch)
+                self._delivered_lines += len(batch)
+                if self._delivered_lines >= COMPACT_AFTER or not self._pending:
+                    self._compact()
+                log.info("Posted %d history ID(s); pending=%d", len(batch), len(self._pending))
@@ -6,11 +6,11 @@ from typing import Iterable, List, Set
 
 from utils.logging_utils import get_logger
 from utils.history_index import load_index, save_index
-from core.sync_client import list_page, post_ids, delete_ids, MAX_PAGE
+from core.sync_client import list_page, delete_ids, MAX_PAGE
+from core.history_publisher import get_publisher
 
 log = get_logger("history_sync")
 
-_QUEUE_FILE = os.path.join("cache", "history_sync_queue.json")
 _PRUNE_QUEUE_FILE = os.path.join("cache", "history_prune_queue.json")
 
 
@@ -23,33 +23,6 @@ def _ensure_cache_dir(base_dir: str) -> str:
     return path
 
 
-def _queue_path(base_dir: str) -> str:
-    _ensure_cache_dir(base_dir)
-    return os.path.join(base_dir, _QUEUE_FILE)
-
-
-def _read_queue(base_dir: str) -> List[str]:
-    path = _queue_path(base_dir)
-    try:
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    return [str(x) for x in data if str(x).strip()]
-    except Exception:
-        pass
-    return []
-
-
-def _write_queue(base_dir: str, ids: Iterable[str]) -> None:
-    path = _queue_path(base_dir)
-    try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(list(dict.fromkeys([str(x).strip() for x in ids if str(x).strip()])), f)
-    except Exception:
-        pass
-
-
 # --- Public helpers ---
 
 def pull_if_missing(base_dir: str) -> None:
@@ -78,49 +51,27 @@ def pull_if_missing(base_dir: str) -> None:
 
 
 def flush_queue(base_dir: str) -> None:
-    """Attempt to POST queued IDs in batches of 500 until delivered."""
+    """Wake the background publisher so pending IDs are retried (non-blocking)."""
     try:
-        pending = _read_queue(base_dir)
-        if not pending:
-            return
-        sent_any = False
-        while pending:
-            batch = pending[:MAX_PAGE]
-            res = post_ids(batch)
-            if res.get("error"):
-                # stop on first failure; keep queue
-                break
-            # success — drop batch
-            pending = pending[MAX_PAGE:]
-            sent_any = True
-        if sent_any:
-            _write_queue(base_dir, pending)
-            log.info("Flushed some queued history IDs; remaining=%d", len(pending))
+        pub = get_publisher(base_dir)
+        if pub.pending_count():
+            log.info("History IDs pending delivery: %d", pub.pending_count())
+        pub.wake()
     except Exception:
         log.exception("flush_queue failed")
 
 
 def queue_post(base_dir: str, fax_id: str) -> None:
-    """Post a single fax_id; on failure, queue it locally for later flush."""
-    s = (str(fax_id) or "").strip()
-    if not s:
-        return
+    """Hand a fax_id to the background publisher; never blocks on FRAAPI."""
+    queue_posts(base_dir, [fax_id])
+
+
+def queue_posts(base_dir: str, fax_ids: Iterable[str]) -> None:
+    """Hand several fax_ids to the background publisher in one journal write."""
     try:
-        res = post_ids([s])
-        if res.get("error"):
-            # Enqueue
-            q = _read_queue(base_dir)
-            q.append(s)
-            _write_queue(base_dir, q)
-            log.warning("Queued fax_id for later sync: %s", s)
+        get_publisher(base_dir).submit(fax_ids)
     except Exception:
-        # On any exception, enqueue
-        try:
-            q = _read_queue(base_dir)
-            q.append(s)
-            _write_queue(base_dir, q)
-        except Exception:
-            pass
+        log.exception("queue_post failed")
 
 
 def _prune_queue_path(base_dir: str) -> str:
@@ -226,21 +177,10 @@ def reconcile(base_dir: str) -> None:
         to_push = list(local_ids - remote_set)
         to_pull = list(remote_set - local_ids)
 
-        # Push in batches of 500
+        # Push through the publisher, which batches by 500 and backs off while FRAAPI is down
         if to_push:
-            log.info("Pushing %d local-only IDs to FRAAPI…", len(to_push))
-        i = 0
-        while i < len(to_push):
-            batch = to_push[i:i + MAX_PAGE]
-            res = post_ids(batch)
-            if res.get("error"):
-                log.warning("Push batch failed; will queue remaining. error=%s", res.get("error"))
-                # queue remaining locally
-                q = _read_queue(base_dir)
-                q.extend(to_push[i:])
-                _write_queue(base_dir, q)
-                break
-            i += MAX_PAGE
+            log.info("Queueing %d local-only IDs for FRAAPI…", len(to_push))
+            queue_posts(base_dir, to_push)
 
         # Pull: add to local index
         if to_pull:
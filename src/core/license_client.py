@@ -75,6 +75,25 @@ def initialize_session(
         return {"error": str(e)}
 
 
+def fetch_bearer(jwt_token: str) -> dict:
+    """POST /bearer for a JWT without touching config or app state.
+
+    Returns the FRA payload ({"bearer_token", "expires_at", ...}) or {"error": ...}.
+    Also used by the receiver scheduler to mint bearers for additional accounts.
+    """
+    headers = {"Authorization": f"Bearer {jwt_token}"}
+    response = requests.post(FRA_BEARER_URL, headers=headers, timeout=10)
+    if response.status_code != 200:
+        log.error(f"/bearer failed: HTTP {response.status_code} - {response.text}")
+        return {"error": "bearer_failed"}
+
+    data = response.json()
+    if not data.get("bearer_token"):
+        log.error("Bearer token missing in response.")
+        return {"error": "bearer_missing"}
+    return data
+
+
 def retrieve_skyswitch_token(app_state) -> dict:
     jwt_token = app_state.global_cfg.jwt_token
     if not jwt_token:
@@ -99,22 +118,13 @@ def retrieve_skyswitch_token(app_state) -> dict:
         return {"error": "jwt_decode_failed"}
 
     # Use (possibly refreshed) JWT
-    headers = {"Authorization": f"Bearer {jwt_token}"}
-
     try:
-        response = requests.post(FRA_BEARER_URL, headers=headers, timeout=10)
-        if response.status_code != 200:
-            log.error(f"/bearer failed: HTTP {response.status_code} - {response.text}")
-            return {"error": "bearer_failed"}
-
-        data = response.json()
+        data = fetch_bearer(jwt_token)
+        if data.get("error"):
+            return data
         token = data.get("bearer_token")
         expiration = data.get("expires_at")
 
-        if not token:
-            log.error("Bearer token missing in response.")
-            return {"error": "bearer_missing"}
-
         # Apply to config
         global_config.set("Token", "bearer_token", token)
         global_config.set("Token", "bearer_token_expires_at", expiration)
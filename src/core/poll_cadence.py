@@ -0,0 +1,179 @@
+"""
+core/poll_cadence.py
+
+Adaptive receiver poll interval and the slower maintenance schedule.
+
+The configured polling frequency ("Fax Options" -> polling_frequency, minutes) stays
+the base interval. After each receiver pass, record_pass() adapts it:
+
+- a pass that downloaded faxes halves the interval (down to poll_min_seconds), so a
+  burst is drained quickly;
+- an empty pass grows it by half again, up to the base while arrivals are recent
+  (within two base intervals) and up to poll_max_seconds after that, so quiet
+  hours are polled less often.
+
+Expensive maintenance (server retention deletes, outbound cleanup/reconcile,
+history reconcile, local inbox cleanup) runs only on passes where
+maintenance_due() is true: at most every maintenance_interval_minutes, and always
+on the first pass after start.
+
+Settings ("Fax Options"): adaptive_polling ("Yes"/"No", default "Yes"; "No" keeps
+the fixed interval with maintenance on every pass), poll_min_seconds (60),
+poll_max_seconds (0 = twice the base), maintenance_interval_minutes (30).
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional, Tuple
+
+from core.config_loader import device_config
+from utils.logging_utils import get_logger
+
+log = get_logger("poll_cadence")
+
+DEFAULT_MIN_SECONDS = 60
+DEFAULT_MAINTENANCE_MINUTES = 30
+SHRINK_FACTOR = 0.5
+GROW_FACTOR = 1.5
+
+
+def fmt_interval(secs: float) -> str:
+    secs = int(max(0, secs))
+    if secs < 60:
+        return f"{secs}s"
+    mins, rem = divmod(secs, 60)
+    if mins < 60:
+        return f"{mins}m" if not rem else f"{mins}m {rem}s"
+    hours, mins = divmod(mins, 60)
+    return f"{hours}h {mins}m" if mins else f"{hours}h"
+
+
+def _int_option(key: str, default: int) -> int:
+    try:
+        return int(device_config.get("Fax Options", key, default) or default)
+    except Exception:
+        return default
+
+
+class PollCadence:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._current: Optional[float] = None
+        self._last_arrival = 0.0
+        self._last_pass = 0.0
+        self._last_count = 0
+        self._last_maintenance = 0.0
+
+    # ---- Settings ----
+
+    @staticmethod
+    def enabled() -> bool:
+        try:
+            value = device_config.get("Fax Options", "adaptive_polling", "Yes") or "Yes"
+            return str(value).strip().lower() == "yes"
+        except Exception:
+            return True
+
+    @staticmethod
+    def bounds(base_secs: int) -> Tuple[int, int]:
+        base = max(1, int(base_secs))
+        lo = max(10, _int_option("poll_min_seconds", DEFAULT_MIN_SECONDS))
+        hi = _int_option("poll_max_seconds", 0) or base * 2
+        lo = min(lo, base)
+        hi = max(hi, base)
+        return lo, hi
+
+    @staticmethod
+    def maintenance_interval() -> int:
+        return max(1, _int_option("maintenance_interval_minutes", DEFAULT_MAINTENANCE_MINUTES)) * 60
+
+    # ---- Poll interval ----
+
+    def interval_for(self, base_secs: int) -> int:
+        """Effective seconds between polls for the configured base interval."""
+        if not self.enabled():
+            return max(1, int(base_secs))
+        lo, hi = self.bounds(base_secs)
+        with self._lock:
+            current = self._current if self._current is not None else base_secs
+        return int(min(hi, max(lo, current)))
+
+    def record_pass(self, base_secs: int, arrivals: int, maintenance: bool = False) -> None:
+        """Adapt the interval after a receiver pass that processed `arrivals` faxes."""
+        now = time.monotonic()
+        base = max(1, int(base_secs))
+        lo, hi = self.bounds(base)
+        with self._lock:
+            current = self._current if self._current is not None else base
+            if arrivals > 0:
+                self._last_arrival = now
+                current = max(lo, current * SHRINK_FACTOR)
+            else:
+                recent = self._last_arrival and now - self._last_arrival < 2 * base
+                ceiling = base if recent else hi
+                if current < ceiling:
+                    current = min(ceiling, current * GROW_FACTOR)
+            self._current = current
+            self._last_pass = now
+            self._last_count = int(arrivals)
+            if maintenance:
+                self._last_maintenance = now
+        if self.enabled():
+            log.debug(f"Poll cadence: {arrivals} new fax(es); next interval {fmt_interval(current)}")
+
+    # ---- Maintenance ----
+
+    def maintenance_due(self) -> bool:
+        """True when this pass should run the expensive maintenance steps."""
+        if not self.enabled():
+            return True
+        with self._lock:
+            if not self._last_maintenance:
+                return True
+            return time.monotonic() - self._last_maintenance >= self.maintenance_interval()
+
+    def maintenance_in(self) -> int:
+        """Seconds until maintenance is next due (0 when due now)."""
+        if not self.enabled():
+            return 0
+        with self._lock:
+            if not self._last_maintenance:
+                return 0
+            left = self.maintenance_interval() - (time.monotonic() - self._last_maintenance)
+        return int(max(0, left))
+
+    # ---- Display ----
+
+    def describe(self, base_secs: int) -> str:
+        """Multi-line summary for the status panel tooltip."""
+        if not self.enabled():
+            return f"Polling every {fmt_interval(base_secs)} (adaptive polling off)."
+        lo, hi = self.bounds(base_secs)
+        lines = [
+            f"Adaptive polling: every {fmt_interval(self.interval_for(base_secs))} "
+            f"(base {fmt_interval(base_secs)}, bounds {fmt_interval(lo)}–{fmt_interval(hi)})"
+        ]
+        with self._lock:
+            last_pass, last_count = self._last_pass, self._last_count
+        if last_pass:
+            ago = fmt_interval(time.monotonic() - last_pass)
+            lines.append(f"Last pass {ago} ago: {last_count} new fax(es)")
+        due_in = self.maintenance_in()
+        every = fmt_interval(self.maintenance_interval())
+        lines.append(
+            f"Maintenance every {every}: " + ("due on next pass" if not due_in else f"next in {fmt_interval(due_in)}")
+        )
+        return "\n".join(lines)
+
+
+_cadence: Optional[PollCadence] = None
+_cadence_lock = threading.Lock()
+
+
+def get_cadence() -> PollCadence:
+    global _cadence
+    with _cadence_lock:
+        if _cadence is None:
+            _cadence = PollCadence()
+        return _cadence
@@ -48,7 +48,8 @@ def _backoff_sleep(attempt: int) -> None:
     time.sleep(base * (0.5 + random.random()))
 
 
-def post_ids(ids: List[str]) -> Dict[str, Any]:
+def post_ids(ids: List[str], max_attempts: int = 5) -> Dict[str, Any]:
+    """POST ids to /sync/post. Background callers pass max_attempts=1 and pace retries themselves."""
     if not ids:
         return {"ok": True, "inserted": 0, "total": 0}
     url = f"{fra_api_base_url()}/sync/post"
@@ -57,7 +58,8 @@ def post_ids(ids: List[str]) -> Dict[str, Any]:
         return {"ok": True, "inserted": 0, "total": 0}
 
     attempts = 0
-    while attempts < 5:
+    refreshed = False
+    while attempts < max_attempts:
         attempts += 1
         jwt = _jwt()
         if not jwt:
@@ -70,7 +72,8 @@ def post_ids(ids: List[str]) -> Dict[str, Any]:
             r = requests.post(url, headers=_auth_header(jwt), json=payload, timeout=TIMEOUTS)
         except requests.RequestException as e:
             log.warning(f"/sync/post network error: {e}")
-            _backoff_sleep(attempts)
+            if attempts < max_attempts:
+                _backoff_sleep(attempts)
             continue
         if r.status_code == 200:
             try:
@@ -79,10 +82,15 @@ def post_ids(ids: List[str]) -> Dict[str, Any]:
                 return {"ok": True}
         if r.status_code in (401, 403):
             if _refresh_jwt():
+                if not refreshed:
+                    # A token refresh does not use up the final attempt
+                    refreshed = True
+                    attempts -= 1
                 continue
             return {"error": "unauthorized", "status": r.status_code}
         if 500 <= r.status_code < 600:
-            _backoff_sleep(attempts)
+            if attempts < max_attempts:
+                _backoff_sleep(attempts)
             continue
         try:
             data = r.json()
@@ -9,6 +9,7 @@ import os
 import shutil
 import subprocess
 import tempfile
+import time
 from datetime import datetime, timedelta, timezone
 
 import fitz  # PyMuPDF for in-app PDF rasterization (no external tools)
@@ -20,12 +21,14 @@ from PIL import Image
 
 from core.app_state import app_state
 from utils.history_index import is_downloaded
+from utils import inbox_index
 from core.history_sync import queue_post
+from core.history_cache import get_history_cache
 from utils.logging_utils import get_logger
-from core.config_loader import device_config, global_config
-from utils.secure_store import secure_decrypt_for_machine
-from integrations.libertyrx_client import liberty_base_url, encode_customer, send_fax
-from utils.pdf_utils import split_pdf_pages
+from utils.pdf_utils import FITZ_LOCK
+from integrations.libertyrx_forwarder import LibertyForwarder, get_forwarder, keep_local_copy
+from core.poll_cadence import get_cadence
+from fax_io.receiver_scheduler import ReceiverAccount, ReceiverScheduler, get_scheduler, load_accounts
 from core.outbox_ledger import (
     all_jobs,
     mark_delivered,
@@ -39,6 +42,9 @@ import threading
 # Module-level lock to ensure only one receiver run at a time within the process
 _RECEIVER_RUN_LOCK = threading.Lock()
 
+# Old inbox files removed per batch before the index is updated and persisted
+CLEANUP_BATCH = 200
+
 
 def convert_pdf_to_jpg(
     pdf_path: str, output_prefix: str, base_dir: str, dpi: int = 200
@@ -66,13 +72,20 @@ def convert_pdf_to_jpg(
         mat = fitz.Matrix(zoom, zoom)
 
         jpgs: list[str] = []
-        with fitz.open(pdf_path) as doc:
-            for i, page in enumerate(doc, start=1):
-                pix = page.get_pixmap(matrix=mat, alpha=False)
-                out_path = os.path.join(parent, f"{base}-{i}.jpg")
-                # Save as JPEG; extension controls format
-                pix.save(out_path)
+        with FITZ_LOCK:
+            doc = fitz.open(pdf_path)
+        try:
+            # One page per locked section (see utils.pdf_utils)
+            for i in range(doc.page_count):
+                out_path = os.path.join(parent, f"{base}-{i + 1}.jpg")
+                with FITZ_LOCK:
+                    pix = doc.load_page(i).get_pixmap(matrix=mat, alpha=False)
+                    # Save as JPEG; extension controls format
+                    pix.save(out_path)
                 jpgs.append(out_path)
+        finally:
+            with FITZ_LOCK:
+                doc.close()
         return jpgs
     except Exception:
         # Log at debug-level context using receiver logger
@@ -100,17 +113,24 @@ def convert_pdf_to_multipage_tiff(pdf_path: str, output_path: str, dpi: int = 20
             zoom = 200.0 / 72.0
         mat = fitz.Matrix(zoom, zoom)
         images = []
-        with fitz.open(pdf_path) as doc:
-            for page in doc:
-                pix = page.get_pixmap(matrix=mat, alpha=False)
-                mode = "RGB"  # alpha is False, so RGB
-                img = Image.frombytes(mode, [pix.width, pix.height], pix.samples)
+        with FITZ_LOCK:
+            doc = fitz.open(pdf_path)
+        try:
+            # One page per locked section; the Pillow work runs outside the lock
+            for i in range(doc.page_count):
+                with FITZ_LOCK:
+                    pix = doc.load_page(i).get_pixmap(matrix=mat, alpha=False)
+                    mode = "RGB"  # alpha is False, so RGB
+                    img = Image.frombytes(mode, [pix.width, pix.height], pix.samples)
                 # For fax-friendly TIFF, convert to bilevel (1-bit) if possible
                 try:
                     img_mono = img.convert("1")
                 except Exception:
                     img_mono = img.convert("L")
                 images.append(img_mono)
+        finally:
+            with FITZ_LOCK:
+                doc.close()
         if not images:
             return False
         os.makedirs(os.path.dirname(output_path) or os.path.dirname(pdf_path), exist_ok=True)
@@ -143,6 +163,13 @@ def convert_pdf_to_multipage_tiff(pdf_path: str, output_path: str, dpi: int = 20
         return False
 
 
+def _convert_outputs(pdf_path: str, jpg_prefix: str, tiff_path: str, base_dir: str, formats: set):
+    """Conversion job for the shared pool; returns (jpg paths, tiff ok)."""
+    jpgs = convert_pdf_to_jpg(pdf_path, jpg_prefix, base_dir) if "JPG" in formats else []
+    tiff_ok = convert_pdf_to_multipage_tiff(pdf_path, tiff_path, dpi=200) if "TIFF" in formats else False
+    return jpgs, tiff_ok
+
+
 class FaxReceiver(QThread):
     finished = pyqtSignal()
 
@@ -204,6 +231,12 @@ class FaxReceiver(QThread):
                 self.base_dir, "Inbox"
             )
             os.makedirs(inbox_path, exist_ok=True)
+            # Pick up any inbox changes made outside the receiver since the last pass.
+            # This is the pass's only directory listing; later steps use the snapshot.
+            try:
+                inbox_index.refresh(self.base_dir, inbox_path)
+            except Exception:
+                self.log.debug("Inbox index refresh failed", exc_info=True)
 
             # Parse selected download formats (multi-select). Legacy "BOTH" => PDF+JPG
             raw_method = (app_state.device_cfg.download_method or "PDF")
@@ -221,18 +254,18 @@ class FaxReceiver(QThread):
                 str(app_state.device_cfg.print_faxes).strip().lower() == "yes"
             )
 
-            fax_user = getattr(app_state.global_cfg, "fax_user", None)
-            bearer = app_state.global_cfg.bearer_token
-            if not fax_user:
+            accounts = load_accounts()
+            if not accounts or not accounts[0].primary:
                 self.log.error(
                     "fax_user missing from config; skipping fax retrieval until account is configured."
                 )
                 self.finished.emit()
                 return
-            if not bearer:
-                self.log.warning("Missing bearer token; cannot retrieve faxes.")
-                self.finished.emit()
-                return
+
+            # Retention deletes, outbound cleanup/reconcile and history reconcile only run
+            # on maintenance passes (see core.poll_cadence); listing and downloads run every pass.
+            cadence = get_cadence()
+            maintenance = cadence.maintenance_due()
 
             # Ensure remote history doc exists and is reconciled with local cache before processing
             try:
@@ -242,12 +275,13 @@ class FaxReceiver(QThread):
                     pull_if_missing(self.base_dir)
                 except Exception:
                     pass
-                try:
-                    # Bidirectional reconcile: push local-only IDs to FRAAPI (creates remote doc if missing),
-                    # and pull any remote-only IDs into local cache
-                    reconcile(self.base_dir)
-                except Exception:
-                    pass
+                if maintenance:
+                    try:
+                        # Bidirectional reconcile: push local-only IDs to FRAAPI (creates remote doc if missing),
+                        # and pull any remote-only IDs into local cache
+                        reconcile(self.base_dir)
+                    except Exception:
+                        pass
                 try:
                     # Attempt to flush any queued history posts
                     flush_queue(self.base_dir)
@@ -261,22 +295,127 @@ class FaxReceiver(QThread):
                 # Never block retrieval due to history sync routines
                 pass
 
-            headers = {
-                "accept": "application/json",
-                "Authorization": f"Bearer {bearer}",
-            }
-            base_url = "https://telco-api.skyswitch.com"
-            list_url = f"{base_url}/users/{fax_user}/faxes/inbound"
+            # Server-side cleanup threshold
+            try:
+                retention_days = int(app_state.device_cfg.archive_duration or 365)
+            except Exception:
+                retention_days = 365
+            if retention_days > 365:
+                retention_days = 365
+            cutoff_dt = datetime.now(timezone.utc) - timedelta(days=retention_days)
 
-            # Aggregate all pages
-            all_faxes = []
-            next_url = list_url
+            # Process due LibertyRx queue jobs (bounded) on the forwarding stage
+            try:
+                get_forwarder().process_queue(max_jobs=5)
+            except Exception:
+                pass
+
+            # One pipeline per due account, interleaved fax by fax
+            scheduler = get_scheduler()
+            pipelines = [
+                self._account_pipeline(
+                    scheduler, acct, inbox_path, selected_formats, should_print, cutoff_dt, maintenance
+                )
+                for acct in scheduler.due_accounts(accounts)
+            ]
+            processed = sum(scheduler.run_interleaved(pipelines))
+
+            if maintenance:
+                try:
+                    get_history_cache(self.base_dir).prune_older_than(
+                        cutoff_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+                    )
+                except Exception:
+                    pass
+
+                # Local inbox cleanup (delete old downloaded files)
+                try:
+                    self._cleanup_local_inbox(inbox_path, cutoff_dt)
+                except Exception as le:
+                    self.log.exception("Local inbox cleanup encountered an error")
+
+            try:
+                base_secs = int(app_state.device_cfg.polling_frequency) * 60
+            except (TypeError, ValueError):
+                base_secs = 300
+            cadence.record_pass(base_secs, processed, maintenance=maintenance)
+
+            self.log.info(
+                f"Receiver pass complete. Processed {processed} item(s)"
+                + (" (with maintenance)." if maintenance else ".")
+            )
+            try:
+                notif_enabled = (
+                    str(
+                        getattr(app_state.device_cfg, "notifications_enabled", "Yes")
+                        or "Yes"
+                    )
+                    .strip()
+                    .lower()
+                    == "yes"
+                )
+                if processed > 0 and notif_enabled:
+                    self._notify_toast(processed)
+            except Exception:
+                self.log.exception("Failed to show toast notification")
+            self.finished.emit()
+
+        except Exception:
+            self.log.exception("Fax retrieval failed")
+            self.finished.emit()
+        finally:
+            self._release_run_lock()
+
+    def _account_pipeline(
+        self,
+        scheduler: ReceiverScheduler,
+        account: ReceiverAccount,
+        inbox_path: str,
+        selected_formats: set,
+        should_print: bool,
+        cutoff_dt: datetime,
+        maintenance: bool = True,
+    ):
+        """
+        Receiver pass for one account, as a generator that yields after listing and
+        after each fax so the scheduler can interleave accounts. Returns the number
+        of faxes processed.
+
+        Downloads of fax N+1 overlap the conversion of fax N, which runs on the
+        scheduler's shared conversion pool; fax N is then finished (print, purge,
+        index, mark downloaded) on this thread.
+        """
+        cursor = scheduler.cursor(account)
+        name = "primary account" if account.primary else f"account {account.label or account.fax_user}"
+        fax_user = account.fax_user
+        bearer = scheduler.bearers.get(account)
+        if not bearer:
+            self.log.warning(f"Missing bearer token; cannot retrieve faxes for {name}.")
+            if not account.primary:
+                cursor.failure(time.monotonic())
+            return 0
+
+        headers = {
+            "accept": "application/json",
+            "Authorization": f"Bearer {bearer}",
+        }
+        base_url = "https://telco-api.skyswitch.com"
+        list_url = f"{base_url}/users/{fax_user}/faxes/inbound"
+
+        # Aggregate all pages
+        all_faxes = []
+        listed_ok = True
+        next_url = list_url
+        try:
             while next_url:
                 resp = requests.get(next_url, headers=headers, timeout=30)
                 if resp.status_code != 200:
                     self.log.error(
-                        f"Failed to list inbound faxes: HTTP {resp.status_code} {resp.text}"
+                        f"Failed to list inbound faxes for {name}: HTTP {resp.status_code} {resp.text}"
                     )
+                    if resp.status_code == 401:
+                        scheduler.bearers.invalidate(account)
+                    listed_ok = False
                     break
                 payload = resp.json() or {}
                 all_faxes.extend(payload.get("data", []) or [])
@@ -285,389 +424,300 @@ class FaxReceiver(QThread):
                 next_url = (
                     (list_url + nxt) if (nxt and not nxt.startswith("http")) else nxt
                 )
-
-            # Server-side cleanup threshold
+        except Exception:
+            self.log.exception(f"Failed to list inbound faxes for {name}")
+            cursor.failure(time.monotonic())
+            return 0
+        # Let other accounts list before this one starts downloading
+        yield
+
+        # Feed the local searchable history cache (contact names are kept from the panel).
+        # The history panel shows the primary account only, so secondary listings stay out.
+        if account.primary:
             try:
-                retention_days = int(app_state.device_cfg.archive_duration or 365)
+                get_history_cache(self.base_dir).upsert_entries(all_faxes, direction="Inbound")
             except Exception:
-                retention_days = 365
-            if retention_days > 365:
-                retention_days = 365
-            cutoff_dt = datetime.now(timezone.utc) - timedelta(days=retention_days)
+                self.log.exception("Failed to update local history cache")
 
-            # Before processing new list, also process due LibertyRx queue jobs (bounded)
+        processed = 0
+        deleted_from_skyswitch: set[str] = set()
+        pending = None
+        for fax in all_faxes:
+            item = None
             try:
-                from integrations.libertyrx_queue import process_due_jobs as _lz_process
-                _lz_process(max_jobs=5)
-            except Exception:
-                pass
+                item = self._fetch_fax(
+                    fax, account, base_url, headers, inbox_path,
+                    selected_formats, should_print, cutoff_dt, deleted_from_skyswitch, maintenance,
+                )
+            except Exception as ie:
+                self.log.exception("Error processing fax item")
+            if pending is not None and self._finish_fax(pending, account, inbox_path, selected_formats, should_print):
+                processed += 1
+            pending = item
+            yield
+        if pending is not None and self._finish_fax(pending, account, inbox_path, selected_formats, should_print):
+            processed += 1
+
+        if maintenance:
+            try:
+                outbound_deleted = self._cleanup_server_outbound(
+                    base_url, fax_user, headers, cutoff_dt, upsert_history=account.primary
+                )
+                deleted_from_skyswitch.update(outbound_deleted)
+            except Exception as oe:
+                self.log.exception("Outbound cleanup encountered an error")
 
-            processed = 0
-            deleted_from_skyswitch: set[str] = set()
-            for fax in all_faxes:
+        # Prune deleted fax IDs from local and server history
+        if deleted_from_skyswitch:
+            try:
+                from utils.history_index import remove_ids
+                remove_ids(self.base_dir, deleted_from_skyswitch)
+            except Exception:
+                self.log.exception("Failed to prune local history")
+            if account.primary:
                 try:
-                    fax_id = fax.get("id")
-                    caller_id = (fax.get("caller_id") or "").strip()
-                    created_at = fax.get("created_at")
-                    pdf_url = fax.get("pdf")
-
-                    # Skip if missing essentials
-                    if not fax_id or not pdf_url or not created_at:
-                        continue
-
-                    # Parse timestamp FIRST (assume Zulu ISO)
-                    try:
-                        if "." in created_at:
-                            ts = datetime.strptime(
-                                created_at, "%Y-%m-%dT%H:%M:%S.%fZ"
-                            ).replace(tzinfo=timezone.utc)
-                        else:
-                            ts = datetime.strptime(
-                                created_at, "%Y-%m-%dT%H:%M:%SZ"
-                            ).replace(tzinfo=timezone.utc)
-                    except Exception:
-                        self.log.exception(f"Failed to parse timestamp: created_at='{created_at}'")
-                        ts = datetime.now(timezone.utc)
-
-                    # Retention check BEFORE download check — ensures expired faxes
-                    # are deleted from SkySwitch even if already downloaded
-                    if ts < cutoff_dt:
-                        if self._delete_server_fax(base_url, fax_user, fax_id, headers):
-                            deleted_from_skyswitch.add(str(fax_id))
-                        continue
-
-                    # If we've already downloaded/processed this fax, skip.
-                    try:
-                        if is_downloaded(self.base_dir, str(fax_id)):
-                            continue
-                    except Exception:
-                        self.log.exception("Failed to check history_index.is_downloaded")
-
-                    # Build filename
-                    file_base = self._build_filename(fax_id, caller_id, ts)
-                    pdf_name = f"{file_base}.pdf"
-                    pdf_path = os.path.join(inbox_path, pdf_name)
-                    jpg_prefix = os.path.join(inbox_path, file_base)
-
-                    # Skip if all requested outputs already exist
-                    already_have_pdf = os.path.exists(pdf_path)
-                    existing_jpgs = [
-                        n
-                        for n in os.listdir(inbox_path)
-                        if n.startswith(file_base + "-") and n.lower().endswith(".jpg")
-                    ]
-                    tiff_path = os.path.join(inbox_path, f"{file_base}.tiff")
-                    need_pdf = ("PDF" in selected_formats) or should_print
-                    need_jpg = ("JPG" in selected_formats)
-                    need_tiff = ("TIFF" in selected_formats)
-
-                    # Download PDF if needed (conversion requires PDF)
-                    if not already_have_pdf:
-                        r = requests.get(pdf_url, headers=headers, timeout=60)
-                        if r.status_code != 200:
-                            self.log.error(
-                                f"Failed to download fax {fax_id}: HTTP {r.status_code}"
-                            )
-                            continue
-                        with open(pdf_path, "wb") as f:
-                            f.write(r.content)
-                        self.log.info(f"Downloaded fax {fax_id} -> {pdf_path}")
+                    from core.history_sync import queue_prune
+                    queue_prune(self.base_dir, list(deleted_from_skyswitch))
+                except Exception:
+                    self.log.exception("Failed to queue server history prune")
+            try:
+                get_history_cache(self.base_dir).delete_ids(deleted_from_skyswitch)
+            except Exception:
+                self.log.exception("Failed to prune local history cache")
+            self.log.info(f"Pruned {len(deleted_from_skyswitch)} expired fax ID(s) from history.")
 
-                    # --- LibertyRx forwarding (if enabled) ---
-                    liberty_delivered_ok = False
-                    try:
-                        dev_settings = getattr(app_state.device_cfg, "integration_settings", {}) or {}
-                        glob_settings = getattr(app_state.global_cfg, "integration_settings", {}) or {}
-                        enabled = (
-                            (dev_settings.get("enable_third_party") or glob_settings.get("enable_third_party") or "No").strip().lower()
-                            == "yes"
-                        )
-                        software = (
-                            dev_settings.get("integration_software")
-                            or glob_settings.get("integration_software")
-                            or "None"
-                        ).strip()
-
-                        if enabled and software == "LibertyRx":
-                            npi = (device_config.get("Integrations", "liberty_npi", "") or "").strip()
-                            api_key_enc = device_config.get("Integrations", "liberty_api_key_enc", "") or ""
-                            vendor_b64_enc = global_config.get(
-                                "Integrations", "liberty_vendor_basic_b64_enc", ""
-                            ) or ""
-
-                            api_key = (
-                                secure_decrypt_for_machine(api_key_enc) if api_key_enc else None
-                            )
-                            vendor_basic_b64 = (
-                                secure_decrypt_for_machine(vendor_b64_enc) if vendor_b64_enc else None
-                            )
-
-                            if npi and api_key and vendor_basic_b64:
-                                # Read PDF into memory
-                                try:
-                                    with open(pdf_path, "rb") as _f:
-                                        _pdf_bytes = _f.read()
-                                except Exception:
-                                    _pdf_bytes = b""
-                                if _pdf_bytes:
-                                    _customer_b64 = encode_customer(npi, api_key)
-                                    _endpoint = liberty_base_url()
-                                    try:
-                                        _size_kb = int(len(_pdf_bytes) / 1024)
-                                        self.log.info(f"LibertyRx: attempting delivery for fax {fax_id} size_kb={_size_kb} from={caller_id or ''}")
-                                    except Exception:
-                                        pass
-                                    _res = send_fax(
-                                        _endpoint,
-                                        vendor_basic_b64,
-                                        _customer_b64,
-                                        caller_id or "",
-                                        _pdf_bytes,
-                                    )
-                                    if _res.get("ok"):
-                                        liberty_delivered_ok = True
-                                        try:
-                                            self.log.info("LibertyRx: delivered successfully.")
-                                        except Exception:
-                                            pass
-                                    else:
-                                        _status = _res.get("status")
-                                        try:
-                                            if _status:
-                                                self.log.warning(f"LibertyRx: initial delivery failed with status {_status}")
-                                            else:
-                                                self.log.warning("LibertyRx: initial delivery failed (no status)")
-                                        except Exception:
-                                            pass
-                                        if _status == 413:
-                                            # Split into single pages and resend each immediately
-                                            try:
-                                                self.log.info("LibertyRx: received 413 — attempting page-split delivery…")
-                                            except Exception:
-                                                pass
-                                            _parts = split_pdf_pages(_pdf_bytes)
-                                            if _parts:
-                                                _all_ok = True
-                                                _fail_idx = 0
-                                                _fail_status = None
-                                                for _i, _part in enumerate(_parts, start=1):
-                                                    _r2 = send_fax(
-                                                        _endpoint,
-                                                        vendor_basic_b64,
-                                                        _customer_b64,
-                                                        caller_id or "",
-                                                        _part,
-                                                    )
-                                                    if not _r2.get("ok"):
-                                                        _all_ok = False
-                                                        _fail_idx = _i
-                                                        _fail_status = _r2.get("status")
-                                                        break
-                                                if _all_ok:
-                                                    liberty_delivered_ok = True
-                                                    try:
-                                                        self.log.info(
-                                                            f"LibertyRx: delivered as {len(_parts)} parts due to size."
-                                                        )
-                                                    except Exception:
-                                                        pass
-                                                    # Operator toast (non-modal)
-                                                    try:
-                                                        notif_enabled = (
-                                                            str(getattr(app_state.device_cfg, "notifications_enabled", "Yes") or "Yes").strip().lower() == "yes"
-                                                        )
-                                                        if notif_enabled:
-                                                            self._notify_toast(1, f"Fax delivered to LibertyRx in {len(_parts)} parts.")
-                                                    except Exception:
-                                                        pass
-                                                else:
-                                                    # Enqueue for retry if split failed
-                                                    try:
-                                                        from integrations.libertyrx_queue import enqueue as _lz_enqueue
-                                                        _ = _lz_enqueue(str(fax_id), caller_id or "", _pdf_bytes, _endpoint)
-                                                    except Exception:
-                                                        pass
-                                                    try:
-                                                        self.log.warning(
-                                                            f"LibertyRx: split delivery failed on part {_fail_idx} with status {_fail_status} — queued for retry"
-                                                        )
-                                                    except Exception:
-                                                        pass
-                                            else:
-                                                # No parts created; queue original
-                                                try:
-                                                    from integrations.libertyrx_queue import enqueue as _lz_enqueue
-                                                    _ = _lz_enqueue(str(fax_id), caller_id or "", _pdf_bytes, _endpoint)
-                                                except Exception:
-                                                    pass
-                                                try:
-                                                    self.log.warning(
-                                                        "LibertyRx: 413 received and page splitting failed — queued for retry."
-                                                    )
-                                                except Exception:
-                                                    pass
-                                        else:
-                                            # For 400: stop and log; For 401/429/5xx: enqueue with backoff
-                                            try:
-                                                if _status == 400:
-                                                    self.log.warning("LibertyRx delivery failed with status 400 — not retrying.")
-                                                elif _status == 401:
-                                                    from integrations.libertyrx_queue import enqueue as _lz_enqueue
-                                                    _ = _lz_enqueue(str(fax_id), caller_id or "", _pdf_bytes, _endpoint)
-                                                    self.log.info("LibertyRx delivery failed with status 401 — queued for retry.")
-                                                    try:
-                                                        notif_enabled = (str(getattr(app_state.device_cfg, "notifications_enabled", "Yes") or "Yes").strip().lower() == "yes")
-                                                        if notif_enabled:
-                                                            self._notify_toast(1, "LibertyRx authentication failed. Check NPI/API key or contact support.")
-                                                    except Exception:
-                                                        pass
-                                                else:
-                                                    from integrations.libertyrx_queue import enqueue as _lz_enqueue
-                                                    _ = _lz_enqueue(str(fax_id), caller_id or "", _pdf_bytes, _endpoint)
-                                                    self.log.info(
-                                                        f"LibertyRx delivery failed with status {_status or 'n/a'} — queued for retry."
-                                                    )
-                                            except Exception:
-                                                pass
-                            else:
-                                # Missing NPI/API key or vendor header; log at debug level
-                                try:
-                                    self.log.debug("LibertyRx enabled but missing NPI/API key or vendor header — skipping delivery.")
-                                except Exception:
-                                    pass
-                    except Exception:
-                        try:
-                            self.log.debug("LibertyRx forwarding block failed", exc_info=True)
-                        except Exception:
-                            pass
+        # Outbound reconciliation (Stage 2): correlate accepted jobs and notify
+        if account.primary and maintenance:
+            try:
+                self._reconcile_outbound_status(base_url, fax_user, headers)
+            except Exception:
+                self.log.exception("Outbound reconciliation encountered an error")
 
-                    # Convert as requested
-                    if "JPG" in selected_formats:
-                        jpgs = convert_pdf_to_jpg(pdf_path, jpg_prefix, self.base_dir)
-                        if not jpgs:
-                            self.log.error("JPG conversion failed for one fax PDF")
-                    if "TIFF" in selected_formats:
-                        tiff_ok = convert_pdf_to_multipage_tiff(pdf_path, tiff_path, dpi=200)
-                        if not tiff_ok:
-                            self.log.error("TIFF conversion failed for one fax PDF")
-
-                    # If PDF is not requested and not needed for printing, remove it
-                    if ("PDF" not in selected_formats) and (not should_print) and os.path.exists(pdf_path):
-                        try:
-                            os.remove(pdf_path)
-                        except Exception:
-                            self.log.debug("Failed to remove PDF after conversions", exc_info=True)
+        if listed_ok:
+            newest = max((str(f.get("created_at") or "") for f in all_faxes), default="")
+            cursor.success(time.monotonic(), newest)
+        else:
+            cursor.failure(time.monotonic())
+        return processed
+
+    def _fetch_fax(
+        self,
+        fax: dict,
+        account: ReceiverAccount,
+        base_url: str,
+        headers: dict,
+        inbox_path: str,
+        selected_formats: set,
+        should_print: bool,
+        cutoff_dt: datetime,
+        deleted_from_skyswitch: set,
+        maintenance: bool = True,
+    ) -> dict | None:
+        """Retention check, download, LibertyRx hand-off and conversion submit for one fax.
+
+        Returns the work item for _finish_fax, or None when the fax needs nothing more."""
+        fax_user = account.fax_user
+        fax_id = fax.get("id")
+        caller_id = (fax.get("caller_id") or "").strip()
+        created_at = fax.get("created_at")
+        pdf_url = fax.get("pdf")
+
+        # Skip if missing essentials
+        if not fax_id or not pdf_url or not created_at:
+            return None
+
+        # Parse timestamp FIRST (assume Zulu ISO)
+        try:
+            if "." in created_at:
+                ts = datetime.strptime(
+                    created_at, "%Y-%m-%dT%H:%M:%S.%fZ"
+                ).replace(tzinfo=timezone.utc)
+            else:
+                ts = datetime.strptime(
+                    created_at, "%Y-%m-%dT%H:%M:%SZ"
+                ).replace(tzinfo=timezone.utc)
+        except Exception:
+            self.log.exception(f"Failed to parse timestamp: created_at='{created_at}'")
+            ts = datetime.now(timezone.utc)
 
-                    # Optional printing hook
-                    if should_print:
-                        try:
-                            self._print_pdf(pdf_path)
-                        except Exception as pe:
-                            self.log.error(
-                                f"Failed to start print job for {pdf_path}: {pe}"
-                            )
+        # Retention check BEFORE download check — ensures expired faxes
+        # are deleted from SkySwitch even if already downloaded (maintenance passes only)
+        if ts < cutoff_dt:
+            if maintenance and self._delete_server_fax(base_url, fax_user, fax_id, headers):
+                deleted_from_skyswitch.add(str(fax_id))
+            return None
 
-                    # Post-Liberty purge (if configured)
-                    try:
-                        keep_local = ((device_config.get("Integrations", "liberty_keep_local_copy", "Yes") or "Yes").strip().lower() == "yes")
-                        if (enabled and software == "LibertyRx" and liberty_delivered_ok and not keep_local):
-                            # Remove local copies (PDF, JPGs, TIFF) for this fax
-                            try:
-                                if os.path.exists(pdf_path):
-                                    os.remove(pdf_path)
-                            except Exception:
-                                pass
-                            try:
-                                # Delete generated JPGs
-                                for n in os.listdir(inbox_path):
-                                    if n.startswith(file_base + "-") and n.lower().endswith(".jpg"):
-                                        try:
-                                            os.remove(os.path.join(inbox_path, n))
-                                        except Exception:
-                                            pass
-                            except Exception:
-                                pass
-                            try:
-                                if os.path.exists(tiff_path):
-                                    os.remove(tiff_path)
-                            except Exception:
-                                pass
-                            try:
-                                self.log.info("LibertyRx: purged local copies after successful delivery per settings.")
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
+        # If we've already downloaded/processed this fax, skip.
+        try:
+            if is_downloaded(self.base_dir, str(fax_id)):
+                return None
+        except Exception:
+            self.log.exception("Failed to check history_index.is_downloaded")
+
+        # Build filename
+        file_base = self._build_filename(fax_id, caller_id, ts, prefix=account.label)
+        pdf_name = f"{file_base}.pdf"
+        pdf_path = os.path.join(inbox_path, pdf_name)
+        jpg_prefix = os.path.join(inbox_path, file_base)
+
+        # Skip if all requested outputs already exist
+        # Snapshot lookup first; only a hit is confirmed on disk
+        already_have_pdf = (
+            inbox_index.contains(self.base_dir, inbox_path, pdf_path, refresh_first=False)
+            and os.path.exists(pdf_path)
+        )
+        tiff_path = os.path.join(inbox_path, f"{file_base}.tiff")
 
-                    # MARK DOWNLOADED ONLY AFTER ALL SUCCESSFUL SIDE EFFECTS
+        # Download PDF if needed (conversion requires PDF)
+        if not already_have_pdf:
+            r = requests.get(pdf_url, headers=headers, timeout=60)
+            if r.status_code != 200:
+                self.log.error(
+                    f"Failed to download fax {fax_id}: HTTP {r.status_code}"
+                )
+                return None
+            with open(pdf_path, "wb") as f:
+                f.write(r.content)
+            self.log.info(f"Downloaded fax {fax_id} -> {pdf_path}")
+
+        # --- LibertyRx forwarding (if enabled; primary account only) ---
+        # Delivery runs on the forwarding stage; this pass only waits for it
+        # when local copies are to be purged after a confirmed delivery.
+        liberty_future = None
+        if account.primary:
+            try:
+                dev_settings = getattr(app_state.device_cfg, "integration_settings", {}) or {}
+                glob_settings = getattr(app_state.global_cfg, "integration_settings", {}) or {}
+                enabled = (
+                    (dev_settings.get("enable_third_party") or glob_settings.get("enable_third_party") or "No").strip().lower()
+                    == "yes"
+                )
+                software = (
+                    dev_settings.get("integration_software")
+                    or glob_settings.get("integration_software")
+                    or "None"
+                ).strip()
+
+                if enabled and software == "LibertyRx":
+                    # Read PDF into memory; later steps may remove the file
                     try:
-                        from utils.history_index import mark_downloaded
-                        mark_downloaded(self.base_dir, str(fax_id))
-                        try:
-                            queue_post(self.base_dir, str(fax_id))
-                        except Exception:
-                            pass
+                        with open(pdf_path, "rb") as _f:
+                            _pdf_bytes = _f.read()
                     except Exception:
-                        self.log.exception("Failed to mark downloaded at end of processing loop")
+                        _pdf_bytes = b""
+                    if _pdf_bytes:
+                        liberty_future = get_forwarder().submit(
+                            str(fax_id), caller_id or "", _pdf_bytes, notify=self._notify_liberty
+                        )
+            except Exception:
+                try:
+                    self.log.debug("LibertyRx forwarding block failed", exc_info=True)
+                except Exception:
+                    pass
 
-                    processed += 1
-                except Exception as ie:
-                    self.log.exception("Error processing fax item")
+        # Convert as requested, on the shared conversion pool
+        conversion = None
+        if "JPG" in selected_formats or "TIFF" in selected_formats:
+            conversion = get_scheduler().conversion_pool().submit(
+                _convert_outputs, pdf_path, jpg_prefix, tiff_path, self.base_dir, selected_formats
+            )
 
-            try:
-                outbound_deleted = self._cleanup_server_outbound(base_url, fax_user, headers, cutoff_dt)
-                deleted_from_skyswitch.update(outbound_deleted)
-            except Exception as oe:
-                self.log.exception("Outbound cleanup encountered an error")
+        return {
+            "fax_id": str(fax_id),
+            "pdf_path": pdf_path,
+            "tiff_path": tiff_path,
+            "conversion": conversion,
+            "liberty_future": liberty_future,
+        }
+
+    def _finish_fax(
+        self,
+        item: dict,
+        account: ReceiverAccount,
+        inbox_path: str,
+        selected_formats: set,
+        should_print: bool,
+    ) -> bool:
+        """Wait for conversions, then print/purge/index and mark the fax downloaded."""
+        try:
+            fax_id = item["fax_id"]
+            pdf_path = item["pdf_path"]
+            tiff_path = item["tiff_path"]
+            liberty_future = item["liberty_future"]
 
-            # Prune deleted fax IDs from local and server history
-            if deleted_from_skyswitch:
+            jpgs = []
+            if item["conversion"] is not None:
                 try:
-                    from utils.history_index import remove_ids
-                    remove_ids(self.base_dir, deleted_from_skyswitch)
+                    jpgs, tiff_ok = item["conversion"].result()
                 except Exception:
-                    self.log.exception("Failed to prune local history")
+                    self.log.exception("Conversion failed for one fax PDF")
+                    jpgs, tiff_ok = [], False
+                if "JPG" in selected_formats and not jpgs:
+                    self.log.error("JPG conversion failed for one fax PDF")
+                if "TIFF" in selected_formats and not tiff_ok:
+                    self.log.error("TIFF conversion failed for one fax PDF")
+
+            # If PDF is not requested and not needed for printing, remove it
+            if ("PDF" not in selected_formats) and (not should_print) and os.path.exists(pdf_path):
                 try:
-                    from core.history_sync import queue_prune
-                    queue_prune(self.base_dir, list(deleted_from_skyswitch))
+                    os.remove(pdf_path)
                 except Exception:
-                    self.log.exception("Failed to queue server history prune")
-                self.log.info(f"Pruned {len(deleted_from_skyswitch)} expired fax ID(s) from history.")
+                    self.log.debug("Failed to remove PDF after conversions", exc_info=True)
 
-            # Local inbox cleanup (delete old downloaded files)
-            try:
-                self._cleanup_local_inbox(inbox_path, cutoff_dt)
-            except Exception as le:
-                self.log.exception("Local inbox cleanup encountered an error")
+            # Optional printing hook
+            if should_print:
+                try:
+                    self._print_pdf(pdf_path)
+                except Exception as pe:
+                    self.log.error(
+                        f"Failed to start print job for {pdf_path}: {pe}"
+                    )
 
-            # Outbound reconciliation (Stage 2): correlate accepted jobs and notify
+            # Post-Liberty purge (if configured)
             try:
-                self._reconcile_outbound_status(base_url, fax_user, headers)
+                if (
+                    liberty_future is not None
+                    and not keep_local_copy()
+                    and LibertyForwarder.wait(liberty_future)
+                ):
+                    # Remove local copies (PDF, JPGs, TIFF) for this fax
+                    for _p in [pdf_path, tiff_path] + list(jpgs or []):
+                        try:
+                            os.remove(_p)
+                        except Exception:
+                            pass
+                    try:
+                        self.log.info("LibertyRx: purged local copies after successful delivery per settings.")
+                    except Exception:
+                        pass
             except Exception:
-                self.log.exception("Outbound reconciliation encountered an error")
+                pass
 
-            self.log.info(f"Receiver pass complete. Processed {processed} item(s).")
+            # Record whatever local outputs remain so the history panel can find them by ID
             try:
-                notif_enabled = (
-                    str(
-                        getattr(app_state.device_cfg, "notifications_enabled", "Yes")
-                        or "Yes"
-                    )
-                    .strip()
-                    .lower()
-                    == "yes"
+                outputs = [pdf_path, tiff_path] + list(jpgs or [])
+                kept = inbox_index.record_files(self.base_dir, inbox_path, fax_id, outputs)
+                inbox_index.forget_files(
+                    self.base_dir, inbox_path, [p for p in outputs if p not in kept]
                 )
-                if processed > 0 and notif_enabled:
-                    self._notify_toast(processed)
             except Exception:
-                self.log.exception("Failed to show toast notification")
-            self.finished.emit()
+                self.log.debug("Failed to update inbox index", exc_info=True)
 
-        except Exception:
-            self.log.exception("Fax retrieval failed")
-            self.finished.emit()
-        finally:
-            self._release_run_lock()
+            # MARK DOWNLOADED ONLY AFTER ALL SUCCESSFUL SIDE EFFECTS
+            try:
+                from utils.history_index import mark_downloaded
+                mark_downloaded(self.base_dir, fax_id)
+                if account.primary:
+                    try:
+                        queue_post(self.base_dir, fax_id)
+                    except Exception:
+                        pass
+            except Exception:
+                self.log.exception("Failed to mark downloaded at end of processing loop")
+            return True
+        except Exception as ie:
+            self.log.exception("Error processing fax item")
+            return False
 
     def _print_pdf(self, pdf_path: str):
         try:
@@ -770,6 +820,17 @@ class FaxReceiver(QThread):
         except Exception as e:
             self.log.exception(f"Print failed for {pdf_path}")
 
+    def _notify_liberty(self, message: str) -> None:
+        """Operator toast for LibertyRx events; called from forwarding-stage threads."""
+        try:
+            notif_enabled = (
+                str(getattr(app_state.device_cfg, "notifications_enabled", "Yes") or "Yes").strip().lower() == "yes"
+            )
+            if notif_enabled:
+                self._notify_toast(1, message)
+        except Exception:
+            pass
+
     def _notify_toast(self, processed: int, message: str | None = None):
         # If a custom message is provided, skip count validation and use it directly
         if message is None:
@@ -1044,9 +1105,12 @@ class FaxReceiver(QThread):
             return False
 
     def _cleanup_server_outbound(
-        self, base_url: str, fax_user: str, headers: dict, cutoff_dt: datetime
+        self, base_url: str, fax_user: str, headers: dict, cutoff_dt: datetime, upsert_history: bool = True
     ) -> set[str]:
-        """List outbound faxes and delete those older than cutoff_dt. Returns set of deleted IDs."""
+        """List outbound faxes and delete those older than cutoff_dt. Returns set of deleted IDs.
+
+        upsert_history=False skips feeding the local history cache (secondary accounts).
+        """
         deleted: set[str] = set()
         try:
             list_url = f"{base_url}/users/{fax_user}/faxes/outbound"
@@ -1060,7 +1124,14 @@ class FaxReceiver(QThread):
                     )
                     break
                 payload = resp.json() or {}
-                for fax in payload.get("data", []) or []:
+                page_faxes = payload.get("data", []) or []
+                # Keep the local history cache in step with the outbound listing
+                if upsert_history:
+                    try:
+                        get_history_cache(self.base_dir).upsert_entries(page_faxes, direction="Outbound")
+                    except Exception:
+                        pass
+                for fax in page_faxes:
                     try:
                         fax_id = fax.get("id")
                         created_at = fax.get("created_at")
@@ -1097,36 +1168,65 @@ class FaxReceiver(QThread):
         return deleted
 
     def _cleanup_local_inbox(self, inbox_path: str, cutoff_dt: datetime):
-        """Delete local inbox files (PDF/JPG) older than cutoff_dt based on file mtime."""
+        """Delete local inbox files (PDF/JPG/TIFF) older than cutoff_dt based on file mtime.
+
+        Candidates come oldest-first from this pass's inbox snapshot (no new listing);
+        each is re-checked on disk before removal and the index is updated per batch."""
+        started = time.monotonic()
+        removed_total = 0
+        gone_total = 0
+        batches = 0
         try:
-            now = datetime.now(timezone.utc)
-            removed = 0
-            for name in os.listdir(inbox_path):
-                low = name.lower()
-                if not (low.endswith(".pdf") or low.endswith(".jpg") or low.endswith(".tiff") or low.endswith(".tif")):
-                    continue
-                fpath = os.path.join(inbox_path, name)
-                try:
-                    mtime = datetime.fromtimestamp(
-                        os.path.getmtime(fpath), tz=timezone.utc
-                    )
-                except Exception:
-                    continue
-                if mtime < cutoff_dt:
+            cutoff_ts = cutoff_dt.timestamp()
+            candidates = inbox_index.files_older_than(
+                self.base_dir, inbox_path, cutoff_ts, refresh_first=False
+            )
+            for i in range(0, len(candidates), CLEANUP_BATCH):
+                removed = []
+                gone = []
+                for fpath in candidates[i:i + CLEANUP_BATCH]:
                     try:
-                        os.remove(fpath)
-                        removed += 1
-                    except Exception as de:
-                        self.log.exception(f"Failed to remove old file '{fpath}'")
-            if removed:
-                self.log.info(f"Local inbox cleanup removed {removed} old file(s).")
+                        mtime = os.path.getmtime(fpath)
+                    except FileNotFoundError:
+                        gone.append(fpath)
+                        continue
+                    except Exception:
+                        continue
+                    if mtime < cutoff_ts:
+                        try:
+                            os.remove(fpath)
+                            removed.append(fpath)
+                        except Exception as de:
+                            self.log.exception(f"Failed to remove old file '{fpath}'")
+                if removed or gone:
+                    inbox_index.forget_files(self.base_dir, inbox_path, removed + gone)
+                    inbox_index.flush(self.base_dir)
+                removed_total += len(removed)
+                gone_total += len(gone)
+                batches += 1
+            if removed_total or gone_total:
+                self.log.info(
+                    f"Local inbox cleanup removed {removed_total} old file(s) "
+                    f"({gone_total} already gone) in {batches} batch(es), "
+                    f"{int((time.monotonic() - started) * 1000)} ms."
+                )
+            else:
+                self.log.debug(
+                    f"Local inbox cleanup: nothing to remove ({int((time.monotonic() - started) * 1000)} ms)."
+                )
         except Exception as e:
             self.log.exception("Local inbox cleanup error")
+        finally:
+            try:
+                inbox_index.flush(self.base_dir)
+            except Exception:
+                pass
 
-    def _build_filename(self, fax_id: str, caller_id: str, ts: datetime) -> str:
+    def _build_filename(self, fax_id: str, caller_id: str, ts: datetime, prefix: str = "") -> str:
         """
         Build a safe filename base for a fax using the configured naming scheme.
         Always returns a string and strips characters invalid for Windows filenames.
+        prefix (an additional account's label) is prepended when set.
         """
 
         def _sanitize(part: str) -> str:
@@ -1146,6 +1246,9 @@ class FaxReceiver(QThread):
         if naming == "cid" and caller_id:
             # CID-DDMMYY-HHMMSS
             base = f"{_sanitize(caller_id)}-{ts.strftime('%d%m%y-%H%M%S')}"
-            return _sanitize(base)
-        # Default to fax id
-        return _sanitize(fax_id)
+        else:
+            # Default to fax id
+            base = str(fax_id)
+        if prefix:
+            base = f"{prefix}-{base}"
+        return _sanitize(base)
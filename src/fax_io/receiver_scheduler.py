@@ -0,0 +1,249 @@
+"""
+Multi-account receiver scheduling.
+
+One FaxRetriever process can poll several SkySwitch fax users: the primary account
+from global config plus any entries in device config "Fax Options" ->
+receiver_accounts, a list of objects:
+
+    {"fax_user": "200@sample.12345.service",   # required
+     "label": "Northside",                     # optional; prefixes file names
+     "jwt_token_enc": "<DPAPI>"}                # optional; FRA JWT for this account
+
+- Each account has its own cursor (last pass, newest fax seen, failure backoff),
+  so a failing account is retried less often without delaying the others.
+- Bearers come from one cache shared by all accounts. The primary bearer is the one
+  MainWindow keeps fresh; an account with its own JWT gets a bearer minted via FRA
+  /bearer and cached until shortly before it expires; accounts without a JWT reuse
+  the primary bearer.
+- run_interleaved() advances the per-account pipelines (generators) round-robin one
+  step at a time, so a large backlog on one account does not starve the others.
+  Index/history updates stay on the receiver thread.
+- Only the primary account feeds the local history cache; the history panel lists
+  the primary fax user with the primary bearer.
+- JPG/TIFF conversions from every pipeline run on one shared pool off the receiver
+  thread. Rendering is PyMuPDF work under utils.pdf_utils.FITZ_LOCK, so the pool has
+  one worker ("Fax Options" -> conversion_workers is accepted for compatibility but
+  capped at MAX_CONVERSION_WORKERS).
+"""
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from core.app_state import app_state
+from core.config_loader import device_config
+from utils.logging_utils import get_logger
+from utils.secure_store import secure_decrypt_for_machine
+
+log = get_logger("receiver_scheduler")
+
+# PyMuPDF calls are serialized app-wide (utils.pdf_utils.FITZ_LOCK); more workers would only queue on it
+DEFAULT_CONVERSION_WORKERS = 1
+MAX_CONVERSION_WORKERS = 1
+# Minted bearers are refreshed this long before they expire
+BEARER_REFRESH_MARGIN = timedelta(minutes=10)
+# Failed accounts are skipped for base * 2^(failures-1) seconds, capped
+BACKOFF_BASE_SECONDS = 60.0
+BACKOFF_MAX_SECONDS = 1800.0
+
+
+class ReceiverAccount:
+    __slots__ = ("fax_user", "label", "jwt_token_enc", "primary")
+
+    def __init__(self, fax_user: str, label: str = "", jwt_token_enc: str = "", primary: bool = False):
+        self.fax_user = fax_user
+        self.label = label
+        self.jwt_token_enc = jwt_token_enc
+        self.primary = primary
+
+    def __repr__(self) -> str:
+        return f"ReceiverAccount({self.label or self.fax_user!r}, primary={self.primary})"
+
+
+def load_accounts() -> List[ReceiverAccount]:
+    """Primary account first, then configured additional accounts (deduplicated by fax_user)."""
+    accounts: List[ReceiverAccount] = []
+    seen = set()
+    primary = (getattr(app_state.global_cfg, "fax_user", None) or "").strip()
+    if primary:
+        accounts.append(ReceiverAccount(primary, primary=True))
+        seen.add(primary.lower())
+    try:
+        extra = device_config.get("Fax Options", "receiver_accounts", []) or []
+    except Exception:
+        extra = []
+    if not isinstance(extra, list):
+        return accounts
+    for entry in extra:
+        if not isinstance(entry, dict):
+            continue
+        fax_user = str(entry.get("fax_user") or "").strip()
+        if not fax_user or fax_user.lower() in seen:
+            continue
+        seen.add(fax_user.lower())
+        accounts.append(
+            ReceiverAccount(
+                fax_user,
+                label=str(entry.get("label") or "").strip(),
+                jwt_token_enc=str(entry.get("jwt_token_enc") or ""),
+            )
+        )
+    return accounts
+
+
+def _parse_expiry(value) -> Optional[datetime]:
+    try:
+        dt = datetime.fromisoformat(str(value))
+        return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+    except Exception:
+        return None
+
+
+class BearerCache:
+    """SkySwitch bearers keyed by the credential that mints them (shared across accounts)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, tuple] = {}  # jwt_token_enc -> (bearer, expires_at)
+
+    def get(self, account: ReceiverAccount) -> Optional[str]:
+        if account.primary or not account.jwt_token_enc:
+            return app_state.global_cfg.bearer_token or None
+        key = account.jwt_token_enc
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[1] and entry[1] - BEARER_REFRESH_MARGIN > now:
+                return entry[0]
+            try:
+                jwt_token = secure_decrypt_for_machine(key) or ""
+            except Exception:
+                jwt_token = ""
+            if not jwt_token:
+                log.warning(f"Receiver account {account.label or account.fax_user}: JWT unavailable")
+                return None
+            try:
+                from core.license_client import fetch_bearer
+                data = fetch_bearer(jwt_token)
+            except Exception as e:
+                data = {"error": str(e)}
+            if data.get("error"):
+                log.warning(f"Receiver account {account.label or account.fax_user}: bearer refresh failed")
+                return None
+            self._entries[key] = (data["bearer_token"], _parse_expiry(data.get("expires_at")))
+            return data["bearer_token"]
+
+    def invalidate(self, account: ReceiverAccount) -> None:
+        """Drop a minted bearer after a 401 so the next pass mints a new one."""
+        with self._lock:
+            self._entries.pop(account.jwt_token_enc, None)
+
+
+class AccountCursor:
+    """Per-account polling state."""
+
+    def __init__(self):
+        self.last_pass_at = 0.0
+        self.last_success_at = 0.0
+        self.newest_created_at = ""
+        self.failures = 0
+        self.next_due = 0.0
+
+    def due(self, now: float) -> bool:
+        return now >= self.next_due
+
+    def success(self, now: float, newest_created_at: str = "") -> None:
+        self.last_pass_at = self.last_success_at = now
+        if newest_created_at > self.newest_created_at:
+            self.newest_created_at = newest_created_at
+        self.failures = 0
+        self.next_due = 0.0
+
+    def failure(self, now: float) -> None:
+        self.last_pass_at = now
+        self.failures += 1
+        delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** (self.failures - 1)))
+        self.next_due = now + delay
+
+
+class ReceiverScheduler:
+    def __init__(self):
+        self.bearers = BearerCache()
+        self._cursors: Dict[str, AccountCursor] = {}
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def cursor(self, account: ReceiverAccount) -> AccountCursor:
+        with self._lock:
+            cur = self._cursors.get(account.fax_user.lower())
+            if cur is None:
+                cur = self._cursors[account.fax_user.lower()] = AccountCursor()
+            return cur
+
+    def due_accounts(self, accounts: Iterable[ReceiverAccount]) -> List[ReceiverAccount]:
+        """Accounts to poll this pass; the primary account is never skipped."""
+        now = time.monotonic()
+        due = []
+        for acct in accounts:
+            cur = self.cursor(acct)
+            if acct.primary or cur.due(now):
+                due.append(acct)
+            else:
+                log.debug(
+                    f"Receiver account {acct.label or acct.fax_user} backing off "
+                    f"({int(cur.next_due - now)}s left after {cur.failures} failure(s))"
+                )
+        return due
+
+    def conversion_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=_conversion_workers(), thread_name_prefix="FaxConvert"
+                )
+            return self._pool
+
+    @staticmethod
+    def run_interleaved(pipelines: List[Iterator]) -> List[int]:
+        """Advance each pipeline one step at a time, round-robin, until all finish.
+
+        A pipeline is a generator that yields between units of work and returns its
+        processed count. Returns the counts in pipeline order.
+        """
+        results = [0] * len(pipelines)
+        active = list(enumerate(pipelines))
+        while active:
+            still = []
+            for idx, gen in active:
+                try:
+                    next(gen)
+                    still.append((idx, gen))
+                except StopIteration as stop:
+                    results[idx] = int(stop.value or 0)
+                except Exception:
+                    log.exception("Receiver account pipeline failed")
+            active = still
+        return results
+
+
+def _conversion_workers() -> int:
+    try:
+        n = int(device_config.get("Fax Options", "conversion_workers", DEFAULT_CONVERSION_WORKERS) or DEFAULT_CONVERSION_WORKERS)
+    except Exception:
+        n = DEFAULT_CONVERSION_WORKERS
+    return max(1, min(MAX_CONVERSION_WORKERS, n))
+
+
+_scheduler: Optional[ReceiverScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> ReceiverScheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = ReceiverScheduler()
+        return _scheduler
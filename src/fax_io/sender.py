@@ -3,8 +3,14 @@ Handles outbound fax transmission using SkySwitch API.
 Builds payload, generates cover/continuation pages for multi-part sends, and sends attachments as multipart/form.
 """
 
+import binascii
+import bisect
+import hashlib
 import os
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 
 import requests
@@ -21,11 +27,9 @@ from core.outbox_ledger import (
     mark_accepted,
     update_metadata,
 )
-from utils.document_utils import (
-    normalize_pdf,
-    generate_cover_pdf_with_multipart_note,
-    generate_continuation_pdf,
-)
+from utils.document_utils import normalize_pdf
+from utils.cover_templates import continuation_pdf_bytes, multipart_cover_pdf_bytes
+from utils.fax_compression import compress_pdf_for_fax, compression_enabled
 from utils.logging_utils import get_logger
 
 log = get_logger("send_client")
@@ -44,10 +48,213 @@ MULTIPART_BASE_OVERHEAD = 2048  # bytes
 MULTIPART_PER_FILE_OVERHEAD = 512  # bytes
 
 
+# Opt-in concurrent session uploads ("Fax Options" -> send_session_concurrency); 1 = sequential
+MAX_PARALLEL_SESSIONS = 4
+
+# Minimum spacing between byte-progress callbacks
+PROGRESS_MIN_BYTES = 64 * 1024
+PROGRESS_MIN_SECONDS = 0.1
+
+_UPLOAD_CHUNK = 64 * 1024
+
+
 def _estimate_overhead(num_files: int) -> int:
     return MULTIPART_BASE_OVERHEAD + num_files * MULTIPART_PER_FILE_OVERHEAD
 
 
+def _fax_compress(path: str, npath: str, temp_paths: list) -> str:
+    """Swap in the bilevel G4 re-encode of path when enabled and smaller; returns the path to send."""
+    if not npath or not compression_enabled():
+        return npath
+    cpath, before, after = compress_pdf_for_fax(path)
+    if not cpath:
+        return npath
+    temp_paths.append(cpath)
+    log.info(f"Attachment compressed for fax: {before} -> {after} bytes")
+    return cpath
+
+
+def _generated_item(data, name: str, is_cover: bool):
+    """Session item for an in-memory generated page (cover/continuation); None if generation failed."""
+    if not data:
+        return None
+    return {"path": name, "data": data, "size": len(data), "mime": "application/pdf", "is_cover": is_cover}
+
+
+def _session_concurrency() -> int:
+    try:
+        n = int(device_config.get("Fax Options", "send_session_concurrency", 1) or 1)
+    except Exception:
+        n = 1
+    return max(1, min(MAX_PARALLEL_SESSIONS, n))
+
+
+def _hash_file(path: str, digest) -> bool:
+    """Feed a file to digest in chunks; False if it could not be read."""
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return True
+    except Exception:
+        return False
+
+
+def _quote_param(value: str) -> str:
+    # Same escaping urllib3 applies to multipart header parameters
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace('"', "%22")
+        .replace("\r", "%0D")
+        .replace("\n", "%0A")
+    )
+
+
+class _MultipartStream:
+    """
+    multipart/form-data body equivalent to requests' data=/files= encoding, read lazily
+    from the attachment files with a known Content-Length. Every read is reported to
+    on_read(position) so progress reflects bytes actually handed to the socket; seek/tell
+    let urllib3 rewind the body when it retries.
+    """
+
+    def __init__(self, fields: Dict[str, str], files: List[Dict[str, Any]], on_read=None):
+        self.boundary = binascii.hexlify(os.urandom(16)).decode("ascii")
+        self._on_read = on_read
+        self._segments: List[Any] = []  # bytes (incl. in-memory pages), or (path, size)
+        for name, value in fields.items():
+            self._segments.append(
+                f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote_param(name)}"\r\n\r\n'.encode("utf-8")
+                + str(value).encode("utf-8")
+                + b"\r\n"
+            )
+        for idx, it in enumerate(files):
+            self._segments.append(
+                (
+                    f"--{self.boundary}\r\n"
+                    f'Content-Disposition: form-data; name="filename[{idx}]"; '
+                    f'filename="{_quote_param(os.path.basename(it["path"]))}"\r\n'
+                    f"Content-Type: {it['mime']}\r\n\r\n"
+                ).encode("utf-8")
+            )
+            if it.get("data") is not None:
+                self._segments.append(it["data"])
+            else:
+                self._segments.append((it["path"], os.path.getsize(it["path"])))
+            self._segments.append(b"\r\n")
+        self._segments.append(f"--{self.boundary}--\r\n".encode("ascii"))
+        self._starts: List[int] = []
+        total = 0
+        for seg in self._segments:
+            self._starts.append(total)
+            total += len(seg) if isinstance(seg, bytes) else seg[1]
+        self.len = total
+        self._pos = 0
+        self._handles: Dict[str, Any] = {}
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self.len
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(_UPLOAD_CHUNK)
+            if not chunk:
+                return
+            yield chunk
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        base = {0: 0, 1: self._pos, 2: self.len}.get(whence, 0)
+        self._pos = max(0, min(self.len, base + int(offset)))
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self.len - self._pos
+        out = []
+        while size > 0 and self._pos < self.len:
+            i = bisect.bisect_right(self._starts, self._pos) - 1
+            seg = self._segments[i]
+            off = self._pos - self._starts[i]
+            if isinstance(seg, bytes):
+                data = seg[off:off + size]
+            else:
+                path, seg_len = seg
+                fh = self._handles.get(path)
+                if fh is None:
+                    fh = self._handles[path] = open(path, "rb")
+                fh.seek(off)
+                data = fh.read(min(size, seg_len - off))
+                if not data:
+                    raise IOError(f"Attachment changed during upload: {path}")
+            out.append(data)
+            self._pos += len(data)
+            size -= len(data)
+        if self._on_read:
+            try:
+                self._on_read(self._pos)
+            except Exception:
+                pass
+        return b"".join(out)
+
+    def close(self) -> None:
+        for fh in self._handles.values():
+            try:
+                fh.close()
+            except Exception:
+                log.debug("Failed to close file handle after session", exc_info=True)
+        self._handles.clear()
+
+
+class _ByteProgress:
+    """Aggregates per-session upload positions into throttled progress callbacks."""
+
+    def __init__(self, callback, total_sessions: int, total_bytes: int):
+        self._cb = callback
+        self._total_sessions = total_sessions
+        self._total_bytes = total_bytes
+        self._lock = threading.Lock()
+        self._positions: Dict[int, int] = {}
+        self._current = 0
+        self._last_bytes = -1
+        self._last_time = 0.0
+
+    def session_started(self, index: int) -> None:
+        with self._lock:
+            self._current = max(self._current, index)
+        self._emit(force=True)
+
+    def update(self, index: int, position: int) -> None:
+        with self._lock:
+            self._positions[index] = position
+        self._emit()
+
+    def _emit(self, force: bool = False) -> None:
+        if not self._cb:
+            return
+        with self._lock:
+            sent = sum(self._positions.values())
+            now = time.monotonic()
+            if not force and sent < self._total_bytes and (
+                sent - self._last_bytes < PROGRESS_MIN_BYTES or now - self._last_time < PROGRESS_MIN_SECONDS
+            ):
+                return
+            self._last_bytes = sent
+            self._last_time = now
+            current = self._current
+        try:
+            self._cb(current, self._total_sessions, sent, self._total_bytes)
+        except Exception:
+            pass
+
+
 def plan_sessions(base_dir: str, attachments: list, include_cover: bool) -> int:
     """Estimate the exact number of sessions that will be used to send the fax.
 
@@ -68,6 +275,7 @@ def plan_sessions(base_dir: str, attachments: list, include_cover: bool) -> int:
                 pass
             if not npath or not os.path.exists(npath):
                 continue
+            npath = _fax_compress(path, npath, temp_paths)
             try:
                 size = os.path.getsize(npath)
             except Exception:
@@ -111,41 +319,21 @@ def plan_sessions(base_dir: str, attachments: list, include_cover: bool) -> int:
                 memo = ""
             # Session 1 cover handling
             try:
-                if sessions[0] and sessions[0][0].get("is_cover"):
-                    rep = generate_cover_pdf_with_multipart_note(attn, memo, session_idx=1, session_total=N, base_dir=base_dir)
-                    if rep:
-                        sessions[0][0] = {
-                            "path": rep,
-                            "size": os.path.getsize(rep),
-                            "mime": "application/pdf",
-                            "is_cover": True,
-                        }
-                        temp_paths.append(rep)
-                else:
-                    rep = generate_cover_pdf_with_multipart_note(attn, memo, session_idx=1, session_total=N, base_dir=base_dir)
-                    if rep:
-                        sessions[0].insert(0, {
-                            "path": rep,
-                            "size": os.path.getsize(rep),
-                            "mime": "application/pdf",
-                            "is_cover": True,
-                        })
-                        temp_paths.append(rep)
+                rep = _generated_item(multipart_cover_pdf_bytes(attn, memo, 1, N), "cover.pdf", True)
+                if rep:
+                    if sessions[0] and sessions[0][0].get("is_cover"):
+                        sessions[0][0] = rep
+                    else:
+                        sessions[0].insert(0, rep)
             except Exception:
                 # If cover gen fails, proceed without it
                 pass
             # Continuation pages for sessions 2..N
             for i in range(1, N):
                 try:
-                    cont = generate_continuation_pdf(session_idx=i+1, session_total=N, base_dir=base_dir)
+                    cont = _generated_item(continuation_pdf_bytes(i + 1, N), f"continuation_{i + 1}.pdf", False)
                     if cont:
-                        sessions[i].insert(0, {
-                            "path": cont,
-                            "size": os.path.getsize(cont),
-                            "mime": "application/pdf",
-                            "is_cover": False,
-                        })
-                        temp_paths.append(cont)
+                        sessions[i].insert(0, cont)
                 except Exception:
                     pass
             # Re-validate sizes after inserts; shift items if needed
@@ -198,6 +386,10 @@ class FaxSender:
             recipient (str): Phone number of the recipient
             attachments (list): List of file paths (UI may have inserted a cover at index 0 if include_cover)
             include_cover (bool): Whether a cover was included by UI as the first item
+            progress_callback: Optional fn(current_session, total_sessions, bytes_sent, bytes_total)
+
+        Sessions upload one at a time unless "Fax Options" -> send_session_concurrency
+        is above 1 (capped at MAX_PARALLEL_SESSIONS).
 
         Returns:
             bool: True if successful, False otherwise
@@ -231,9 +423,18 @@ class FaxSender:
         temp_paths: List[str] = []  # for cleanup (normalized PDFs and generated pages)
         temp_handles: List[Any] = []  # for closing
         normalized_items: List[Dict[str, Any]] = []
+        # Short SHA-256 of the first attachment for ledger correlation
+        first_hash = None
         try:
             for idx, path in enumerate(attachments):
-                npath = normalize_pdf(path) if (path and path.lower().endswith(".pdf")) else path
+                digest = hashlib.sha256() if idx == 0 else None
+                npath = normalize_pdf(path, digest=digest) if (path and path.lower().endswith(".pdf")) else path
+                if digest is not None and path:
+                    # normalize_pdf hashed the original while loading it; otherwise hash it in chunks
+                    if npath == path:
+                        digest = hashlib.sha256()
+                    if npath != path or _hash_file(path, digest):
+                        first_hash = digest.hexdigest()[:12]
                 try:
                     if npath != path and npath and npath.startswith(tempfile.gettempdir()):
                         temp_paths.append(npath)
@@ -243,6 +444,7 @@ class FaxSender:
                 if not npath or not os.path.exists(npath):
                     log.warning(f"Attachment missing: {path}")
                     continue
+                npath = _fax_compress(path, npath, temp_paths)
                 size = 0
                 try:
                     size = os.path.getsize(npath)
@@ -307,62 +509,25 @@ class FaxSender:
 
                 # Session 1 cover handling
                 try:
-                    if sessions[0] and sessions[0][0].get("is_cover"):
-                        rep = generate_cover_pdf_with_multipart_note(
-                            attn, memo, session_idx=1, session_total=N, base_dir=base_dir
+                    rep = _generated_item(multipart_cover_pdf_bytes(attn, memo, 1, N), "cover.pdf", True)
+                    if not rep:
+                        log.warning(
+                            "ReportLab unavailable or cover-with-note generation failed; proceeding without multi-part note on cover."
                         )
-                        if rep:
-                            sessions[0][0] = {
-                                "path": rep,
-                                "size": os.path.getsize(rep),
-                                "mime": "application/pdf",
-                                "is_cover": True,
-                            }
-                            temp_paths.append(rep)
-                        else:
-                            log.warning(
-                                "ReportLab unavailable or cover-with-note generation failed; proceeding without multi-part note on cover."
-                            )
+                    elif sessions[0] and sessions[0][0].get("is_cover"):
+                        sessions[0][0] = rep
                     else:
                         # Insert generated cover with multipart note at the start of session 1
-                        rep = generate_cover_pdf_with_multipart_note(
-                            attn, memo, session_idx=1, session_total=N, base_dir=base_dir
-                        )
-                        if rep:
-                            sessions[0].insert(
-                                0,
-                                {
-                                    "path": rep,
-                                    "size": os.path.getsize(rep),
-                                    "mime": "application/pdf",
-                                    "is_cover": True,
-                                },
-                            )
-                            temp_paths.append(rep)
-                        else:
-                            log.warning(
-                                "ReportLab unavailable or cover-with-note generation failed; proceeding without generated cover."
-                            )
+                        sessions[0].insert(0, rep)
                 except Exception:
                     log.exception("Error while preparing cover-with-note for session 1")
 
                 # Continuation pages for sessions 2..N
                 for i in range(1, N):
                     try:
-                        cont = generate_continuation_pdf(
-                            session_idx=i + 1, session_total=N, base_dir=base_dir
-                        )
+                        cont = _generated_item(continuation_pdf_bytes(i + 1, N), f"continuation_{i + 1}.pdf", False)
                         if cont:
-                            sessions[i].insert(
-                                0,
-                                {
-                                    "path": cont,
-                                    "size": os.path.getsize(cont),
-                                    "mime": "application/pdf",
-                                    "is_cover": False,
-                                },
-                            )
-                            temp_paths.append(cont)
+                            sessions[i].insert(0, cont)
                         else:
                             log.warning(
                                 "ReportLab unavailable or continuation page generation failed; proceeding without continuation page."
@@ -403,6 +568,8 @@ class FaxSender:
             endpoint = f"https://telco-api.skyswitch.com/users/{fax_user}/faxes/send"
             headers = {"Authorization": f"Bearer {app_state.global_cfg.bearer_token}"}
 
+            concurrency = min(_session_concurrency(), len(sessions))
+
             # Prepare retrying session
             def _get_session() -> requests.Session:
                 try:
@@ -416,7 +583,7 @@ class FaxSender:
                         allowed_methods=["POST", "GET"],
                         raise_on_status=False,
                     )
-                    adapter = HTTPAdapter(max_retries=retry)
+                    adapter = HTTPAdapter(pool_maxsize=max(1, concurrency), max_retries=retry)
                     s.mount("https://", adapter)
                     s.mount("http://", adapter)
                     return s
@@ -472,101 +639,95 @@ class FaxSender:
             except Exception:
                 key = None
 
+            total = len(sessions)
+            bodies = [
+                _MultipartStream(
+                    {"caller_id": caller_digits, "destination": dest_digits},
+                    part,
+                    on_read=(lambda pos, i=i: progress.update(i, pos)),
+                )
+                for i, part in enumerate(sessions, start=1)
+            ]
+            progress = _ByteProgress(progress_callback, total, sum(len(b) for b in bodies))
+
             # Report planned total sessions via callback if provided
-            try:
-                if progress_callback:
-                    progress_callback(0, len(sessions))
-            except Exception:
-                pass
+            progress.session_started(0)
 
             session_client = _get_session()
-            total_bytes_sent = 0
-            for i, part in enumerate(sessions, start=1):
-                # Notify progress (current session index, total)
+            abort = threading.Event()
+
+            def _send_part(i: int, part: List[Dict[str, Any]]):
+                """Upload one session. Returns (ok, ledger failure reason or None, bytes)."""
+                body = bodies[i - 1]
+                if abort.is_set():
+                    body.close()
+                    return False, None, 0
+                progress.session_started(i)
                 try:
-                    if progress_callback:
-                        progress_callback(i, len(sessions))
-                except Exception:
-                    pass
-                # Build files for this part
-                files = {}
-                handles_this: List[Any] = []
-                try:
-                    for idx, it in enumerate(part):
-                        fh = open(it["path"], "rb")
-                        handles_this.append(fh)
-                        files[f"filename[{idx}]"] = (
-                            os.path.basename(it["path"]),
-                            fh,
-                            it["mime"],
-                        )
-
-                    data = {"caller_id": caller_digits, "destination": dest_digits}
-
-                    est_bytes = sum(x.get("size", 0) for x in part) + _estimate_overhead(
-                        len(part)
-                    )
                     log.info(
-                        f"Sending session {i}/{len(sessions)} with {len(part)} attachment(s); est bytes ≈ {est_bytes}"
+                        f"Sending session {i}/{total} with {len(part)} attachment(s); {len(body)} bytes"
                     )
+                    started = time.monotonic()
                     resp = session_client.post(
-                        endpoint, data=data, files=files, headers=headers, timeout=60
+                        endpoint,
+                        data=body,
+                        headers=dict(headers, **{"Content-Type": body.content_type}),
+                        timeout=60,
                     )
                     code = getattr(resp, "status_code", 0)
                     if code == 429:
                         log.warning("Manual send throttled by provider (429). Aborting remaining sessions.")
-                        # Record failure/backoff
-                        if key:
-                            job = record_failure(base_dir, key, "HTTP 429")
-                            attempts = int(job.get("attempts", 0))
-                            if attempts >= 3:
-                                mark_quarantined(base_dir, key, reason="HTTP 429")
-                                _notify_toast(f"Fax failed after 3 attempts to {dest_digits}.")
-                        return False
+                        abort.set()
+                        return False, "HTTP 429", 0
                     if not (200 <= code < 300):
-                        body = None
-                        try:
-                            body = resp.text[:300]
-                        except Exception:
-                            body = ""
-                        log.error(f"Session {i}/{len(sessions)} failed: {code} {body}")
-                        if key:
-                            job = record_failure(base_dir, key, f"HTTP {code}")
-                            attempts = int(job.get("attempts", 0))
-                            if attempts >= 3:
-                                mark_quarantined(base_dir, key, reason=f"HTTP {code}")
-                                _notify_toast(f"Fax failed after 3 attempts to {dest_digits}.")
-                        return False
-                    else:
-                        log.info(f"Session {i}/{len(sessions)} sent successfully.")
-                        # Accumulate bytes
                         try:
-                            total_bytes_sent += est_bytes
+                            text = resp.text[:300]
                         except Exception:
-                            pass
+                            text = ""
+                        log.error(f"Session {i}/{total} failed: {code} {text}")
+                        abort.set()
+                        return False, f"HTTP {code}", 0
+                    elapsed = max(0.001, time.monotonic() - started)
+                    log.info(
+                        f"Session {i}/{total} sent successfully ({len(body)} bytes, {len(body) / elapsed / 1024:.0f} KiB/s)."
+                    )
+                    return True, None, len(body)
+                except Exception:
+                    log.exception(f"Unexpected error sending session {i}/{total}")
+                    abort.set()
+                    return False, None, 0
                 finally:
-                    # Close per-session handles
-                    for fh in handles_this:
-                        try:
-                            fh.close()
-                        except Exception:
-                            log.debug("Failed to close file handle after session", exc_info=True)
+                    body.close()
+
+            if concurrency > 1:
+                log.info(f"Uploading up to {concurrency} sessions concurrently.")
+                with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                    results = list(pool.map(lambda job: _send_part(*job), enumerate(sessions, start=1)))
+            else:
+                results = []
+                for i, part in enumerate(sessions, start=1):
+                    results.append(_send_part(i, part))
+                    if not results[-1][0]:
+                        break
+
+            total_bytes_sent = sum(r[2] for r in results if r[0])
+            if not all(r[0] for r in results):
+                # Only provider rejections count against the ledger's retry budget
+                failure = next((r[1] for r in results if r[1]), None)
+                if key and failure:
+                    job = record_failure(base_dir, key, failure)
+                    attempts = int(job.get("attempts", 0))
+                    if attempts >= 3:
+                        mark_quarantined(base_dir, key, reason=failure)
+                        _notify_toast(f"Fax failed after 3 attempts to {dest_digits}.")
+                return False
 
             # All sessions sent OK → mark accepted & toast
             try:
                 if key:
-                    # Optionally compute short hash of first file for correlation
-                    short_hash = None
-                    try:
-                        import hashlib
-                        if first_path and os.path.exists(first_path):
-                            with open(first_path, "rb") as _f:
-                                short_hash = hashlib.sha256(_f.read()).hexdigest()[:12]
-                    except Exception:
-                        short_hash = None
                     mark_accepted(base_dir, key, dest=dest_digits, caller=caller_digits, bytes_total=total_bytes_sent)
-                    if short_hash:
-                        update_metadata(base_dir, key, file_hash=short_hash)
+                    if first_hash:
+                        update_metadata(base_dir, key, file_hash=first_hash)
                 # Toast (respect device setting if available via app_state)
                 try:
                     notif_enabled = (str(getattr(app_state.device_cfg, "notifications_enabled", "Yes") or "Yes").strip().lower() == "yes")
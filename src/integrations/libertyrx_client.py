@@ -5,6 +5,8 @@ LibertyRx client (Sprint 1 skeleton)
 - Base URL selection helper.
 - Customer header encoder.
 - Minimal send_fax with explicit timeouts and structured errors.
+- send_fax_split: 413 fallback that posts adaptive page groups one at a time.
+- liberty_credentials: DPAPI-decrypted credentials cached for the process.
 
 This module intentionally avoids UI/queueing. It follows the repo's patterns:
 - typing annotations (Python 3.10+)
@@ -16,11 +18,13 @@ from __future__ import annotations
 
 import base64
 import os
-from typing import Any, Dict
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from core.config_loader import global_config
+from core.config_loader import device_config, global_config
 from utils.logging_utils import get_logger
-from utils.secure_store import secure_encrypt_for_machine
+from utils.pdf_utils import PdfPartSplitter
+from utils.secure_store import secure_decrypt_for_machine, secure_encrypt_for_machine
 
 import requests
 
@@ -51,6 +55,41 @@ def encode_customer(npi: str, key: str) -> str:
     return base64.b64encode(s.encode("utf-8")).decode("ascii")
 
 
+# (npi, api_key_enc, vendor_b64_enc) -> (npi, api_key, vendor_basic_b64)
+_creds_cache: Dict[Tuple[str, str, str], Tuple[str, str, str]] = {}
+_creds_lock = threading.Lock()
+
+
+def liberty_credentials() -> Optional[Tuple[str, str, str]]:
+    """Return (npi, api_key, vendor_basic_b64), or None when any piece is missing.
+
+    DPAPI decryption runs once per distinct set of encrypted values; the encrypted
+    values are re-read from config on every call, so a rotated key or a refreshed
+    vendor header takes effect immediately. Plaintext is kept in memory only.
+    """
+    npi = (device_config.get("Integrations", "liberty_npi", "") or "").strip()
+    api_key_enc = device_config.get("Integrations", "liberty_api_key_enc", "") or ""
+    vendor_b64_enc = global_config.get("Integrations", "liberty_vendor_basic_b64_enc", "") or ""
+    if not (npi and api_key_enc and vendor_b64_enc):
+        return None
+    key = (npi, api_key_enc, vendor_b64_enc)
+    with _creds_lock:
+        creds = _creds_cache.get(key)
+        if creds is not None:
+            return creds
+        try:
+            api_key = secure_decrypt_for_machine(api_key_enc) or ""
+            vendor_basic = secure_decrypt_for_machine(vendor_b64_enc) or ""
+        except Exception:
+            return None
+        if not api_key or not vendor_basic:
+            return None
+        # Only the current credentials are worth keeping
+        _creds_cache.clear()
+        creds = _creds_cache[key] = (npi, api_key, vendor_basic)
+        return creds
+
+
 def fra_api_base_url() -> str:
         """FRA API base URL from env FRA_BASE_URL"""
         return (os.environ.get("FRA_BASE_URL") or "http://licensing.clinicnetworking.com:8000").rstrip("/")
@@ -259,3 +298,72 @@ def send_fax(
         pass
 
     return {"error": msg or f"HTTP {resp.status_code}", "status": resp.status_code}
+
+
+# Raw PDF bytes per split part; the JSON body is ~4/3 of this after base64
+DEFAULT_PART_MAX_KB = 6144
+
+
+def liberty_part_max_bytes() -> int:
+    """Per-part budget for split delivery (Integrations.liberty_part_max_kb)."""
+    try:
+        kb = int(global_config.get("Integrations", "liberty_part_max_kb", DEFAULT_PART_MAX_KB) or DEFAULT_PART_MAX_KB)
+    except Exception:
+        kb = DEFAULT_PART_MAX_KB
+    return max(64, kb) * 1024
+
+
+def send_fax_split(
+    endpoint_url: str,
+    vendor_basic_b64: str,
+    customer_b64: str,
+    from_number: str,
+    pdf_bytes: bytes,
+    *,
+    start_page: int = 0,
+    max_bytes: Optional[int] = None,
+    on_progress: Optional[Callable[[PdfPartSplitter], None]] = None,
+) -> Dict[str, Any]:
+    """Deliver a PDF as page groups sized just under the part budget.
+
+    Parts are built lazily and released after each POST. A 413 on a multi-page
+    part retries those pages in smaller groups. on_progress(splitter) runs after
+    every delivered part so callers can checkpoint splitter.next_page and
+    splitter.max_bytes and later resume with start_page/max_bytes.
+
+    Returns
+    - {"ok": True, "parts": int, "pages": int} when every page was delivered.
+    - {"error": str, "status": int|None, "next_page": int, "max_bytes": int, "parts": int}
+      otherwise; next_page is the first page that was not delivered.
+    """
+    log = get_logger("libertyrx_client")
+    splitter = PdfPartSplitter(pdf_bytes, max_bytes or liberty_part_max_bytes(), start_page)
+    last: Dict[str, Any] = {"error": "split_failed", "status": None}
+    for part in splitter.parts():
+        res = send_fax(endpoint_url, vendor_basic_b64, customer_b64, from_number, part.data)
+        if res.get("ok"):
+            splitter.delivered(part)
+            if on_progress:
+                try:
+                    on_progress(splitter)
+                except Exception:
+                    pass
+            continue
+        last = res
+        if int(res.get("status") or 0) == 413 and part.pages > 1:
+            try:
+                log.info(f"LibertyRx: part of {part.pages} pages too large; retrying in smaller groups")
+            except Exception:
+                pass
+            splitter.too_large(part)
+            continue
+        break
+    if splitter.done:
+        return {"ok": True, "parts": splitter.parts_sent, "pages": splitter.page_count}
+    return {
+        "error": last.get("error") or "split_failed",
+        "status": last.get("status"),
+        "next_page": splitter.next_page,
+        "max_bytes": splitter.max_bytes,
+        "parts": splitter.parts_sent,
+    }
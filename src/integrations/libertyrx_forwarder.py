@@ -0,0 +1,285 @@
+"""
+LibertyRx forwarding stage
+
+Delivers freshly downloaded inbound faxes to LibertyRx off the receiver thread.
+
+- The receiver hands over (fax_id, caller_id, PDF bytes) and gets a Future back;
+  it only waits on it when Integrations.liberty_keep_local_copy = "No" (local
+  copies may be purged only after a confirmed delivery).
+- Before submit() returns, the fax is written to the retry queue as a held job
+  (libertyrx_queue.enqueue(hold_secs=HANDOFF_HOLD_SECONDS)), so marking the fax
+  downloaded never loses it. The job is also claimed (libertyrx_queue.claim_job)
+  until the delivery finishes, so process_due_jobs leaves it alone even if the hold
+  runs out while the delivery waits for a worker. The delivery deletes the job on
+  success, drops it on 400, and otherwise makes it due with any split checkpoint.
+- Deliveries run on a pool (Integrations.liberty_forward_workers, default 1, at
+  most MAX_WORKERS). The retry queue (libertyrx_queue.process_due_jobs) runs on the
+  same pool, one pass at a time. Page splitting uses PyMuPDF under
+  utils.pdf_utils.FITZ_LOCK; the uploads themselves run outside it.
+- Credentials come from libertyrx_client.liberty_credentials(), so DPAPI decryption
+  happens once per process instead of once per fax.
+- Failure handling matches the previous inline flow: 413 -> page-split delivery
+  (queued with its checkpoint if it stops part-way), 400 -> logged, not retried,
+  401/429/5xx/network -> queued with backoff.
+
+Logging MUST avoid PHI and secrets.
+"""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from core.config_loader import device_config
+from integrations.libertyrx_client import (
+    encode_customer,
+    liberty_base_url,
+    liberty_credentials,
+    send_fax,
+    send_fax_split,
+)
+from utils.logging_utils import get_logger
+
+log = get_logger("libertyrx.forwarder")
+
+DEFAULT_WORKERS = 1
+MAX_WORKERS = 4
+# Hand-off jobs stay out of the retry queue this long; split deliveries extend it per part
+HANDOFF_HOLD_SECONDS = 900
+
+_forwarder: Optional["LibertyForwarder"] = None
+_forwarder_lock = threading.Lock()
+
+
+def get_forwarder() -> "LibertyForwarder":
+    """Process-wide forwarding stage; the pool is created on first use."""
+    global _forwarder
+    with _forwarder_lock:
+        if _forwarder is None:
+            _forwarder = LibertyForwarder(_configured_workers())
+        return _forwarder
+
+
+def keep_local_copy() -> bool:
+    """Integrations.liberty_keep_local_copy; "No" purges local outputs after delivery."""
+    try:
+        value = device_config.get("Integrations", "liberty_keep_local_copy", "Yes") or "Yes"
+        return str(value).strip().lower() == "yes"
+    except Exception:
+        return True
+
+
+def _configured_workers() -> int:
+    try:
+        n = int(device_config.get("Integrations", "liberty_forward_workers", DEFAULT_WORKERS) or DEFAULT_WORKERS)
+    except Exception:
+        n = DEFAULT_WORKERS
+    return max(1, min(MAX_WORKERS, n))
+
+
+def _enqueue(fax_id: str, caller_id: str, pdf_bytes: bytes, endpoint: str, **checkpoint) -> str:
+    try:
+        from integrations.libertyrx_queue import enqueue
+        return enqueue(fax_id, caller_id, pdf_bytes, endpoint, **checkpoint)
+    except Exception:
+        log.debug("LibertyRx: failed to enqueue delivery for retry", exc_info=True)
+        return ""
+
+
+def _reschedule(job_id: str, due_in_secs: int = 0, **checkpoint) -> bool:
+    try:
+        from integrations.libertyrx_queue import reschedule_job
+        return reschedule_job(job_id, due_in_secs, **checkpoint)
+    except Exception:
+        log.debug("LibertyRx: failed to update queued delivery", exc_info=True)
+        return False
+
+
+def _claim(job_id: str) -> None:
+    if not job_id:
+        return
+    try:
+        from integrations.libertyrx_queue import claim_job
+        claim_job(job_id)
+    except Exception:
+        log.debug("LibertyRx: failed to claim queued delivery", exc_info=True)
+
+
+def _release(job_id: str) -> None:
+    if not job_id:
+        return
+    try:
+        from integrations.libertyrx_queue import release_job
+        release_job(job_id)
+    except Exception:
+        log.debug("LibertyRx: failed to release queued delivery", exc_info=True)
+
+
+def _delete(job_id: str) -> None:
+    if not job_id:
+        return
+    try:
+        from integrations.libertyrx_queue import delete_job
+        delete_job(job_id)
+    except Exception:
+        log.debug("LibertyRx: failed to remove queued delivery", exc_info=True)
+
+
+class LibertyForwarder:
+    def __init__(self, workers: int = DEFAULT_WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="LibertyRxForward")
+        self._queue_lock = threading.Lock()
+        self._queue_future: Optional[Future] = None
+
+    def submit(
+        self,
+        fax_id: str,
+        caller_id: str,
+        pdf_bytes: bytes,
+        notify: Optional[Callable[[str], None]] = None,
+    ) -> Future:
+        """Schedule delivery of one fax; the Future resolves to True once LibertyRx accepted it.
+
+        The held queue job is written and claimed before this returns. notify(message)
+        is called from the worker thread for operator-facing events.
+        """
+        job_id = _enqueue(fax_id, caller_id, pdf_bytes, liberty_base_url(), hold_secs=HANDOFF_HOLD_SECONDS)
+        _claim(job_id)
+        return self._pool.submit(self._deliver, job_id, fax_id, caller_id, pdf_bytes, notify)
+
+    def process_queue(self, max_jobs: int = 5) -> Optional[Future]:
+        """Run one bounded retry-queue pass on the pool unless one is already running."""
+        with self._queue_lock:
+            if self._queue_future is not None and not self._queue_future.done():
+                return self._queue_future
+            from integrations.libertyrx_queue import process_due_jobs
+            self._queue_future = self._pool.submit(process_due_jobs, max_jobs)
+            return self._queue_future
+
+    @staticmethod
+    def wait(future: Optional[Future], timeout: Optional[float] = None) -> bool:
+        """Block until a delivery finishes; False when it failed, raised or timed out."""
+        if future is None:
+            return False
+        try:
+            return bool(future.result(timeout=timeout))
+        except Exception:
+            return False
+
+    def _deliver(
+        self,
+        job_id: str,
+        fax_id: str,
+        caller_id: str,
+        pdf_bytes: bytes,
+        notify: Optional[Callable[[str], None]],
+    ) -> bool:
+        try:
+            return self._deliver_one(job_id, fax_id, caller_id, pdf_bytes, notify)
+        except Exception:
+            log.debug("LibertyRx forwarding failed", exc_info=True)
+            # Leave the fax to the retry queue
+            _reschedule(job_id)
+            return False
+        finally:
+            _release(job_id)
+
+    def _retry_later(
+        self, job_id: str, fax_id: str, caller_id: str, pdf_bytes: bytes, endpoint: str, **checkpoint
+    ) -> None:
+        """Make the held job due (with any split checkpoint), or queue a new one when it is gone."""
+        if not _reschedule(job_id, **checkpoint):
+            _enqueue(fax_id, caller_id, pdf_bytes, endpoint, **checkpoint)
+
+    def _deliver_one(
+        self,
+        job_id: str,
+        fax_id: str,
+        caller_id: str,
+        pdf_bytes: bytes,
+        notify: Optional[Callable[[str], None]],
+    ) -> bool:
+        creds = liberty_credentials()
+        if not creds:
+            # Missing NPI/API key or vendor header; log at debug level
+            log.debug("LibertyRx enabled but missing NPI/API key or vendor header — skipping delivery.")
+            _delete(job_id)
+            return False
+        if not pdf_bytes:
+            _delete(job_id)
+            return False
+        npi, api_key, vendor_basic_b64 = creds
+        customer_b64 = encode_customer(npi, api_key)
+        endpoint = liberty_base_url()
+        log.info(f"LibertyRx: attempting delivery for fax {fax_id} size_kb={int(len(pdf_bytes) / 1024)}")
+
+        res = send_fax(endpoint, vendor_basic_b64, customer_b64, caller_id, pdf_bytes)
+        if res.get("ok"):
+            _delete(job_id)
+            log.info("LibertyRx: delivered successfully.")
+            return True
+
+        status = res.get("status")
+        if status:
+            log.warning(f"LibertyRx: initial delivery failed with status {status}")
+        else:
+            log.warning("LibertyRx: initial delivery failed (no status)")
+
+        if status == 413:
+            # Resend as page groups sized under the Liberty part budget
+            log.info("LibertyRx: received 413 — attempting page-split delivery…")
+            def _checkpoint(splitter) -> None:
+                # Persist progress and keep the job held while parts are still going out
+                _reschedule(
+                    job_id,
+                    HANDOFF_HOLD_SECONDS,
+                    split_next_page=splitter.next_page,
+                    split_max_bytes=splitter.max_bytes,
+                )
+
+            split = send_fax_split(
+                endpoint, vendor_basic_b64, customer_b64, caller_id, pdf_bytes, on_progress=_checkpoint
+            )
+            if split.get("ok"):
+                _delete(job_id)
+                log.info(f"LibertyRx: delivered as {split.get('parts')} parts due to size.")
+                self._notify(notify, f"Fax delivered to LibertyRx in {split.get('parts')} parts.")
+                return True
+            # Enqueue for retry, resuming at the first undelivered page
+            next_page = int(split.get("next_page") or 0)
+            self._retry_later(
+                job_id,
+                fax_id,
+                caller_id,
+                pdf_bytes,
+                endpoint,
+                split_next_page=next_page,
+                split_max_bytes=split.get("max_bytes"),
+            )
+            log.warning(
+                f"LibertyRx: split delivery stopped at page {next_page + 1} "
+                f"after {split.get('parts')} part(s) with status {split.get('status')} — queued for retry"
+            )
+            return False
+
+        # For 400: stop and log; for 401/429/5xx: enqueue with backoff
+        if status == 400:
+            _delete(job_id)
+            log.warning("LibertyRx delivery failed with status 400 — not retrying.")
+        elif status == 401:
+            self._retry_later(job_id, fax_id, caller_id, pdf_bytes, endpoint)
+            log.info("LibertyRx delivery failed with status 401 — queued for retry.")
+            self._notify(notify, "LibertyRx authentication failed. Check NPI/API key or contact support.")
+        else:
+            self._retry_later(job_id, fax_id, caller_id, pdf_bytes, endpoint)
+            log.info(f"LibertyRx delivery failed with status {status or 'n/a'} — queued for retry.")
+        return False
+
+    @staticmethod
+    def _notify(notify: Optional[Callable[[str], None]], message: str) -> None:
+        if notify is None:
+            return
+        try:
+            notify(message)
+        except Exception:
+            pass
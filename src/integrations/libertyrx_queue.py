@@ -27,6 +27,20 @@ Job schema (JSON)
 - last_error: Optional[str]
 - endpoint_url: str (the target URL used when first enqueued; usually liberty_base_url())
 - pdf_enc: str (DPAPI-protected base64 of the PDF bytes)
+- split_next_page: Optional[int] (set once split delivery has started; first page not yet
+  delivered, so a retry resumes there instead of re-sending delivered parts)
+- split_max_bytes: Optional[int] (part budget learned from 413s during split delivery)
+
+Hand-off jobs
+- The forwarding stage (libertyrx_forwarder) writes each inbound fax as a job before
+  it attempts delivery, with next_attempt_at pushed out by hold_secs so this queue
+  leaves it alone while the first attempt runs. The forwarder deletes the job on
+  success or makes it due via reschedule_job() on failure; if the app stops
+  mid-delivery, the job becomes due once the hold expires.
+- The hold only covers restarts. Within the process, the forwarder claims the job
+  (claim_job) when it is handed over and releases it when its delivery finishes;
+  process_due_jobs skips claimed jobs even when their hold has run out (a delivery
+  still waiting for a pool worker), so a fax is never sent twice.
 
 Notes
 - Secrets (NPI/API key/vendor basic) are NOT stored in the queue. They are read
@@ -39,14 +53,20 @@ import base64
 import json
 import os
 import random
+import threading
 import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from core.config_loader import device_config, global_config
-from integrations.libertyrx_client import encode_customer, liberty_base_url, send_fax
+from integrations.libertyrx_client import (
+    encode_customer,
+    liberty_base_url,
+    liberty_credentials,
+    send_fax,
+    send_fax_split,
+)
 from utils.logging_utils import get_logger
-from utils.pdf_utils import split_pdf_pages
 from utils.secure_store import secure_decrypt_for_machine, secure_encrypt_for_machine
 
 log = get_logger("libertyrx.queue")
@@ -71,6 +91,25 @@ def _job_path(job_id: str) -> str:
     return os.path.join(queue_dir(), f"{job_id}.json")
 
 
+# Job ids currently owned by a delivery in this process (forwarder hand-off or queue pass)
+_claimed: set[str] = set()
+_claimed_lock = threading.Lock()
+
+
+def claim_job(job_id: str) -> bool:
+    """Mark a job as being delivered in this process; False when it is already claimed."""
+    with _claimed_lock:
+        if not job_id or job_id in _claimed:
+            return False
+        _claimed.add(job_id)
+        return True
+
+
+def release_job(job_id: str) -> None:
+    with _claimed_lock:
+        _claimed.discard(job_id)
+
+
 BACKOFF_STEPS = [60, 300, 900, 3600, 14400, 43200]  # seconds: 1m,5m,15m,1h,4h,12h
 
 
@@ -130,10 +169,23 @@ def delete_job(job_id: str) -> None:
             pass
 
 
-def enqueue(fax_id: str, from_number: str, pdf_bytes: bytes, endpoint_url: Optional[str] = None, source_file: Optional[str] = None) -> str:
+def enqueue(
+    fax_id: str,
+    from_number: str,
+    pdf_bytes: bytes,
+    endpoint_url: Optional[str] = None,
+    source_file: Optional[str] = None,
+    split_next_page: Optional[int] = None,
+    split_max_bytes: Optional[int] = None,
+    hold_secs: int = 0,
+) -> str:
     """Create a queued job for Liberty delivery with encrypted PDF content.
 
-    Returns the job id.
+    split_next_page/split_max_bytes carry a split-delivery checkpoint so the
+    retry resumes at the first undelivered page. hold_secs delays the first
+    queue attempt (hand-off jobs the forwarder is still delivering).
+
+    Returns the job id, or "" when the job could not be written.
     """
     try:
         enc = secure_encrypt_for_machine(base64.b64encode(pdf_bytes).decode("ascii"))
@@ -153,7 +205,7 @@ def enqueue(fax_id: str, from_number: str, pdf_bytes: bytes, endpoint_url: Optio
         "created_at": _now_iso(),
         "updated_at": _now_iso(),
         "attempts": 0,
-        "next_attempt_at": _now_iso(),
+        "next_attempt_at": (_now() + timedelta(seconds=max(0, int(hold_secs or 0)))).isoformat(),
         "status": "queued",
         "last_error": None,
         "endpoint_url": (endpoint_url or liberty_base_url()),
@@ -161,14 +213,46 @@ def enqueue(fax_id: str, from_number: str, pdf_bytes: bytes, endpoint_url: Optio
     }
     if source_file:
         job["source_file"] = os.path.abspath(source_file)
+    if split_next_page is not None:
+        job["split_next_page"] = int(split_next_page)
+        if split_max_bytes:
+            job["split_max_bytes"] = int(split_max_bytes)
     save_job(job)
+    if not os.path.exists(_job_path(job_id)):
+        return ""
     try:
-        log.info(f"Liberty queue: enqueued fax {fax_id} for retry")
+        if hold_secs:
+            log.debug(f"Liberty queue: recorded hand-off job for fax {fax_id}")
+        else:
+            log.info(f"Liberty queue: enqueued fax {fax_id} for retry")
     except Exception:
         pass
     return job_id
 
 
+def reschedule_job(
+    job_id: str,
+    due_in_secs: int = 0,
+    split_next_page: Optional[int] = None,
+    split_max_bytes: Optional[int] = None,
+) -> bool:
+    """Set when an existing job is next attempted, recording a split checkpoint if given.
+
+    Returns False when the job no longer exists.
+    """
+    job = _read_job(_job_path(job_id)) if job_id else None
+    if not job:
+        return False
+    job["next_attempt_at"] = (_now() + timedelta(seconds=max(0, int(due_in_secs or 0)))).isoformat()
+    job["status"] = "queued"
+    if split_next_page is not None:
+        job["split_next_page"] = int(split_next_page)
+        if split_max_bytes:
+            job["split_max_bytes"] = int(split_max_bytes)
+    save_job(job)
+    return True
+
+
 def _is_due(job: Dict[str, Any], now: Optional[datetime] = None) -> bool:
     now = now or _now()
     try:
@@ -332,7 +416,8 @@ def process_due_jobs(max_jobs: int = 5) -> None:
 
     - Imports any manually dropped PDFs in the queue folder as jobs.
     - Respects 401 gate: if active, returns without processing any jobs.
-    - Processes up to max_jobs that are due by next_attempt_at.
+    - Processes up to max_jobs that are due by next_attempt_at, skipping jobs claimed
+      by a delivery in progress. Each job is claimed and re-read before it is sent.
     - Uses current NPI/API key and vendor header from config (supports rotation).
     """
     try:
@@ -350,8 +435,18 @@ def process_due_jobs(max_jobs: int = 5) -> None:
         for job in jobs:
             if count >= max_jobs:
                 break
-            _process_one(job)
-            count += 1
+            job_id = job.get("id")
+            if not claim_job(job_id):
+                continue
+            try:
+                # The forwarder may have delivered or rescheduled it since the listing
+                job = _read_job(_job_path(job_id))
+                if not job or not _is_due(job):
+                    continue
+                _process_one(job)
+                count += 1
+            finally:
+                release_job(job_id)
     except Exception:
         try:
             log.debug("Liberty queue processing failed", exc_info=True)
@@ -359,30 +454,38 @@ def process_due_jobs(max_jobs: int = 5) -> None:
             pass
 
 
+def _finish_job(job: Dict[str, Any], message: str) -> None:
+    """Remove a delivered job and any source drop-file."""
+    delete_job(job.get("id"))
+    try:
+        src = job.get("source_file")
+        if src and os.path.exists(src):
+            os.remove(src)
+            try:
+                log.info(f"Liberty queue: removed dropped file after success: {os.path.basename(src)}")
+            except Exception:
+                pass
+    except Exception:
+        try:
+            log.debug("Liberty queue: failed to remove source drop-file after success", exc_info=True)
+        except Exception:
+            pass
+    try:
+        log.info(f"Liberty queue: {message}")
+    except Exception:
+        pass
+
+
 def _process_one(job: Dict[str, Any]) -> None:
-    job_id = job.get("id")
     fax_id = job.get("fax_id")
-    # Resolve credentials on demand
-    npi = (device_config.get("Integrations", "liberty_npi", "") or "").strip()
-    api_key_enc = device_config.get("Integrations", "liberty_api_key_enc", "") or ""
-    vendor_b64_enc = global_config.get("Integrations", "liberty_vendor_basic_b64_enc", "") or ""
-
-    if not (npi and api_key_enc and vendor_b64_enc):
+    # Resolve credentials on demand (decrypted once per process, re-read on rotation)
+    creds = liberty_credentials()
+    if not creds:
         # Missing secrets; reschedule in 1 hour
         _set_next_attempt(job, reason_status="secrets_missing")
         save_job(job)
         return
-
-    try:
-        api_key = secure_decrypt_for_machine(api_key_enc) or ""
-        vendor_basic = secure_decrypt_for_machine(vendor_b64_enc) or ""
-    except Exception:
-        api_key = ""
-        vendor_basic = ""
-    if not api_key or not vendor_basic:
-        _set_next_attempt(job, reason_status="secrets_missing")
-        save_job(job)
-        return
+    npi, api_key, vendor_basic = creds
 
     # Decrypt PDF
     try:
@@ -398,64 +501,45 @@ def _process_one(job: Dict[str, Any]) -> None:
 
     endpoint = liberty_base_url()  # prefer current build endpoint
     customer_b64 = encode_customer(npi, api_key)
-    res = send_fax(endpoint, vendor_basic, customer_b64, job.get("from_number") or "", pdf_bytes)
+    from_number = job.get("from_number") or ""
+    resume_page = job.get("split_next_page")
 
-    if res.get("ok"):
-        # Success: remove job and any source drop-file if present
-        delete_job(job_id)
-        try:
-            src = job.get("source_file")
-            if src and os.path.exists(src):
-                os.remove(src)
-                try:
-                    log.info(f"Liberty queue: removed dropped file after success: {os.path.basename(src)}")
-                except Exception:
-                    pass
-        except Exception:
-            try:
-                log.debug("Liberty queue: failed to remove source drop-file after success", exc_info=True)
-            except Exception:
-                pass
-        try:
-            log.info(f"Liberty queue: delivered fax {fax_id} from queue")
-        except Exception:
-            pass
-        return
+    if resume_page is None:
+        res = send_fax(endpoint, vendor_basic, customer_b64, from_number, pdf_bytes)
+        if res.get("ok"):
+            _finish_job(job, f"delivered fax {fax_id} from queue")
+            return
+        status = int(res.get("status") or 0)
+    else:
+        # A previous split delivery was interrupted; skip the whole-PDF attempt
+        status = 413
 
-    status = int(res.get("status") or 0)
-    # Handle 413 with per-page split
+    # Handle 413 with adaptive page-group split, checkpointing each delivered part
     if status == 413:
-        parts = split_pdf_pages(pdf_bytes)
-        if parts:
-            all_ok = True
-            for idx, part in enumerate(parts, start=1):
-                r2 = send_fax(endpoint, vendor_basic, customer_b64, job.get("from_number") or "", part)
-                if not r2.get("ok"):
-                    all_ok = False
-                    status = int(r2.get("status") or 0)
-                    break
-            if all_ok:
-                delete_job(job_id)
-                # Remove original dropped file if present
-                try:
-                    src = job.get("source_file")
-                    if src and os.path.exists(src):
-                        os.remove(src)
-                        try:
-                            log.info(f"Liberty queue: removed dropped file after split-success: {os.path.basename(src)}")
-                        except Exception:
-                            pass
-                except Exception:
-                    try:
-                        log.debug("Liberty queue: failed to remove source drop-file after split-success", exc_info=True)
-                    except Exception:
-                        pass
-                try:
-                    log.info(f"Liberty queue: delivered fax {fax_id} in {len(parts)} parts")
-                except Exception:
-                    pass
-                return
-        # If split failed, fall through to error handling using last status
+        def _checkpoint(splitter) -> None:
+            job["split_next_page"] = splitter.next_page
+            job["split_max_bytes"] = splitter.max_bytes
+            save_job(job)
+
+        res2 = send_fax_split(
+            endpoint,
+            vendor_basic,
+            customer_b64,
+            from_number,
+            pdf_bytes,
+            start_page=int(resume_page or 0),
+            max_bytes=job.get("split_max_bytes") or None,
+            on_progress=_checkpoint,
+        )
+        del pdf_bytes
+        if res2.get("ok"):
+            _finish_job(job, f"delivered fax {fax_id} in {res2.get('parts')} parts")
+            return
+        job["split_next_page"] = int(res2.get("next_page") or 0)
+        if res2.get("max_bytes"):
+            job["split_max_bytes"] = int(res2["max_bytes"])
+        status = int(res2.get("status") or 0)
+        # Fall through to error handling using the failing part's status
 
     if status == 400:
         # Do not retry
@@ -1,14 +1,18 @@
 import os
 
-from PyQt5.QtCore import QSize, Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QIcon
-from PyQt5.QtWidgets import (QCheckBox, QDialog, QFileDialog, QGridLayout,
-                             QHBoxLayout, QLabel, QLineEdit, QMessageBox,
-                             QPushButton, QScrollArea, QSizePolicy,
-                             QSpacerItem, QTabWidget, QTextEdit, QVBoxLayout,
+from PyQt5.QtWidgets import (QAbstractItemView, QCheckBox, QDialog,
+                             QFileDialog, QFrame, QGridLayout, QHBoxLayout,
+                             QLabel, QLineEdit, QListView, QMessageBox,
+                             QPushButton, QTabWidget, QTextEdit, QVBoxLayout,
                              QWidget)
 
 from core.config_loader import device_config, global_config
+from ui.widgets.contact_grid_view import (ContactCardDelegate,
+                                          ContactGridModel, GridRow,
+                                          card_for, card_key, card_rows)
+from utils.incremental_filter import IncrementalFilter
 
 
 class AddressBookDialog(QDialog):
@@ -28,6 +32,10 @@ class AddressBookDialog(QDialog):
         )
         self._icon_delete = QIcon(os.path.join(self.base_dir, "images", "TrashCan.png"))
 
+        # Normalized search keys per contact index, rebuilt only when contacts change
+        self._contact_filter = IncrementalFilter()
+        self._indexed_keys = []
+
         self.layout = QVBoxLayout(self)
 
         header = QHBoxLayout()
@@ -51,32 +59,26 @@ class AddressBookDialog(QDialog):
         # Tabs for Contacts and Companies
         self.tabs = QTabWidget()
 
+        # Cards are painted by a delegate (one model row per grid line), so only
+        # visible rows cost anything and no widgets are created per contact
+        self._cards = {}
+
         # Contacts tab
         self.contacts_tab = QWidget()
-        self.contacts_scroll = QScrollArea()
-        self.contacts_scroll.setWidgetResizable(True)
-        self.contacts_container = QWidget()
-        self.grid_layout_contacts = QGridLayout(self.contacts_container)
-        self.grid_layout_contacts.setSpacing(12)
-        self.contacts_scroll.setWidget(self.contacts_container)
+        self.contacts_model = ContactGridModel(self)
+        self.contacts_view = self._make_grid_view(self.contacts_model)
         contacts_tab_layout = QVBoxLayout(self.contacts_tab)
         contacts_tab_layout.setContentsMargins(0, 0, 0, 0)
-        contacts_tab_layout.addWidget(self.contacts_scroll)
+        contacts_tab_layout.addWidget(self.contacts_view)
         self.tabs.addTab(self.contacts_tab, "Contacts")
 
-        # Companies tab
+        # Companies tab: company header rows followed by that group's cards
         self.companies_tab = QWidget()
-        self.companies_scroll = QScrollArea()
-        self.companies_scroll.setWidgetResizable(True)
-        self.companies_container = QWidget()
-        # Companies view uses a vertical layout of grouped grids
-        self.vbox_companies = QVBoxLayout(self.companies_container)
-        self.vbox_companies.setSpacing(16)
-        self.vbox_companies.setContentsMargins(4, 4, 4, 4)
-        self.companies_scroll.setWidget(self.companies_container)
+        self.companies_model = ContactGridModel(self)
+        self.companies_view = self._make_grid_view(self.companies_model)
         companies_tab_layout = QVBoxLayout(self.companies_tab)
         companies_tab_layout.setContentsMargins(0, 0, 0, 0)
-        companies_tab_layout.addWidget(self.companies_scroll)
+        companies_tab_layout.addWidget(self.companies_view)
         self.tabs.addTab(self.companies_tab, "Companies")
 
         self.layout.addWidget(self.tabs)
@@ -92,10 +94,64 @@ class AddressBookDialog(QDialog):
         self.layout.addLayout(footer)
 
         # Populate both tabs
+        self._refresh_all()
+
+    def _make_grid_view(self, model):
+        view = QListView()
+        view.setFrameShape(QFrame.NoFrame)
+        view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        view.setResizeMode(QListView.Adjust)
+        view.setLayoutMode(QListView.Batched)
+        view.setSelectionMode(QAbstractItemView.NoSelection)
+        view.setMouseTracking(True)
+        view.setItemDelegate(ContactCardDelegate(self, view))
+        view.setModel(model)
+        return view
+
+    def _refresh_all(self):
+        """Re-index contacts (after add/edit/delete/import) and rebuild both tabs."""
+        self._reindex_contacts()
+        # Keep cached cards only for contacts that still exist in this form
+        keys = {card_key(c) for c in (self.address_book_manager.contacts or [])}
+        self._cards = {k: v for k, v in self._cards.items() if k in keys}
         self.populate_cards()
         self.populate_companies()
 
+    def _card_item(self, index, contact):
+        return (index, contact, card_for(self._cards, contact, self._format_phone_display))
+
+    def _set_rows(self, view, model, rows):
+        # Patched rows may have changed height (e.g. an email line was added)
+        delegate = view.itemDelegate()
+        for n in model.set_rows(rows):
+            delegate.sizeHintChanged.emit(model.index(n, 0))
+
+    def _reindex_contacts(self):
+        # Only re-index positions whose contact changed (a single edit touches one entry)
+        contacts = self.address_book_manager.contacts or []
+        indexed = self._indexed_keys
+        for i, c in enumerate(contacts):
+            key = card_key(c)
+            if i < len(indexed) and indexed[i] == key and i in self._contact_filter:
+                continue
+            self._contact_filter.set_item(
+                i,
+                (c.get("name"), c.get("company"), c.get("email")),
+                (c.get("phone"), c.get("phone1")),
+            )
+        for i in range(len(contacts), len(indexed)):
+            self._contact_filter.remove_item(i)
+        self._indexed_keys = [card_key(c) for c in contacts]
+
+    def _filtered_contacts(self):
+        contacts = self.address_book_manager.contacts or []
+        return [(i, c) for i, c in enumerate(contacts) if self._contact_filter.is_match(i)]
+
     def _on_search_change(self):
+        # Rebuild only when the set of matching contacts actually changed
+        if not self._contact_filter.update(self.search_bar.text()):
+            return
         self.populate_cards()
         self.populate_companies()
 
@@ -107,21 +163,6 @@ class AddressBookDialog(QDialog):
             # Fallback: update immediately if timer not available
             self._on_search_change()
 
-    def _clear_layout(self, layout):
-        while layout.count():
-            item = layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.setParent(None)
-            else:
-                child_layout = item.layout()
-                if child_layout is not None:
-                    self._clear_layout(child_layout)
-
-    def _add_spacer_row(self, grid_layout, row, cols=2, height=8):
-        spacer = QSpacerItem(0, height, QSizePolicy.Minimum, QSizePolicy.Fixed)
-        grid_layout.addItem(spacer, row, 0, 1, cols)
-
     def _format_phone_display(self, raw: str) -> str:
         """Format a phone string into (###) ###-#### when 10 digits are present.
         Accepts inputs with punctuation or leading +1; falls back to digits if <10.
@@ -139,48 +180,12 @@ class AddressBookDialog(QDialog):
 
     def populate_cards(self):
         # Contacts tab population with favorites pinned and spacer
-        self._clear_layout(self.grid_layout_contacts)
-        self.contacts_container.setUpdatesEnabled(False)
-
-        query = self.search_bar.text().strip().lower()
-        has_query = bool(query)
-        query_digits = "".join(ch for ch in query if ch.isdigit())
-
-        contacts = self.address_book_manager.contacts or []
-        # filter by name/company/email or phone digits
-        filtered = [
-            (i, c)
-            for i, c in enumerate(contacts)
-            if (query in (c.get("name", "") or "").lower())
-            or (query in (c.get("company", "") or "").lower())
-            or (query in (c.get("email", "") or "").lower())
-            or (
-                query_digits
-                and (
-                    (
-                        query_digits
-                        in (
-                            "".join(ch for ch in (c.get("phone") or "") if ch.isdigit())
-                        )
-                    )
-                    or (
-                        query_digits
-                        in (
-                            "".join(
-                                ch for ch in (c.get("phone1") or "") if ch.isdigit()
-                            )
-                        )
-                    )
-                )
-            )
-        ]
+        has_query = bool(self._contact_filter.query.strip())
+        filtered = self._filtered_contacts()
 
         # If searching and nothing matched, display a helpful message.
         if has_query and not filtered:
-            msg = QLabel("No matches found.")
-            msg.setObjectName("hint")
-            self.grid_layout_contacts.addWidget(msg, 0, 0, 1, 2)
-            self.contacts_container.setUpdatesEnabled(True)
+            self._set_rows(self.contacts_view, self.contacts_model, [GridRow("message", text="No matches found.")])
             return
 
         # Split favorites and non-favorites (placeholders treated as non-fav)
@@ -248,91 +253,25 @@ class AddressBookDialog(QDialog):
         real_non_favs.sort(key=sort_key)
         placeholders.sort(key=sort_key)
 
-        # Render: favorites first, spacer, other real contacts, spacer (if placeholders), then placeholders at bottom
-        row = 0
-        col_count = 2
-        # favorites
-        for idx, (true_index, contact) in enumerate(favs):
-            r, col = divmod(row, col_count)
-            card = self.create_contact_card(contact, true_index)
-            self.grid_layout_contacts.addWidget(card, r, col)
-            row += 1
+        # Rows: favorites first, spacer, other real contacts, spacer (if placeholders), then placeholders at bottom
+        rows = card_rows([self._card_item(i, c) for i, c in favs])
         # spacer between favorites and others if both exist
         if favs and real_non_favs:
-            r, _ = divmod(row, col_count)
-            self._add_spacer_row(
-                self.grid_layout_contacts, r, cols=col_count, height=10
-            )
-            row = (r + 1) * col_count
-        # other real contacts
-        for idx, (true_index, contact) in enumerate(real_non_favs):
-            r, col = divmod(row, col_count)
-            card = self.create_contact_card(contact, true_index)
-            self.grid_layout_contacts.addWidget(card, r, col)
-            row += 1
+            rows.append(GridRow("spacer", height=10))
+        rows += card_rows([self._card_item(i, c) for i, c in real_non_favs])
         # spacer between real contacts and placeholders if placeholders exist
         if placeholders:
-            r, _ = divmod(row, col_count)
-            self._add_spacer_row(self.grid_layout_contacts, r, cols=col_count, height=8)
-            row = (r + 1) * col_count
-        # placeholders last
-        for idx, (true_index, contact) in enumerate(placeholders):
-            r, col = divmod(row, col_count)
-            card = self.create_contact_card(contact, true_index)
-            self.grid_layout_contacts.addWidget(card, r, col)
-            row += 1
-        # Re-enable updates after population
-        try:
-            self.contacts_container.setUpdatesEnabled(True)
-        except Exception:
-            pass
+            rows.append(GridRow("spacer", height=8))
+            rows += card_rows([self._card_item(i, c) for i, c in placeholders])
+        self._set_rows(self.contacts_view, self.contacts_model, rows)
 
     def populate_companies(self):
         # Companies tab: group by company, with favorites pinned within each group
-        self._clear_layout(self.vbox_companies)
-        self.companies_container.setUpdatesEnabled(False)
-        query = self.search_bar.text().strip().lower()
-        has_query = bool(query)
-        query_digits = "".join(ch for ch in query if ch.isdigit())
-
-        contacts = self.address_book_manager.contacts or []
-        # apply global filter on name/company/email or phone digits
-        filtered = [
-            (i, c)
-            for i, c in enumerate(contacts)
-            if (query in (c.get("name", "") or "").lower())
-            or (query in (c.get("company", "") or "").lower())
-            or (query in (c.get("email", "") or "").lower())
-            or (
-                query_digits
-                and (
-                    (
-                        query_digits
-                        in (
-                            "".join(ch for ch in (c.get("phone") or "") if ch.isdigit())
-                        )
-                    )
-                    or (
-                        query_digits
-                        in (
-                            "".join(
-                                ch for ch in (c.get("phone1") or "") if ch.isdigit()
-                            )
-                        )
-                    )
-                )
-            )
-        ]
+        has_query = bool(self._contact_filter.query.strip())
+        filtered = self._filtered_contacts()
         # If searching and nothing matched, display a helpful message.
         if has_query and not filtered:
-            msg = QLabel("No matches found.")
-            msg.setObjectName("hint")
-            self.vbox_companies.addWidget(msg)
-            self.vbox_companies.addStretch()
-            try:
-                self.companies_container.setUpdatesEnabled(True)
-            except Exception:
-                pass
+            self._set_rows(self.companies_view, self.companies_model, [GridRow("message", text="No matches found.")])
             return
         # Group by company
         groups = {}
@@ -345,6 +284,7 @@ class AddressBookDialog(QDialog):
         if "Unspecified" in groups:
             group_names.append("Unspecified")
 
+        rows = []
         for gname in group_names:
             items = groups[gname]
             # Split favorites
@@ -362,205 +302,16 @@ class AddressBookDialog(QDialog):
             favs.sort(key=lambda pair: (pair[1].get("name") or "").lower())
             non_favs.sort(key=lambda pair: (pair[1].get("name") or "").lower())
 
-            # Group header
-            header = QLabel(f"<b>{gname}</b>")
-            header.setObjectName("sectionHeader")
-            self.vbox_companies.addWidget(header)
-
-            grid = QGridLayout()
-            grid.setSpacing(12)
-
-            row = 0
-            col_count = 2
-            # favorites first
-            for true_index, contact in [(i, c) for i, c in favs]:
-                r, col = divmod(row, col_count)
-                card = self.create_contact_card(contact, true_index)
-                grid.addWidget(card, r, col)
-                row += 1
-            # spacer if both exist
+            # Group header (separated from the previous group)
+            if rows:
+                rows.append(GridRow("spacer", height=16))
+            rows.append(GridRow("header", text=gname))
+            # favorites first, spacer if both exist, then non favorites
+            rows += card_rows([self._card_item(i, c) for i, c in favs])
             if favs and non_favs:
-                r, _ = divmod(row, col_count)
-                self._add_spacer_row(grid, r, cols=col_count, height=8)
-                row = (r + 1) * col_count
-            # non favorites
-            for true_index, contact in [(i, c) for i, c in non_favs]:
-                r, col = divmod(row, col_count)
-                card = self.create_contact_card(contact, true_index)
-                grid.addWidget(card, r, col)
-                row += 1
-
-            container = QWidget()
-            container.setLayout(grid)
-            self.vbox_companies.addWidget(container)
-        self.vbox_companies.addStretch()
-        try:
-            self.companies_container.setUpdatesEnabled(True)
-        except Exception:
-            pass
-
-    def create_contact_card(self, contact, index):
-        # Outer container (card)
-        outer = QWidget()
-        is_placeholder = contact.get("is_placeholder", False)
-        from ui.theme import get_theme as _gt
-        _ct = _gt()
-        outer.setStyleSheet(
-            f"QWidget {{ border: 1px solid {_ct['border']}; border-radius: 8px; }}"
-        )
-        outer_layout = QVBoxLayout(outer)
-        outer_layout.setContentsMargins(0, 0, 0, 0)
-        outer_layout.setSpacing(0)
-
-        # Header with avatar/initials and name/company
-        header = QWidget()
-        header.setStyleSheet(
-            f"QWidget {{ background: {_ct['background']}; border-top-left-radius: 8px; border-top-right-radius: 8px; }}"
-        )
-        h = QHBoxLayout(header)
-        h.setContentsMargins(10, 10, 10, 10)
-        h.setSpacing(10)
-
-        # Avatar/initials
-        avatar = QLabel()
-        initials = (
-            "".join(
-                [
-                    w[0].upper()
-                    for w in (
-                        contact.get("company") or contact.get("name") or " "
-                    ).split()[:2]
-                ]
-            ).strip()
-            or "?"
-        )
-        avatar.setText(initials)
-        avatar.setAlignment(Qt.AlignCenter)
-        avatar.setFixedSize(36, 36)
-        avatar.setStyleSheet(
-            f"QLabel {{ background: {_ct['primary']}; color: {_ct['text_on_primary']}; font-weight: bold; border-radius: 18px; }}"
-        )
-        h.addWidget(avatar)
-
-        title_box = QVBoxLayout()
-        name_txt = (
-            contact.get("name")
-            or contact.get("company")
-            or ("New Contact" if is_placeholder else "")
-        )
-        name_lbl = QLabel(f"<b>{name_txt}</b>")
-        name_lbl.setContentsMargins(0, 0, 0, 0)
-        company = contact.get("company", "")
-        comp_lbl = QLabel(company)
-        comp_lbl.setStyleSheet(f"color:{_ct['text_secondary']};")
-        title_box.addWidget(name_lbl)
-        if company:
-            title_box.addWidget(comp_lbl)
-        else:
-            note = (contact.get("notes") or "") if is_placeholder else ""
-            if note:
-                hint = QLabel(note)
-                hint.setStyleSheet(f"color:{_ct['text_muted']}; font-style: italic;")
-                title_box.addWidget(hint)
-        # Compact spacing: no stretch between header and body
-        h.addLayout(title_box, 1)
-        outer_layout.addWidget(header)
-
-        # Body (compact margins/spacing)
-        body = QWidget()
-        body_layout = QVBoxLayout(body)
-        body_layout.setContentsMargins(10, 4, 10, 6)
-        body_layout.setSpacing(2)
-
-        def line(lbl, val):
-            # Only render when a value is present to avoid empty rows
-            if not val:
-                return
-            text = f"<span style='color:#888'>{lbl}</span> {val}"
-            body_layout.addWidget(QLabel(text))
-
-        fax_disp = (
-            self._format_phone_display(contact.get("phone", ""))
-            if contact.get("phone")
-            else ""
-        )
-        phone_disp = (
-            self._format_phone_display(contact.get("phone1", ""))
-            if contact.get("phone1")
-            else ""
-        )
-        line("Fax:", fax_disp)
-        line("Phone:", phone_disp)
-        line("Email:", contact.get("email", ""))
-
-        # Smart hints (non-blocking)
-        smart_notes = []
-        if not is_placeholder:
-            if not (contact.get("phone") or "").strip():
-                smart_notes.append("Missing Fax number for one‑click send")
-            if contact.get("email") and "@" not in contact.get("email"):
-                smart_notes.append("Email looks invalid")
-        if smart_notes:
-            warn = QLabel(" \u26A0\uFE0F  " + " • ".join(smart_notes))
-            warn.setStyleSheet(f"color:{_ct['warning']};")
-            body_layout.addWidget(warn)
-
-        # Footer buttons
-        footer = QWidget()
-        f = QHBoxLayout(footer)
-        f.setContentsMargins(10, 6, 10, 10)
-        f.setSpacing(6)
-
-        # Favorite toggle button (star)
-        fav_btn = QPushButton("☆")
-        fav_btn.setFixedSize(32, 32)
-        fav_btn.setToolTip("Mark as Favorite")
-        is_fav = bool(contact.get("favorite", False))
-        if is_fav:
-            fav_btn.setText("★")
-            fav_btn.setToolTip("Unmark Favorite")
-        fav_btn.setEnabled(not is_placeholder and index >= 0)
-        fav_btn.clicked.connect(lambda: self._toggle_favorite(index, not is_fav))
-        f.addWidget(fav_btn)
-        f.addStretch()
-
-        edit_btn = QPushButton()
-        edit_btn.setIcon(self._icon_edit)
-        edit_btn.setToolTip("Edit this contact")
-        edit_btn.setEnabled(not is_placeholder and index >= 0)
-        edit_btn.clicked.connect(lambda: self.open_edit_dialog(contact, index))
-
-        select_btn = QPushButton()
-        select_btn.setIcon(self._icon_select)
-        select_btn.setToolTip("Send a fax to this contact")
-        select_btn.setEnabled(not is_placeholder and index >= 0)
-        select_btn.clicked.connect(lambda: self.select_contact(index))
-
-        delete_btn = QPushButton()
-        delete_btn.setIcon(self._icon_delete)
-        delete_btn.setToolTip("Delete this contact")
-        delete_btn.setVisible(not is_placeholder and index >= 0)
-        delete_btn.clicked.connect(lambda: self.confirm_delete(index))
-
-        # Uniform icon button styling
-        for _btn in (edit_btn, select_btn, delete_btn):
-            try:
-                _btn.setIconSize(QSize(18, 18))
-                _btn.setMinimumSize(36, 28)
-                _btn.setStyleSheet(
-                    f"QPushButton {{ padding: 6px; border: 1px solid {_ct['border']}; border-radius: 6px; background-color: {_ct['surface']}; }}"
-                    f"QPushButton:hover {{ background-color: {_ct['background']}; }}"
-                )
-            except Exception:
-                pass
-
-        f.addWidget(edit_btn)
-        f.addWidget(select_btn)
-        f.addWidget(delete_btn)
-
-        outer_layout.addWidget(body)
-        outer_layout.addWidget(footer)
-        return outer
+                rows.append(GridRow("spacer", height=8))
+            rows += card_rows([self._card_item(i, c) for i, c in non_favs])
+        self._set_rows(self.companies_view, self.companies_model, rows)
 
     def _toggle_favorite(self, index: int, new_value: bool):
         try:
@@ -578,16 +329,14 @@ class AddressBookDialog(QDialog):
     def open_add_dialog(self):
         dlg = AddContactDialog(self.base_dir, self.address_book_manager, self)
         if dlg.exec_() == QDialog.Accepted:
-            self.populate_cards()
-            self.populate_companies()
+            self._refresh_all()
 
     def open_edit_dialog(self, contact, index):
         dlg = AddContactDialog(
             self.base_dir, self.address_book_manager, self, contact, index
         )
         if dlg.exec_() == QDialog.Accepted:
-            self.populate_cards()
-            self.populate_companies()
+            self._refresh_all()
 
     def select_contact(self, index):
         contact = self.address_book_manager.contacts[index]
@@ -614,8 +363,7 @@ class AddressBookDialog(QDialog):
         )
         if reply == QMessageBox.Yes:
             self.address_book_manager.delete_contact(row)
-            self.populate_cards()
-            self.populate_companies()
+            self._refresh_all()
 
     def import_contacts(self):
         path, _ = QFileDialog.getOpenFileName(
@@ -623,8 +371,7 @@ class AddressBookDialog(QDialog):
         )
         if path:
             self.address_book_manager.import_contacts(path)
-            self.populate_cards()
-            self.populate_companies()
+            self._refresh_all()
 
     def export_contacts(self):
         path, _ = QFileDialog.getSaveFileName(
@@ -1,36 +1,54 @@
 import os
+from datetime import datetime, timedelta, timezone
 
-from PyQt5.QtCore import Qt, QUrl
-from PyQt5.QtWidgets import (QFileDialog, QFrame, QHBoxLayout, QLabel,
-                             QLineEdit, QMessageBox, QPushButton, QScrollArea,
+from PyQt5.QtCore import QPoint, Qt, QTimer, QUrl
+from PyQt5.QtWidgets import (QAbstractItemView, QComboBox, QFileDialog,
+                             QFrame, QHBoxLayout, QLabel, QLineEdit,
+                             QListView, QMessageBox, QPushButton,
                              QSizePolicy, QVBoxLayout, QWidget)
 
 from core.address_book import AddressBookManager
+from core.history_cache import get_history_cache
 from ui.address_book_dialog import AddContactDialog
 from ui.threads.retrieve_faxes_thread import RetrieveFaxesThread
 from ui.utils.thumb_loader import ThumbnailHelper
-from ui.widgets.fax_history_card import create_fax_card
+from ui.widgets.fax_history_view import (FaxHistoryDelegate,
+                                         FaxHistoryFilterProxy,
+                                         FaxHistoryModel, FaxRecord)
 from ui.widgets.pdf_viewer_dialog import (open_pdf_viewer,
                                           open_pdf_viewer_confirmation)
+from utils import inbox_index
 from utils.logging_utils import get_logger
 
+# Rows read from the local history cache per page
+CACHE_PAGE_SIZE = 50
+HISTORY_RANGES = (
+    ("All time", 0),
+    ("Last 7 days", 7),
+    ("Last 30 days", 30),
+    ("Last 90 days", 90),
+    ("Last year", 365),
+)
+
 
 class FaxHistoryPanel(QWidget):
     """
     Right-hand embedded panel: vertical scrolling list of fax entries with metadata and preview (inbound only).
     """
 
-    def __init__(self, base_dir, app_state, exe_dir=None, parent=None):
+    def __init__(self, base_dir, app_state, exe_dir=None, parent=None, address_book_manager=None):
         super().__init__(parent)
         self.base_dir = base_dir
         self.exe_dir = exe_dir or base_dir
         self.app_state = app_state
         self.log = get_logger("fax_history")
-        # Address book
-        try:
-            self.addr_mgr = AddressBookManager(self.base_dir)
-        except Exception:
-            self.addr_mgr = None
+        # Address book (shared with the send panel when provided by MainWindow)
+        self.addr_mgr = address_book_manager
+        if self.addr_mgr is None:
+            try:
+                self.addr_mgr = AddressBookManager(self.base_dir)
+            except Exception:
+                self.addr_mgr = None
         self.setMinimumWidth(320)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
@@ -69,42 +87,64 @@ class FaxHistoryPanel(QWidget):
         header_row.addLayout(self.header_actions)
         root.addLayout(header_row)
 
-        # Search box
+        # Search box and date range; both query the local history cache (debounced)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(250)
+        self._search_timer.timeout.connect(self._reload_from_cache)
+        search_row = QHBoxLayout()
         self.search = QLineEdit()
-        self.search.setPlaceholderText("Search number or status...")
+        self.search.setPlaceholderText("Search number, name or status...")
         self.search.textChanged.connect(self._apply_filter)
-        root.addWidget(self.search)
-
-        # Scroll area with container
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
+        search_row.addWidget(self.search, 1)
+        self.range_combo = QComboBox()
+        for label, days in HISTORY_RANGES:
+            self.range_combo.addItem(label, days)
+        self.range_combo.currentIndexChanged.connect(lambda _: self._reload_from_cache())
+        search_row.addWidget(self.range_combo)
+        root.addLayout(search_row)
+
+        # Virtualized list: one model row per fax, cards are painted by the delegate
+        self.model = FaxHistoryModel(self)
+        self.proxy = FaxHistoryFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        self.view = QListView()
+        self.view.setObjectName("faxHistoryList")
+        self.view.setFrameShape(QFrame.NoFrame)
+        self.view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         # Prevent horizontal scrolling by ensuring content adapts to viewport width
-        try:
-            self.scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        except Exception:
-            pass
-        self.container = QWidget()
-        self.vbox = QVBoxLayout(self.container)
-        self.vbox.setSpacing(8)
-        self.vbox.addStretch()
-        self.scroll.setWidget(self.container)
-        # Detect near-bottom for lazy loading
-        self.scroll.verticalScrollBar().valueChanged.connect(self._on_scroll)
-        root.addWidget(self.scroll, 1)
+        self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.view.setResizeMode(QListView.Adjust)
+        self.view.setUniformItemSizes(True)
+        self.view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.view.setMouseTracking(True)
+        self.delegate = FaxHistoryDelegate(self, self.view)
+        self.view.setItemDelegate(self.delegate)
+        self.view.setModel(self.proxy)
+        # Detect near-bottom for lazy loading, and load thumbnails for rows scrolled into view
+        self.view.verticalScrollBar().valueChanged.connect(self._on_scroll)
+        self._thumb_timer = QTimer(self)
+        self._thumb_timer.setSingleShot(True)
+        self._thumb_timer.setInterval(50)
+        self._thumb_timer.timeout.connect(self._load_visible_thumbnails)
+        self.proxy.rowsInserted.connect(lambda *_: self._thumb_timer.start())
+        self.proxy.layoutChanged.connect(lambda *_: self._thumb_timer.start())
+        self.proxy.modelReset.connect(lambda *_: self._thumb_timer.start())
+        root.addWidget(self.view, 1)
 
         # Thumbnail/network helper
         self.thumb_helper = ThumbnailHelper(
             self.base_dir, self.exe_dir, self.app_state, self
         )
 
-        # State for data and pagination
-        self._all_data = []
+        # State for pagination: API pages still to fetch, and whether the cache has older rows
         self._next_inbound_page = 1
         self._next_outbound_page = 1
         self._loading_more = False
+        self._cache_exhausted = False
+        self._cache_ok = True
 
         # Load items initially
-        self._data = []
         self.request_refresh()
 
     def request_refresh(self):
@@ -116,19 +156,13 @@ class FaxHistoryPanel(QWidget):
         self._perform_refresh()
 
     def _perform_refresh(self):
-        """Refresh list by refetching from API (page 1 for both directions)."""
+        """Show cached history immediately, then refetch page 1 of both directions from the API."""
         self._refresh_in_progress = True
         self._refresh_requested_again = False
-        # Abort any in-flight thumbnail fetches to prevent late callbacks
-        try:
-            self._abort_active_replies()
-        except Exception:
-            pass
-        self._all_data = []
-        self._clear_items()
         self._next_inbound_page = 1
         self._next_outbound_page = 1
         self._loading_more = True
+        self._reload_from_cache()
         # Guard: if fax_user missing, skip API calls and leave panel empty
         fax_user = getattr(self.app_state.global_cfg, "fax_user", None)
         if not fax_user:
@@ -138,16 +172,11 @@ class FaxHistoryPanel(QWidget):
                 )
             except Exception:
                 pass
-            # Reset flags and keep panel empty
+            # Reset flags and keep showing whatever the local cache has
             self._refresh_in_progress = False
             self._loading_more = False
             return
-        self.worker = RetrieveFaxesThread(
-            fax_user,
-            self.app_state.global_cfg.bearer_token or "",
-            inbound_page=self._next_inbound_page,
-            outbound_page=self._next_outbound_page,
-        )
+        self.worker = self._make_worker(fax_user, self._next_inbound_page, self._next_outbound_page)
 
         # When finished, populate and clear in-progress flag
         def _on_finished(data):
@@ -163,14 +192,8 @@ class FaxHistoryPanel(QWidget):
         self.worker.start()
 
     def _clear_items(self):
-        # remove all except stretch
-        count = self.vbox.count()
-        for i in reversed(range(count - 1)):
-            item = self.vbox.itemAt(i)
-            w = item.widget()
-            if w is not None:
-                w.setParent(None)
-        # Also abort any active replies to avoid late callbacks hitting removed widgets
+        self.model.clear()
+        # Also abort any active replies; late callbacks are dropped by the model generation check
         try:
             self._abort_active_replies()
         except Exception:
@@ -184,24 +207,92 @@ class FaxHistoryPanel(QWidget):
             pass
 
     def _apply_filter(self, text):
-        text = (text or "").strip().lower()
-        show_in = self.toggle_inbound.isChecked()
-        show_out = self.toggle_outbound.isChecked()
-        for i in range(self.vbox.count() - 1):
-            w = self.vbox.itemAt(i).widget()
-            if not w:
-                continue
-            match_text = (w.property("match_text") or "").lower()
-            direction = (w.property("direction") or "").lower()
-            dir_ok = (show_in and direction == "inbound") or (
-                show_out and direction == "outbound"
-            )
-            w.setVisible(dir_ok and (text in match_text))
+        # Loaded rows are filtered instantly through the search index; the (debounced)
+        # cache query then brings in matches that were not loaded yet
+        self.proxy.set_filter(
+            text, self.toggle_inbound.isChecked(), self.toggle_outbound.isChecked()
+        )
+        self._search_timer.start()
+
+    def _make_worker(self, fax_user, inbound_page, outbound_page):
+        return RetrieveFaxesThread(
+            fax_user,
+            self.app_state.global_cfg.bearer_token or "",
+            inbound_page=inbound_page,
+            outbound_page=outbound_page,
+            base_dir=self.base_dir,
+            contact_names=self._contact_names(),
+        )
+
+    def _contact_names(self) -> dict:
+        """{sanitized phone: display name} snapshot handed to the fetch thread."""
+        names = {}
+        try:
+            if self.addr_mgr:
+                self.addr_mgr.reload_if_changed()
+                for c in self.addr_mgr.contacts or []:
+                    if c.get("is_placeholder", False):
+                        continue
+                    name = (c.get("name") or c.get("company") or "").strip()
+                    if not name:
+                        continue
+                    for key in ("phone", "phone1"):
+                        p = AddressBookManager._sanitize_phone(c.get(key, ""))
+                        if p and p not in names:
+                            names[p] = name
+        except Exception:
+            pass
+        return names
+
+    def _cache_filter(self) -> dict:
+        directions = []
+        if self.toggle_inbound.isChecked():
+            directions.append("inbound")
+        if self.toggle_outbound.isChecked():
+            directions.append("outbound")
+        since = None
+        days = self.range_combo.currentData()
+        if days:
+            since = (datetime.now(timezone.utc) - timedelta(days=int(days))).strftime("%Y-%m-%dT%H:%M:%SZ")
+        return {"text": self.search.text(), "directions": directions, "since": since}
+
+    def _query_cache(self, **kwargs) -> list:
+        try:
+            entries = get_history_cache(self.base_dir).query(**self._cache_filter(), **kwargs)
+            self._cache_ok = True
+            return entries
+        except Exception:
+            self._cache_ok = False
+            self.log.exception("Fax history cache unavailable")
+            return []
+
+    def _records_for(self, entries):
+        return [FaxRecord(entry, self.addr_mgr, self.base_dir) for entry in entries]
+
+    def _reload_from_cache(self):
+        """Replace the list with the first page of cached history matching the search and range."""
+        self._search_timer.stop()
+        entries = self._query_cache(limit=CACHE_PAGE_SIZE)
+        self._clear_items()
+        self.model.add_records(self._records_for(entries))
+        self._cache_exhausted = len(entries) < CACHE_PAGE_SIZE
+        self._fill_viewport()
+
+    def _load_more_from_cache(self) -> int:
+        """Append the next cached page after the last row shown. Returns rows added."""
+        last = self.model.last_record()
+        before = (last.created_at, last.key) if last else None
+        entries = self._query_cache(before=before, limit=CACHE_PAGE_SIZE)
+        self._cache_exhausted = len(entries) < CACHE_PAGE_SIZE
+        return self.model.add_records(self._records_for(entries))
+
+    def _fill_viewport(self):
+        # Keep paging while the list does not fill the view (no scroll events would fire)
+        QTimer.singleShot(0, self._on_scroll)
 
     def _populate_list(self, data):
-        # Merge into the full dataset and record next pages
+        # Fetched pages were written to the history cache by the thread; record next pages
         data = data or []
-        self._all_data.extend(data)
         try:
             self._next_inbound_page = getattr(self.worker, "next_inbound_page", None)
             self._next_outbound_page = getattr(self.worker, "next_outbound_page", None)
@@ -209,25 +300,99 @@ class FaxHistoryPanel(QWidget):
             pass
         self._loading_more = False
 
-        # Rebuild visible list according to toggles, search, and newest-first by created_at
-        self._clear_items()
-        # Interweave inbound/outbound sorted by created_at (already sorted in thread, but re-sort to be safe)
-        try:
-            sorted_all = sorted(
-                self._all_data, key=lambda x: x.get("created_at", ""), reverse=True
+        if not self._cache_ok:
+            # Cache unavailable: show every fetched row directly (data holds only changes)
+            fetched = getattr(self.worker, "fetched", None) or data
+            self.model.add_records(self._records_for(fetched))
+            return
+        # Pick up new and changed rows down to the last row shown; older ones page in on scroll
+        last = self.model.last_record()
+        if last is None:
+            entries = self._query_cache(limit=CACHE_PAGE_SIZE)
+        else:
+            entries = self._query_cache(
+                not_before=(last.created_at, last.key),
+                limit=self.model.rowCount() + CACHE_PAGE_SIZE,
             )
+        self.model.add_records(self._records_for(entries))
+        self._cache_exhausted = False
+        # data holds only new/changed entries; keep paging if the API returned anything at all
+        if data or getattr(self.worker, "fetched_count", 0):
+            self._fill_viewport()
+
+    def repopulate(self):
+        """Repaint all rows, e.g. after a theme change."""
+        try:
+            self.view.doItemsLayout()
+            self.view.viewport().update()
         except Exception:
-            sorted_all = list(self._all_data)
+            pass
 
-        for entry in sorted_all:
-            # Toggle filtering will be applied in _apply_filter
-            card = self._create_card(entry)
-            self.vbox.insertWidget(self.vbox.count() - 1, card)
-        # re-apply filter to new items (also respects toggles)
-        self._apply_filter(self.search.text())
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        try:
+            self._thumb_timer.start()
+        except Exception:
+            pass
 
-    def _create_card(self, entry: dict) -> QWidget:
-        return create_fax_card(self, entry, self.thumb_helper)
+    def _visible_source_rows(self):
+        """Source-model rows currently in the viewport, plus a small look-ahead."""
+        count = self.proxy.rowCount()
+        if count <= 0:
+            return []
+        vp = self.view.viewport()
+        first = self.view.indexAt(QPoint(1, 1))
+        last = self.view.indexAt(QPoint(1, max(1, vp.height() - 2)))
+        start = first.row() if first.isValid() else 0
+        end = last.row() if last.isValid() else count - 1
+        end = min(count - 1, end + 2)
+        rows = []
+        for r in range(start, end + 1):
+            src = self.proxy.mapToSource(self.proxy.index(r, 0))
+            if src.isValid():
+                rows.append(src.row())
+        return rows
+
+    def _load_visible_thumbnails(self):
+        try:
+            preview_w, _ph = self.delegate._preview_size()
+            gen = self.model.generation
+            remote = []
+            for row in self._visible_source_rows():
+                rec = self.model.record_at(row)
+                if rec is None:
+                    continue
+                local_pdf = self.delegate._local_pdf(rec)
+                if local_pdf:
+                    if self.model.needs_thumbnail(rec.key):
+                        self.model.mark_thumbnail_pending(rec.key)
+                        # Rendered off the GUI thread; the row shows a placeholder until then
+                        self.thumb_helper.request_pdf_thumbnail(
+                            local_pdf,
+                            preview_w,
+                            lambda pm, k=rec.key, g=gen: self.model.set_thumbnail(k, pm, g),
+                        )
+                    continue
+                url = rec.entry.get("thumbnail") or self.thumb_helper.thumbnail_url_for(rec.entry)
+                if not url:
+                    if self.model.needs_thumbnail(rec.key):
+                        self.model.set_thumbnail(rec.key, None)
+                    continue
+                remote.append((rec.key, url))
+            # Drop fetches for rows that scrolled away, then queue visible rows top-down
+            self.thumb_helper.retain_remote([url for _k, url in remote])
+            for priority, (key, url) in enumerate(remote):
+                if not self.model.needs_thumbnail(key):
+                    continue
+                self.model.mark_thumbnail_pending(key)
+                self.thumb_helper.fetch_remote_pixmap(
+                    url,
+                    lambda pm, k=key, g=gen: self.model.set_thumbnail(k, pm, g),
+                    priority=priority,
+                    on_cancel=lambda k=key, g=gen: self.model.clear_thumbnail_pending(k, g),
+                )
+        except Exception:
+            pass
 
     # Public API: allow MainWindow to add small widgets into the header actions row
     def add_header_widget(self, widget):
@@ -247,27 +412,29 @@ class FaxHistoryPanel(QWidget):
 
     def _on_scroll(self, _=None):
         try:
-            sb = self.scroll.verticalScrollBar()
+            self._thumb_timer.start()
+        except Exception:
+            pass
+        try:
+            sb = self.view.verticalScrollBar()
             if not sb:
                 return
             near_bottom = sb.value() >= sb.maximum() - 50
             if near_bottom and not self._loading_more:
-                # Decide next pages to request
+                # Page through the local cache first; fetch older API pages once it runs out
+                if not self._cache_exhausted and self._cache_ok:
+                    if self._load_more_from_cache():
+                        self._fill_viewport()
+                        return
                 in_p = self._next_inbound_page or None
                 out_p = self._next_outbound_page or None
                 if not in_p and not out_p:
                     return
+                fax_user = getattr(self.app_state.global_cfg, "fax_user", None) or ""
+                if not fax_user:
+                    return
                 self._loading_more = True
-                self.worker = RetrieveFaxesThread(
-                    (
-                        getattr(self.app_state.global_cfg, "fax_user", None)
-                        or self.app_state.global_cfg.fax_user
-                        or ""
-                    ),
-                    self.app_state.global_cfg.bearer_token or "",
-                    inbound_page=in_p or 0,
-                    outbound_page=out_p or 0,
-                )
+                self.worker = self._make_worker(fax_user, in_p or 0, out_p or 0)
                 self.worker.finished.connect(self._populate_list)
                 self.worker.start()
         except Exception:
@@ -452,26 +619,13 @@ class FaxHistoryPanel(QWidget):
             )
             if not os.path.isdir(inbox):
                 return None
-            # Try matching by id or known fields embedded in filename
+            # Match by fax id/uuid only (receiver-recorded names or exact file stem)
             keys = [
                 str(entry.get("id", "")),
                 str(entry.get("fax_id", "")),
                 str(entry.get("uuid", "")),
             ]
-            keys = [k for k in keys if k]
-            files = [f for f in os.listdir(inbox) if f.lower().endswith(".pdf")]
-            # 1) Exact matches
-            for k in keys:
-                for f in files:
-                    if k and k in f:
-                        return os.path.join(inbox, f)
-            # 2) Heuristic by timestamp or number if id not present
-            rn = str(entry.get("remote_number", ""))
-            ts = str(entry.get("timestamp", "")).replace(":", "-")
-            for f in files:
-                if (rn and rn in f) or (ts and ts in f):
-                    return os.path.join(inbox, f)
-            return None
+            return inbox_index.find_local_file(self.base_dir, inbox, keys, (".pdf",))
         except Exception:
             return None
 
@@ -558,11 +712,7 @@ class FaxHistoryPanel(QWidget):
             digits = AddressBookManager._sanitize_phone(key)
             if not digits or not getattr(self, "addr_mgr", None):
                 return
-            # Refresh contacts to ensure we have latest
-            try:
-                self.addr_mgr.refresh_contacts()
-            except Exception:
-                pass
+            # Lookup reloads the address book only if it changed on disk
             idx, contact = self.addr_mgr.find_contact_by_phone(digits)
             if not contact:
                 try:
@@ -580,7 +580,10 @@ class MainWindow(QMainWindow):
 
         # Right side: Fax History (bottom area). Retrieval controls move to a full-width top header.
         self.fax_history_panel = FaxHistoryPanel(
-            self.base_dir, self.app_state, self.exe_dir
+            self.base_dir,
+            self.app_state,
+            self.exe_dir,
+            address_book_manager=self.address_book_model,
         )
         self.fax_history_panel.setMinimumWidth(300)
 
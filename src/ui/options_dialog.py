@@ -19,6 +19,7 @@ from PyQt5.QtWidgets import (QButtonGroup, QCheckBox, QComboBox, QDialog,
 
 from core.config_loader import device_config, global_config
 from core.license_client import initialize_session, retrieve_skyswitch_token
+from fax_io.sender import MAX_PARALLEL_SESSIONS
 from integrations.computer_rx import CRxIntegration2
 from ui.busy import BusyDialog
 from utils.logging_utils import get_logger, set_global_logging_level
@@ -228,6 +229,39 @@ class OptionsDialog(QDialog):
         group.setLayout(g_lay)
         layout.addWidget(group)
 
+        # --- Sending group ---
+        send_group = QGroupBox("Sending")
+        send_lay = QVBoxLayout()
+        send_lay.setSpacing(8)
+
+        concurrency_row = QHBoxLayout()
+        concurrency_row.addWidget(QLabel("Concurrent Session Uploads:"))
+        self.send_concurrency_spinbox = QSpinBox()
+        self.send_concurrency_spinbox.setRange(1, MAX_PARALLEL_SESSIONS)
+        try:
+            cur_sessions = int(device_config.get("Fax Options", "send_session_concurrency", 1) or 1)
+        except Exception:
+            cur_sessions = 1
+        self.send_concurrency_spinbox.setValue(max(1, min(MAX_PARALLEL_SESSIONS, cur_sessions)))
+        self.send_concurrency_spinbox.setToolTip(
+            "Large faxes are sent as several sessions; 1 uploads them one at a time."
+        )
+        concurrency_row.addWidget(self.send_concurrency_spinbox)
+        concurrency_row.addStretch()
+        send_lay.addLayout(concurrency_row)
+
+        self.fax_compression_checkbox = QCheckBox("Compress scanned pages before sending")
+        self.fax_compression_checkbox.setToolTip(
+            "Re-encode image-heavy pages as black-and-white fax images (smaller uploads)."
+        )
+        self.fax_compression_checkbox.setChecked(
+            str(device_config.get("Fax Options", "fax_compression", "No") or "No").strip().lower() == "yes"
+        )
+        send_lay.addWidget(self.fax_compression_checkbox)
+
+        send_group.setLayout(send_lay)
+        layout.addWidget(send_group)
+
         # --- Behavior group ---
         beh_group = QGroupBox("Behavior")
         beh_lay = QVBoxLayout()
@@ -465,9 +499,74 @@ class OptionsDialog(QDialog):
         self.account_group = group
 
         layout.addWidget(group)
+
+        # --- Additional receiver accounts (polled alongside the primary fax user) ---
+        acct_group = QGroupBox("Additional Receiver Accounts")
+        acct_lay = QVBoxLayout()
+        acct_lay.setSpacing(8)
+        self._receiver_accounts = []
+        raw_accounts = device_config.get("Fax Options", "receiver_accounts", []) or []
+        if isinstance(raw_accounts, list):
+            self._receiver_accounts = [dict(a) for a in raw_accounts if isinstance(a, dict) and a.get("fax_user")]
+        self.receiver_accounts_list = QListWidget()
+        self.receiver_accounts_list.setMaximumHeight(90)
+        self._refresh_receiver_accounts_list()
+        acct_lay.addWidget(self.receiver_accounts_list)
+        acct_btn_row = QHBoxLayout()
+        add_acct_btn = QPushButton("Add...")
+        remove_acct_btn = QPushButton("Remove")
+        add_acct_btn.clicked.connect(self._add_receiver_account)
+        remove_acct_btn.clicked.connect(self._remove_receiver_account)
+        acct_btn_row.addWidget(add_acct_btn)
+        acct_btn_row.addWidget(remove_acct_btn)
+        acct_btn_row.addStretch()
+        acct_lay.addLayout(acct_btn_row)
+        acct_group.setLayout(acct_lay)
+        layout.addWidget(acct_group)
+
         layout.addStretch()
         return page
 
+    def _refresh_receiver_accounts_list(self):
+        self.receiver_accounts_list.clear()
+        for acct in self._receiver_accounts:
+            label = acct.get("label") or ""
+            text = f"{label} ({acct['fax_user']})" if label else acct["fax_user"]
+            if acct.get("jwt_token_enc"):
+                text += " - own credentials"
+            self.receiver_accounts_list.addItem(text)
+
+    def _add_receiver_account(self):
+        dlg = ReceiverAccountDialog(self)
+        if dlg.exec_() != QDialog.Accepted:
+            return
+        fax_user, label, jwt_token = dlg.values()
+        primary = (getattr(self.app_state.global_cfg, "fax_user", None) or "").strip().lower()
+        existing = {a["fax_user"].lower() for a in self._receiver_accounts}
+        if not fax_user or "@" not in fax_user:
+            QMessageBox.warning(self, "Receiver Account", "Enter the full fax user (e.g. 200@sample.12345.service).")
+            return
+        if fax_user.lower() == primary or fax_user.lower() in existing:
+            QMessageBox.warning(self, "Receiver Account", "That fax user is already being polled.")
+            return
+        entry = {"fax_user": fax_user}
+        if label:
+            entry["label"] = label
+        if jwt_token:
+            try:
+                entry["jwt_token_enc"] = secure_encrypt_for_machine(jwt_token)
+            except Exception:
+                QMessageBox.warning(self, "Receiver Account", "Could not protect the token on this machine.")
+                return
+        self._receiver_accounts.append(entry)
+        self._refresh_receiver_accounts_list()
+
+    def _remove_receiver_account(self):
+        row = self.receiver_accounts_list.currentRow()
+        if 0 <= row < len(self._receiver_accounts):
+            del self._receiver_accounts[row]
+            self._refresh_receiver_accounts_list()
+
     def _build_logging_page(self):
         page = QWidget()
         layout = QVBoxLayout(page)
@@ -874,6 +973,15 @@ class OptionsDialog(QDialog):
                 "faxid" if self.naming_faxid_radio.isChecked() else "cid",
             )
             device_config.set("Fax Options", "polling_frequency", minutes)
+            device_config.set("Fax Options", "receiver_accounts", list(self._receiver_accounts))
+            device_config.set(
+                "Fax Options", "send_session_concurrency", int(self.send_concurrency_spinbox.value())
+            )
+            device_config.set(
+                "Fax Options",
+                "fax_compression",
+                "Yes" if self.fax_compression_checkbox.isChecked() else "No",
+            )
             device_config.set(
                 "Fax Options",
                 "print_faxes",
@@ -1182,3 +1290,42 @@ class OptionsDialog(QDialog):
         # Subtly draw attention to the Account section when unconfigured
         if not have_both:
             self._flash_account_attention()
+
+
+class ReceiverAccountDialog(QDialog):
+    """Collects one additional receiver account for "Fax Options" -> receiver_accounts."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Add Receiver Account")
+        self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
+        self.setModal(True)
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+        self.fax_user_input = QLineEdit()
+        self.fax_user_input.setPlaceholderText("200@sample.12345.service")
+        self.label_input = QLineEdit()
+        self.label_input.setPlaceholderText("Optional; prefixes downloaded file names")
+        self.jwt_input = QLineEdit()
+        self.jwt_input.setEchoMode(QLineEdit.Password)
+        self.jwt_input.setPlaceholderText("Optional; blank uses this device's credentials")
+        form.addRow("Fax User:", self.fax_user_input)
+        form.addRow("Label:", self.label_input)
+        form.addRow("FRA Token:", self.jwt_input)
+        layout.addLayout(form)
+        row = QHBoxLayout()
+        row.addStretch()
+        ok = QPushButton("Add")
+        cancel = QPushButton("Cancel")
+        ok.clicked.connect(self.accept)
+        cancel.clicked.connect(self.reject)
+        row.addWidget(ok)
+        row.addWidget(cancel)
+        layout.addLayout(row)
+
+    def values(self):
+        return (
+            (self.fax_user_input.text() or "").strip(),
+            (self.label_input.text() or "").strip(),
+            (self.jwt_input.text() or "").strip(),
+        )
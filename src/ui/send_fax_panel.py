@@ -1,11 +1,10 @@
-import io
 import os
 import random
 import tempfile
-from tempfile import mkstemp
+import time
 
-from PyQt5.QtCore import QRectF, QSize, Qt, QThread, QTimer
-from PyQt5.QtGui import QIcon, QImage, QMovie, QPixmap
+from PyQt5.QtCore import QEvent, QRectF, QSize, Qt, QThread, QTimer
+from PyQt5.QtGui import QIcon, QMovie
 from PyQt5.QtWidgets import (QCheckBox, QComboBox, QDialog, QFileDialog,
                              QGraphicsScene, QGraphicsView, QGridLayout,
                              QGroupBox, QHBoxLayout, QInputDialog, QLabel,
@@ -16,16 +15,14 @@ from PyQt5.QtWidgets import (QCheckBox, QComboBox, QDialog, QFileDialog,
 from core.config_loader import device_config, global_config
 from fax_io.sender import FaxSender, MAX_FILE_BYTES, plan_sessions
 from utils.document_utils import normalize_document
-
-try:
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib.units import inch
-    from reportlab.pdfgen import canvas
-
-    REPORTLAB_AVAILABLE = True
-except Exception:
-    REPORTLAB_AVAILABLE = False
+from utils.cover_templates import (
+    DEFAULT_FOOTER,
+    REPORTLAB_AVAILABLE,
+    designer_cover_pdf_bytes,
+    write_temp,
+)
 from ui.busy import BusyDialog
+from ui.widgets.pdf_page_renderer import PdfPageRenderer, fit_mode, zoom_mode
 from utils.logging_utils import get_logger
 from workers.scan_worker import ScanWorker
 from workers.send_worker import SendWorker
@@ -48,8 +45,8 @@ class SendFaxPanel(QWidget):
 
         self.zoomed = False
         self.attachments = []
-        self.page_images = []
         self.current_page = 0
+        self.original_pixmap = None
         self.scan_session_count = 0
         self._cover_temp_path = None
 
@@ -140,6 +137,11 @@ class SendFaxPanel(QWidget):
         self.fax_prefix.textChanged.connect(
             lambda: self._auto_advance(self.fax_prefix, self.fax_suffix)
         )
+        # Show the matching address book contact once a full number is entered
+        self.recipient_contact_label = QLabel("")
+        self.recipient_contact_label.setObjectName("hint")
+        for field in (self.fax_area, self.fax_prefix, self.fax_suffix):
+            field.textChanged.connect(self._update_recipient_contact)
 
         # Address Book button
         self.address_book_btn = QPushButton("Address Book")
@@ -168,6 +170,7 @@ class SendFaxPanel(QWidget):
         fax_row_h.addWidget(self.fax_prefix)
         fax_row_h.addWidget(dash2)
         fax_row_h.addWidget(self.fax_suffix)
+        fax_row_h.addWidget(self.recipient_contact_label)
         fax_row_h.addStretch()
         recipient_layout.addWidget(self.fax_row_widget, row, 1, 1, 3)
         recipient_layout.addWidget(self.address_book_btn, row, 4, 1, 2)
@@ -258,6 +261,11 @@ class SendFaxPanel(QWidget):
         self.preview_view.setScene(self.preview_scene)
         self.preview_view.setMouseTracking(True)
         self.preview_view.viewport().installEventFilter(self)
+        # Pages are rendered lazily on a worker thread, current page first
+        self.page_renderer = PdfPageRenderer(self.base_dir, self.exe_dir, self)
+        self.page_renderer.opened.connect(self._on_preview_opened)
+        self.page_renderer.pageReady.connect(self._on_preview_page_ready)
+        self.page_renderer.pageFailed.connect(self._on_preview_page_failed)
 
         right_preview_layout.addWidget(self.preview_view)
 
@@ -712,19 +720,9 @@ class SendFaxPanel(QWidget):
         QMessageBox.warning(self, "Scanner Error", message)
         self.scan_button.setEnabled(True)
 
-    def _on_zoom(self):
-        self.zoomed = True
-        self.preview_view.setDragMode(QGraphicsView.ScrollHandDrag)
-        self._update_preview_zoom(1.0)
-
-    def _on_unzoom(self):
-        self.zoomed = False
-        self.preview_view.setDragMode(QGraphicsView.NoDrag)
-        self._update_preview_zoom(1.0)
-
     def _update_preview_zoom(self, factor, center=None):
         self.preview_scene.clear()
-        if hasattr(self, "original_pixmap"):
+        if self.original_pixmap is not None:
             if center:
                 w, h = self.original_pixmap.width(), self.original_pixmap.height()
                 x = int(center.x() * (w / self.preview_view.viewport().width()))
@@ -737,93 +735,109 @@ class SendFaxPanel(QWidget):
                     self.preview_view.setSceneRect(QRectF(self.original_pixmap.rect()))
                 else:
                     viewport_size = self.preview_view.viewport().size()
-                    scaled = self.original_pixmap.scaled(
-                        viewport_size, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                    )
+                    scaled = self.original_pixmap
+                    if scaled.width() > viewport_size.width() or scaled.height() > viewport_size.height():
+                        scaled = scaled.scaled(
+                            viewport_size, Qt.KeepAspectRatio, Qt.SmoothTransformation
+                        )
                     self.preview_scene.addPixmap(scaled)
                     self.preview_view.setSceneRect(QRectF(scaled.rect()))
 
+    def _preview_mode(self):
+        return zoom_mode() if self.zoomed else fit_mode(self.preview_view)
+
+    def _show_preview_page(self):
+        """Show the current page, rendering it (and prefetching neighbours) if needed."""
+        pm = self.page_renderer.request(self.current_page, self._preview_mode())
+        if pm is None:
+            pm = self.page_renderer.any_pixmap(self.current_page)
+        if pm is None:
+            self.original_pixmap = None
+            self.preview_scene.clear()
+            self.preview_scene.addText(f"Rendering page {self.current_page + 1}…")
+            return
+        self.original_pixmap = pm
+        self._update_preview_zoom(1.0)
+
+    def _on_zoom(self):
+        self.zoomed = True
+        self.preview_view.setDragMode(QGraphicsView.ScrollHandDrag)
+        if self.page_renderer.page_count > 0:
+            self._show_preview_page()
+        else:
+            self._update_preview_zoom(1.0)
+
+    def _on_unzoom(self):
+        self.zoomed = False
+        self.preview_view.setDragMode(QGraphicsView.NoDrag)
+        if self.page_renderer.page_count > 0:
+            self._show_preview_page()
+        else:
+            self._update_preview_zoom(1.0)
+
+    def eventFilter(self, obj, event):
+        try:
+            if (
+                obj is self.preview_view.viewport()
+                and event.type() == QEvent.Resize
+                and self.page_renderer.page_count > 0
+                and not self.zoomed
+            ):
+                # Fit-to-view pages are rendered for the viewport size
+                self._show_preview_page()
+        except Exception:
+            pass
+        return super().eventFilter(obj, event)
+
     def _preview_document(self, index):
         self.preview_scene.clear()
-        self.page_images.clear()
+        self.original_pixmap = None
         self.current_page = 0
+        self.page_prev_btn.setEnabled(False)
+        self.page_next_btn.setEnabled(False)
 
         if index < 0 or index >= len(self.attachments):
+            self.page_renderer.clear()
             self.preview_scene.addText("No preview")
-            self.page_prev_btn.setEnabled(False)
-            self.page_next_btn.setEnabled(False)
             return
 
         path = self.attachments[index]
         if path.lower().endswith(".pdf"):
-            try:
-                imgs = []
-                # Try PyMuPDF (fitz) first to avoid spawning Poppler subprocesses (no console windows)
-                try:
-                    import fitz  # PyMuPDF
-
-                    doc = fitz.open(path)
-                    if doc.page_count <= 0:
-                        raise RuntimeError("Empty PDF")
-                    for i in range(doc.page_count):
-                        page = doc.load_page(i)
-                        pix = page.get_pixmap(dpi=200, alpha=False)
-                        img_bytes = pix.tobytes("png")
-                        qimg = QImage.fromData(img_bytes)
-                        imgs.append(QPixmap.fromImage(qimg))
-                except Exception:
-                    # Fallback to pdf2image + Poppler if PyMuPDF is unavailable
-                    from pdf2image import convert_from_path
-
-                    # Prefer MEIPASS/base_dir (onefile extraction) for Poppler, then fallback to exe_dir
-                    candidates = [
-                        os.path.join(self.base_dir, "poppler", "bin"),
-                        os.path.join(self.exe_dir or self.base_dir, "poppler", "bin"),
-                    ]
-                    poppler_bin = next(
-                        (p for p in candidates if os.path.isdir(p)), None
-                    )
-                    kwargs = {"dpi": 200}
-                    if poppler_bin:
-                        kwargs["poppler_path"] = poppler_bin
-                    pages = convert_from_path(path, **kwargs)
-                    for pil_image in pages:
-                        buf = io.BytesIO()
-                        pil_image.save(buf, format="PNG")
-                        qt_image = QImage.fromData(buf.getvalue())
-                        imgs.append(QPixmap.fromImage(qt_image))
-
-                if imgs:
-                    self.page_images = imgs
-                    self.original_pixmap = self.page_images[0]
-                    self._update_preview_zoom(1.0)
-                    multi = len(self.page_images) > 1
-                    self.page_prev_btn.setEnabled(multi)
-                    self.page_next_btn.setEnabled(multi)
-                else:
-                    self.preview_scene.addText("Failed to render PDF.")
-                    self.page_prev_btn.setEnabled(False)
-                    self.page_next_btn.setEnabled(False)
-            except Exception as e:
-                self.preview_scene.addText(f"Preview error: {e}")
-                self.page_prev_btn.setEnabled(False)
-                self.page_next_btn.setEnabled(False)
+            self.preview_scene.addText("Loading preview…")
+            self.page_renderer.open(path)
         else:
+            self.page_renderer.clear()
             self.preview_scene.addText("Preview not supported for this file type.")
-            self.page_prev_btn.setEnabled(False)
-            self.page_next_btn.setEnabled(False)
+
+    def _on_preview_opened(self, count: int):
+        if count <= 0:
+            self.preview_scene.clear()
+            self.preview_scene.addText("Failed to render PDF.")
+            return
+        multi = count > 1
+        self.page_prev_btn.setEnabled(multi)
+        self.page_next_btn.setEnabled(multi)
+        self._show_preview_page()
+
+    def _on_preview_page_ready(self, index: int):
+        if index == self.current_page:
+            self._show_preview_page()
+
+    def _on_preview_page_failed(self, index: int):
+        if index == self.current_page:
+            self.original_pixmap = None
+            self.preview_scene.clear()
+            self.preview_scene.addText(f"Failed to render page {index + 1}.")
 
     def _on_prev_page(self):
         if self.current_page > 0:
             self.current_page -= 1
-            self.original_pixmap = self.page_images[self.current_page]
-            self._update_preview_zoom(1.0)
+            self._show_preview_page()
 
     def _on_next_page(self):
-        if self.current_page < len(self.page_images) - 1:
+        if self.current_page < self.page_renderer.page_count - 1:
             self.current_page += 1
-            self.original_pixmap = self.page_images[self.current_page]
-            self._update_preview_zoom(1.0)
+            self._show_preview_page()
 
     def _on_send(self):
         fax = f"1{self.fax_area.text()}{self.fax_prefix.text()}{self.fax_suffix.text()}"
@@ -923,6 +937,9 @@ class SendFaxPanel(QWidget):
             self._send_busy = None
 
         # Start worker thread
+        self._send_last_progress = (0, 0)
+        self._send_transfer_start = None
+        self._send_transfer_text = ""
         try:
             self.send_thread = QThread(self)
             self.send_worker = SendWorker(self.base_dir, fax, list(self.attachments), include_cover)
@@ -931,6 +948,7 @@ class SendFaxPanel(QWidget):
             # Wire signals
             self.send_thread.started.connect(self.send_worker.run)
             self.send_worker.progress.connect(self._on_send_progress)
+            self.send_worker.transfer.connect(self._on_send_transfer)
             self.send_worker.success.connect(self._on_send_result)
             self.send_worker.error.connect(self._on_send_error)
             self.send_worker.finished.connect(self.send_thread.quit)
@@ -979,7 +997,7 @@ class SendFaxPanel(QWidget):
         self.cover_checkbox.setChecked(False)
         # Do not delete cover immediately; scheduled above. Just forget its path.
         self._cover_temp_path = None
-        self.page_images = []
+        self.page_renderer.clear()
         self.original_pixmap = None
         self.current_page = 0
         self.attachments.clear()
@@ -1033,6 +1051,20 @@ class SendFaxPanel(QWidget):
             except Exception:
                 pass
 
+    def _update_recipient_contact(self, _=None):
+        try:
+            digits = (
+                self.fax_area.text() + self.fax_prefix.text() + self.fax_suffix.text()
+            )
+            name = ""
+            if len(digits) == 10 and self.address_book_manager:
+                _idx, contact = self.address_book_manager.find_contact_by_phone(digits)
+                if contact:
+                    name = (contact.get("name") or contact.get("company") or "").strip()
+            self.recipient_contact_label.setText(name)
+        except Exception:
+            pass
+
     def populate_phone_fields(self, phone: str):
         # Accepts 10-digit string, optionally with punctuation
         digits = "".join([c for c in (phone or "") if c.isdigit()])
@@ -1084,58 +1116,22 @@ class SendFaxPanel(QWidget):
             company = address = phone = email = ""
             custom_footer_enabled = False
             custom_footer_text = ""
+        # Footer: default or custom if enabled
+        footer_text = DEFAULT_FOOTER
+        if custom_footer_enabled and (custom_footer_text or "").strip():
+            footer_text = custom_footer_text.strip()
         try:
-            fd, path = mkstemp(suffix=".pdf")
-            os.close(fd)
-            c = canvas.Canvas(path, pagesize=letter)
-            width, height = letter
-
-            # Header block: company info (centered for a professional presentation)
-            top = height - 0.9 * inch
-            c.setFont("Helvetica-Bold", 16)
-            if company:
-                c.drawCentredString(width / 2.0, top, company)
-                top -= 0.22 * inch
-            c.setFont("Helvetica", 10)
-            if address:
-                c.drawCentredString(width / 2.0, top, address)
-                top -= 0.18 * inch
-            if phone or email:
-                contact_line = " ".join(
-                    [x for x in [phone, (f"| {email}" if email else "")] if x]
-                )
-                c.drawCentredString(width / 2.0, top, contact_line)
-                top -= 0.18 * inch
-
-            # Title centered both horizontally and vertically
-            c.setFont("Helvetica-Bold", 28)
-            center_y = height / 2.0
-            c.drawCentredString(width / 2.0, center_y + 0.35 * inch, "COVER SHEET")
-
-            # Body: To / Memo centered beneath the title
-            c.setFont("Helvetica", 12)
-            attn = (self.cover_to_input.text() or "").strip()
-            memo = (self.cover_memo_input.text() or "").strip()
-            c.drawCentredString(
-                width / 2.0, center_y - 0.05 * inch, f"To / Attn: {attn}"
+            # Header/title/footer come from a template cached per settings; only To/Memo are stamped
+            data = designer_cover_pdf_bytes(
+                (self.cover_to_input.text() or "").strip(),
+                (self.cover_memo_input.text() or "").strip(),
+                company=company,
+                address=address,
+                phone=phone,
+                email=email,
+                footer=footer_text,
             )
-            c.drawCentredString(width / 2.0, center_y - 0.35 * inch, f"Memo: {memo}")
-
-            # Footer: default or custom if enabled
-            footer_text = "The remainder of this page is intentionally left blank."
-            try:
-                if custom_footer_enabled:
-                    candidate = (custom_footer_text or "").strip()
-                    if candidate:
-                        footer_text = candidate
-            except Exception:
-                pass
-            c.setFont("Helvetica-Oblique", 10)
-            c.drawCentredString(width / 2.0, 0.75 * inch, footer_text)
-
-            c.showPage()
-            c.save()
-            return path
+            return write_temp(data)
         except Exception:
             return None
 
@@ -1264,9 +1260,33 @@ class SendFaxPanel(QWidget):
 
 
     def _on_send_progress(self, current: int, total: int):
+        self._send_last_progress = (current, total)
+        self._update_send_text()
+
+    def _on_send_transfer(self, sent, total):
+        """Track uploaded bytes so the busy dialog can show size and throughput."""
+        try:
+            now = time.monotonic()
+            if getattr(self, "_send_transfer_start", None) is None:
+                self._send_transfer_start = now
+            mib = 1024 * 1024
+            txt = f"{sent / mib:.1f} of {total / mib:.1f} MB"
+            elapsed = now - self._send_transfer_start
+            if sent and elapsed > 0.5:
+                txt += f" ({sent / elapsed / 1024:.0f} KB/s)"
+            self._send_transfer_text = txt
+        except Exception:
+            self._send_transfer_text = ""
+        self._update_send_text()
+
+    def _update_send_text(self):
         try:
+            current, total = getattr(self, "_send_last_progress", (0, 0))
             if total and current:
                 txt = f"Sending session {current} of {total}..."
+                detail = getattr(self, "_send_transfer_text", "")
+                if detail:
+                    txt = f"{txt}\n{detail}"
             elif total:
                 txt = f"Preparing to send ({total} session(s))..."
             else:
@@ -3,7 +3,8 @@ ui/status_panel.py
 
 Contains status bar visual elements including:
 - TokenLifespanProgressBar: Tracks access token validity
-- FaxPollTimerProgressBar: Visual countdown until next poll trigger
+- FaxPollTimerProgressBar: Visual countdown until next poll trigger (adaptive interval,
+  see core.poll_cadence)
 These widgets integrate with polling logic but do not perform polling themselves.
 """
 
@@ -14,6 +15,7 @@ from PyQt5.QtWidgets import QProgressBar
 
 from core.app_state import app_state
 from core.config_loader import device_config, global_config
+from core.poll_cadence import fmt_interval, get_cadence
 from utils.logging_utils import get_logger
 
 
@@ -95,6 +97,11 @@ class FaxPollTimerProgressBar(QProgressBar):
     """
     Progress bar for visualizing polling interval countdown.
     Intended to be reset every successful poll cycle.
+
+    interval_secs is the configured (base) frequency; the countdown uses the
+    adaptive interval from core.poll_cadence, re-read every tick so a pass that
+    found faxes shortens the wait right away. The tooltip shows the current
+    interval, its bounds and when maintenance is next due.
     """
 
     def __init__(self, parent=None):
@@ -116,6 +123,7 @@ class FaxPollTimerProgressBar(QProgressBar):
             )
 
         self.elapsed = 0
+        self._tooltip_ticks = 0
 
         self.timer = QTimer(self)
         self.timer.timeout.connect(self._tick)
@@ -172,18 +180,36 @@ class FaxPollTimerProgressBar(QProgressBar):
                 self.log.warning(f"Bearer refresh hook failed: {e}")
 
         self.elapsed += 1
-        if self.elapsed >= self.interval_secs:
+        if self.elapsed >= self.effective_interval():
             self.retrieveFaxes()
             self.elapsed = 0
         self._update_display()
 
+    def effective_interval(self) -> int:
+        try:
+            return max(1, get_cadence().interval_for(self.interval_secs))
+        except Exception:
+            return max(1, int(self.interval_secs))
+
     def _update_display(self):
-        pct = int((self.elapsed / self.interval_secs) * 100)
-        remaining = max(self.interval_secs - self.elapsed, 0)
+        interval = self.effective_interval()
+        pct = int((self.elapsed / interval) * 100)
+        remaining = max(interval - self.elapsed, 0)
         mins = int(remaining // 60)
         secs = int(remaining % 60)
-        self.setFormat(f"Next poll in {mins:02d}:{secs:02d}")
+        text = f"Next poll in {mins:02d}:{secs:02d}"
+        if interval != self.interval_secs:
+            text += f" (every {fmt_interval(interval)})"
+        self.setFormat(text)
         self.setValue(min(pct, 100))
+        # Tooltip text changes slowly; refresh it every 10 ticks
+        self._tooltip_ticks -= 1
+        if self._tooltip_ticks <= 0:
+            self._tooltip_ticks = 10
+            try:
+                self.setToolTip(get_cadence().describe(self.interval_secs))
+            except Exception:
+                pass
 
     def retrieveFaxes(self):
         """Stub method to be connected by caller to polling logic."""
@@ -1,19 +1,83 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PyQt5.QtCore import QThread, pyqtSignal
 
+from core.address_book import AddressBookManager
+from core.history_cache import get_history_cache
+
+BASE_URL = "https://telco-api.skyswitch.com"
+
+# One pooled session shared by every fetch so refreshes reuse open TLS connections
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    global _session
+    with _session_lock:
+        if _session is None:
+            try:
+                s = requests.Session()
+                retry = Retry(
+                    total=2,
+                    connect=2,
+                    read=1,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["GET"],
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry)
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+                _session = s
+            except Exception:
+                return requests.Session()
+        return _session
+
+
+def _entry_id(entry: dict) -> str:
+    return str(entry.get("id") or entry.get("fax_id") or entry.get("uuid") or "")
+
 
 class RetrieveFaxesThread(QThread):
+    """
+    Fetch one page of inbound and outbound history concurrently.
+
+    The last response for each (direction, page) is kept on disk and revalidated with
+    If-None-Match/If-Modified-Since. finished() carries only entries that are new or
+    changed compared to that cached response; every fetched entry is still written to
+    the local history cache. fetched holds every entry the pages held (newest first),
+    for callers that cannot read the history cache; fetched_count is its length.
+    """
+
     finished = pyqtSignal(list)
 
-    def __init__(self, fax_user, bearer_token, inbound_page: int = 1, outbound_page: int = 1):
+    def __init__(self, fax_user, bearer_token, inbound_page: int = 1, outbound_page: int = 1,
+                 base_dir=None, contact_names=None):
         super().__init__()
         self.fax_user = fax_user
         self.bearer_token = bearer_token
         self.inbound_page = inbound_page
         self.outbound_page = outbound_page
+        # When base_dir is set, fetched pages are written to the local history cache.
+        # contact_names is a {sanitized phone: name} snapshot taken on the GUI thread.
+        self.base_dir = base_dir
+        self.contact_names = contact_names or {}
         # Exposed after run to support lazy-loading
         self.next_inbound_page = None
         self.next_outbound_page = None
+        self.fetched = []
+        self.fetched_count = 0
 
     def run(self):
         if not self.fax_user or not self.bearer_token:
@@ -21,65 +85,144 @@ class RetrieveFaxesThread(QThread):
             return
 
         try:
-            base_url = "https://telco-api.skyswitch.com"
-            inbound_url = f"{base_url}/users/{self.fax_user}/faxes/inbound"
-            outbound_url = f"{base_url}/users/{self.fax_user}/faxes/outbound"
-            # Append page parameters for lazy loading
-            if self.inbound_page and self.inbound_page > 1:
-                inbound_url += f"?page={self.inbound_page}"
-            if self.outbound_page and self.outbound_page > 1:
-                outbound_url += f"?page={self.outbound_page}"
-            headers = {"accept": "application/json", "Authorization": f"Bearer {self.bearer_token}"}
-            faxes = []
-
-            inbound_json = None
-            outbound_json = None
+            jobs = [(d, p) for d, p in (("inbound", self.inbound_page), ("outbound", self.outbound_page)) if p]
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                results = list(pool.map(lambda job: self._fetch_page(*job), jobs))
 
-            inbound_response = requests.get(inbound_url, headers=headers, timeout=10)
-            if inbound_response.status_code == 200:
-                try:
-                    inbound_json = inbound_response.json()
-                except Exception:
-                    inbound_json = {"error": "invalid_json", "text": inbound_response.text}
-                inbound_faxes = (inbound_json or {}).get("data", [])
-                for fax in inbound_faxes:
-                    fax["direction"] = "Inbound"
-                faxes.extend(inbound_faxes)
-                # Next page calc
-                try:
-                    meta = (inbound_json or {}).get("meta") or {}
-                    cur = int(meta.get("current_page") or self.inbound_page or 1)
-                    last = int(meta.get("last_page") or cur)
-                    self.next_inbound_page = (cur + 1) if cur < last else None
-                except Exception:
-                    self.next_inbound_page = None
+            faxes = []
+            fetched = []
+            for (direction, _page), (changed, all_entries, next_page) in zip(jobs, results):
+                if direction == "inbound":
+                    self.next_inbound_page = next_page
+                else:
+                    self.next_outbound_page = next_page
+                faxes.extend(changed)
+                fetched.extend(all_entries)
+            self.fetched_count = len(fetched)
 
-            outbound_response = requests.get(outbound_url, headers=headers, timeout=10)
-            if outbound_response.status_code == 200:
-                try:
-                    outbound_json = outbound_response.json()
-                except Exception:
-                    outbound_json = {"error": "invalid_json", "text": outbound_response.text}
-                outbound_faxes = (outbound_json or {}).get("data", [])
-                for fax in outbound_faxes:
-                    fax["direction"] = "Outbound"
-                faxes.extend(outbound_faxes)
-                # Next page calc
-                try:
-                    meta = (outbound_json or {}).get("meta") or {}
-                    cur = int(meta.get("current_page") or self.outbound_page or 1)
-                    last = int(meta.get("last_page") or cur)
-                    self.next_outbound_page = (cur + 1) if cur < last else None
-                except Exception:
-                    self.next_outbound_page = None
+            self._update_cache(fetched)
 
             # Sort newest-first by created_at
             try:
                 faxes.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+                fetched.sort(key=lambda x: x.get("created_at", ""), reverse=True)
             except Exception:
                 pass
+            self.fetched = fetched
 
             self.finished.emit(faxes)
         except Exception as e:
             print(f"Error retrieving faxes: {str(e)}")
             self.finished.emit([])
+
+    def _fetch_page(self, direction: str, page: int):
+        """Returns (new_or_changed_entries, all_entries, next_page) for one direction."""
+        url = f"{BASE_URL}/users/{self.fax_user}/faxes/{direction}"
+        # Append page parameters for lazy loading
+        if page and page > 1:
+            url += f"?page={page}"
+        headers = {"accept": "application/json", "Authorization": f"Bearer {self.bearer_token}"}
+        cached = self._load_page(direction, page)
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        try:
+            resp = _get_session().get(url, headers=headers, timeout=10)
+        except Exception as e:
+            print(f"Error retrieving {direction} faxes: {str(e)}")
+            return [], [], None
+
+        if resp.status_code == 304 and cached:
+            payload = cached.get("body") or {}
+            entries = self._label(payload.get("data", []), direction)
+            return [], entries, self._next_page(payload, page)
+        if resp.status_code != 200:
+            return [], [], None
+        try:
+            payload = resp.json() or {}
+        except Exception:
+            payload = {"error": "invalid_json", "text": resp.text}
+        entries = self._label(payload.get("data", []), direction)
+
+        # Servers without validators still return the same body; diff against the cached page
+        previous = {}
+        for e in self._label(((cached or {}).get("body") or {}).get("data", []), direction):
+            previous[_entry_id(e)] = e
+        changed = [e for e in entries if previous.get(_entry_id(e)) != e]
+        if not cached or changed or len(previous) != len(entries):
+            self._save_page(direction, page, resp, payload)
+        return changed, entries, self._next_page(payload, page)
+
+    @staticmethod
+    def _label(entries, direction: str) -> list:
+        entries = list(entries or [])
+        for fax in entries:
+            fax["direction"] = direction.capitalize()
+        return entries
+
+    @staticmethod
+    def _next_page(payload: dict, page: int):
+        try:
+            meta = (payload or {}).get("meta") or {}
+            cur = int(meta.get("current_page") or page or 1)
+            last = int(meta.get("last_page") or cur)
+            return (cur + 1) if cur < last else None
+        except Exception:
+            return None
+
+    # ---- On-disk page cache ----
+    def _page_path(self, direction: str, page: int):
+        if not self.base_dir:
+            return None
+        user = hashlib.md5(str(self.fax_user).encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self.base_dir, "cache", "history_pages", f"{user}_{direction}_{int(page or 1)}.json")
+
+    def _load_page(self, direction: str, page: int):
+        path = self._page_path(direction, page)
+        if not path:
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else None
+        except Exception:
+            return None
+
+    def _save_page(self, direction: str, page: int, resp, payload: dict):
+        path = self._page_path(direction, page)
+        if not path:
+            return
+        tmp = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            record = {
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+                "fetched_at": int(time.time()),
+                "body": payload,
+            }
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp", prefix=".page_")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(record, f)
+            os.replace(tmp, path)
+        except Exception:
+            if tmp:
+                try:
+                    os.unlink(tmp)
+                except Exception:
+                    pass
+
+    # ---- Local history cache ----
+    def _contact_name(self, number: str) -> str:
+        return self.contact_names.get(AddressBookManager._sanitize_phone(number or ""), "")
+
+    def _update_cache(self, faxes):
+        if not self.base_dir or not faxes:
+            return
+        try:
+            get_history_cache(self.base_dir).upsert_entries(faxes, contact_lookup=self._contact_name)
+        except Exception:
+            pass
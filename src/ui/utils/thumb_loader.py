@@ -1,8 +1,204 @@
+import hashlib
+import json
 import os
-from typing import Optional
-from PyQt5.QtCore import QUrl, Qt
-from PyQt5.QtGui import QPixmap, QImage
-from PyQt5.QtWidgets import QLabel
+import threading
+import time
+from typing import Callable, Optional
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QUrl, Qt, pyqtSignal
+from PyQt5.QtGui import QPixmap, QPixmapCache, QImage
+
+# Local PDF thumbnails rendered on disk are capped at this many bytes (LRU by mtime)
+LOCAL_THUMB_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Default cap for downloaded thumbnails; override with Fax Options/thumbnail_cache_mb
+REMOTE_THUMB_CACHE_DEFAULT_MB = 128
+# Concurrent thumbnail requests to SkySwitch
+MAX_REMOTE_FETCHES = 4
+# Cached remote thumbnails older than this are revalidated with If-None-Match/If-Modified-Since
+REMOTE_REVALIDATE_SECONDS = 6 * 3600
+# Ensure the in-memory pixmap cache can hold a few screens of thumbnails (KB)
+PIXMAP_CACHE_MIN_KB = 32 * 1024
+
+
+class _DiskCacheLRU:
+    """Byte-capped LRU over a flat directory of .png files; file mtime is the recency stamp."""
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total: Optional[int] = None
+
+    @staticmethod
+    def touch(path: str) -> None:
+        try:
+            os.utime(path, None)
+        except Exception:
+            pass
+
+    def added(self, nbytes: int) -> bool:
+        """Account for a new file. Returns True when a sweep is due."""
+        with self._lock:
+            if self._total is None:
+                return True
+            self._total += nbytes
+            return self._total > self.max_bytes
+
+    def sweep(self) -> None:
+        """Recount the directory and evict down to 90% of the cap if over it."""
+        with self._lock:
+            entries = []
+            total = 0
+            try:
+                with os.scandir(self.cache_dir) as it:
+                    for e in it:
+                        if not e.name.endswith(".png"):
+                            continue
+                        try:
+                            st = e.stat()
+                        except Exception:
+                            continue
+                        entries.append((st.st_mtime, st.st_size, e.path))
+                        total += st.st_size
+            except Exception:
+                return
+            if total > self.max_bytes:
+                # Evict below the cap so we don't sweep on every insert
+                target = int(self.max_bytes * 0.9)
+                entries.sort()
+                for _mtime, size, path in entries:
+                    if total <= target:
+                        break
+                    try:
+                        os.remove(path)
+                        total -= size
+                    except Exception:
+                        continue
+                    try:
+                        os.remove(os.path.splitext(path)[0] + ".json")
+                    except Exception:
+                        pass
+            self._total = total
+
+
+_disk_caches: dict[str, _DiskCacheLRU] = {}
+_disk_caches_lock = threading.Lock()
+
+
+def _disk_cache_for(cache_dir: str, max_bytes: int) -> _DiskCacheLRU:
+    with _disk_caches_lock:
+        lru = _disk_caches.get(cache_dir)
+        if lru is None:
+            lru = _DiskCacheLRU(cache_dir, max_bytes)
+            _disk_caches[cache_dir] = lru
+        lru.max_bytes = max_bytes
+        return lru
+
+
+class _SweepTask(QRunnable):
+    def __init__(self, lru: _DiskCacheLRU):
+        super().__init__()
+        self.lru = lru
+
+    def run(self):
+        try:
+            self.lru.sweep()
+        except Exception:
+            pass
+
+
+def _thumb_target_size(target_max_w: int) -> tuple[int, int]:
+    max_w = max(260, min(480, int(target_max_w)))
+    return max_w, int(max_w * 1.3)
+
+
+def render_pdf_image(pdf_path: str, target_max_w: int, base_dir: str, exe_dir: Optional[str] = None) -> Optional[QImage]:
+    """
+    Render page 1 of a PDF to a scaled QImage. Safe to call off the GUI thread
+    (QImage only, no QPixmap).
+    """
+    max_w, max_h = _thumb_target_size(target_max_w)
+    try:
+        # First, try rendering with PyMuPDF (fitz) to avoid spawning Poppler subprocesses (no console windows)
+        try:
+            import fitz  # PyMuPDF
+            from utils.pdf_utils import FITZ_LOCK
+            with FITZ_LOCK, fitz.open(pdf_path) as doc:
+                if doc.page_count <= 0:
+                    return None
+                page = doc.load_page(0)
+                # Render at approximately 120 DPI
+                pix = page.get_pixmap(dpi=120, alpha=False)
+                # Wrap the raw RGB samples directly; copy() detaches from the fitz buffer
+                qimg = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888).copy()
+            return qimg.scaled(max_w, max_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        except Exception:
+            # Fallback to pdf2image + Poppler if PyMuPDF is unavailable
+            from pdf2image import convert_from_path
+            # Prefer MEIPASS/base_dir (onefile extraction) for Poppler, then fallback to exe_dir
+            candidates = [
+                os.path.join(base_dir, "poppler", "bin"),
+                os.path.join(exe_dir or base_dir, "poppler", "bin"),
+            ]
+            poppler_bin = next((p for p in candidates if os.path.isdir(p)), None)
+            kwargs = {"dpi": 120, "first_page": 1, "last_page": 1}
+            if poppler_bin:
+                kwargs["poppler_path"] = poppler_bin
+            pages = convert_from_path(pdf_path, **kwargs)
+            if not pages:
+                return None
+            img = pages[0].convert("RGB")
+            data = img.tobytes("raw", "RGB")
+            qimg = QImage(data, img.width, img.height, img.width * 3, QImage.Format_RGB888).copy()
+            return qimg.scaled(max_w, max_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    except Exception:
+        return None
+
+
+class _ThumbSignals(QObject):
+    done = pyqtSignal(str, QImage)
+
+
+class _LocalThumbTask(QRunnable):
+    """Load a local PDF thumbnail from the disk cache, or render and cache it."""
+
+    def __init__(self, key: str, pdf_path: str, target_max_w: int, cache_path: str, lru: _DiskCacheLRU,
+                 base_dir: str, exe_dir: Optional[str], signals: _ThumbSignals):
+        super().__init__()
+        self.key = key
+        self.pdf_path = pdf_path
+        self.target_max_w = target_max_w
+        self.cache_path = cache_path
+        self.lru = lru
+        self.base_dir = base_dir
+        self.exe_dir = exe_dir
+        self.signals = signals
+
+    def run(self):
+        img = QImage()
+        try:
+            if os.path.exists(self.cache_path):
+                if img.load(self.cache_path):
+                    self.lru.touch(self.cache_path)
+                else:
+                    img = QImage()
+            if img.isNull():
+                rendered = render_pdf_image(self.pdf_path, self.target_max_w, self.base_dir, self.exe_dir)
+                if rendered is not None and not rendered.isNull():
+                    img = rendered
+                    try:
+                        tmp_path = self.cache_path + ".part"
+                        if img.save(tmp_path, "PNG"):
+                            os.replace(tmp_path, self.cache_path)
+                            if self.lru.added(os.path.getsize(self.cache_path)):
+                                self.lru.sweep()
+                    except Exception:
+                        pass
+        except Exception:
+            img = QImage()
+        try:
+            self.signals.done.emit(self.key, img)
+        except Exception:
+            pass
 
 
 class ThumbnailHelper:
@@ -17,6 +213,39 @@ class ThumbnailHelper:
         self.parent = parent_widget
         self._active_replies = set()
         self._net_mgr = None
+        # Local PDF thumbnails render on a private pool. PyMuPDF calls are serialized
+        # app-wide by utils.pdf_utils.FITZ_LOCK, so one worker is all this pool needs.
+        self._pool = QThreadPool(parent_widget)
+        self._pool.setMaxThreadCount(1)
+        self._local_signals = _ThumbSignals()
+        self._local_signals.done.connect(self._on_local_done)
+        self._local_inflight: set[str] = set()
+        self._local_waiters: dict[str, list] = {}
+        try:
+            if QPixmapCache.cacheLimit() < PIXMAP_CACHE_MIN_KB:
+                QPixmapCache.setCacheLimit(PIXMAP_CACHE_MIN_KB)
+        except Exception:
+            pass
+        # Remote fetch scheduler state (GUI thread only): url -> queued or in-flight job
+        self._remote_jobs: dict[str, dict] = {}
+        self._remote_seq = 0
+        self._remote_active = 0
+        self._remote_checked: dict[str, float] = {}
+        try:
+            from core.config_loader import device_config
+            cache_mb = int(
+                device_config.get("Fax Options", "thumbnail_cache_mb", REMOTE_THUMB_CACHE_DEFAULT_MB)
+                or REMOTE_THUMB_CACHE_DEFAULT_MB
+            )
+        except Exception:
+            cache_mb = REMOTE_THUMB_CACHE_DEFAULT_MB
+        self._remote_lru = _disk_cache_for(self._thumb_cache_dir(), max(1, cache_mb) * 1024 * 1024)
+        # Startup sweep of both disk caches, off the GUI thread
+        try:
+            self._pool.start(_SweepTask(self._remote_lru))
+            self._pool.start(_SweepTask(_disk_cache_for(self._local_cache_dir(), LOCAL_THUMB_CACHE_MAX_BYTES)))
+        except Exception:
+            pass
 
     # ---- Cache helpers ----
     def _thumb_cache_dir(self) -> str:
@@ -36,8 +265,21 @@ class ThumbnailHelper:
             safe = (url or "").replace(":", "_").replace("/", "_").replace("?", "_")
             return os.path.join(self._thumb_cache_dir(), f"{safe}.png")
 
+    def _local_cache_dir(self) -> str:
+        try:
+            cache_dir = os.path.join(self._thumb_cache_dir(), "local")
+            os.makedirs(cache_dir, exist_ok=True)
+            return cache_dir
+        except Exception:
+            return self._thumb_cache_dir()
+
     # ---- Public API ----
     def abort_active(self):
+        # Pending local renders still finish and populate the caches, but no longer call back
+        self._local_waiters.clear()
+        for job in list(self._remote_jobs.values()):
+            job["cancelled"] = True
+        self._remote_jobs.clear()
         try:
             for r in list(self._active_replies):
                 try:
@@ -69,51 +311,59 @@ class ThumbnailHelper:
             return None
 
     def render_pdf_thumbnail(self, pdf_path: str, target_max_w: int) -> Optional[QPixmap]:
+        """Synchronous render; prefer request_pdf_thumbnail from GUI code."""
+        img = render_pdf_image(pdf_path, target_max_w, self.base_dir, self.exe_dir)
+        if img is None or img.isNull():
+            return None
+        return QPixmap.fromImage(img)
+
+    def request_pdf_thumbnail(self, pdf_path: str, target_max_w: int,
+                              on_ready: Callable[[Optional[QPixmap]], None]):
+        """
+        Deliver a thumbnail for a local PDF to on_ready(pixmap_or_None) on the GUI thread.
+        Memory-cached thumbnails are delivered synchronously; otherwise the disk cache lookup
+        or render runs on the thumbnail pool and callers show a placeholder meanwhile.
+        """
         try:
-            # First, try rendering with PyMuPDF (fitz) to avoid spawning Poppler subprocesses (no console windows)
+            st = os.stat(pdf_path)
+        except Exception:
+            on_ready(None)
+            return
+        max_w, _max_h = _thumb_target_size(target_max_w)
+        ident = f"{os.path.abspath(pdf_path)}|{st.st_size}|{st.st_mtime_ns}|{max_w}"
+        key = "fr_thumb_" + hashlib.md5(ident.encode("utf-8")).hexdigest()
+        pm = QPixmapCache.find(key)
+        if pm is not None and not pm.isNull():
+            on_ready(pm)
+            return
+        self._local_waiters.setdefault(key, []).append(on_ready)
+        if key in self._local_inflight:
+            return
+        self._local_inflight.add(key)
+        cache_dir = self._local_cache_dir()
+        task = _LocalThumbTask(
+            key, pdf_path, max_w, os.path.join(cache_dir, f"{key}.png"),
+            _disk_cache_for(cache_dir, LOCAL_THUMB_CACHE_MAX_BYTES),
+            self.base_dir, self.exe_dir, self._local_signals,
+        )
+        self._pool.start(task)
+
+    def _on_local_done(self, key: str, img: QImage):
+        self._local_inflight.discard(key)
+        pm = None
+        if img is not None and not img.isNull():
+            pm = QPixmap.fromImage(img)
             try:
-                import fitz  # PyMuPDF
-                doc = fitz.open(pdf_path)
-                if doc.page_count <= 0:
-                    return None
-                page = doc.load_page(0)
-                # Render at approximately 120 DPI
-                pix = page.get_pixmap(dpi=120, alpha=False)
-                img_bytes = pix.tobytes("png")
-                from io import BytesIO
-                qimg = QImage.fromData(img_bytes)
-                pm = QPixmap.fromImage(qimg)
-                max_w = max(260, min(480, int(target_max_w)))
-                max_h = int(max_w * 1.3)
-                return pm.scaled(max_w, max_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                QPixmapCache.insert(key, pm)
             except Exception:
-                # Fallback to pdf2image + Poppler if PyMuPDF is unavailable
-                from pdf2image import convert_from_path
-                # Prefer MEIPASS/base_dir (onefile extraction) for Poppler, then fallback to exe_dir
-                candidates = [
-                    os.path.join(self.base_dir, "poppler", "bin"),
-                    os.path.join(self.exe_dir or self.base_dir, "poppler", "bin"),
-                ]
-                poppler_bin = next((p for p in candidates if os.path.isdir(p)), None)
-                kwargs = {"dpi": 120}
-                if poppler_bin:
-                    kwargs["poppler_path"] = poppler_bin
-                pages = convert_from_path(pdf_path, **kwargs)
-                if not pages:
-                    return None
-                img = pages[0]
-                from io import BytesIO
-                buf = BytesIO()
-                img.save(buf, format='PNG')
-                qimg = QImage.fromData(buf.getvalue())
-                pm = QPixmap.fromImage(qimg)
-                max_w = max(260, min(480, int(target_max_w)))
-                max_h = int(max_w * 1.3)
-                return pm.scaled(max_w, max_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        except Exception:
-            return None
+                pass
+        for cb in self._local_waiters.pop(key, []):
+            try:
+                cb(pm)
+            except Exception:
+                pass
 
-    def _load_cached_thumbnail(self, label: QLabel, cache_path: str) -> bool:
+    def _load_cached_pixmap(self, cache_path: str) -> Optional[QPixmap]:
         try:
             if os.path.exists(cache_path):
                 data_bytes = None
@@ -123,105 +373,221 @@ class ThumbnailHelper:
                 except Exception:
                     data_bytes = None
                 if not data_bytes or len(data_bytes) < 64:
-                    return False
+                    return None
                 pm = QPixmap()
                 if not pm.loadFromData(data_bytes):
-                    return False
-                try:
-                    target_w = label.width() or 0
-                    if not isinstance(target_w, int) or target_w <= 0:
-                        target_w = 320
-                    target_h = int(target_w * 1.3)
-                    label.setPixmap(pm.scaled(target_w, target_h, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-                except Exception:
-                    return False
-                return True
+                    return None
+                return pm
         except Exception:
-            return False
-        return False
+            return None
+        return None
 
-    def fetch_remote_thumbnail(self, label: QLabel, url: str):
+    @staticmethod
+    def _read_meta(meta_path: str) -> dict:
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    @staticmethod
+    def _write_meta(meta_path: str, meta: dict) -> None:
+        try:
+            tmp_path = meta_path + ".part"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(tmp_path, meta_path)
+        except Exception:
+            pass
+
+    def fetch_remote_pixmap(self, url: str, on_ready: Callable[[Optional[QPixmap]], None],
+                            priority: int = 0, on_cancel: Optional[Callable[[], None]] = None):
+        """
+        Deliver the thumbnail at url to on_ready(pixmap_or_None) on the GUI thread.
+        Cached thumbnails are delivered synchronously (and revalidated in the background
+        once stale); otherwise the fetch is queued by priority (lower first) behind at most
+        MAX_REMOTE_FETCHES concurrent requests. on_cancel is called instead of on_ready if
+        the request is dropped by retain_remote().
+        """
         cache_path = self._thumb_cache_path(url)
-        if self._load_cached_thumbnail(label, cache_path):
+        mem_key = "fr_remote_" + os.path.splitext(os.path.basename(cache_path))[0]
+        pm = QPixmapCache.find(mem_key)
+        if pm is None or pm.isNull():
+            pm = self._load_cached_pixmap(cache_path)
+            if pm is not None:
+                self._remote_lru.touch(cache_path)
+                try:
+                    QPixmapCache.insert(mem_key, pm)
+                except Exception:
+                    pass
+        if pm is not None:
+            on_ready(pm)
+            checked = self._remote_checked.get(url)
+            if checked is None:
+                checked = float(self._read_meta(self._meta_path(cache_path)).get("checked_at") or 0)
+                self._remote_checked[url] = checked
+            if time.time() - checked < REMOTE_REVALIDATE_SECONDS:
+                return
+            # Stale: keep showing the cached image and revalidate behind visible fetches
+            self._enqueue_remote(url, cache_path, mem_key, on_ready, None, priority + 1_000_000, True)
             return
+        self._enqueue_remote(url, cache_path, mem_key, on_ready, on_cancel, priority, False)
+
+    @staticmethod
+    def _meta_path(cache_path: str) -> str:
+        return os.path.splitext(cache_path)[0] + ".json"
+
+    def retain_remote(self, urls) -> None:
+        """Cancel queued and in-flight fetches whose URL is not in urls (rows scrolled away)."""
+        keep = set(urls or ())
+        for url, job in list(self._remote_jobs.items()):
+            if url in keep:
+                continue
+            job["cancelled"] = True
+            self._remote_jobs.pop(url, None)
+            for _on_ready, on_cancel in job["callbacks"]:
+                if on_cancel is not None:
+                    try:
+                        on_cancel()
+                    except Exception:
+                        pass
+            reply = job.get("reply")
+            if reply is not None:
+                try:
+                    reply.abort()
+                except Exception:
+                    pass
+
+    def _enqueue_remote(self, url, cache_path, mem_key, on_ready, on_cancel, priority, revalidate):
+        job = self._remote_jobs.get(url)
+        if job is None:
+            self._remote_seq += 1
+            job = {
+                "url": url,
+                "cache_path": cache_path,
+                "mem_key": mem_key,
+                "callbacks": [],
+                "priority": priority,
+                "seq": self._remote_seq,
+                "revalidate": revalidate,
+                "reply": None,
+                "cancelled": False,
+            }
+            self._remote_jobs[url] = job
+        else:
+            job["priority"] = min(job["priority"], priority)
+            job["revalidate"] = job["revalidate"] and revalidate
+        job["callbacks"].append((on_ready, on_cancel))
+        self._pump_remote()
+
+    def _pump_remote(self):
+        while self._remote_active < MAX_REMOTE_FETCHES:
+            queued = [j for j in self._remote_jobs.values() if j["reply"] is None]
+            if not queued:
+                return
+            job = min(queued, key=lambda j: (j["priority"], j["seq"]))
+            if not self._start_remote(job):
+                self._remote_jobs.pop(job["url"], None)
+                for on_ready, _on_cancel in job["callbacks"]:
+                    if not job["revalidate"]:
+                        try:
+                            on_ready(None)
+                        except Exception:
+                            pass
+
+    def _start_remote(self, job: dict) -> bool:
         try:
             from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest
-            import weakref
-            try:
-                import sip
-            except Exception:
-                sip = None
             if self._net_mgr is None:
                 self._net_mgr = QNetworkAccessManager(self.parent)
-            req = QNetworkRequest(QUrl(url))
+            req = QNetworkRequest(QUrl(job["url"]))
             token = self.app_state.global_cfg.bearer_token or ""
             if token:
                 req.setRawHeader(b"Authorization", f"Bearer {token}".encode("utf-8"))
+            if job["revalidate"]:
+                meta = self._read_meta(self._meta_path(job["cache_path"]))
+                if meta.get("etag"):
+                    req.setRawHeader(b"If-None-Match", str(meta["etag"]).encode("utf-8"))
+                if meta.get("last_modified"):
+                    req.setRawHeader(b"If-Modified-Since", str(meta["last_modified"]).encode("utf-8"))
             reply = self._net_mgr.get(req)
+            job["reply"] = reply
+            self._remote_active += 1
             try:
                 self._active_replies.add(reply)
             except Exception:
                 pass
-            label_ref = weakref.ref(label)
+            reply.finished.connect(lambda j=job, r=reply: self._on_remote_finished(j, r))
+            return True
+        except Exception:
+            return False
 
-            def _on_finished():
-                try:
-                    lbl = label_ref()
-                    if lbl is None:
-                        return
-                    if sip is not None:
-                        try:
-                            if sip.isdeleted(lbl):
-                                return
-                        except Exception:
-                            pass
-                    if reply.error() == 0:
-                        qb = reply.readAll()
-                        data_bytes = bytes(qb)
-                        # Cache atomically
-                        try:
-                            tmp_path = cache_path + ".part"
-                            with open(tmp_path, 'wb') as f:
-                                f.write(data_bytes)
-                            try:
-                                os.replace(tmp_path, cache_path)
-                            except Exception:
-                                pass
-                        except Exception:
-                            pass
-                        pm = QPixmap()
-                        if not pm.loadFromData(data_bytes):
-                            try:
-                                lbl.setVisible(False)
-                            except Exception:
-                                pass
-                            return
-                        try:
-                            target_w = lbl.width() or 320
-                            target_h = int(target_w * 1.3)
-                            lbl.setPixmap(pm.scaled(target_w, target_h, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-                        except Exception:
-                            try:
-                                lbl.setVisible(False)
-                            except Exception:
-                                pass
-                            return
-                    else:
-                        try:
-                            lbl.setVisible(False)
-                        except Exception:
-                            return
-                finally:
+    def _on_remote_finished(self, job: dict, reply):
+        self._remote_active = max(0, self._remote_active - 1)
+        try:
+            self._active_replies.discard(reply)
+        except Exception:
+            pass
+        if self._remote_jobs.get(job["url"]) is job:
+            self._remote_jobs.pop(job["url"], None)
+        result = None
+        deliver = not job["cancelled"]
+        try:
+            from PyQt5.QtNetwork import QNetworkRequest
+            status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+            cache_path = job["cache_path"]
+            meta_path = self._meta_path(cache_path)
+            now = time.time()
+            if job["cancelled"]:
+                pass
+            elif reply.error() == 0 and status == 304:
+                meta = self._read_meta(meta_path)
+                meta["checked_at"] = now
+                self._write_meta(meta_path, meta)
+                self._remote_checked[job["url"]] = now
+                self._remote_lru.touch(cache_path)
+                # Cached image is still current and already on screen
+                deliver = False
+            elif reply.error() == 0:
+                data_bytes = bytes(reply.readAll())
+                pm = QPixmap()
+                if pm.loadFromData(data_bytes):
+                    result = pm
                     try:
-                        self._active_replies.discard(reply)
+                        QPixmapCache.insert(job["mem_key"], pm)
                     except Exception:
                         pass
-                    reply.deleteLater()
-
-            reply.finished.connect(_on_finished)
-        except Exception:
-            try:
-                label.setVisible(False)
-            except Exception:
-                pass
-
+                    # Cache atomically, with validators for later revalidation
+                    try:
+                        tmp_path = cache_path + ".part"
+                        with open(tmp_path, 'wb') as f:
+                            f.write(data_bytes)
+                        os.replace(tmp_path, cache_path)
+                        meta = {"checked_at": now}
+                        etag = bytes(reply.rawHeader(b"ETag")).decode("latin-1").strip()
+                        last_mod = bytes(reply.rawHeader(b"Last-Modified")).decode("latin-1").strip()
+                        if etag:
+                            meta["etag"] = etag
+                        if last_mod:
+                            meta["last_modified"] = last_mod
+                        self._write_meta(meta_path, meta)
+                        self._remote_checked[job["url"]] = now
+                        if self._remote_lru.added(len(data_bytes)):
+                            self._pool.start(_SweepTask(self._remote_lru))
+                    except Exception:
+                        pass
+                elif job["revalidate"]:
+                    deliver = False
+            elif job["revalidate"]:
+                # Keep showing the cached copy if revalidation fails
+                deliver = False
+        finally:
+            reply.deleteLater()
+        if deliver:
+            for on_ready, _on_cancel in job["callbacks"]:
+                try:
+                    on_ready(result)
+                except Exception:
+                    pass
+        self._pump_remote()
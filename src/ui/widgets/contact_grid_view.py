@@ -0,0 +1,379 @@
+"""
+Model/view implementation of the address book card grid.
+
+Each model row is one line of the grid: up to two contact cards, a company
+header or a spacer. ContactCardDelegate paints the cards and hit-tests the
+favorite/edit/select/delete buttons, so no per-contact widgets exist and only
+visible rows are ever painted. ContactGridModel.set_rows() diffs against the
+current rows and emits dataChanged for rows that changed instead of resetting
+when the grid shape is the same (e.g. after editing a single contact).
+"""
+from typing import Callable, Optional
+
+from PyQt5.QtCore import QAbstractListModel, QEvent, QModelIndex, QPoint, QRect, QSize, Qt
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QPainter, QPainterPath, QPen
+from PyQt5.QtWidgets import QStyledItemDelegate, QToolTip
+
+from ui.theme import get_theme
+
+RowRole = Qt.UserRole + 1
+
+COLUMNS = 2
+
+
+def card_key(contact: dict) -> tuple:
+    """Everything a card displays; cards are reused while this is unchanged."""
+    return tuple(
+        str(contact.get(k) or "")
+        for k in ("name", "company", "notes", "phone", "phone1", "email")
+    ) + (bool(contact.get("favorite", False)), bool(contact.get("is_placeholder", False)))
+
+
+class ContactCard:
+    """Display-ready text for one contact card, computed once per contact version."""
+
+    __slots__ = (
+        "is_placeholder", "favorite", "initials", "name", "company", "hint",
+        "lines", "warning",
+    )
+
+    def __init__(self, contact: dict, format_phone: Callable[[str], str]):
+        self.is_placeholder = bool(contact.get("is_placeholder", False))
+        self.favorite = bool(contact.get("favorite", False))
+        words = (contact.get("company") or contact.get("name") or " ").split()[:2]
+        self.initials = "".join(w[0].upper() for w in words).strip() or "?"
+        self.name = contact.get("name") or contact.get("company") or ("New Contact" if self.is_placeholder else "")
+        self.company = contact.get("company", "") or ""
+        self.hint = (contact.get("notes") or "") if (self.is_placeholder and not self.company) else ""
+        self.lines = []
+        if contact.get("phone"):
+            self.lines.append(("Fax:", format_phone(contact.get("phone", ""))))
+        if contact.get("phone1"):
+            self.lines.append(("Phone:", format_phone(contact.get("phone1", ""))))
+        if contact.get("email"):
+            self.lines.append(("Email:", contact.get("email", "")))
+        # Smart hints (non-blocking)
+        notes = []
+        if not self.is_placeholder:
+            if not (contact.get("phone") or "").strip():
+                notes.append("Missing Fax number for one‑click send")
+            if contact.get("email") and "@" not in contact.get("email"):
+                notes.append("Email looks invalid")
+        self.warning = (" ⚠️  " + " • ".join(notes)) if notes else ""
+
+
+def card_for(cache: dict, contact: dict, format_phone: Callable[[str], str]) -> ContactCard:
+    """Cached ContactCard for a contact; rebuilt only when its displayed fields change."""
+    key = card_key(contact)
+    card: Optional[ContactCard] = cache.get(key)
+    if card is None:
+        card = ContactCard(contact, format_phone)
+        cache[key] = card
+    return card
+
+
+class GridRow:
+    """One grid line: kind is "cards", "header", "spacer" or "message"."""
+
+    __slots__ = ("kind", "cards", "text", "height")
+
+    def __init__(self, kind: str, cards=None, text: str = "", height: int = 0):
+        self.kind = kind
+        self.cards = cards or []  # [(contact index, contact dict, ContactCard)]
+        self.text = text
+        self.height = height
+
+    def signature(self) -> tuple:
+        return (
+            self.kind, self.text, self.height,
+            tuple((i, id(card)) for i, _c, card in self.cards),
+        )
+
+
+def card_rows(items: list) -> list:
+    """Pack [(index, contact, card)] into rows of COLUMNS cards."""
+    return [GridRow("cards", items[i:i + COLUMNS]) for i in range(0, len(items), COLUMNS)]
+
+
+class ContactGridModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[GridRow] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+        row = self._rows[index.row()]
+        if role == RowRole:
+            return row
+        if role == Qt.DisplayRole:
+            return row.text or " ".join(card.name for _i, _c, card in row.cards)
+        return None
+
+    def set_rows(self, rows: list) -> list:
+        """Replace the rows. Returns the row numbers patched in place ([] after a reset)."""
+        if len(rows) != len(self._rows):
+            self.beginResetModel()
+            self._rows = list(rows)
+            self.endResetModel()
+            return []
+        changed = [
+            n for n, (old, new) in enumerate(zip(self._rows, rows))
+            if old.signature() != new.signature()
+        ]
+        self._rows = list(rows)
+        for n in changed:
+            idx = self.index(n, 0)
+            self.dataChanged.emit(idx, idx, [RowRole])
+        return changed
+
+
+class ContactCardDelegate(QStyledItemDelegate):
+    """Paints contact cards and maps clicks on painted buttons back to dialog actions."""
+
+    PAD = 10
+    GAP = 12
+    AVATAR = 36
+    STAR = 32
+    ICON_W = 36
+    ICON_H = 28
+    ICON_SIZE = 18
+
+    def __init__(self, dialog, view):
+        super().__init__(view)
+        self.dialog = dialog
+        self.view = view
+        self._hover = None  # (row, column, control name)
+
+    # ---- Geometry ----
+    def _line_h(self, font: QFont) -> int:
+        return QFontMetrics(font).height() + 2
+
+    def _card_height(self, card: ContactCard, font: QFont) -> int:
+        line = self._line_h(font)
+        title_lines = 2 if (card.company or card.hint) else 1
+        header = self.PAD * 2 + max(self.AVATAR, title_lines * line)
+        body_lines = len(card.lines) + (1 if card.warning else 0)
+        body = 4 + body_lines * line + 6
+        footer = 6 + self.STAR + 10
+        return header + body + footer
+
+    def sizeHint(self, option, index):
+        row = index.data(RowRole)
+        width = max(300, self.view.viewport().width())
+        if row is None:
+            return QSize(width, 0)
+        font = QFont(option.font)
+        if row.kind == "cards":
+            h = max(self._card_height(card, font) for _i, _c, card in row.cards)
+            return QSize(width, h + self.GAP)
+        if row.kind == "spacer":
+            return QSize(width, row.height)
+        return QSize(width, self._line_h(font) + 12)
+
+    def _card_rects(self, rect: QRect, row: GridRow) -> list:
+        rect = rect.adjusted(4, 0, -4, 0)
+        col_w = (rect.width() - self.GAP * (COLUMNS - 1)) // COLUMNS
+        h = rect.height() - self.GAP
+        return [
+            QRect(rect.left() + n * (col_w + self.GAP), rect.top(), col_w, h)
+            for n in range(len(row.cards))
+        ]
+
+    def _buttons(self, card_rect: QRect, card: ContactCard) -> list:
+        """[(name, rect, enabled, tooltip)] for one card's footer."""
+        enabled = not card.is_placeholder
+        y = card_rect.bottom() - 10 - self.STAR + 1
+        buttons = [(
+            "fav", QRect(card_rect.left() + self.PAD, y, self.STAR, self.STAR), enabled,
+            "Unmark Favorite" if card.favorite else "Mark as Favorite",
+        )]
+        icon_y = y + (self.STAR - self.ICON_H) // 2
+        x = card_rect.right() - self.PAD + 1
+        right = [("select", "Send a fax to this contact"), ("edit", "Edit this contact")]
+        if enabled:
+            right.insert(0, ("delete", "Delete this contact"))
+        for name, tip in right:
+            x -= self.ICON_W
+            buttons.append((name, QRect(x, icon_y, self.ICON_W, self.ICON_H), enabled, tip))
+            x -= 6
+        return buttons
+
+    # ---- Painting ----
+    def paint(self, painter: QPainter, option, index):
+        row = index.data(RowRole)
+        if row is None:
+            return
+        t = get_theme()
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        font = QFont(option.font)
+        rect = option.rect
+        if row.kind == "header":
+            bold = QFont(font)
+            bold.setBold(True)
+            painter.setFont(bold)
+            painter.setPen(QColor(t['text_primary']))
+            painter.drawText(rect.adjusted(4, 0, -4, 0), Qt.AlignVCenter | Qt.AlignLeft, row.text)
+        elif row.kind == "message":
+            painter.setFont(font)
+            painter.setPen(QColor(t['text_muted']))
+            painter.drawText(rect.adjusted(4, 0, -4, 0), Qt.AlignVCenter | Qt.AlignLeft, row.text)
+        elif row.kind == "cards":
+            for col, ((_i, _contact, card), card_rect) in enumerate(zip(row.cards, self._card_rects(rect, row))):
+                card_rect.setHeight(self._card_height(card, font))
+                self._paint_card(painter, card_rect, card, font, t, (index.row(), col))
+        painter.restore()
+
+    def _paint_card(self, painter, rect: QRect, card: ContactCard, font: QFont, t: dict, pos):
+        line = self._line_h(font)
+        fm = QFontMetrics(font)
+        bold = QFont(font)
+        bold.setBold(True)
+        path = QPainterPath()
+        path.addRoundedRect(rect.x() + 0.5, rect.y() + 0.5, rect.width() - 1, rect.height() - 1, 8, 8)
+
+        # Card with header band
+        title_lines = 2 if (card.company or card.hint) else 1
+        header_h = self.PAD * 2 + max(self.AVATAR, title_lines * line)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(t['surface']))
+        painter.drawPath(path)
+        painter.save()
+        painter.setClipPath(path)
+        painter.fillRect(QRect(rect.left(), rect.top(), rect.width(), header_h), QColor(t['background']))
+        painter.restore()
+        painter.setPen(QPen(QColor(t['border']), 1))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawPath(path)
+
+        # Avatar/initials
+        avatar = QRect(rect.left() + self.PAD, rect.top() + self.PAD, self.AVATAR, self.AVATAR)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(t['primary']))
+        painter.drawEllipse(avatar)
+        painter.setFont(bold)
+        painter.setPen(QColor(t['text_on_primary']))
+        painter.drawText(avatar, Qt.AlignCenter, card.initials)
+
+        # Name and company (or placeholder hint)
+        tx = avatar.right() + 1 + 10
+        tw = max(10, rect.right() - self.PAD - tx)
+        ty = rect.top() + self.PAD
+        if title_lines == 1:
+            ty += (self.AVATAR - line) // 2
+        painter.setPen(QColor(t['text_primary']))
+        painter.drawText(QRect(tx, ty, tw, line), Qt.AlignVCenter | Qt.AlignLeft,
+                         QFontMetrics(bold).elidedText(card.name, Qt.ElideRight, tw))
+        if card.company or card.hint:
+            sub = QFont(font)
+            sub.setItalic(not card.company)
+            painter.setFont(sub)
+            painter.setPen(QColor(t['text_secondary'] if card.company else t['text_muted']))
+            painter.drawText(QRect(tx, ty + line, tw, line), Qt.AlignVCenter | Qt.AlignLeft,
+                             QFontMetrics(sub).elidedText(card.company or card.hint, Qt.ElideRight, tw))
+
+        # Body lines
+        painter.setFont(font)
+        bx = rect.left() + self.PAD
+        bw = rect.width() - self.PAD * 2
+        y = rect.top() + header_h + 4
+        for label, value in card.lines:
+            painter.setPen(QColor("#888"))
+            lw = fm.horizontalAdvance(label + " ")
+            painter.drawText(QRect(bx, y, lw, line), Qt.AlignVCenter | Qt.AlignLeft, label)
+            painter.setPen(QColor(t['text_primary']))
+            painter.drawText(QRect(bx + lw, y, max(10, bw - lw), line), Qt.AlignVCenter | Qt.AlignLeft,
+                             fm.elidedText(value, Qt.ElideRight, max(10, bw - lw)))
+            y += line
+        if card.warning:
+            painter.setPen(QColor(t['warning']))
+            painter.drawText(QRect(bx, y, bw, line), Qt.AlignVCenter | Qt.AlignLeft,
+                             fm.elidedText(card.warning, Qt.ElideRight, bw))
+
+        # Footer buttons
+        icons = {
+            "edit": self.dialog._icon_edit,
+            "select": self.dialog._icon_select,
+            "delete": self.dialog._icon_delete,
+        }
+        for name, brect, enabled, _tip in self._buttons(rect, card):
+            hovered = enabled and self._hover == (pos[0], pos[1], name)
+            painter.setPen(QPen(QColor(t['border']), 1))
+            painter.setBrush(QColor(t['background'] if hovered else t['surface']))
+            painter.drawRoundedRect(brect, 6, 6)
+            if name == "fav":
+                painter.setFont(font)
+                painter.setPen(QColor(t['text_primary'] if enabled else t['text_muted']))
+                painter.drawText(brect, Qt.AlignCenter, "★" if card.favorite else "☆")
+                continue
+            s = self.ICON_SIZE
+            icon_rect = QRect(brect.center().x() - s // 2 + 1, brect.center().y() - s // 2 + 1, s, s)
+            painter.setOpacity(1.0 if enabled else 0.4)
+            icons[name].paint(painter, icon_rect)
+            painter.setOpacity(1.0)
+
+    # ---- Interaction ----
+    def _hit(self, pos: QPoint, option, row: GridRow):
+        """(column, control name, enabled, tooltip) under pos, or None."""
+        if row.kind != "cards":
+            return None
+        font = QFont(option.font)
+        for col, ((_i, _c, card), card_rect) in enumerate(zip(row.cards, self._card_rects(option.rect, row))):
+            card_rect.setHeight(self._card_height(card, font))
+            if not card_rect.contains(pos):
+                continue
+            for name, brect, enabled, tip in self._buttons(card_rect, card):
+                if brect.contains(pos):
+                    return col, name, enabled, tip
+            return None
+        return None
+
+    def editorEvent(self, event, model, option, index):
+        row = index.data(RowRole)
+        if row is None:
+            return False
+        etype = event.type()
+        if etype == QEvent.MouseMove:
+            hit = self._hit(event.pos(), option, row)
+            hover = (index.row(), hit[0], hit[1]) if (hit and hit[2]) else None
+            if hover != self._hover:
+                self._hover = hover
+                self.view.viewport().update()
+            self.view.viewport().setCursor(Qt.PointingHandCursor if hover else Qt.ArrowCursor)
+            return False
+        if etype == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            hit = self._hit(event.pos(), option, row)
+            if hit and hit[2]:
+                contact_index, contact, card = row.cards[hit[0]]
+                self._activate(hit[1], contact_index, contact, card)
+                return True
+        return False
+
+    def _activate(self, name: str, contact_index: int, contact: dict, card: ContactCard):
+        if contact_index is None or contact_index < 0:
+            return
+        dlg = self.dialog
+        if name == "fav":
+            dlg._toggle_favorite(contact_index, not card.favorite)
+        elif name == "edit":
+            dlg.open_edit_dialog(contact, contact_index)
+        elif name == "select":
+            dlg.select_contact(contact_index)
+        elif name == "delete":
+            dlg.confirm_delete(contact_index)
+
+    def helpEvent(self, event, view, option, index):
+        row = index.data(RowRole) if index.isValid() else None
+        if row is not None and event.type() == QEvent.ToolTip:
+            hit = self._hit(event.pos(), option, row)
+            if hit and hit[3]:
+                QToolTip.showText(event.globalPos(), hit[3], view)
+                return True
+            QToolTip.hideText()
+            return True
+        return super().helpEvent(event, view, option, index)
+
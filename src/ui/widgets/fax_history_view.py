@@ -0,0 +1,608 @@
+"""
+Model/view implementation of the fax history list.
+
+FaxHistoryModel keeps one lightweight FaxRecord per fax, FaxHistoryFilterProxy
+applies the search box and direction toggles, and FaxHistoryDelegate paints a
+card for each visible row. No per-fax widgets exist, so loading more pages only
+inserts rows into the model.
+"""
+import os
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional
+
+from PyQt5.QtCore import (QAbstractListModel, QEvent, QModelIndex, QPoint,
+                          QRect, QSize, QSortFilterProxyModel, Qt)
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen, QPixmap
+from PyQt5.QtWidgets import QMenu, QStyle, QStyledItemDelegate, QToolTip
+
+from core.address_book import AddressBookManager
+from ui.theme import color_for_direction, color_for_status, get_theme
+from utils import inbox_index
+from utils.history_index import is_downloaded
+from utils.incremental_filter import IncrementalFilter
+
+RecordRole = Qt.UserRole + 1
+
+_UNRESOLVED = object()
+
+
+def _localize(created_iso: str) -> str:
+    try:
+        dt = None
+        if created_iso:
+            if created_iso.endswith("Z"):
+                created_iso = created_iso.replace("Z", "+00:00")
+            dt = datetime.fromisoformat(created_iso)
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            dt = dt.astimezone()
+        return dt.strftime('%Y-%m-%d %H:%M:%S %Z') if dt else ""
+    except Exception:
+        return created_iso
+
+
+class FaxRecord:
+    """Display-ready data for one fax, computed once when the row is added."""
+
+    __slots__ = (
+        "entry", "key", "fax_id", "direction", "direction_label", "status",
+        "unread", "from_num", "to_num", "name_from", "name_to", "link_from",
+        "link_to", "ts_local", "pages", "created_at", "match_text",
+        "downloaded_logged", "has_thumb", "local_pdf", "local_pdf_version",
+    )
+
+    def __init__(self, entry: dict, addr_mgr=None, base_dir: Optional[str] = None):
+        self.entry = entry
+        self.fax_id = str(entry.get("id") or entry.get("fax_id") or entry.get("uuid") or "")
+        self.direction_label = str(entry.get("direction", "") or "")
+        self.direction = self.direction_label.lower()
+        self.key = f"{self.direction}:{self.fax_id}" if self.fax_id else f"{self.direction}:{id(entry)}"
+        self.status = str(entry.get("status", ""))
+        self.unread = bool(entry.get("unread", False))
+        self.from_num = str(entry.get("caller_id", ""))
+        self.to_num = str(entry.get("destination", ""))
+        self.created_at = str(entry.get("created_at", "") or "")
+        self.ts_local = _localize(self.created_at)
+        self.pages = entry.get("pages", "")
+        self.name_from = ""
+        self.name_to = ""
+        self.link_from = None
+        self.link_to = None
+        try:
+            if addr_mgr:
+                if self.direction == "inbound":
+                    _idx, c = addr_mgr.find_contact_by_phone(self.from_num)
+                    if c:
+                        self.name_from = (c.get('name') or c.get('company') or '').strip()
+                        self.link_from = AddressBookManager._sanitize_phone(self.from_num)
+                elif self.direction == "outbound":
+                    _idx, c = addr_mgr.find_contact_by_phone(self.to_num)
+                    if c:
+                        self.name_to = (c.get('name') or c.get('company') or '').strip()
+                        self.link_to = AddressBookManager._sanitize_phone(self.to_num)
+        except Exception:
+            pass
+        try:
+            self.downloaded_logged = is_downloaded(base_dir, self.fax_id) if (base_dir and self.fax_id) else False
+        except Exception:
+            self.downloaded_logged = False
+        self.has_thumb = bool(entry.get("thumbnail"))
+        # Local inbox lookup is deferred until the row is first shown, and
+        # repeated only when the inbox index changes (see inbox_index.version)
+        self.local_pdf = _UNRESOLVED
+        self.local_pdf_version = -1
+        num_text = f"{self.from_num} {self.to_num} {str(entry.get('remote_number', ''))}"
+        name_parts = f"{self.name_from} {self.name_to}".strip()
+        self.match_text = f"{self.direction_label} {num_text} {self.status} {name_parts}".lower()
+
+    def search_fields(self):
+        """(text fields, phone fields) registered with the model's search index."""
+        remote = str(self.entry.get("remote_number", "") or "")
+        numbers = (self.from_num, self.to_num, remote)
+        return (self.direction_label, self.status, self.name_from, self.name_to) + numbers, numbers
+
+
+class FaxHistoryModel(QAbstractListModel):
+    """Newest-first list of FaxRecords with a bounded thumbnail cache."""
+
+    THUMB_CACHE_LIMIT = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._records: list[FaxRecord] = []
+        self._by_key: dict[str, FaxRecord] = {}
+        self._thumbs: "OrderedDict[str, Optional[QPixmap]]" = OrderedDict()
+        self._pending: set[str] = set()
+        # Normalized search keys, indexed once per record
+        self.search_index = IncrementalFilter()
+        # Bumped on clear() so late thumbnail callbacks for old rows are dropped
+        self.generation = 0
+
+    # ---- Qt model API ----
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._records)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._records)):
+            return None
+        rec = self._records[index.row()]
+        if role == RecordRole:
+            return rec
+        if role == Qt.DisplayRole:
+            return rec.match_text
+        return None
+
+    # ---- Records ----
+    def clear(self):
+        self.beginResetModel()
+        self._records = []
+        self._by_key = {}
+        self._thumbs.clear()
+        self._pending.clear()
+        self.search_index.clear()
+        self.generation += 1
+        self.endResetModel()
+
+    def record_at(self, row: int) -> Optional[FaxRecord]:
+        if 0 <= row < len(self._records):
+            return self._records[row]
+        return None
+
+    def _insert_pos(self, created_at: str) -> int:
+        # First row strictly older than created_at (records are newest-first)
+        lo, hi = 0, len(self._records)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._records[mid].created_at >= created_at:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def add_records(self, records: list[FaxRecord]) -> int:
+        """Insert records in created_at order without resetting existing rows.
+        Rows already present are updated in place when their entry changed (e.g. status)."""
+        fresh = []
+        for rec in records:
+            old = self._by_key.get(rec.key)
+            if old is not None:
+                if old.entry != rec.entry and old.created_at == rec.created_at:
+                    self._replace_record(old, rec)
+                continue
+            self._by_key[rec.key] = rec
+            self.search_index.set_item(rec.key, *rec.search_fields())
+            fresh.append(rec)
+        if not fresh:
+            return 0
+        fresh.sort(key=lambda r: r.created_at, reverse=True)
+        if not self._records or fresh[0].created_at <= self._records[-1].created_at:
+            # Common case for lazy-loaded pages: everything is older than what we have
+            start = len(self._records)
+            self.beginInsertRows(QModelIndex(), start, start + len(fresh) - 1)
+            self._records.extend(fresh)
+            self.endInsertRows()
+            return len(fresh)
+        for rec in fresh:
+            pos = self._insert_pos(rec.created_at)
+            self.beginInsertRows(QModelIndex(), pos, pos)
+            self._records.insert(pos, rec)
+            self.endInsertRows()
+        return len(fresh)
+
+    def _replace_record(self, old: FaxRecord, rec: FaxRecord):
+        try:
+            row = self._records.index(old)
+        except ValueError:
+            return
+        self._records[row] = rec
+        self._by_key[rec.key] = rec
+        self.search_index.set_item(rec.key, *rec.search_fields())
+        idx = self.index(row, 0)
+        self.dataChanged.emit(idx, idx, [RecordRole, Qt.DisplayRole])
+
+    def last_record(self) -> Optional[FaxRecord]:
+        return self._records[-1] if self._records else None
+
+    def _row_of(self, key: str) -> int:
+        rec = self._by_key.get(key)
+        if rec is None:
+            return -1
+        try:
+            return self._records.index(rec)
+        except ValueError:
+            return -1
+
+    def refresh_rows(self, keys):
+        """Emit dataChanged for the given records (lets the proxy re-filter just those rows)."""
+        keys = set(keys)
+        for row, rec in enumerate(self._records):
+            if rec.key in keys:
+                idx = self.index(row, 0)
+                self.dataChanged.emit(idx, idx, [Qt.DisplayRole])
+
+    def _emit_row_changed(self, key: str):
+        row = self._row_of(key)
+        if row >= 0:
+            idx = self.index(row, 0)
+            self.dataChanged.emit(idx, idx, [RecordRole])
+
+    # ---- Thumbnails ----
+    def needs_thumbnail(self, key: str) -> bool:
+        return key not in self._thumbs and key not in self._pending
+
+    def is_thumbnail_pending(self, key: str) -> bool:
+        return key in self._pending
+
+    def thumbnail(self, key: str) -> Optional[QPixmap]:
+        pm = self._thumbs.get(key)
+        if pm is not None:
+            self._thumbs.move_to_end(key)
+        return pm
+
+    def has_no_thumbnail(self, key: str) -> bool:
+        return key in self._thumbs and self._thumbs[key] is None
+
+    def mark_thumbnail_pending(self, key: str):
+        self._pending.add(key)
+
+    def clear_thumbnail_pending(self, key: str, generation: Optional[int] = None):
+        """Forget a cancelled request so the row asks again when it scrolls back into view."""
+        if generation is not None and generation != self.generation:
+            return
+        self._pending.discard(key)
+
+    def set_thumbnail(self, key: str, pixmap: Optional[QPixmap], generation: Optional[int] = None):
+        if generation is not None and generation != self.generation:
+            return
+        if key not in self._by_key:
+            return
+        self._pending.discard(key)
+        self._thumbs[key] = pixmap if (pixmap is not None and not pixmap.isNull()) else None
+        self._thumbs.move_to_end(key)
+        # Evicted rows simply request their thumbnail again when scrolled back into view
+        while len(self._thumbs) > self.THUMB_CACHE_LIMIT:
+            self._thumbs.popitem(last=False)
+        self._emit_row_changed(key)
+
+
+class FaxHistoryFilterProxy(QSortFilterProxyModel):
+    """Search text + inbound/outbound toggles over the model's search index."""
+
+    # Above this many changed rows a full invalidate is cheaper than per-row updates
+    PATCH_LIMIT = 64
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._show_in = True
+        self._show_out = True
+        self.setDynamicSortFilter(True)
+
+    def set_filter(self, text: str, show_inbound: bool, show_outbound: bool):
+        model = self.sourceModel()
+        if model is None:
+            return
+        changed = model.search_index.update(text or "")
+        if (show_inbound, show_outbound) != (self._show_in, self._show_out):
+            self._show_in = show_inbound
+            self._show_out = show_outbound
+            self.invalidateFilter()
+        elif len(changed) > self.PATCH_LIMIT:
+            self.invalidateFilter()
+        elif changed:
+            # Only rows whose match state flipped are re-filtered
+            model.refresh_rows(changed)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        model = self.sourceModel()
+        rec = model.record_at(source_row)
+        if rec is None:
+            return False
+        dir_ok = (self._show_in and rec.direction == "inbound") or (
+            self._show_out and rec.direction == "outbound"
+        )
+        return dir_ok and model.search_index.is_match(rec.key)
+
+
+class FaxHistoryDelegate(QStyledItemDelegate):
+    """Paints fax cards and maps clicks on painted controls back to panel actions."""
+
+    PAD = 10
+    SPACING = 8
+    ROW_GAP = 4
+    BUTTON_H = 28
+    TOP_H = 22
+
+    def __init__(self, panel, view):
+        super().__init__(view)
+        self.panel = panel
+        self.view = view
+        self._hover = None  # (row, control name)
+
+    # ---- Geometry ----
+    def _preview_size(self):
+        try:
+            vpw = self.view.viewport().width()
+        except Exception:
+            vpw = self.panel.width()
+        preview_w = max(180, min(320, vpw - 260))
+        return preview_w, int(preview_w * 1.3)
+
+    def sizeHint(self, option, index):
+        fm = QFontMetrics(option.font)
+        _pw, ph = self._preview_size()
+        line = fm.height() + 4
+        h = self.ROW_GAP * 2 + self.PAD * 2 + self.TOP_H + line * 2 + self.SPACING * 3 + ph
+        return QSize(max(300, self.view.viewport().width()), h)
+
+    def _buttons_for(self, rec: FaxRecord, available: bool):
+        buttons = [
+            ("view", "View", available, "Open the fax in the built-in viewer"),
+            ("download", "Download ▾", available, "Download fax in selected format"),
+        ]
+        if rec.direction == "outbound" and rec.entry.get("confirmation"):
+            buttons.append(("view_conf", "View Confirmation", True, "Open the confirmation receipt in the viewer"))
+            buttons.append(("download_conf", "Download Confirmation", True, "Choose a location to save the confirmation receipt"))
+        return buttons
+
+    def _layout(self, rect: QRect, rec: FaxRecord, font: QFont) -> dict:
+        fm = QFontMetrics(font)
+        bold = QFont(font)
+        bold.setBold(True)
+        fmb = QFontMetrics(bold)
+        card = rect.adjusted(2, self.ROW_GAP, -2, -self.ROW_GAP)
+        inner = card.adjusted(self.PAD, self.PAD, -self.PAD, -self.PAD)
+        line = fm.height() + 4
+        geo = {"card": card}
+        x, y = inner.left(), inner.top()
+        pill_w = fmb.horizontalAdvance(rec.direction_label) + 16
+        geo["pill"] = QRect(x, y, pill_w, self.TOP_H)
+        status_w = fmb.horizontalAdvance(rec.status) + 4
+        geo["status"] = QRect(inner.right() - status_w, y, status_w, self.TOP_H)
+        if rec.unread:
+            new_w = fmb.horizontalAdvance("NEW") + 4
+            geo["new"] = QRect(geo["status"].left() - new_w - 8, y, new_w, self.TOP_H)
+        y += self.TOP_H + self.SPACING
+        geo["meta1"] = QRect(x, y, inner.width(), line)
+        # Link hit-areas for contact names
+        if rec.name_from:
+            lx = x + fm.horizontalAdvance("From: ")
+            geo["link_from"] = QRect(lx, y, fm.horizontalAdvance(rec.name_from), line)
+        if rec.name_to:
+            from_part = f"From: {rec.name_from} ({rec.from_num})" if rec.name_from else f"From: {rec.from_num}"
+            lx = x + fm.horizontalAdvance(f"{from_part}    To: ")
+            geo["link_to"] = QRect(lx, y, fm.horizontalAdvance(rec.name_to), line)
+        y += line + self.SPACING
+        geo["meta2"] = QRect(x, y, inner.width(), line)
+        y += line + self.SPACING
+        pw, ph = self._preview_size()
+        geo["preview"] = QRect(x, y, pw, ph)
+        ax = x + pw + 10
+        aw = max(120, inner.right() - ax)
+        geo["avail"] = QRect(ax, y, aw, fm.height() + 4)
+        by = y + fm.height() + 4 + 6
+        return geo | {"actions_x": ax, "actions_w": aw, "buttons_y": by}
+
+    def _button_rects(self, geo: dict, buttons) -> dict:
+        rects = {}
+        y = geo["buttons_y"]
+        for name, _text, _enabled, _tip in buttons:
+            rects[name] = QRect(geo["actions_x"], y, geo["actions_w"], self.BUTTON_H)
+            y += self.BUTTON_H + 6
+        return rects
+
+    def _local_pdf(self, rec: FaxRecord, verify: bool = False) -> Optional[str]:
+        """Cached local PDF for an inbound row; no filesystem access on paint or hover.
+
+        verify=True (clicks) stats the cached path once and re-resolves if it is gone.
+        """
+        current = inbox_index.version()
+        if rec.local_pdf is _UNRESOLVED or rec.local_pdf_version != current:
+            rec.local_pdf = None
+            if rec.direction == "inbound":
+                try:
+                    rec.local_pdf = self.panel._resolve_local_pdf(rec.entry)
+                except Exception:
+                    rec.local_pdf = None
+            # Resolving may have rescanned the inbox; record the version it saw
+            rec.local_pdf_version = inbox_index.version()
+        if verify and rec.local_pdf and not os.path.exists(rec.local_pdf):
+            rec.local_pdf = _UNRESOLVED
+            return self._local_pdf(rec)
+        return rec.local_pdf
+
+    # ---- Painting ----
+    def paint(self, painter: QPainter, option, index):
+        rec = index.data(RecordRole)
+        if rec is None:
+            return
+        t = get_theme()
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        font = QFont(option.font)
+        bold = QFont(font)
+        bold.setBold(True)
+        geo = self._layout(option.rect, rec, font)
+        row = index.row()
+
+        # Card
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        painter.setPen(QPen(QColor(t['border_hover'] if hovered else t['border']), 1))
+        painter.setBrush(QColor(color_for_direction(rec.direction)))
+        painter.drawRoundedRect(geo["card"], 8, 8)
+
+        # Top row: direction pill, NEW badge, status
+        painter.setFont(bold)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(t['background']))
+        painter.drawRoundedRect(geo["pill"], 10, 10)
+        painter.setPen(QColor(t['text_primary']))
+        painter.drawText(geo["pill"], Qt.AlignCenter, rec.direction_label)
+        if "new" in geo:
+            painter.setPen(QColor(t['badge_new']))
+            painter.drawText(geo["new"], Qt.AlignVCenter | Qt.AlignRight, "NEW")
+        painter.setPen(QColor(color_for_status(rec.status)))
+        painter.drawText(geo["status"], Qt.AlignVCenter | Qt.AlignRight, rec.status)
+
+        # Meta lines (contact names drawn as links)
+        painter.setFont(font)
+        fm = QFontMetrics(font)
+        x = geo["meta1"].left()
+        segments = []
+        if rec.name_from:
+            segments += [("From: ", None), (rec.name_from, "link"), (f" ({rec.from_num})", None)]
+        else:
+            segments.append((f"From: {rec.from_num}", None))
+        segments.append(("    To: ", None))
+        if rec.name_to:
+            segments += [(rec.name_to, "link"), (f" ({rec.to_num})", None)]
+        else:
+            segments.append((rec.to_num, None))
+        for text, kind in segments:
+            if kind == "link":
+                link_font = QFont(font)
+                link_font.setUnderline(True)
+                painter.setFont(link_font)
+                painter.setPen(QColor(t['link']))
+            else:
+                painter.setFont(font)
+                painter.setPen(QColor(t['text_primary']))
+            w = fm.horizontalAdvance(text)
+            painter.drawText(QRect(x, geo["meta1"].top(), w + 2, geo["meta1"].height()), Qt.AlignVCenter | Qt.AlignLeft, text)
+            x += w
+        painter.setFont(font)
+        painter.setPen(QColor(t['text_secondary']))
+        painter.drawText(geo["meta2"], Qt.AlignVCenter | Qt.AlignLeft, f"Time: {rec.ts_local}    Pages: {rec.pages}")
+
+        # Preview
+        model = self._source_model(index)
+        local_pdf = self._local_pdf(rec)
+        prev = geo["preview"]
+        pm = model.thumbnail(rec.key) if model else None
+        if pm is not None:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(t['surface']))
+            painter.drawRoundedRect(prev, 4, 4)
+            scaled = pm
+            if pm.width() > prev.width() or pm.height() > prev.height():
+                scaled = pm.scaled(prev.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            px = prev.left() + (prev.width() - scaled.width()) // 2
+            py = prev.top() + (prev.height() - scaled.height()) // 2
+            painter.drawPixmap(px, py, scaled)
+        else:
+            pending = model is None or not model.has_no_thumbnail(rec.key)
+            pen = QPen(QColor(t['border']), 1, Qt.SolidLine if pending else Qt.DashLine)
+            painter.setPen(pen)
+            painter.setBrush(QColor(t['surface'] if pending else t['background']))
+            painter.drawRoundedRect(prev, 4, 4)
+            painter.setPen(QColor(t['text_secondary'] if pending else t['text_muted']))
+            painter.drawText(prev, Qt.AlignCenter, "Loading preview…" if pending else "No preview")
+
+        # Availability label
+        has_local = bool(local_pdf)
+        available = bool(has_local or rec.has_thumb)
+        if not available:
+            avail_text, avail_color = "Unavailable", t['warning']
+        elif rec.downloaded_logged or has_local:
+            avail_text, avail_color = "Downloaded", t['success']
+        else:
+            avail_text, avail_color = "Not downloaded", t['error']
+        painter.setPen(QColor(avail_color))
+        painter.drawText(geo["avail"], Qt.AlignVCenter | Qt.AlignLeft, avail_text)
+
+        # Buttons
+        buttons = self._buttons_for(rec, available)
+        for name, rect in self._button_rects(geo, buttons).items():
+            text, enabled = next((b[1], b[2]) for b in buttons if b[0] == name)
+            is_hover = enabled and self._hover == (row, name)
+            if enabled:
+                bg = t['button_hover'] if is_hover else t['button_bg']
+                fg = t['button_text']
+            else:
+                bg, fg = t['border'], t['text_muted']
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(bg))
+            painter.drawRoundedRect(rect, 4, 4)
+            painter.setPen(QColor(fg))
+            painter.drawText(rect, Qt.AlignCenter, text)
+
+        painter.restore()
+
+    # ---- Interaction ----
+    @staticmethod
+    def _source_model(index):
+        model = index.model()
+        if isinstance(model, QSortFilterProxyModel):
+            model = model.sourceModel()
+        return model if isinstance(model, FaxHistoryModel) else None
+
+    def _hit(self, pos: QPoint, option, rec: FaxRecord):
+        geo = self._layout(option.rect, rec, QFont(option.font))
+        local_pdf = self._local_pdf(rec)
+        available = bool(local_pdf or rec.has_thumb)
+        buttons = self._buttons_for(rec, available)
+        for name, rect in self._button_rects(geo, buttons).items():
+            if rect.contains(pos):
+                enabled = next(b[2] for b in buttons if b[0] == name)
+                tip = next(b[3] for b in buttons if b[0] == name)
+                return (name if enabled else None), tip, rect
+        for name in ("link_from", "link_to"):
+            if name in geo and geo[name].contains(pos):
+                return name, None, geo[name]
+        if geo["preview"].contains(pos):
+            url = rec.entry.get("thumbnail") or self.panel.thumb_helper.thumbnail_url_for(rec.entry)
+            if local_pdf or url:
+                return "preview", "Click to open full preview", geo["preview"]
+        return None, None, None
+
+    def editorEvent(self, event, model, option, index):
+        rec = index.data(RecordRole)
+        if rec is None:
+            return False
+        etype = event.type()
+        if etype == QEvent.MouseMove:
+            name, _tip, _rect = self._hit(event.pos(), option, rec)
+            hover = (index.row(), name) if name else None
+            if hover != self._hover:
+                self._hover = hover
+                self.view.viewport().update()
+            self.view.viewport().setCursor(Qt.PointingHandCursor if name else Qt.ArrowCursor)
+            return False
+        if etype == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            name, _tip, rect = self._hit(event.pos(), option, rec)
+            if name:
+                self._activate(name, rec, rect)
+                return True
+        return False
+
+    def _activate(self, name: str, rec: FaxRecord, rect: QRect):
+        panel = self.panel
+        entry = rec.entry
+        local_pdf = self._local_pdf(rec, verify=True)
+        if name in ("view", "preview"):
+            panel._open_pdf_viewer(entry, local_pdf)
+        elif name == "download":
+            menu = QMenu(self.view)
+            for fmt in ("PDF", "JPG", "TIFF"):
+                act = menu.addAction(fmt)
+                act.triggered.connect(lambda _=False, f=fmt, ent=entry: panel._download_fax(ent, f))
+            menu.exec_(self.view.viewport().mapToGlobal(rect.bottomLeft()))
+        elif name == "view_conf":
+            panel._on_view_confirmation(entry)
+        elif name == "download_conf":
+            panel._download_confirmation(entry)
+        elif name == "link_from" and rec.link_from:
+            panel._on_contact_link(f"contact:{rec.link_from}")
+        elif name == "link_to" and rec.link_to:
+            panel._on_contact_link(f"contact:{rec.link_to}")
+
+    def helpEvent(self, event, view, option, index):
+        rec = index.data(RecordRole) if index.isValid() else None
+        if rec is not None and event.type() == QEvent.ToolTip:
+            _name, tip, _rect = self._hit(event.pos(), option, rec)
+            if tip:
+                QToolTip.showText(event.globalPos(), tip, view)
+                return True
+            QToolTip.hideText()
+            return True
+        return super().helpEvent(event, view, option, index)
@@ -0,0 +1,311 @@
+"""
+Lazy, per-page PDF rendering shared by the fax viewer dialogs and the Send Fax preview.
+
+A single worker thread keeps the PyMuPDF document open and renders pages on
+demand: the page being shown first, then its neighbours as prefetch. Rendered
+pages are kept in a small LRU keyed by (page, mode), where mode is either
+("fit", width, height) for the fit-to-viewport size or ("dpi", dpi) for the
+zoomed view.
+"""
+import os
+import threading
+from collections import OrderedDict, deque
+from typing import Iterator, Optional
+
+from PyQt5.QtCore import QObject, QThread, Qt, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap
+
+from utils.pdf_utils import FITZ_LOCK
+
+ZOOM_DPI = 200
+
+
+def fit_mode(view) -> tuple:
+    """Render mode that fits a page inside the given view's viewport."""
+    try:
+        size = view.viewport().size()
+        return ("fit", max(50, size.width()), max(50, size.height()))
+    except Exception:
+        return ("fit", 800, 1000)
+
+
+def zoom_mode(dpi: int = ZOOM_DPI) -> tuple:
+    return ("dpi", int(dpi))
+
+
+def _poppler_path(base_dir: str, exe_dir: Optional[str]) -> Optional[str]:
+    # Prefer MEIPASS/base_dir (onefile extraction) for Poppler, then fallback to exe_dir
+    candidates = [
+        os.path.join(base_dir, "poppler", "bin"),
+        os.path.join(exe_dir or base_dir, "poppler", "bin"),
+    ]
+    return next((p for p in candidates if os.path.isdir(p)), None)
+
+
+def _pil_to_qimage(pil_image) -> QImage:
+    img = pil_image.convert("RGB")
+    data = img.tobytes("raw", "RGB")
+    return QImage(data, img.width, img.height, img.width * 3, QImage.Format_RGB888).copy()
+
+
+class _RenderWorker(QThread):
+    """Owns the open document; processes open/render jobs one at a time."""
+
+    opened = pyqtSignal(int, int)                  # generation, page count (0 on failure)
+    rendered = pyqtSignal(int, int, object, QImage)  # generation, page index, mode, image
+
+    def __init__(self, base_dir: str, exe_dir: Optional[str]):
+        super().__init__()
+        self.base_dir = base_dir
+        self.exe_dir = exe_dir
+        self._cond = threading.Condition()
+        self._jobs: deque = deque()
+        self._stop = False
+        self._doc = None
+        self._path: Optional[str] = None
+        self._gen = -1
+
+    # ---- Job submission (GUI thread) ----
+    def submit_open(self, gen: int, path: Optional[str]):
+        with self._cond:
+            # Anything queued belongs to the previous document
+            self._jobs.clear()
+            self._jobs.append(("open", gen, path))
+            self._cond.notify()
+
+    def submit_render(self, gen: int, jobs: list):
+        """Replace queued renders with jobs (first one is the page being shown)."""
+        with self._cond:
+            kept = [j for j in self._jobs if j[0] == "open"]
+            self._jobs.clear()
+            self._jobs.extend(kept)
+            for index, mode in jobs:
+                self._jobs.append(("render", gen, index, mode))
+            self._cond.notify()
+
+    def stop(self):
+        with self._cond:
+            self._stop = True
+            self._jobs.clear()
+            self._cond.notify()
+
+    # ---- Worker thread ----
+    def run(self):
+        while True:
+            with self._cond:
+                while not self._jobs and not self._stop:
+                    self._cond.wait()
+                if self._stop:
+                    break
+                job = self._jobs.popleft()
+            try:
+                if job[0] == "open":
+                    self._open(job[1], job[2])
+                else:
+                    _kind, gen, index, mode = job
+                    if gen == self._gen:
+                        self.rendered.emit(gen, index, mode, self._render(index, mode))
+            except Exception:
+                pass
+        self._close_doc()
+
+    def _close_doc(self):
+        try:
+            if self._doc is not None:
+                with FITZ_LOCK:
+                    self._doc.close()
+        except Exception:
+            pass
+        self._doc = None
+
+    def _open(self, gen: int, path: Optional[str]):
+        self._close_doc()
+        self._gen = gen
+        self._path = path
+        if not path:
+            return
+        count = 0
+        try:
+            # Try PyMuPDF (fitz) first to avoid spawning Poppler subprocesses (no console windows).
+            # Open from memory so no file handle is held: attachments and cover temp files get
+            # replaced or deleted while the preview is showing them.
+            import fitz  # PyMuPDF
+            with open(path, "rb") as f:
+                data = f.read()
+            with FITZ_LOCK:
+                self._doc = fitz.open(stream=data, filetype="pdf")
+                count = self._doc.page_count
+        except Exception:
+            self._doc = None
+            try:
+                from pdf2image import pdfinfo_from_path
+                kwargs = {}
+                poppler_bin = _poppler_path(self.base_dir, self.exe_dir)
+                if poppler_bin:
+                    kwargs["poppler_path"] = poppler_bin
+                count = int(pdfinfo_from_path(path, **kwargs).get("Pages", 0) or 0)
+            except Exception:
+                count = 0
+        self.opened.emit(gen, count)
+
+    def _render(self, index: int, mode: tuple) -> QImage:
+        try:
+            if self._doc is not None:
+                import fitz  # PyMuPDF
+                with FITZ_LOCK:
+                    page = self._doc.load_page(index)
+                    if mode[0] == "fit":
+                        rect = page.rect
+                        scale = min(mode[1] / max(1.0, rect.width), mode[2] / max(1.0, rect.height))
+                        scale = max(0.1, scale)
+                    else:
+                        scale = float(mode[1]) / 72.0
+                    pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
+                    return QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888).copy()
+            # Fallback to pdf2image + Poppler if PyMuPDF is unavailable
+            from pdf2image import convert_from_path
+            dpi = mode[1] if mode[0] == "dpi" else 100
+            kwargs = {"dpi": dpi, "first_page": index + 1, "last_page": index + 1}
+            poppler_bin = _poppler_path(self.base_dir, self.exe_dir)
+            if poppler_bin:
+                kwargs["poppler_path"] = poppler_bin
+            pages = convert_from_path(self._path, **kwargs)
+            if not pages:
+                return QImage()
+            img = _pil_to_qimage(pages[0])
+            if mode[0] == "fit":
+                img = img.scaled(mode[1], mode[2], Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            return img
+        except Exception:
+            return QImage()
+
+
+class PdfPageRenderer(QObject):
+    """
+    GUI-side handle for lazy page rendering. Call open(path), wait for opened(page_count),
+    then request(index, mode); pageReady(index) fires when a requested page is cached
+    and pageFailed(index) when it could not be rendered.
+    """
+
+    opened = pyqtSignal(int)
+    pageReady = pyqtSignal(int)
+    pageFailed = pyqtSignal(int)
+
+    CACHE_PAGES = 8
+    PREFETCH = 1
+
+    def __init__(self, base_dir: str, exe_dir: Optional[str] = None, parent=None):
+        super().__init__(parent)
+        self.base_dir = base_dir
+        self.exe_dir = exe_dir or base_dir
+        self.path: Optional[str] = None
+        self.page_count = 0
+        self._gen = 0
+        self._cache: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+        self._worker = _RenderWorker(self.base_dir, self.exe_dir)
+        self._worker.opened.connect(self._on_opened)
+        self._worker.rendered.connect(self._on_rendered)
+        self._worker.start()
+
+    def open(self, path: str):
+        self._gen += 1
+        self.path = path
+        self.page_count = 0
+        self._cache.clear()
+        self._worker.submit_open(self._gen, path)
+
+    def clear(self):
+        """Forget the current document (e.g. when the preview is emptied)."""
+        self._gen += 1
+        self.path = None
+        self.page_count = 0
+        self._cache.clear()
+        self._worker.submit_open(self._gen, None)
+
+    def pixmap(self, index: int, mode: tuple) -> Optional[QPixmap]:
+        key = (index, mode)
+        pm = self._cache.get(key)
+        if pm is not None:
+            self._cache.move_to_end(key)
+        return pm
+
+    def any_pixmap(self, index: int) -> Optional[QPixmap]:
+        """Any cached rendering of a page (e.g. at a previous size) to show while re-rendering."""
+        for (i, _mode), pm in reversed(self._cache.items()):
+            if i == index:
+                return pm
+        return None
+
+    def request(self, index: int, mode: tuple) -> Optional[QPixmap]:
+        """Return the page if cached; otherwise render it first, then prefetch its neighbours."""
+        if not (0 <= index < self.page_count):
+            return None
+        pm = self.pixmap(index, mode)
+        jobs = []
+        if pm is None:
+            jobs.append((index, mode))
+        for delta in range(1, self.PREFETCH + 1):
+            for n in (index + delta, index - delta):
+                if 0 <= n < self.page_count and (n, mode) not in self._cache:
+                    jobs.append((n, mode))
+        # Queued prefetches are replaced on every request
+        if jobs:
+            self._worker.submit_render(self._gen, jobs)
+        return pm
+
+    def close(self):
+        try:
+            self._worker.stop()
+            self._worker.wait(3000)
+        except Exception:
+            pass
+        self._cache.clear()
+
+    def iter_print_pixmaps(self, dpi: int = ZOOM_DPI) -> Iterator[QPixmap]:
+        """Render each page for printing on the calling thread, one page at a time."""
+        if not self.path:
+            return
+        try:
+            import fitz  # PyMuPDF
+            with FITZ_LOCK:
+                doc = fitz.open(self.path)
+            try:
+                for i in range(doc.page_count):
+                    # One page per locked section; the printer consumes it outside the lock
+                    with FITZ_LOCK:
+                        pix = doc.load_page(i).get_pixmap(dpi=dpi, alpha=False)
+                        img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888).copy()
+                    yield QPixmap.fromImage(img)
+            finally:
+                with FITZ_LOCK:
+                    doc.close()
+            return
+        except ImportError:
+            pass
+        from pdf2image import convert_from_path
+        poppler_bin = _poppler_path(self.base_dir, self.exe_dir)
+        for i in range(self.page_count):
+            kwargs = {"dpi": dpi, "first_page": i + 1, "last_page": i + 1}
+            if poppler_bin:
+                kwargs["poppler_path"] = poppler_bin
+            pages = convert_from_path(self.path, **kwargs)
+            yield QPixmap.fromImage(_pil_to_qimage(pages[0])) if pages else QPixmap()
+
+    # ---- Worker callbacks (GUI thread) ----
+    def _on_opened(self, gen: int, count: int):
+        if gen != self._gen:
+            return
+        self.page_count = count
+        self.opened.emit(count)
+
+    def _on_rendered(self, gen: int, index: int, mode, img: QImage):
+        if gen != self._gen:
+            return
+        if img is None or img.isNull():
+            self.pageFailed.emit(index)
+            return
+        self._cache[(index, mode)] = QPixmap.fromImage(img)
+        self._cache.move_to_end((index, mode))
+        while len(self._cache) > self.CACHE_PAGES:
+            self._cache.popitem(last=False)
+        self.pageReady.emit(index)
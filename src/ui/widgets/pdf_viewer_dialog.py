@@ -1,23 +1,50 @@
 import os
 from typing import Optional
-from PyQt5.QtCore import Qt, QUrl
-from PyQt5.QtGui import QPixmap, QImage
+from PyQt5.QtCore import Qt, QUrl, QRectF
 from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QMessageBox, QGraphicsView, QGraphicsScene
 from PyQt5.QtPrintSupport import QPrinter, QPrintDialog
 
+from ui.widgets.pdf_page_renderer import PdfPageRenderer, fit_mode, zoom_mode
+
 
 def open_pdf_viewer(parent, entry: dict, local_pdf_path: Optional[str], app_state, base_dir: str, exe_dir: Optional[str]):
     """
     Open a full PDF viewer with page navigation, zoom controls, and download.
     If local_pdf_path is None or missing, fetch the remote PDF first using bearer token.
     """
+    _open_viewer(
+        parent, entry, local_pdf_path, app_state, base_dir, exe_dir,
+        title="Fax Document",
+        url_key="pdf",
+        download_attr="_download_pdf",
+        print_title="Print Fax Document",
+        missing_url_text="No PDF URL available.",
+    )
+
+
+def open_pdf_viewer_confirmation(parent, entry: dict, local_pdf_path: Optional[str], app_state, base_dir: str, exe_dir: Optional[str]):
+    """
+    Open a PDF viewer for fax confirmation receipts. Behaves like open_pdf_viewer but
+    fetches entry['confirmation'] and uses _download_confirmation for the download action.
+    """
+    _open_viewer(
+        parent, entry, local_pdf_path, app_state, base_dir, exe_dir,
+        title="Fax Confirmation",
+        url_key="confirmation",
+        download_attr="_download_confirmation",
+        print_title="Print Fax Confirmation",
+        missing_url_text="No confirmation URL available.",
+    )
+
+
+def _open_viewer(parent, entry: dict, local_pdf_path: Optional[str], app_state, base_dir: str, exe_dir: Optional[str],
+                 title: str, url_key: str, download_attr: str, print_title: str, missing_url_text: str):
     try:
         from tempfile import mkstemp
-        from pdf2image import convert_from_path
 
         # Prepare dialog UI
         dlg = QDialog(parent)
-        dlg.setWindowTitle("Fax Document")
+        dlg.setWindowTitle(title)
         dlg.setWindowFlags(dlg.windowFlags() & ~Qt.WindowContextHelpButtonHint)
         layout = QVBoxLayout(dlg)
 
@@ -41,6 +68,8 @@ def open_pdf_viewer(parent, entry: dict, local_pdf_path: Optional[str], app_stat
         btn_zoom_out = QPushButton("Zoom-")
         btn_download = QPushButton("Download PDF")
         btn_print = QPushButton("Print")
+        btn_prev.setEnabled(False)
+        btn_next.setEnabled(False)
         controls.addWidget(btn_prev)
         controls.addWidget(btn_next)
         controls.addStretch()
@@ -51,299 +80,86 @@ def open_pdf_viewer(parent, entry: dict, local_pdf_path: Optional[str], app_stat
         controls.addWidget(btn_download)
         layout.addLayout(controls)
 
-        # State
-        page_images: list[QPixmap] = []
+        # State: pages are rendered lazily by the shared renderer (document stays open)
+        renderer = PdfPageRenderer(base_dir, exe_dir, dlg)
         current_page = {"i": 0}
         zoomed = {"on": False}
-        original_pixmap = {"pm": None}
 
-        def update_view():
+        def current_mode():
+            return zoom_mode() if zoomed["on"] else fit_mode(view)
+
+        def show_text(text: str):
             scene.clear()
-            pm = original_pixmap["pm"]
-            if not pm:
+            scene.addText(text)
+            view.setSceneRect(scene.itemsBoundingRect())
+
+        def update_view():
+            index = current_page["i"]
+            pm = renderer.request(index, current_mode())
+            if pm is None:
+                # Keep showing an earlier rendering of this page (if any) until the new one arrives
+                pm = renderer.any_pixmap(index)
+            if pm is None:
+                show_text(f"Rendering page {index + 1}…")
                 return
-            if zoomed["on"]:
-                scene.addPixmap(pm)
-                from PyQt5.QtCore import QRectF
-                view.setSceneRect(QRectF(pm.rect()))
-            else:
+            scene.clear()
+            if not zoomed["on"]:
+                # Rendered for the viewport size at request time; rescale if the dialog was resized
                 viewport_size = view.viewport().size()
-                scaled = pm.scaled(viewport_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                scene.addPixmap(scaled)
-                from PyQt5.QtCore import QRectF
-                view.setSceneRect(QRectF(scaled.rect()))
+                if pm.width() > viewport_size.width() or pm.height() > viewport_size.height():
+                    pm = pm.scaled(viewport_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            scene.addPixmap(pm)
+            view.setSceneRect(QRectF(pm.rect()))
 
         def set_page(index: int):
-            if 0 <= index < len(page_images):
+            if 0 <= index < renderer.page_count:
                 current_page["i"] = index
-                original_pixmap["pm"] = page_images[index]
                 update_view()
                 btn_prev.setEnabled(index > 0)
-                btn_next.setEnabled(index < len(page_images) - 1)
-
-        def render_pdf(path: str):
-            try:
-                imgs = []
-                # Try PyMuPDF (fitz) first to avoid spawning Poppler subprocesses (no console windows)
-                try:
-                    import fitz  # PyMuPDF
-                    doc = fitz.open(path)
-                    if doc.page_count <= 0:
-                        raise RuntimeError("Empty PDF")
-                    for i in range(doc.page_count):
-                        page = doc.load_page(i)
-                        pix = page.get_pixmap(dpi=200, alpha=False)
-                        img_bytes = pix.tobytes("png")
-                        from io import BytesIO
-                        qimg = QImage.fromData(img_bytes)
-                        imgs.append(QPixmap.fromImage(qimg))
-                except Exception:
-                    # Fallback to pdf2image + Poppler if PyMuPDF is unavailable
-                    from pdf2image import convert_from_path
-                    # Prefer MEIPASS/base_dir (onefile extraction) for Poppler, then fallback to exe_dir
-                    candidates = [
-                        os.path.join(base_dir, "poppler", "bin"),
-                        os.path.join(exe_dir or base_dir, "poppler", "bin"),
-                    ]
-                    poppler_bin = next((p for p in candidates if os.path.isdir(p)), None)
-                    kwargs = {"dpi": 200}
-                    if poppler_bin:
-                        kwargs["poppler_path"] = poppler_bin
-                    pages = convert_from_path(path, **kwargs)
-                    from io import BytesIO
-                    for pil_image in pages:
-                        buf = BytesIO()
-                        pil_image.save(buf, format='PNG')
-                        qimg = QImage.fromData(buf.getvalue())
-                        imgs.append(QPixmap.fromImage(qimg))
-                page_images.clear()
-                page_images.extend(imgs)
-                set_page(0)
-            except Exception as e:
-                scene.addText(f"Failed to render PDF: {e}")
-
-        def do_download():
-            try:
-                # parent should expose _download_pdf(entry)
-                if hasattr(parent, '_download_pdf'):
-                    parent._download_pdf(entry)
-            except Exception:
-                pass
-
-        def do_print():
-            try:
-                if not page_images:
-                    QMessageBox.information(dlg, "Print", "Document is not ready to print yet.")
-                    return
-                printer = QPrinter(QPrinter.HighResolution)
-                # Show a print dialog so user can pick printer/settings
-                dlg_print = QPrintDialog(printer, dlg)
-                dlg_print.setWindowTitle("Print Fax Document")
-                if dlg_print.exec_() != QDialog.Accepted:
-                    return
-                from PyQt5.QtGui import QPainter
-                painter = QPainter()
-                if not painter.begin(printer):
-                    QMessageBox.warning(dlg, "Print", "Failed to start printer.")
-                    return
-                try:
-                    for idx, pm in enumerate(page_images):
-                        # Scale pixmap to fit printable area while preserving aspect
-                        page_rect = printer.pageRect()
-                        if pm.isNull() or page_rect.width() <= 0 or page_rect.height() <= 0:
-                            if idx < len(page_images) - 1:
-                                printer.newPage()
-                            continue
-                        scaled = pm.scaled(page_rect.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        x = page_rect.x() + (page_rect.width() - scaled.width()) // 2
-                        y = page_rect.y() + (page_rect.height() - scaled.height()) // 2
-                        painter.drawPixmap(x, y, scaled)
-                        if idx < len(page_images) - 1:
-                            printer.newPage()
-                finally:
-                    painter.end()
-                QMessageBox.information(dlg, "Print", "Document sent to printer.")
-            except Exception as pe:
-                QMessageBox.warning(dlg, "Print", f"Printing failed: {pe}")
-
-        btn_prev.clicked.connect(lambda: set_page(current_page["i"] - 1))
-        btn_next.clicked.connect(lambda: set_page(current_page["i"] + 1))
-        btn_zoom_in.clicked.connect(lambda: (zoomed.__setitem__('on', True), view.setDragMode(QGraphicsView.ScrollHandDrag), update_view()))
-        btn_zoom_out.clicked.connect(lambda: (zoomed.__setitem__('on', False), view.setDragMode(QGraphicsView.NoDrag), update_view()))
-        btn_download.clicked.connect(do_download)
-        btn_print.clicked.connect(do_print)
-
-        # Acquire PDF path (local or remote)
-        def start_with_path(path: str):
-            if not path or not os.path.exists(path):
-                scene.addText("Unable to load PDF.")
-            else:
-                render_pdf(path)
-
-        if local_pdf_path and os.path.exists(local_pdf_path):
-            start_with_path(local_pdf_path)
-        else:
-            # Fetch remote PDF and then render
-            url = entry.get("pdf")
-            if not url:
-                scene.addText("No PDF URL available.")
-            else:
-                try:
-                    from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest
-                    mgr = QNetworkAccessManager(dlg)
-                    req = QNetworkRequest(QUrl(url))
-                    token = app_state.global_cfg.bearer_token or ""
-                    if token:
-                        req.setRawHeader(b"Authorization", f"Bearer {token}".encode("utf-8"))
-                    reply = mgr.get(req)
-
-                    def _save_and_render():
-                        try:
-                            if reply.error() == 0:
-                                data = reply.readAll().data()
-                                fd, tmp_path = mkstemp(suffix='.pdf')
-                                os.close(fd)
-                                with open(tmp_path, 'wb') as f:
-                                    f.write(data)
-                                start_with_path(tmp_path)
-                            else:
-                                scene.addText("Failed to fetch PDF.")
-                        finally:
-                            reply.deleteLater()
-
-                    reply.finished.connect(_save_and_render)
-                except Exception as e:
-                    scene.addText(f"Failed to start download: {e}")
-
-        dlg.resize(800, 600)
-        dlg.exec_()
-    except Exception as e:
-        QMessageBox.warning(parent, "Viewer", f"Failed to open PDF viewer: {e}")
-
-
-
-def open_pdf_viewer_confirmation(parent, entry: dict, local_pdf_path: Optional[str], app_state, base_dir: str, exe_dir: Optional[str]):
-    """
-    Open a PDF viewer for fax confirmation receipts. Behaves like open_pdf_viewer but
-    fetches entry['confirmation'] and uses _download_confirmation for the download action.
-    """
-    try:
-        from tempfile import mkstemp
-        from pdf2image import convert_from_path  # noqa: F401 (import parity with open_pdf_viewer)
-
-        dlg = QDialog(parent)
-        dlg.setWindowTitle("Fax Confirmation")
-        dlg.setWindowFlags(dlg.windowFlags() & ~Qt.WindowContextHelpButtonHint)
-        layout = QVBoxLayout(dlg)
-
-        view = QGraphicsView()
-        scene = QGraphicsScene()
-        view.setScene(scene)
-        view.setObjectName("pdfPreview")
-        view.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        view.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        view.setDragMode(QGraphicsView.NoDrag)
-        layout.addWidget(view)
+                btn_next.setEnabled(index < renderer.page_count - 1)
 
-        controls = QHBoxLayout()
-        btn_prev = QPushButton(); btn_prev.setText("Prev")
-        btn_next = QPushButton(); btn_next.setText("Next")
-        btn_zoom_in = QPushButton("Zoom+")
-        btn_zoom_out = QPushButton("Zoom-")
-        btn_download = QPushButton("Download PDF")
-        btn_print = QPushButton("Print")
-        controls.addWidget(btn_prev)
-        controls.addWidget(btn_next)
-        controls.addStretch()
-        controls.addWidget(btn_zoom_in)
-        controls.addWidget(btn_zoom_out)
-        controls.addStretch()
-        controls.addWidget(btn_print)
-        controls.addWidget(btn_download)
-        layout.addLayout(controls)
+        def on_opened(count: int):
+            if count <= 0:
+                show_text("Failed to render PDF: document has no pages or could not be opened.")
+                return
+            set_page(0)
 
-        page_images: list[QPixmap] = []
-        current_page = {"i": 0}
-        zoomed = {"on": False}
-        original_pixmap = {"pm": None}
+        def on_page_ready(index: int):
+            if index == current_page["i"]:
+                update_view()
 
-        def update_view():
-            scene.clear()
-            pm = original_pixmap["pm"]
-            if not pm:
-                return
-            if zoomed["on"]:
-                scene.addPixmap(pm)
-                from PyQt5.QtCore import QRectF
-                view.setSceneRect(QRectF(pm.rect()))
-            else:
-                viewport_size = view.viewport().size()
-                scaled = pm.scaled(viewport_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                scene.addPixmap(scaled)
-                from PyQt5.QtCore import QRectF
-                view.setSceneRect(QRectF(scaled.rect()))
+        def on_page_failed(index: int):
+            if index == current_page["i"]:
+                show_text(f"Failed to render page {index + 1}.")
 
-        def set_page(index: int):
-            if 0 <= index < len(page_images):
-                current_page["i"] = index
-                original_pixmap["pm"] = page_images[index]
+        def on_resize(event):
+            QDialog.resizeEvent(dlg, event)
+            # Fit-to-window pages are rendered for the viewport size; re-request at the new size
+            if renderer.page_count > 0 and not zoomed["on"]:
                 update_view()
-                btn_prev.setEnabled(index > 0)
-                btn_next.setEnabled(index < len(page_images) - 1)
 
-        def render_pdf(path: str):
-            try:
-                imgs = []
-                try:
-                    import fitz  # PyMuPDF
-                    doc = fitz.open(path)
-                    if doc.page_count <= 0:
-                        raise RuntimeError("Empty PDF")
-                    for i in range(doc.page_count):
-                        page = doc.load_page(i)
-                        pix = page.get_pixmap(dpi=200, alpha=False)
-                        img_bytes = pix.tobytes("png")
-                        from io import BytesIO
-                        qimg = QImage.fromData(img_bytes)
-                        imgs.append(QPixmap.fromImage(qimg))
-                except Exception:
-                    from pdf2image import convert_from_path
-                    candidates = [
-                        os.path.join(base_dir, "poppler", "bin"),
-                        os.path.join(exe_dir or base_dir, "poppler", "bin"),
-                    ]
-                    poppler_bin = next((p for p in candidates if os.path.isdir(p)), None)
-                    kwargs = {"dpi": 200}
-                    if poppler_bin:
-                        kwargs["poppler_path"] = poppler_bin
-                    pages = convert_from_path(path, **kwargs)
-                    from io import BytesIO
-                    for pil_image in pages:
-                        buf = BytesIO()
-                        pil_image.save(buf, format='PNG')
-                        qimg = QImage.fromData(buf.getvalue())
-                        imgs.append(QPixmap.fromImage(qimg))
-                page_images.clear()
-                page_images.extend(imgs)
-                set_page(0)
-            except Exception as e:
-                scene.addText(f"Failed to render PDF: {e}")
+        dlg.resizeEvent = on_resize
+        renderer.opened.connect(on_opened)
+        renderer.pageReady.connect(on_page_ready)
+        renderer.pageFailed.connect(on_page_failed)
 
         def do_download():
             try:
-                if hasattr(parent, '_download_confirmation'):
-                    parent._download_confirmation(entry)
+                # parent should expose the download handler for this document type
+                if hasattr(parent, download_attr):
+                    getattr(parent, download_attr)(entry)
             except Exception:
                 pass
 
         def do_print():
             try:
-                if not page_images:
+                if renderer.page_count <= 0:
                     QMessageBox.information(dlg, "Print", "Document is not ready to print yet.")
                     return
                 printer = QPrinter(QPrinter.HighResolution)
+                # Show a print dialog so user can pick printer/settings
                 dlg_print = QPrintDialog(printer, dlg)
-                dlg_print.setWindowTitle("Print Fax Confirmation")
+                dlg_print.setWindowTitle(print_title)
                 if dlg_print.exec_() != QDialog.Accepted:
                     return
                 from PyQt5.QtGui import QPainter
@@ -352,17 +168,17 @@ def open_pdf_viewer_confirmation(parent, entry: dict, local_pdf_path: Optional[s
                     QMessageBox.warning(dlg, "Print", "Failed to start printer.")
                     return
                 try:
-                    for idx, pm in enumerate(page_images):
+                    total = renderer.page_count
+                    # Pages are rendered one at a time so the whole document is never in memory
+                    for idx, pm in enumerate(renderer.iter_print_pixmaps()):
+                        # Scale pixmap to fit printable area while preserving aspect
                         page_rect = printer.pageRect()
-                        if pm.isNull() or page_rect.width() <= 0 or page_rect.height() <= 0:
-                            if idx < len(page_images) - 1:
-                                printer.newPage()
-                            continue
-                        scaled = pm.scaled(page_rect.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        x = page_rect.x() + (page_rect.width() - scaled.width()) // 2
-                        y = page_rect.y() + (page_rect.height() - scaled.height()) // 2
-                        painter.drawPixmap(x, y, scaled)
-                        if idx < len(page_images) - 1:
+                        if not pm.isNull() and page_rect.width() > 0 and page_rect.height() > 0:
+                            scaled = pm.scaled(page_rect.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                            x = page_rect.x() + (page_rect.width() - scaled.width()) // 2
+                            y = page_rect.y() + (page_rect.height() - scaled.height()) // 2
+                            painter.drawPixmap(x, y, scaled)
+                        if idx < total - 1:
                             printer.newPage()
                 finally:
                     painter.end()
@@ -377,18 +193,21 @@ def open_pdf_viewer_confirmation(parent, entry: dict, local_pdf_path: Optional[s
         btn_download.clicked.connect(do_download)
         btn_print.clicked.connect(do_print)
 
+        # Acquire PDF path (local or remote)
         def start_with_path(path: str):
             if not path or not os.path.exists(path):
-                scene.addText("Unable to load PDF.")
+                show_text("Unable to load PDF.")
             else:
-                render_pdf(path)
+                show_text("Loading…")
+                renderer.open(path)
 
         if local_pdf_path and os.path.exists(local_pdf_path):
             start_with_path(local_pdf_path)
         else:
-            url = entry.get("confirmation")
+            # Fetch remote PDF and then render
+            url = entry.get(url_key)
             if not url:
-                scene.addText("No confirmation URL available.")
+                show_text(missing_url_text)
             else:
                 try:
                     from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest
@@ -398,6 +217,7 @@ def open_pdf_viewer_confirmation(parent, entry: dict, local_pdf_path: Optional[s
                     if token:
                         req.setRawHeader(b"Authorization", f"Bearer {token}".encode("utf-8"))
                     reply = mgr.get(req)
+                    show_text("Downloading…")
 
                     def _save_and_render():
                         try:
@@ -409,15 +229,18 @@ def open_pdf_viewer_confirmation(parent, entry: dict, local_pdf_path: Optional[s
                                     f.write(data)
                                 start_with_path(tmp_path)
                             else:
-                                scene.addText("Failed to fetch PDF.")
+                                show_text("Failed to fetch PDF.")
                         finally:
                             reply.deleteLater()
 
                     reply.finished.connect(_save_and_render)
                 except Exception as e:
-                    scene.addText(f"Failed to start download: {e}")
+                    show_text(f"Failed to start download: {e}")
 
         dlg.resize(800, 600)
-        dlg.exec_()
+        try:
+            dlg.exec_()
+        finally:
+            renderer.close()
     except Exception as e:
         QMessageBox.warning(parent, "Viewer", f"Failed to open PDF viewer: {e}")
@@ -1,7 +1,8 @@
 import json
 import os
 import random
-from typing import Dict, List, Optional
+import threading
+from typing import Dict, List, Optional, Tuple
 
 _DEFAULT_MESSAGES = {
     "humorous": [
@@ -27,29 +28,50 @@ _DEFAULT_MESSAGES = {
 }
 
 
+# path -> ((mtime_ns, size), pool); reloaded only when the JSON file changes
+_pool_cache: Dict[str, Tuple[Optional[tuple], Dict[str, List[str]]]] = {}
+_pool_lock = threading.Lock()
+
+
+def _read_pool_file(path: str) -> Optional[Dict[str, List[str]]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            if isinstance(data, dict):
+                # Coerce lists and normalize keys to lowercase
+                out: Dict[str, List[str]] = {}
+                for k, v in data.items():
+                    if isinstance(v, list) and all(isinstance(x, str) for x in v):
+                        out[(k or "").strip().lower()] = v
+                if out:
+                    return out
+    except Exception:
+        pass
+    return None
+
+
 def load_message_pool(base_dir: str) -> Dict[str, List[str]]:
     """
     Load cover footer messages from shared/cover_messages.json if present.
     Fallback to in-module defaults.
     - Normalizes category keys to lowercase so JSON can use any casing (e.g., "Humor" or "humorous").
+    - The parsed pool is cached and re-read only when the file's mtime/size changes.
     """
+    path = os.path.join(base_dir or "", "shared", "cover_messages.json")
     try:
-        path = os.path.join(base_dir, "shared", "cover_messages.json")
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    # Coerce lists and normalize keys to lowercase
-                    out: Dict[str, List[str]] = {}
-                    for k, v in data.items():
-                        if isinstance(v, list) and all(isinstance(x, str) for x in v):
-                            out[(k or "").strip().lower()] = v
-                    if out:
-                        return out
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
     except Exception:
-        pass
+        stamp = None
+    with _pool_lock:
+        cached = _pool_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return dict(cached[1])
+    pool = (_read_pool_file(path) if stamp else None) or _DEFAULT_MESSAGES
+    with _pool_lock:
+        _pool_cache[path] = (stamp, pool)
     # Default pool already uses lowercase keys
-    return dict(_DEFAULT_MESSAGES)
+    return dict(pool)
 
 
 def random_footer(base_dir: str, category: str | None) -> str:
@@ -0,0 +1,226 @@
+"""
+Cover and continuation page templates rendered in memory.
+
+A template is the draw list of one page kind (fonts, positions, static lines such
+as the designer header and footer, and format fields for attn, memo and session
+i/N), built once per settings version. render() draws the whole list on a fresh
+ReportLab canvas and returns PDF bytes; nothing touches the disk unless the caller
+asks for a file (spool() / write_temp()).
+
+- Templates are keyed by (kind, settings tuple); changing the cover settings simply
+  produces a new version.
+- The saving is in memoization, not in partial rendering: finished pages are kept
+  in a small LRU keyed by template version + field values, so plan_sessions and the
+  real send (and repeated "Session i of N" pages) reuse the same bytes. A miss
+  redraws the full page, which is a handful of text draws; merging a prebuilt static
+  page with a field overlay would cost more than that. ReportLab runs with
+  invariant=1 so identical inputs give identical output.
+- Returns None when ReportLab is unavailable, like the callers it replaces.
+"""
+from __future__ import annotations
+
+import io
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from utils.logging_utils import get_logger
+
+try:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.pdfgen import canvas
+    REPORTLAB_AVAILABLE = True
+except Exception:
+    REPORTLAB_AVAILABLE = False
+
+log = get_logger("cover_templates")
+
+DEFAULT_FOOTER = "The remainder of this page is intentionally left blank."
+
+_RENDER_CACHE_MAX = 32
+# Spooled outputs stay in memory up to this size before rolling over to disk
+SPOOL_MAX_BYTES = 512 * 1024
+
+# (font, size, y in points, text). Text may hold str.format fields.
+_Op = Tuple[str, float, float, str]
+
+
+class CoverTemplate:
+    __slots__ = ("kind", "version", "ops")
+
+    def __init__(self, kind: str, version: tuple, ops: List[_Op]):
+        self.kind = kind
+        self.version = version
+        self.ops = ops
+
+    def render(self, **fields) -> Optional[bytes]:
+        """Cached PDF bytes for these field values; a miss draws the full page."""
+        key = (self.kind, self.version, tuple(sorted(fields.items())))
+        with _render_lock:
+            data = _render_cache.get(key)
+            if data is not None:
+                _render_cache.move_to_end(key)
+                return data
+        try:
+            buf = io.BytesIO()
+            c = canvas.Canvas(buf, pagesize=letter, invariant=1)
+            width = letter[0]
+            for font, size, y, text in self.ops:
+                c.setFont(font, size)
+                c.drawCentredString(width / 2.0, y, text.format(**fields))
+            c.showPage()
+            c.save()
+            data = buf.getvalue()
+        except Exception as e:
+            log.error(f"Failed to render {self.kind} page: {e}")
+            return None
+        with _render_lock:
+            _render_cache[key] = data
+            while len(_render_cache) > _RENDER_CACHE_MAX:
+                _render_cache.popitem(last=False)
+        return data
+
+
+_templates: Dict[tuple, CoverTemplate] = {}
+_templates_lock = threading.Lock()
+_render_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+_render_lock = threading.Lock()
+
+
+def _template(kind: str, version: tuple, build) -> Optional[CoverTemplate]:
+    if not REPORTLAB_AVAILABLE:
+        log.warning(f"ReportLab not available; cannot generate {kind} PDF.")
+        return None
+    key = (kind, version)
+    with _templates_lock:
+        tpl = _templates.get(key)
+        if tpl is None:
+            tpl = _templates[key] = CoverTemplate(kind, version, build())
+        return tpl
+
+
+def _escape(value) -> str:
+    """Static layout text goes through str.format; keep user braces literal."""
+    return str(value or "").replace("{", "{{").replace("}", "}}")
+
+
+# ---- Layouts ----
+
+def _simple_cover_ops(multipart: bool) -> List[_Op]:
+    height = letter[1]
+    center_y = height / 2.0
+    ops: List[_Op] = [("Helvetica-Bold", 20, height - 0.9 * inch, "FAX COVER SHEET")]
+    if multipart:
+        ops += [
+            ("Helvetica", 12, center_y + 0.25 * inch, "To / Attn: {attn}"),
+            ("Helvetica", 12, center_y - 0.05 * inch, "Memo: {memo}"),
+            ("Helvetica-Bold", 12, center_y - 0.35 * inch, "Multi-part Fax — Session {idx} of {total}"),
+        ]
+    else:
+        ops += [
+            ("Helvetica", 12, center_y + 0.2 * inch, "To / Attn: {attn}"),
+            ("Helvetica", 12, center_y - 0.1 * inch, "Memo: {memo}"),
+        ]
+    ops.append(("Helvetica-Oblique", 10, 0.75 * inch, DEFAULT_FOOTER))
+    return ops
+
+
+def _continuation_ops() -> List[_Op]:
+    return [("Helvetica-Bold", 18, letter[1] / 2.0, "Continuation — Session {idx} of {total}")]
+
+
+def _designer_ops(company: str, address: str, phone: str, email: str, footer: str) -> List[_Op]:
+    height = letter[1]
+    ops: List[_Op] = []
+    # Header block: company info
+    top = height - 0.9 * inch
+    if company:
+        ops.append(("Helvetica-Bold", 16, top, _escape(company)))
+        top -= 0.22 * inch
+    if address:
+        ops.append(("Helvetica", 10, top, _escape(address)))
+        top -= 0.18 * inch
+    if phone or email:
+        contact_line = " ".join([x for x in [phone, (f"| {email}" if email else "")] if x])
+        ops.append(("Helvetica", 10, top, _escape(contact_line)))
+    center_y = height / 2.0
+    ops += [
+        ("Helvetica-Bold", 28, center_y + 0.35 * inch, "COVER SHEET"),
+        ("Helvetica", 12, center_y - 0.05 * inch, "To / Attn: {attn}"),
+        ("Helvetica", 12, center_y - 0.35 * inch, "Memo: {memo}"),
+        ("Helvetica-Oblique", 10, 0.75 * inch, _escape(footer or DEFAULT_FOOTER)),
+    ]
+    return ops
+
+
+# ---- Public API ----
+
+def cover_pdf_bytes(attn: str, memo: str) -> Optional[bytes]:
+    tpl = _template("cover", (), lambda: _simple_cover_ops(False))
+    return tpl.render(attn=attn or "", memo=memo or "") if tpl else None
+
+
+def multipart_cover_pdf_bytes(attn: str, memo: str, session_idx: int, session_total: int) -> Optional[bytes]:
+    tpl = _template("cover_multipart", (), lambda: _simple_cover_ops(True))
+    if not tpl:
+        return None
+    return tpl.render(
+        attn=attn or "",
+        memo=memo or "",
+        idx=max(1, int(session_idx)),
+        total=max(1, int(session_total)),
+    )
+
+
+def continuation_pdf_bytes(session_idx: int, session_total: int) -> Optional[bytes]:
+    tpl = _template("continuation", (), _continuation_ops)
+    if not tpl:
+        return None
+    return tpl.render(idx=max(1, int(session_idx)), total=max(1, int(session_total)))
+
+
+def designer_cover_pdf_bytes(
+    attn: str,
+    memo: str,
+    *,
+    company: str = "",
+    address: str = "",
+    phone: str = "",
+    email: str = "",
+    footer: str = "",
+) -> Optional[bytes]:
+    """Cover from the send panel's designer settings; the settings tuple is the template version."""
+    version = (company or "", address or "", phone or "", email or "", footer or "")
+    tpl = _template("designer", version, lambda: _designer_ops(*version))
+    return tpl.render(attn=attn or "", memo=memo or "") if tpl else None
+
+
+def spool(data: Optional[bytes]):
+    """Wrap bytes in a SpooledTemporaryFile positioned at 0 (None passes through)."""
+    if data is None:
+        return None
+    f = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES, suffix=".pdf")
+    f.write(data)
+    f.seek(0)
+    return f
+
+
+def write_temp(data: Optional[bytes]) -> Optional[str]:
+    """Write bytes to a mkstemp .pdf for callers that need a path; None on failure."""
+    if data is None:
+        return None
+    fd, path = tempfile.mkstemp(suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        return path
+    except Exception as e:
+        log.error(f"Failed to write generated page: {e}")
+        try:
+            os.remove(path)
+        except Exception:
+            pass
+        return None
@@ -4,24 +4,24 @@ Used during manual faxing and inbound fax processing.
 """
 
 import datetime
+import io
 import os
 import shutil
 import tempfile
+import time
 
 from pypdf import PdfReader, PdfWriter
 
+from utils.cover_templates import (
+    continuation_pdf_bytes,
+    cover_pdf_bytes,
+    multipart_cover_pdf_bytes,
+    write_temp,
+)
 from utils.logging_utils import get_logger
+from utils.pdf_utils import FITZ_LOCK
 from PIL import Image, ImageDraw, ImageFont
 
-# Try to use reportlab for PDF generation when available
-try:
-    from reportlab.lib.pagesizes import letter
-    from reportlab.pdfgen import canvas
-    from reportlab.lib.units import inch
-    REPORTLAB_AVAILABLE = True
-except Exception:
-    REPORTLAB_AVAILABLE = False
-
 log = get_logger("doc_utils")
 
 # Allowed file types (no conversion)
@@ -31,6 +31,101 @@ def is_supported_filetype(filepath):
     return filepath.lower().endswith(SUPPORTED_TYPES)
 
 
+def _read_pdf_bytes(input_path, digest=None) -> bytes:
+    """Read a file in chunks, feeding digest (if any) in the same pass."""
+    buf = io.BytesIO()
+    with open(input_path, "rb") as src:
+        for chunk in iter(lambda: src.read(1024 * 1024), b""):
+            if digest is not None:
+                digest.update(chunk)
+            buf.write(chunk)
+    return buf.getvalue()
+
+
+def _normalize_with_pymupdf(data: bytes, fix_orientation: bool):
+    """
+    Rewrite a PDF with PyMuPDF: optional landscape->portrait rotation, unused-object
+    garbage collection and deflate of uncompressed streams, all in C.
+    Returns the temp output path, or None so the caller can fall back to pypdf.
+    """
+    try:
+        import fitz  # PyMuPDF
+    except Exception:
+        return None
+    doc = None
+    temp_path = None
+    # One document operation (open, rotate, save) per locked section
+    with FITZ_LOCK:
+        try:
+            doc = fitz.open(stream=data, filetype="pdf")
+            if doc.needs_pass or doc.page_count <= 0:
+                return None
+            if fix_orientation:
+                for page in doc:
+                    # page.rect already reflects /Rotate, so only pages that display landscape turn
+                    if page.rect.width > page.rect.height:
+                        page.set_rotation((page.rotation + 90) % 360)
+            fd, temp_path = tempfile.mkstemp(suffix=".pdf")
+            os.close(fd)
+            doc.save(temp_path, garbage=3, deflate=True)
+            return temp_path
+        except Exception as e:
+            log.debug(f"PyMuPDF normalization failed; falling back to pypdf: {e}")
+            if temp_path:
+                try:
+                    os.remove(temp_path)
+                except Exception:
+                    pass
+            return None
+        finally:
+            if doc is not None:
+                try:
+                    doc.close()
+                except Exception:
+                    pass
+
+
+def _normalize_with_pypdf(data: bytes, fix_orientation: bool) -> str:
+    reader = PdfReader(io.BytesIO(data))
+    writer = PdfWriter()
+    for page in reader.pages:
+        if fix_orientation:
+            width = float(page.mediabox.width)
+            height = float(page.mediabox.height)
+            # Compare the displayed orientation: /Rotate 90 or 270 swaps the sides
+            rotation = int(page.rotation or 0) % 360
+            if rotation in (90, 270):
+                width, height = height, width
+            if width > height:
+                page.rotate(90)
+        writer.add_page(page)
+
+    fd, temp_path = tempfile.mkstemp(suffix=".pdf")
+    os.close(fd)
+    with open(temp_path, "wb") as f:
+        writer.write(f)
+    return temp_path
+
+
+def _normalize(input_path, fix_orientation: bool, digest=None) -> str:
+    """PyMuPDF first, pypdf fallback. Raises if both engines fail."""
+    started = time.perf_counter()
+    data = _read_pdf_bytes(input_path, digest)
+    engine = "pymupdf"
+    out_path = _normalize_with_pymupdf(data, fix_orientation)
+    if not out_path:
+        engine = "pypdf"
+        out_path = _normalize_with_pypdf(data, fix_orientation)
+    try:
+        log.debug(
+            f"Normalized PDF with {engine}: {len(data)} -> {os.path.getsize(out_path)} bytes "
+            f"in {(time.perf_counter() - started) * 1000:.0f} ms"
+        )
+    except Exception:
+        pass
+    return out_path
+
+
 def normalize_orientation(input_path):
     """
     Ensures all pages are portrait oriented and sized to US Letter.
@@ -48,22 +143,7 @@ def normalize_orientation(input_path):
         return copy_to_temp(input_path)
 
     try:
-        reader = PdfReader(input_path)
-        writer = PdfWriter()
-
-        for page in reader.pages:
-            width = float(page.mediabox.width)
-            height = float(page.mediabox.height)
-            if width > height:
-                page.rotate(90)
-            writer.add_page(page)
-
-        fd, temp_path = tempfile.mkstemp(suffix=".pdf")
-        os.close(fd)
-        with open(temp_path, "wb") as f:
-            writer.write(f)
-
-        return temp_path
+        return _normalize(input_path, fix_orientation=True)
     except Exception as e:
         log.error(f"Failed to normalize orientation for {input_path}: {e}")
         return copy_to_temp(input_path)
@@ -143,14 +223,17 @@ def convert_image_to_pdf(image_path, output_path):
         return None
 
 
-def normalize_pdf(input_path):
+def normalize_pdf(input_path, digest=None):
     """
     Returns a normalized PDF path (copies or flattens input) into a temporary file.
     - If the file is not a PDF, returns the original path unchanged.
     - If normalization fails for any reason, returns the original path unchanged.
+    - Uses PyMuPDF when available and falls back to pypdf.
 
     Args:
         input_path (str): Path to original file
+        digest: Optional hashlib object updated with the original bytes in the same
+            read pass that loads them for parsing. Only complete when a new path is returned.
 
     Returns:
         str: Path to a valid PDF. This may be a temp file when input is a PDF.
@@ -160,17 +243,7 @@ def normalize_pdf(input_path):
         return input_path
 
     try:
-        reader = PdfReader(input_path)
-        writer = PdfWriter()
-        for page in reader.pages:
-            writer.add_page(page)
-
-        fd, normalized_path = tempfile.mkstemp(suffix=".pdf")
-        os.close(fd)
-        with open(normalized_path, "wb") as f:
-            writer.write(f)
-
-        return normalized_path
+        return _normalize(input_path, fix_orientation=False, digest=digest)
     except Exception as e:
         log.error(f"Failed to normalize PDF: {e}")
         return input_path
@@ -180,37 +253,9 @@ def generate_cover_pdf(attn: str, memo: str, *, base_dir: str | None = None) ->
     """Generate a professional one-page cover PDF.
 
     Returns temp filepath or None if ReportLab is unavailable or an error occurs.
+    Prefer cover_templates.cover_pdf_bytes() when a file is not required.
     """
-    if not REPORTLAB_AVAILABLE:
-        log.warning("ReportLab not available; cannot generate cover PDF.")
-        return None
-    try:
-        fd, path = tempfile.mkstemp(suffix=".pdf")
-        os.close(fd)
-        c = canvas.Canvas(path, pagesize=letter)
-        width, height = letter
-
-        # Header block (kept generic; UI has richer designer but this is a safe fallback)
-        top = height - 0.9 * inch
-        c.setFont("Helvetica-Bold", 20)
-        c.drawCentredString(width / 2.0, top, "FAX COVER SHEET")
-
-        c.setFont("Helvetica", 12)
-        center_y = height / 2.0
-        c.drawCentredString(width / 2.0, center_y + 0.2 * inch, f"To / Attn: {attn or ''}")
-        c.drawCentredString(width / 2.0, center_y - 0.1 * inch, f"Memo: {memo or ''}")
-
-        c.setFont("Helvetica-Oblique", 10)
-        c.drawCentredString(
-            width / 2.0, 0.75 * inch, "The remainder of this page is intentionally left blank."
-        )
-
-        c.showPage()
-        c.save()
-        return path
-    except Exception as e:
-        log.error(f"Failed to generate cover PDF: {e}")
-        return None
+    return write_temp(cover_pdf_bytes(attn, memo))
 
 
 def generate_cover_pdf_with_multipart_note(
@@ -225,43 +270,7 @@ def generate_cover_pdf_with_multipart_note(
 
     Example note: "Multi-part Fax — Session {i} of {N}".
     """
-    if not REPORTLAB_AVAILABLE:
-        log.warning("ReportLab not available; cannot generate cover-with-note PDF.")
-        return None
-    try:
-        fd, path = tempfile.mkstemp(suffix=".pdf")
-        os.close(fd)
-        c = canvas.Canvas(path, pagesize=letter)
-        width, height = letter
-
-        top = height - 0.9 * inch
-        c.setFont("Helvetica-Bold", 20)
-        c.drawCentredString(width / 2.0, top, "FAX COVER SHEET")
-
-        c.setFont("Helvetica", 12)
-        center_y = height / 2.0
-        c.drawCentredString(width / 2.0, center_y + 0.25 * inch, f"To / Attn: {attn or ''}")
-        c.drawCentredString(width / 2.0, center_y - 0.05 * inch, f"Memo: {memo or ''}")
-
-        # Multi-part note just below Memo
-        c.setFont("Helvetica-Bold", 12)
-        c.drawCentredString(
-            width / 2.0,
-            center_y - 0.35 * inch,
-            f"Multi-part Fax — Session {max(1, int(session_idx))} of {max(1, int(session_total))}",
-        )
-
-        c.setFont("Helvetica-Oblique", 10)
-        c.drawCentredString(
-            width / 2.0, 0.75 * inch, "The remainder of this page is intentionally left blank."
-        )
-
-        c.showPage()
-        c.save()
-        return path
-    except Exception as e:
-        log.error(f"Failed to generate cover-with-note PDF: {e}")
-        return None
+    return write_temp(multipart_cover_pdf_bytes(attn, memo, session_idx, session_total))
 
 
 def generate_continuation_pdf(*, session_idx: int, session_total: int, base_dir: str | None = None) -> str | None:
@@ -269,27 +278,7 @@ def generate_continuation_pdf(*, session_idx: int, session_total: int, base_dir:
 
     Text: "Continuation — Session {i} of {N}" (centered).
     """
-    if not REPORTLAB_AVAILABLE:
-        log.warning("ReportLab not available; cannot generate continuation PDF.")
-        return None
-    try:
-        fd, path = tempfile.mkstemp(suffix=".pdf")
-        os.close(fd)
-        c = canvas.Canvas(path, pagesize=letter)
-        width, height = letter
-
-        c.setFont("Helvetica-Bold", 18)
-        c.drawCentredString(
-            width / 2.0,
-            height / 2.0,
-            f"Continuation — Session {max(1, int(session_idx))} of {max(1, int(session_total))}",
-        )
-        c.showPage()
-        c.save()
-        return path
-    except Exception as e:
-        log.error(f"Failed to generate continuation PDF: {e}")
-        return None
+    return write_temp(continuation_pdf_bytes(session_idx, session_total))
 
 
 # Deprecated shim retained for backward compatibility
@@ -357,14 +346,20 @@ def convert_pdf_to_jpgs(input_pdf: str, output_dir: str, *, dpi: int = 200, qual
             import fitz  # PyMuPDF
             from PIL import Image as _PILImage
             zoom = max(1.0, float(dpi) / 72.0)
-            doc = fitz.open(input_pdf)
+            with FITZ_LOCK:
+                doc = fitz.open(input_pdf)
             pil_pages = []
-            for i in range(doc.page_count):
-                page = doc.load_page(i)
-                pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
-                # Build PIL Image from pixmap buffer
-                img = _PILImage.frombytes("RGB", (pix.width, pix.height), pix.samples)
-                pil_pages.append(img)
+            try:
+                for i in range(doc.page_count):
+                    with FITZ_LOCK:
+                        page = doc.load_page(i)
+                        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+                        # Build PIL Image from pixmap buffer
+                        img = _PILImage.frombytes("RGB", (pix.width, pix.height), pix.samples)
+                    pil_pages.append(img)
+            finally:
+                with FITZ_LOCK:
+                    doc.close()
             if pil_pages:
                 result = _save_pages(pil_pages)
                 if isinstance(result, list):
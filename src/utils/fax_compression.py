@@ -0,0 +1,177 @@
+"""
+Fax-optimized outbound compression (opt-in: "Fax Options" -> fax_compression = "Yes").
+
+Color and grayscale scans from office MFPs are far larger than the bilevel image the
+fax network delivers. compress_pdf_for_fax() re-renders image-heavy pages at FAX_DPI
+and re-encodes them as 1-bit CCITT Group 4, the same approach ScanWorker._image_to_pdf
+uses for fresh scans (grayscale -> Floyd-Steinberg 1-bit -> G4 TIFF -> img2pdf, with a
+PyMuPDF wrapper as fallback). Text/vector pages and pages whose images are already
+bilevel are copied unchanged.
+
+Notes
+- Results are kept in a small in-memory cache keyed by (path, size, mtime), so the
+  session estimate in plan_sessions and the real send render each file only once.
+- Only sizes and page counts are logged (no file names / PHI).
+"""
+from __future__ import annotations
+
+import io
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from utils.logging_utils import get_logger
+from utils.pdf_utils import FITZ_LOCK
+
+log = get_logger("fax_compression")
+
+FAX_DPI = 200
+# Fraction of the page area covered by images for a page to count as image-heavy
+IMAGE_COVERAGE_MIN = 0.5
+_CACHE_MAX_ENTRIES = 4
+
+_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def compression_enabled() -> bool:
+    try:
+        from core.config_loader import device_config
+        value = device_config.get("Fax Options", "fax_compression", "No")
+        return str(value or "No").strip().lower() == "yes"
+    except Exception:
+        return False
+
+
+def _is_image_heavy(page) -> bool:
+    try:
+        area = abs(page.rect)
+        if area <= 0:
+            return False
+        covered = 0.0
+        reencodable = False
+        for info in page.get_image_info():
+            bbox = page.rect & info.get("bbox")
+            covered += abs(bbox)
+            if int(info.get("bpc") or 8) > 1 or int(info.get("colorspace") or 1) > 1:
+                reencodable = True
+        return reencodable and covered / area >= IMAGE_COVERAGE_MIN
+    except Exception:
+        return False
+
+
+def _bilevel_g4_page(page, dpi: int = FAX_DPI) -> Optional[bytes]:
+    """Render one page to a single-page CCITT G4 PDF (bytes), or None."""
+    import fitz  # PyMuPDF
+    from PIL import Image
+
+    pix = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY, alpha=False)
+    im = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+    im = im.convert("1", dither=Image.FLOYDSTEINBERG)
+    tiff = io.BytesIO()
+    im.save(tiff, format="TIFF", compression="group4", dpi=(dpi, dpi))
+    tiff_bytes = tiff.getvalue()
+
+    # Preferred: img2pdf embeds the G4 stream as-is
+    try:
+        import img2pdf
+        return img2pdf.convert(tiff_bytes, dpi=dpi)
+    except Exception:
+        pass
+    # Fallback: PyMuPDF wrapper at the original page size
+    try:
+        out = fitz.open()
+        try:
+            dst = out.new_page(width=page.rect.width, height=page.rect.height)
+            dst.insert_image(dst.rect, stream=tiff_bytes)
+            return out.tobytes(garbage=3, deflate=True)
+        finally:
+            out.close()
+    except Exception:
+        return None
+
+
+def _compress(path: str) -> Tuple[Optional[bytes], int]:
+    """Returns (compressed bytes or None when nothing was gained, re-encoded page count)."""
+    import fitz  # PyMuPDF
+
+    with FITZ_LOCK:
+        src = fitz.open(path)
+        out = fitz.open()
+    try:
+        if src.needs_pass:
+            return None, 0
+        reencoded = 0
+        # One page per locked section (see utils.pdf_utils)
+        for i in range(src.page_count):
+            with FITZ_LOCK:
+                page = src.load_page(i)
+                data = _bilevel_g4_page(page) if _is_image_heavy(page) else None
+                if data:
+                    with fitz.open(stream=data, filetype="pdf") as one:
+                        out.insert_pdf(one)
+                    reencoded += 1
+                else:
+                    out.insert_pdf(src, from_page=i, to_page=i)
+        if not reencoded:
+            return None, 0
+        with FITZ_LOCK:
+            return out.tobytes(garbage=3, deflate=True), reencoded
+    finally:
+        with FITZ_LOCK:
+            out.close()
+            src.close()
+
+
+def compress_pdf_for_fax(path: str) -> Tuple[Optional[str], int, int]:
+    """
+    Re-encode image-heavy pages of a PDF as bilevel G4.
+
+    Returns (temp_path or None, bytes_before, bytes_after). temp_path is None when the
+    input is not a PDF, nothing qualified, or the result would not be smaller; the
+    caller owns (and removes) the returned temp file.
+    """
+    if not path or not path.lower().endswith(".pdf"):
+        return None, 0, 0
+    try:
+        st = os.stat(path)
+    except Exception:
+        return None, 0, 0
+    before = int(st.st_size)
+    key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+
+    # Cached value is the compressed PDF, or b"" when compression gained nothing
+    with _cache_lock:
+        data = _cache.get(key)
+        if data is not None:
+            _cache.move_to_end(key)
+    if data is None:
+        try:
+            data, reencoded = _compress(path)
+        except Exception as e:
+            log.debug(f"Fax compression skipped: {e}")
+            data, reencoded = None, 0
+        if data is not None and len(data) < before:
+            log.info(f"Fax compression: {reencoded} page(s) re-encoded to G4, {before} -> {len(data)} bytes")
+        else:
+            data = b""
+        with _cache_lock:
+            _cache[key] = data
+            while len(_cache) > _CACHE_MAX_ENTRIES:
+                _cache.popitem(last=False)
+    if not data:
+        return None, before, before
+
+    fd, out_path = tempfile.mkstemp(suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+    except Exception:
+        try:
+            os.remove(out_path)
+        except Exception:
+            pass
+        return None, before, before
+    return out_path, before, len(data)
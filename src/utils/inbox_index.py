@@ -0,0 +1,354 @@
+"""
+Index of local inbox files keyed by fax ID.
+
+The receiver records the files it writes for each fax; anything else in the
+inbox (older downloads, files copied in by hand, other naming schemes) is
+picked up by an incremental rescan that only runs when the inbox directory's
+mtime changes. The index is persisted under <base_dir>/cache so a restart does
+not need to re-list a large inbox on a network share.
+
+A receiver pass refreshes once at the start and then works from that snapshot
+(refresh=False) plus its own record/forget calls, so the directory is listed at
+most once per pass. Retention cleanup walks an mtime-ordered view and stops at
+the first file newer than the cutoff.
+
+version() changes whenever the set of indexed files does, so callers that cache
+resolved paths (the history view) know when to look them up again.
+"""
+import bisect
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Iterable, Optional
+
+INBOX_EXTS = (".pdf", ".jpg", ".tiff", ".tif")
+# Minimum seconds between directory stat() checks
+REFRESH_INTERVAL = 2.0
+
+_lock = threading.RLock()
+_loaded_base: str | None = None
+_inbox: str | None = None
+_dir_sig: tuple | None = None
+_files: dict[str, list] = {}          # name -> [mtime, size]
+_by_id: dict[str, list[str]] = {}     # fax_id -> [names] recorded by the receiver
+_by_stem: dict[str, set[str]] = {}    # filename stem (without -N page suffix) -> names
+_by_age: list[tuple[float, str]] | None = None  # (mtime, name) ascending; rebuilt lazily
+_last_check = 0.0
+_dirty = False
+_version = 0
+
+_PAGE_SUFFIX = re.compile(r"-\d+$")
+
+
+def _index_path(base_dir: str) -> str:
+    try:
+        cache_dir = os.path.join(base_dir, "cache")
+        os.makedirs(cache_dir, exist_ok=True)
+        return os.path.join(cache_dir, "inbox_index.json")
+    except Exception:
+        return os.path.join(base_dir, "inbox_index.json")
+
+
+def _norm_inbox(inbox: str) -> str:
+    return os.path.normcase(os.path.abspath(inbox))
+
+
+def _stem(name: str) -> str:
+    base, ext = os.path.splitext(name)
+    if ext.lower() == ".jpg":
+        base = _PAGE_SUFFIX.sub("", base)
+    return base
+
+
+def _dir_signature(inbox: str):
+    try:
+        st = os.stat(inbox)
+        return (st.st_mtime_ns, st.st_ino)
+    except Exception:
+        return None
+
+
+def _add_name(name: str, mtime: float, size: int) -> None:
+    global _by_age, _version
+    _by_age = None
+    if name not in _files:
+        _version += 1
+    _files[name] = [mtime, size]
+    _by_stem.setdefault(_stem(name), set()).add(name)
+
+
+def _drop_names(names: set[str]) -> None:
+    global _by_age, _version
+    if not names:
+        return
+    _by_age = None
+    _version += 1
+    for name in names:
+        _files.pop(name, None)
+        stem = _stem(name)
+        stem_names = _by_stem.get(stem)
+        if stem_names is not None:
+            stem_names.discard(name)
+            if not stem_names:
+                _by_stem.pop(stem, None)
+    # One pass over the ID map for the whole batch
+    for fid in [k for k, v in _by_id.items() if not names.isdisjoint(v)]:
+        remaining = [n for n in _by_id[fid] if n not in names]
+        if remaining:
+            _by_id[fid] = remaining
+        else:
+            _by_id.pop(fid, None)
+
+
+def _reset(inbox: str) -> None:
+    global _inbox, _dir_sig, _files, _by_id, _by_stem, _by_age, _last_check, _version
+    _version += 1
+    _inbox = _norm_inbox(inbox)
+    _by_age = None
+    _dir_sig = None
+    _last_check = 0.0
+    _files = {}
+    _by_id = {}
+    _by_stem = {}
+
+
+def _load(base_dir: str, inbox: str) -> None:
+    """Load the persisted index once per process (or when the inbox path changes)."""
+    global _loaded_base, _dir_sig
+    if _loaded_base == base_dir and _inbox == _norm_inbox(inbox):
+        return
+    _reset(inbox)
+    _loaded_base = base_dir
+    try:
+        with open(_index_path(base_dir), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get("inbox") != _inbox:
+            return
+        for name, meta in (data.get("files") or {}).items():
+            try:
+                _add_name(name, float(meta[0]), int(meta[1]))
+            except Exception:
+                continue
+        for fid, names in (data.get("by_id") or {}).items():
+            kept = [n for n in (names or []) if n in _files]
+            if kept:
+                _by_id[str(fid)] = kept
+        sig = data.get("dir_sig")
+        _dir_sig = tuple(sig) if isinstance(sig, list) else None
+    except Exception:
+        pass
+
+
+def _scan(inbox: str) -> bool:
+    """Diff the directory against the index. Returns True if anything changed."""
+    seen: dict[str, tuple[float, int]] = {}
+    try:
+        with os.scandir(inbox) as it:
+            for e in it:
+                if not e.name.lower().endswith(INBOX_EXTS):
+                    continue
+                try:
+                    if not e.is_file():
+                        continue
+                    st = e.stat()
+                    seen[e.name] = (st.st_mtime, st.st_size)
+                except Exception:
+                    continue
+    except Exception:
+        return False
+    changed = False
+    missing = {n for n in _files if n not in seen}
+    if missing:
+        _drop_names(missing)
+        changed = True
+    for name, (mtime, size) in seen.items():
+        if _files.get(name) != [mtime, size]:
+            _add_name(name, mtime, size)
+            changed = True
+    return changed
+
+
+def _save(base_dir: str) -> None:
+    global _dirty
+    path = _index_path(base_dir)
+    dir_path = os.path.dirname(path) or "."
+    tmp = None
+    try:
+        payload = {
+            "inbox": _inbox,
+            "dir_sig": list(_dir_sig) if _dir_sig else None,
+            "files": _files,
+            "by_id": _by_id,
+        }
+        fd, tmp = tempfile.mkstemp(dir=dir_path, suffix=".tmp", prefix=".inbox_")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp, path)
+        _dirty = False
+    except Exception:
+        if tmp:
+            try:
+                os.unlink(tmp)
+            except Exception:
+                pass
+
+
+# --- Public API ---
+
+def version() -> int:
+    """Counter bumped whenever files are added to or dropped from the index."""
+    return _version
+
+
+def refresh(base_dir: str, inbox: str, force: bool = False) -> None:
+    """Rescan the inbox if its directory mtime changed since the last scan."""
+    global _dir_sig, _last_check
+    if not inbox:
+        return
+    with _lock:
+        _load(base_dir, inbox)
+        now = time.monotonic()
+        if not force and now - _last_check < REFRESH_INTERVAL:
+            return
+        _last_check = now
+        sig = _dir_signature(inbox)
+        if sig is None:
+            return
+        if not force and sig == _dir_sig:
+            if _dirty:
+                _save(base_dir)
+            return
+        changed = _scan(inbox)
+        _dir_sig = sig
+        if changed or _dirty or force:
+            _save(base_dir)
+
+
+def flush(base_dir: str) -> None:
+    """Persist pending record/forget changes."""
+    with _lock:
+        if _dirty and _loaded_base == base_dir:
+            _save(base_dir)
+
+
+def record_files(base_dir: str, inbox: str, fax_id: str, paths: Iterable[str]) -> list[str]:
+    """Called by the receiver after writing the local outputs for a fax.
+
+    Returns the paths that exist (and were recorded); missing paths are skipped.
+    """
+    global _dirty
+    fid = str(fax_id or "").strip()
+    if not fid or not inbox:
+        return []
+    recorded = []
+    with _lock:
+        _load(base_dir, inbox)
+        names = list(_by_id.get(fid, []))
+        for p in paths or []:
+            try:
+                st = os.stat(p)
+            except Exception:
+                continue
+            name = os.path.basename(p)
+            _add_name(name, st.st_mtime, st.st_size)
+            recorded.append(p)
+            if name not in names:
+                names.append(name)
+        if names:
+            _by_id[fid] = names
+        _dirty = True
+    return recorded
+
+
+def forget_files(base_dir: str, inbox: str, paths: Iterable[str]) -> None:
+    """Drop deleted files from the index."""
+    global _dirty
+    if not inbox:
+        return
+    with _lock:
+        _load(base_dir, inbox)
+        names = {os.path.basename(p) for p in paths or []}
+        names &= _files.keys()
+        if names:
+            _drop_names(names)
+            _dirty = True
+
+
+def contains(base_dir: str, inbox: str, path: str, refresh_first: bool = True) -> bool:
+    """Whether the index (snapshot) knows a file by this name; no per-file stat."""
+    if not inbox or not path:
+        return False
+    with _lock:
+        if refresh_first:
+            refresh(base_dir, inbox)
+        else:
+            _load(base_dir, inbox)
+        return os.path.basename(path) in _files
+
+
+def files_for(base_dir: str, inbox: str, fax_id: str) -> list[str]:
+    """All indexed paths for a fax ID (receiver-recorded, or matching filename stem)."""
+    fid = str(fax_id or "").strip()
+    if not fid or not inbox:
+        return []
+    with _lock:
+        refresh(base_dir, inbox)
+        names = set(_by_id.get(fid, []))
+        names |= _by_stem.get(fid, set())
+        return [os.path.join(inbox, n) for n in sorted(names)]
+
+
+def find_local_file(
+    base_dir: str,
+    inbox: str,
+    keys: Iterable[str],
+    exts: tuple = (".pdf",),
+) -> Optional[str]:
+    """
+    Resolve a local file for the first matching key (fax ID/uuid): files the receiver
+    recorded for it, then files whose stem is exactly the key. Two dict lookups per
+    key; there is no substring match on numbers or timestamps, which could attach
+    another fax's file.
+    """
+    if not inbox:
+        return None
+    with _lock:
+        refresh(base_dir, inbox)
+        for k in keys or []:
+            k = str(k or "").strip()
+            if not k:
+                continue
+            names = list(_by_id.get(k, [])) + sorted(_by_stem.get(k, set()))
+            for n in names:
+                if n.lower().endswith(exts):
+                    return os.path.join(inbox, n)
+    return None
+
+
+def files_older_than(
+    base_dir: str,
+    inbox: str,
+    cutoff_ts: float,
+    exts: tuple = INBOX_EXTS,
+    refresh_first: bool = True,
+) -> list[str]:
+    """Indexed paths whose recorded mtime is older than cutoff_ts (epoch seconds), oldest first.
+
+    Pass refresh_first=False to reuse the snapshot taken earlier in the same pass.
+    """
+    global _by_age
+    if not inbox:
+        return []
+    with _lock:
+        if refresh_first:
+            refresh(base_dir, inbox)
+        else:
+            _load(base_dir, inbox)
+        if _by_age is None:
+            _by_age = sorted((meta[0], n) for n, meta in _files.items())
+        # Everything before the first entry at/after the cutoff is expired
+        end = bisect.bisect_left(_by_age, (cutoff_ts, ""))
+        return [os.path.join(inbox, n) for _mtime, n in _by_age[:end] if n.lower().endswith(exts)]
@@ -0,0 +1,175 @@
+"""
+Incremental search filter shared by list views (fax history, address book).
+
+Each item is registered once with its searchable text fields and phone fields.
+Keys are normalized up front (lowercase text, digits-only phones with and
+without a leading country code) and indexed by trigram, so a query only
+verifies the few candidates whose trigrams all match. update(query) returns
+just the items whose match state changed, letting views show/hide those rows
+instead of re-evaluating or rebuilding everything.
+
+Query semantics: whitespace-separated terms must all match. A term made of
+digits and phone punctuation matches phone digits (or text); any other term
+is a case-insensitive substring of the text fields.
+"""
+import re
+from typing import Hashable, Iterable, Optional
+
+_PHONE_TERM = re.compile(r"^[\d()+\-.]*\d[\d()+\-.]*$")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_text(value) -> str:
+    return _SPACES.sub(" ", str(value or "")).strip().lower()
+
+
+def normalize_phone(value) -> str:
+    """Digits only, plus the 10-digit form when a leading 1 is present."""
+    digits = "".join(ch for ch in str(value or "") if ch.isdigit())
+    if len(digits) == 11 and digits.startswith("1"):
+        return f"{digits} {digits[1:]}"
+    return digits
+
+
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class IncrementalFilter:
+    def __init__(self):
+        self._text: dict = {}       # key -> normalized text blob
+        self._digits: dict = {}     # key -> normalized phone blob
+        self._text_tri: dict = {}   # trigram -> keys
+        self._digit_tri: dict = {}  # trigram -> keys
+        self._query = ""
+        self._terms: list = []
+        self._matched: set = set()
+
+    # ---- Items ----
+    def __len__(self):
+        return len(self._text)
+
+    def __contains__(self, key):
+        return key in self._text
+
+    def clear(self):
+        self._text.clear()
+        self._digits.clear()
+        self._text_tri.clear()
+        self._digit_tri.clear()
+        self._matched.clear()
+
+    def set_item(self, key: Hashable, text_fields: Iterable = (), phone_fields: Iterable = ()) -> bool:
+        """Add or replace an item. Returns whether it matches the current query."""
+        if key in self._text:
+            self.remove_item(key)
+        text = " | ".join(t for t in (normalize_text(f) for f in text_fields) if t)
+        digits = " ".join(d for d in (normalize_phone(f) for f in phone_fields) if d)
+        self._text[key] = text
+        self._digits[key] = digits
+        for tri in _trigrams(text):
+            self._text_tri.setdefault(tri, set()).add(key)
+        for tri in _trigrams(digits):
+            self._digit_tri.setdefault(tri, set()).add(key)
+        ok = self._item_matches(key, self._terms)
+        if ok:
+            self._matched.add(key)
+        return ok
+
+    def remove_item(self, key: Hashable):
+        text = self._text.pop(key, None)
+        digits = self._digits.pop(key, None)
+        self._matched.discard(key)
+        for blob, index in ((text, self._text_tri), (digits, self._digit_tri)):
+            for tri in _trigrams(blob or ""):
+                keys = index.get(tri)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        index.pop(tri, None)
+
+    # ---- Matching ----
+    @staticmethod
+    def _parse(query: str) -> list:
+        terms = []
+        for term in normalize_text(query).split(" "):
+            if not term:
+                continue
+            digits = "".join(ch for ch in term if ch.isdigit()) if _PHONE_TERM.match(term) else ""
+            terms.append((term, digits))
+        return terms
+
+    def _item_matches(self, key, terms) -> bool:
+        text = self._text.get(key, "")
+        digits = self._digits.get(key, "")
+        for term, term_digits in terms:
+            if term in text:
+                continue
+            if term_digits and term_digits in digits:
+                continue
+            return False
+        return True
+
+    def _candidates(self, term: str, term_digits: str) -> Optional[set]:
+        """Keys that can contain the term, or None when the term is too short to index."""
+        if len(term) < 3:
+            return None
+        found = self._lookup(self._text_tri, term)
+        if term_digits:
+            if len(term_digits) < 3:
+                return None
+            found = found | self._lookup(self._digit_tri, term_digits)
+        return found
+
+    @staticmethod
+    def _lookup(index: dict, term: str) -> set:
+        result = None
+        for tri in sorted(_trigrams(term), key=lambda t: len(index.get(t, ()))):
+            keys = index.get(tri)
+            if not keys:
+                return set()
+            result = set(keys) if result is None else (result & keys)
+            if not result:
+                return set()
+        return result or set()
+
+    def match(self, query: str) -> set:
+        """All keys matching query (every key for an empty query)."""
+        terms = self._parse(query)
+        if not terms:
+            return set(self._text)
+        pool = None
+        for term, term_digits in terms:
+            cand = self._candidates(term, term_digits)
+            if cand is not None:
+                pool = cand if pool is None else (pool & cand)
+        # Typing more characters can only narrow the previous result
+        prev = normalize_text(self._query)
+        if prev and normalize_text(query).startswith(prev) and len(prev.split(" ")) == len(terms):
+            pool = set(self._matched) if pool is None else (pool & self._matched)
+        if pool is None:
+            pool = self._text.keys()
+        return {k for k in pool if self._item_matches(k, terms)}
+
+    def update(self, query: str) -> set:
+        """Apply a new query. Returns the keys whose match state changed."""
+        if normalize_text(query) == normalize_text(self._query):
+            self._query = query
+            return set()
+        matched = self.match(query)
+        changed = matched ^ self._matched
+        self._query = query
+        self._terms = self._parse(query)
+        self._matched = matched
+        return changed
+
+    def is_match(self, key: Hashable) -> bool:
+        return key in self._matched
+
+    @property
+    def query(self) -> str:
+        return self._query
+
+    @property
+    def matched(self) -> set:
+        return self._matched
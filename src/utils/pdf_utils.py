@@ -5,14 +5,31 @@ PDF utility helpers for FaxRetriever (Sprint 7)
   Splits a PDF into single-page PDF byte blobs. Uses PyMuPDF (fitz), which is
   already a project dependency for rendering, to avoid introducing new
   dependencies. If splitting fails, returns an empty list.
+- PdfPartSplitter(pdf_bytes, max_bytes, start_page)
+  Lazily yields page groups sized just under max_bytes, one at a time, so a
+  caller can send and release each part before the next is built. The caller
+  reports each outcome (delivered / too_large), which drives resume points and
+  adaptive group sizes.
 
 Notes
 - This module must not log PHI. It performs no logging.
 - Callers should handle errors by checking for empty return values.
+
+PyMuPDF and threads (app-wide rule)
+- MuPDF's global context is not safe for concurrent use. Every fitz call anywhere in
+  the app (open, load/render page, insert/save, close) runs while holding FITZ_LOCK.
+- A document may stay open between locked sections (the splitter keeps its source
+  open across uploads), but it is only touched with the lock held.
+- Keep sections short, about one page or one document operation, and do network or
+  other slow work outside the lock, so that renderers on other threads interleave.
 """
 from __future__ import annotations
 
-from typing import List
+import threading
+from typing import Iterator, List, Optional
+
+# See "PyMuPDF and threads" above. Re-entrant so helpers can nest sections.
+FITZ_LOCK = threading.RLock()
 
 
 def split_pdf_pages(pdf_bytes: bytes) -> List[bytes]:
@@ -29,6 +46,11 @@ def split_pdf_pages(pdf_bytes: bytes) -> List[bytes]:
         # PyMuPDF not available; cannot split
         return []
 
+    with FITZ_LOCK:
+        return _split_pages_locked(fitz, pdf_bytes)
+
+
+def _split_pages_locked(fitz, pdf_bytes: bytes) -> List[bytes]:
     try:
         src = fitz.open(stream=pdf_bytes, filetype="pdf")
     except Exception:
@@ -59,3 +81,115 @@ def split_pdf_pages(pdf_bytes: bytes) -> List[bytes]:
         except Exception:
             pass
         return []
+
+
+class PdfPart:
+    """Pages [start, end) of the source document as a standalone PDF."""
+
+    __slots__ = ("start", "end", "data")
+
+    def __init__(self, start: int, end: int, data: bytes):
+        self.start = start
+        self.end = end
+        self.data = data
+
+    @property
+    def pages(self) -> int:
+        return self.end - self.start
+
+
+class PdfPartSplitter:
+    """Generator-based splitter for size-limited uploads.
+
+    parts() builds one group of pages at a time starting at next_page. After
+    each yielded part the caller must call delivered(part) to move on, or
+    too_large(part) to retry the same pages with a smaller budget; if it does
+    neither the generator stops (failure), leaving next_page at the first page
+    that was not delivered so a later retry can resume there.
+
+    Group sizes adapt: the first guess uses the average bytes per page, then
+    every built part rescales the estimate toward ~90% of max_bytes. A single
+    page larger than max_bytes is still yielded on its own.
+    """
+
+    FILL = 0.9
+
+    def __init__(self, pdf_bytes: bytes, max_bytes: int, start_page: int = 0):
+        self.pdf_bytes = pdf_bytes
+        self.max_bytes = max(1, int(max_bytes))
+        self.next_page = max(0, int(start_page or 0))
+        self.page_count = 0
+        self.parts_sent = 0
+        self._outcome: Optional[str] = None
+        self._group = 0
+
+    @property
+    def done(self) -> bool:
+        return self.page_count > 0 and self.next_page >= self.page_count
+
+    def delivered(self, part: PdfPart) -> None:
+        self.next_page = part.end
+        self.parts_sent += 1
+        self._outcome = "delivered"
+
+    def too_large(self, part: PdfPart) -> None:
+        """Shrink the budget below this part's size; its pages are rebuilt smaller."""
+        self.max_bytes = max(1, min(self.max_bytes, int(len(part.data) * 0.5)))
+        self._group = max(1, part.pages // 2)
+        self._outcome = "too_large"
+
+    def parts(self) -> Iterator[PdfPart]:
+        try:
+            import fitz  # PyMuPDF
+        except Exception:
+            return
+        try:
+            with FITZ_LOCK:
+                src = fitz.open(stream=self.pdf_bytes, filetype="pdf")
+                self.page_count = src.page_count
+        except Exception:
+            return
+        try:
+            if self.page_count <= 0:
+                return
+            if not self._group:
+                per_page = max(1, len(self.pdf_bytes) // self.page_count)
+                self._group = max(1, int(self.max_bytes * self.FILL) // per_page)
+            while self.next_page < self.page_count:
+                with FITZ_LOCK:
+                    part = self._build(src, self.next_page)
+                if part is None:
+                    return
+                self._outcome = None
+                yield part
+                outcome = self._outcome
+                del part  # release before building the next group
+                if outcome is None:
+                    return
+        finally:
+            try:
+                with FITZ_LOCK:
+                    src.close()
+            except Exception:
+                pass
+
+    def _build(self, src, start: int) -> Optional[PdfPart]:
+        import fitz  # PyMuPDF
+
+        group = max(1, min(self._group, self.page_count - start))
+        while True:
+            end = start + group
+            dst = fitz.open()
+            try:
+                dst.insert_pdf(src, from_page=start, to_page=end - 1)
+                data = dst.tobytes(garbage=3, deflate=True)
+            except Exception:
+                return None
+            finally:
+                dst.close()
+            if len(data) <= self.max_bytes or group == 1:
+                # Aim the next group at ~FILL of the budget based on this part's density
+                per_page = max(1, len(data) // group)
+                self._group = max(1, int(self.max_bytes * self.FILL) // per_page)
+                return PdfPart(start, end, data)
+            group = max(1, int(group * self.max_bytes * self.FILL / len(data)))
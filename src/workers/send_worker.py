@@ -11,6 +11,7 @@ class SendWorker(QObject):
     success = pyqtSignal(bool)
     error = pyqtSignal(str)
     progress = pyqtSignal(int, int)  # current_session, total_sessions
+    transfer = pyqtSignal(object, object)  # bytes_sent, bytes_total
 
     def __init__(self, base_dir: str, recipient: str, attachments: List[str], include_cover: bool, parent=None):
         super().__init__(parent)
@@ -20,9 +21,11 @@ class SendWorker(QObject):
         self.attachments = list(attachments or [])
         self.include_cover = include_cover
 
-    def _progress_cb(self, current: int, total: int):
+    def _progress_cb(self, current: int, total: int, bytes_sent: int = 0, bytes_total: int = 0):
         try:
             self.progress.emit(int(current), int(total))
+            if bytes_total:
+                self.transfer.emit(int(bytes_sent), int(bytes_total))
         except Exception:
             # Silently ignore signal issues
             pass
@@ -0,0 +1,79 @@
+"""
+LibertyRx hand-off and retry queue interplay.
+
+The forwarder writes each inbound fax as a held queue job before delivering it.
+If the hold runs out while the delivery is still waiting for a pool worker, the
+retry queue must leave the job alone; otherwise the fax is sent twice.
+
+Run from the repository root:
+    python -m pytest -q tests
+"""
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from integrations import libertyrx_forwarder as forwarder  # noqa: E402
+from integrations import libertyrx_queue as queue  # noqa: E402
+
+PDF = b"%PDF-1.4 handoff test"
+ENDPOINT = "https://liberty.invalid/fax"
+
+
+@pytest.fixture
+def sent(monkeypatch, tmp_path):
+    """Queue in a temp dir, no DPAPI, fixed credentials; returns the list of sent payloads."""
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
+    monkeypatch.setattr(queue, "secure_encrypt_for_machine", lambda s: s)
+    monkeypatch.setattr(queue, "secure_decrypt_for_machine", lambda s: s)
+    monkeypatch.setattr(queue, "_liberty_gate_active", lambda: False)
+    creds = lambda: ("1234567890", "api-key", "dmVuZG9yOnNlY3JldA==")  # noqa: E731
+    for module in (queue, forwarder):
+        monkeypatch.setattr(module, "liberty_credentials", creds)
+        monkeypatch.setattr(module, "liberty_base_url", lambda: ENDPOINT)
+
+    payloads = []
+    lock = threading.Lock()
+
+    def fake_send_fax(endpoint, vendor_basic_b64, customer_b64, from_number, pdf_bytes):
+        with lock:
+            payloads.append(pdf_bytes)
+        return {"ok": True, "status": 200}
+
+    monkeypatch.setattr(queue, "send_fax", fake_send_fax)
+    monkeypatch.setattr(forwarder, "send_fax", fake_send_fax)
+    return payloads
+
+
+def test_expired_hold_is_skipped_while_delivery_is_queued(sent):
+    fwd = forwarder.LibertyForwarder(workers=1)
+    gate = threading.Event()
+    fwd._pool.submit(gate.wait)  # keep the only worker busy so the delivery stays queued
+    try:
+        future = fwd.submit("fax-1", "15555550100", PDF)
+        (job,) = queue.load_all_jobs()
+        # The hold runs out before a worker picks the delivery up
+        assert queue.reschedule_job(job["id"], 0)
+        queue.process_due_jobs()
+        assert sent == []
+        assert [j["id"] for j in queue.load_all_jobs()] == [job["id"]]
+    finally:
+        gate.set()
+
+    assert fwd.wait(future, timeout=10)
+    assert sent == [PDF]
+    assert queue.load_all_jobs() == []
+    queue.process_due_jobs()
+    assert sent == [PDF]
+    fwd._pool.shutdown(wait=True)
+
+
+def test_unclaimed_expired_job_is_sent_by_queue(sent):
+    job_id = queue.enqueue("fax-2", "15555550100", PDF, ENDPOINT, hold_secs=forwarder.HANDOFF_HOLD_SECONDS)
+    assert queue.reschedule_job(job_id, 0)
+    queue.process_due_jobs()
+    assert sent == [PDF]
+    assert queue.load_all_jobs() == []